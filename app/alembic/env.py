@@ -12,6 +12,9 @@ from app.movies.infrastructure.models import MovieModel, GenreModel, MovieGenreL
 from app.showtimes.infrastructure.models import ShowtimeModel
 from app.rooms.infrastructure.models import RoomModel
 from app.reservations.infrastructure.models import SeatModel, ReservationModel
+from app.shared.infrastructure.scheduling.models import JobRunModel
+from app.shared.infrastructure.outbox.models import OutboxEventModel
+from app.payments.infrastructure.models import PaymentEventModel, PaymentInboxEventModel
 
 target_metadata = SQLModel.metadata
 config = context.config
@@ -1,31 +1,61 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 from typing import Annotated
 from uuid import UUID
 
 import jwt
-from fastapi import Depends, HTTPException, security, status
+from fastapi import Depends, HTTPException, Request, security, status
 from jwt.exceptions import InvalidTokenError
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.database import get_session
+from app.database import get_async_read_session, get_async_session, get_read_session, get_session
 from app.settings import get_settings
+from app.shared.infrastructure.replicas.recent_writers import recent_writers
+from app.shared.infrastructure.replicas.session_writes import has_writes
 from app.users.infrastructure.models import UserModel
 
 settings = get_settings()
 
 
-def get_fastapi_session() -> Generator[Session, None, None]:
+def get_fastapi_session(request: Request) -> Generator[Session, None, None]:
     with get_session() as session:
         yield session
+        user_id = getattr(request.state, "user_id", None)
+        if user_id is not None and has_writes(session):
+            recent_writers.record(user_id)
 
 
 SessionDep = Annotated[Session, Depends(get_fastapi_session)]
 
+
+def get_fastapi_read_session() -> Generator[Session, None, None]:
+    with get_read_session() as session:
+        yield session
+
+
+ReadSessionDep = Annotated[Session, Depends(get_fastapi_read_session)]
+
+
+async def get_fastapi_async_session() -> AsyncGenerator[AsyncSession, None]:
+    async with get_async_session() as session:
+        yield session
+
+
+AsyncSessionDep = Annotated[AsyncSession, Depends(get_fastapi_async_session)]
+
+
+async def get_fastapi_async_read_session() -> AsyncGenerator[AsyncSession, None]:
+    async with get_async_read_session() as session:
+        yield session
+
+
+AsyncReadSessionDep = Annotated[AsyncSession, Depends(get_fastapi_async_read_session)]
+
 reusable_oauth2 = security.OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/access-token/")
 TokenDep = Annotated[str, Depends(reusable_oauth2)]
 
 
-def get_current_user(session: SessionDep, token: TokenDep) -> UserModel:
+def get_current_user(request: Request, session: SessionDep, token: TokenDep) -> UserModel:
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
     except InvalidTokenError:
@@ -38,12 +68,21 @@ def get_current_user(session: SessionDep, token: TokenDep) -> UserModel:
         raise HTTPException(status_code=404, detail="User not found")
     if user.is_active is False:
         raise HTTPException(status_code=400, detail="Inactive user")
+    request.state.user_id = user.id
     return user
 
 
 CurrentUser = Annotated[UserModel, Depends(get_current_user)]
 
 
+async def get_fastapi_user_async_read_session(current_user: CurrentUser) -> AsyncGenerator[AsyncSession, None]:
+    async with get_async_read_session(primary=recent_writers.wrote_recently(current_user.id)) as session:
+        yield session
+
+
+UserAsyncReadSessionDep = Annotated[AsyncSession, Depends(get_fastapi_user_async_read_session)]
+
+
 def get_current_active_superuser(current_user: CurrentUser) -> UserModel:
     if current_user.is_superuser is False:
         raise HTTPException(
@@ -1,17 +1,28 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
+from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import Connection, Engine, create_engine
+from sqlalchemy import Connection, Engine, NullPool, create_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlalchemy_utils import create_database, database_exists
 from sqlmodel import Session, SQLModel
-
-from app.api.deps import get_fastapi_session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.api.deps import (
+    get_fastapi_async_read_session,
+    get_fastapi_async_session,
+    get_fastapi_read_session,
+    get_fastapi_session,
+    get_fastapi_user_async_read_session,
+)
 from app.auth.domain.token import Token
 from app.main import app
+from app.movies.infrastructure.caches.movie_listing_cache import movie_listing_cache
 from app.settings import Settings, get_settings
 from app.shared.domain.value_objects.id import Id
 from app.shared.tests.domain.mothers.user_mother import UserMother
+from app.showtimes.infrastructure.caches.seat_map_cache import seat_map_cache
 from app.users.infrastructure.models import UserModel
 
 
@@ -21,8 +32,18 @@ def settings() -> Settings:
 
 
 @pytest.fixture
-def engine() -> Engine:
-    return create_engine("sqlite://", connect_args={"check_same_thread": False})
+def database_path(tmp_path: Path) -> Path:
+    return tmp_path / "test.db"
+
+
+@pytest.fixture
+def engine(database_path: Path) -> Engine:
+    return create_engine(f"sqlite:///{database_path}", connect_args={"check_same_thread": False})
+
+
+@pytest.fixture
+def async_engine(database_path: Path) -> AsyncEngine:
+    return create_async_engine(f"sqlite+aiosqlite:///{database_path}", poolclass=NullPool)
 
 
 @pytest.fixture
@@ -56,11 +77,33 @@ def session(connection: Connection) -> Generator[Session, None, None]:
 
 
 @pytest.fixture
-def client(session: Session) -> Generator[TestClient, None, None]:
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture
+async def async_session(
+    async_engine: AsyncEngine,
+    setup_database: None,  # noqa: ARG001
+) -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSession(async_engine) as async_session:
+        yield async_session
+
+
+@pytest.fixture
+def client(session: Session, async_engine: AsyncEngine) -> Generator[TestClient, None, None]:
     def get_override_session() -> Session:
         return session
 
+    async def get_override_async_session() -> AsyncGenerator[AsyncSession, None]:
+        async with AsyncSession(async_engine) as async_session:
+            yield async_session
+
     app.dependency_overrides[get_fastapi_session] = get_override_session
+    app.dependency_overrides[get_fastapi_async_session] = get_override_async_session
+    app.dependency_overrides[get_fastapi_read_session] = get_override_session
+    app.dependency_overrides[get_fastapi_async_read_session] = get_override_async_session
+    app.dependency_overrides[get_fastapi_user_async_read_session] = get_override_async_session
 
     with TestClient(app) as client:
         yield client
@@ -68,6 +111,13 @@ def client(session: Session) -> Generator[TestClient, None, None]:
     app.dependency_overrides.clear()
 
 
+@pytest.fixture(autouse=True)
+def clear_caches() -> Generator[None, None, None]:
+    yield
+    seat_map_cache.clear()
+    movie_listing_cache.clear()
+
+
 @pytest.fixture
 def user(session: Session) -> UserModel:
     user = UserMother().create()
@@ -0,0 +1,47 @@
+import argparse
+import logging
+import signal
+from typing import Any
+
+from app.payments.application.subscribers.cancel_payment_when_reservation_expired import (
+    CancelPaymentWhenReservationExpired,
+)
+from app.payments.application.subscribers.refund_when_reservation_cancelled import RefundWhenReservationCancelled
+from app.shared.domain.events.event_subscriber import EventSubscriber
+from app.shared.infrastructure.events.rabbitmq_configurer_factory import RabbitMQConfigurerFactory
+
+logger = logging.getLogger(__name__)
+
+SUBSCRIBERS: list[type[EventSubscriber[Any]]] = [RefundWhenReservationCancelled, CancelPaymentWhenReservationExpired]
+
+
+def setup_event_subscribers() -> None:
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    configurer = RabbitMQConfigurerFactory.create()
+    for subscriber in SUBSCRIBERS:
+        configurer.add_subscriber(subscriber)
+    configurer.start()
+
+
+def replay_dead_letters(limit: int | None = None) -> None:
+    configurer = RabbitMQConfigurerFactory.create()
+    try:
+        for subscriber in SUBSCRIBERS:
+            replayed = configurer.replay_dead_letters(subscriber, limit=limit)
+            logger.info("Replayed %d dead-lettered messages for %s", replayed, subscriber.__name__)
+    finally:
+        configurer.stop()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--replay", action="store_true", help="re-drive dead-lettered events and exit")
+    parser.add_argument("--limit", type=int, default=None, help="maximum messages to replay per subscriber")
+    arguments = parser.parse_args()
+
+    if arguments.replay:
+        replay_dead_letters(limit=arguments.limit)
+    else:
+        setup_event_subscribers()
@@ -1,13 +1,59 @@
-from collections.abc import Generator
-from contextlib import contextmanager
+import itertools
+from collections.abc import AsyncGenerator, Generator
+from contextlib import asynccontextmanager, contextmanager
 
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import Pool
 from sqlmodel import Session, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.settings import get_settings
+from app.shared.infrastructure.pools.instrumented_pool import (
+    InstrumentedAsyncAdaptedQueuePool,
+    InstrumentedQueuePool,
+    instrument_pool,
+)
+from app.shared.infrastructure.pools.pool_metrics import PoolMetrics
 
 settings = get_settings()
 
-engine = create_engine(str(settings.SQLALCHEMY_DATABASE_URI))
+engine = create_engine(
+    str(settings.SQLALCHEMY_DATABASE_URI),
+    poolclass=InstrumentedQueuePool,
+    **settings.SQLALCHEMY_ENGINE_OPTIONS,
+)
+async_engine = create_async_engine(
+    str(settings.SQLALCHEMY_DATABASE_URI),
+    poolclass=InstrumentedAsyncAdaptedQueuePool,
+    **settings.SQLALCHEMY_ENGINE_OPTIONS,
+)
+
+read_engines = [
+    create_engine(uri, poolclass=InstrumentedQueuePool, **settings.SQLALCHEMY_ENGINE_OPTIONS)
+    for uri in settings.POSTGRES_READ_REPLICA_URIS
+]
+async_read_engines = [
+    create_async_engine(uri, poolclass=InstrumentedAsyncAdaptedQueuePool, **settings.SQLALCHEMY_ENGINE_OPTIONS)
+    for uri in settings.POSTGRES_READ_REPLICA_URIS
+]
+read_engine_cycle = itertools.cycle(read_engines or [engine])
+async_read_engine_cycle = itertools.cycle(async_read_engines or [async_engine])
+
+database_pools: dict[str, Pool] = {
+    "primary": engine.pool,
+    "primary_async": async_engine.sync_engine.pool,
+    **{f"replica_{index}": read_engine.pool for index, read_engine in enumerate(read_engines)},
+    **{
+        f"replica_{index}_async": async_read_engine.sync_engine.pool
+        for index, async_read_engine in enumerate(async_read_engines)
+    },
+}
+database_pool_metrics: dict[str, PoolMetrics] = {name: PoolMetrics() for name in database_pools}
+for name, pool in database_pools.items():
+    instrument_pool(pool, database_pool_metrics[name])
+
+pool_metrics = database_pool_metrics["primary"]
+async_pool_metrics = database_pool_metrics["primary_async"]
 
 
 @contextmanager
@@ -21,3 +67,34 @@ def get_session() -> Generator[Session, None, None]:
         raise
     finally:
         session.close()
+
+
+@asynccontextmanager
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    session = AsyncSession(async_engine)
+    try:
+        yield session
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
+
+
+@contextmanager
+def get_read_session(primary: bool = False) -> Generator[Session, None, None]:
+    session = Session(engine if primary else next(read_engine_cycle))
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@asynccontextmanager
+async def get_async_read_session(primary: bool = False) -> AsyncGenerator[AsyncSession, None]:
+    session = AsyncSession(async_engine if primary else next(async_read_engine_cycle))
+    try:
+        yield session
+    finally:
+        await session.close()
@@ -2,42 +2,39 @@ import multiprocessing
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
-from apscheduler.schedulers.background import BackgroundScheduler
 from fastapi import FastAPI
 from fastapi.routing import APIRoute
 
 from app.api.main import api_router
-from app.payments.application.subscribers.refund_when_reservation_cancelled import RefundWhenReservationCancelled
-from app.reservations.application.jobs.cancel_expired_reservations_job import cancel_expired_reservations_job
+from app.consumers import setup_event_subscribers
+from app.reservations.infrastructure.schedulers.reservation_expiry_scheduler import reservation_expiry_scheduler
+from app.scheduler import init_apscheduler, leader_election
 from app.settings import get_settings
-from app.shared.infrastructure.events.rabbitmq_configurer_factory import RabbitMQConfigurerFactory
+from app.shared.infrastructure.events.rabbitmq_publisher import rabbitmq_publisher
 
 settings = get_settings()
 
 
-def setup_jobs_scheduler() -> None:
-    scheduler = BackgroundScheduler()
-    scheduler.add_job(cancel_expired_reservations_job, "interval", minutes=1)
-    scheduler.start()
-
-
-def setup_event_subscribers() -> None:
-    configurer = RabbitMQConfigurerFactory.create()
-    configurer.add_subscriber(RefundWhenReservationCancelled)
-    configurer.start()
-
-
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:  # noqa: ARG001
-    setup_jobs_scheduler()
+    scheduler = init_apscheduler()
+    reservation_expiry_scheduler.start()
 
-    subscriber_process = multiprocessing.Process(target=setup_event_subscribers)
-    subscriber_process.start()
+    subscriber_process = None
+    if settings.EVENT_SUBSCRIBERS_IN_PROCESS:
+        subscriber_process = multiprocessing.Process(target=setup_event_subscribers)
+        subscriber_process.start()
 
     yield
 
-    subscriber_process.terminate()
-    subscriber_process.join()
+    if subscriber_process is not None:
+        subscriber_process.terminate()
+        subscriber_process.join()
+
+    reservation_expiry_scheduler.stop()
+    scheduler.shutdown(wait=False)
+    leader_election.resign()
+    rabbitmq_publisher.close()
 
 
 def custom_generate_unique_id(route: APIRoute) -> str:
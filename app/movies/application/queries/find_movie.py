@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 from app.movies.domain.exceptions import MovieDoesNotExist
-from app.movies.domain.finders.movie_finder import MovieFinder
+from app.movies.domain.finders.async_movie_finder import AsyncMovieFinder
 from app.movies.domain.movie import Movie
 from app.shared.domain.value_objects.date import Date
 from app.shared.domain.value_objects.id import Id
@@ -18,11 +18,11 @@ class FindMovieParams:
 
 
 class FindMovie:
-    def __init__(self, finder: MovieFinder) -> None:
+    def __init__(self, finder: AsyncMovieFinder) -> None:
         self._finder = finder
 
-    def execute(self, params: FindMovieParams) -> Movie:
-        movie = self._finder.find_movie_by_showtime_date(
+    async def execute(self, params: FindMovieParams) -> Movie:
+        movie = await self._finder.find_movie_by_showtime_date(
             movie_id=params.movie_id,
             showtime_date=params.showtime_date,
         )
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 
-from app.movies.domain.finders.movie_finder import MovieFinder
+from app.movies.domain.finders.async_movie_finder import AsyncMovieFinder
 from app.movies.domain.movie import Movie
 from app.shared.domain.value_objects.date import Date
 from app.shared.domain.value_objects.id import Id
@@ -20,18 +20,13 @@ class FindMoviesParams:
 
 
 class FindMovies:
-    def __init__(self, finder: MovieFinder) -> None:
+    def __init__(self, finder: AsyncMovieFinder) -> None:
         self._finder = finder
 
-    def execute(self, params: FindMoviesParams) -> list[Movie]:
-        movies = self._finder.find_movies_by_showtime_date(params.showtime_date)
-
+    async def execute(self, params: FindMoviesParams) -> list[Movie]:
         if params.genre_id is None:
-            return movies
-
-        movies_filtered: list[Movie] = []
-        for movie in movies:
-            if movie.has_genre(params.genre_id):
-                movies_filtered.append(movie)
+            return await self._finder.find_movies_by_showtime_date(showtime_date=params.showtime_date)
 
-        return movies_filtered
+        return await self._finder.find_movies_by_showtime_date_and_genre(
+            showtime_date=params.showtime_date, genre_id=params.genre_id
+        )
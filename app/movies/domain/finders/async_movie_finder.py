@@ -0,0 +1,13 @@
+from typing import Protocol
+
+from app.movies.domain.movie import Movie
+from app.shared.domain.value_objects.date import Date
+from app.shared.domain.value_objects.id import Id
+
+
+class AsyncMovieFinder(Protocol):
+    async def find_movie_by_showtime_date(self, movie_id: Id, showtime_date: Date) -> Movie | None: ...
+
+    async def find_movies_by_showtime_date(self, showtime_date: Date) -> list[Movie]: ...
+
+    async def find_movies_by_showtime_date_and_genre(self, showtime_date: Date, genre_id: Id) -> list[Movie]: ...
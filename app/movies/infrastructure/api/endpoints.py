@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile, status
+from fastapi import APIRouter, Depends, File, Form, Header, HTTPException, Response, UploadFile, status
+from pydantic import TypeAdapter
 
-from app.api.deps import SessionDep, get_current_active_superuser
+from app.api.deps import AsyncReadSessionDep, ReadSessionDep, SessionDep, get_current_active_superuser
 from app.movies.application.commands.add_movie_genre import AddMovieGenre, AddMovieGenreParams
 from app.movies.application.commands.create_movie import CreateMovie, CreateMovieParams
 from app.movies.application.commands.delete_movie import DeleteMovie
@@ -15,6 +16,8 @@ from app.movies.domain.exceptions import (
     MovieDoesNotExist,
 )
 from app.movies.infrastructure.api.responses import GenreResponse, MovieExtendedResponse, MovieResponse
+from app.movies.infrastructure.caches.movie_listing_cache import movie_listing_cache
+from app.movies.infrastructure.finders.async_sqlmodel_movie_finder import AsyncSqlModelMovieFinder
 from app.movies.infrastructure.finders.sqlmodel_genre_finder import SqlModelGenreFinder
 from app.movies.infrastructure.finders.sqlmodel_movie_finder import SqlModelMovieFinder
 from app.movies.infrastructure.repositories.sqlmodel_movie_repository import SqlModelMovieRepository
@@ -23,19 +26,38 @@ from app.shared.domain.value_objects.id import Id
 
 router = APIRouter()
 
+MOVIE_LISTING_ADAPTER = TypeAdapter(list[MovieExtendedResponse])
+
 
 @router.get("/genres/", response_model=list[GenreResponse], status_code=status.HTTP_200_OK)
-def list_genres(session: SessionDep) -> list[GenreResponse]:
+def list_genres(session: ReadSessionDep) -> list[GenreResponse]:
     genres = FindAllGenres(finder=SqlModelGenreFinder(session=session)).execute()
     return GenreResponse.from_domain_list(genres=genres)
 
 
 @router.get("/", response_model=list[MovieExtendedResponse], status_code=status.HTTP_200_OK)
-def list_movies(session: SessionDep, showtime_date: str, genre_id: str | None = None) -> list[MovieExtendedResponse]:
-    movies = FindMovies(finder=SqlModelMovieFinder(session=session)).execute(
-        params=FindMoviesParams.from_primitives(showtime_date=showtime_date, genre_id=genre_id),
-    )
-    return MovieExtendedResponse.from_domain_list(movies=movies)
+async def list_movies(
+    session: AsyncReadSessionDep,
+    showtime_date: str,
+    genre_id: str | None = None,
+    if_none_match: str | None = Header(default=None),
+) -> Response:
+    params = FindMoviesParams.from_primitives(showtime_date=showtime_date, genre_id=genre_id)
+
+    listing = movie_listing_cache.get(showtime_date=params.showtime_date, genre_id=params.genre_id)
+    if listing is None:
+        generation = movie_listing_cache.generation
+        movies = await FindMovies(finder=AsyncSqlModelMovieFinder(session=session)).execute(params=params)
+        listing = movie_listing_cache.put(
+            showtime_date=params.showtime_date,
+            genre_id=params.genre_id,
+            body=MOVIE_LISTING_ADAPTER.dump_json(MovieExtendedResponse.from_domain_list(movies=movies)),
+            generation=generation,
+        )
+
+    if listing.matches(if_none_match):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": listing.etag})
+    return Response(content=listing.body, media_type="application/json", headers={"ETag": listing.etag})
 
 
 @router.post(
@@ -57,9 +79,9 @@ def create_movie(
 
 
 @router.get("/{movie_id}/", response_model=MovieExtendedResponse, status_code=status.HTTP_200_OK)
-def get_movie(session: SessionDep, movie_id: str, showtime_date: str) -> MovieExtendedResponse:
+async def get_movie(session: AsyncReadSessionDep, movie_id: str, showtime_date: str) -> MovieExtendedResponse:
     try:
-        movie = FindMovie(finder=SqlModelMovieFinder(session=session)).execute(
+        movie = await FindMovie(finder=AsyncSqlModelMovieFinder(session=session)).execute(
             params=FindMovieParams.from_primitives(movie_id=movie_id, showtime_date=showtime_date)
         )
     except MovieDoesNotExist:
@@ -0,0 +1,77 @@
+import hashlib
+import threading
+import time
+from dataclasses import dataclass, field
+
+from app.settings import get_settings
+from app.shared.domain.value_objects.date import Date
+from app.shared.domain.value_objects.id import Id
+
+settings = get_settings()
+
+
+@dataclass(frozen=True)
+class MovieListing:
+    body: bytes
+    etag: str
+    loaded_at: float = field(default_factory=time.monotonic)
+
+    @classmethod
+    def from_body(cls, body: bytes) -> "MovieListing":
+        return cls(body=body, etag=f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"')
+
+    def is_expired(self, ttl_seconds: float) -> bool:
+        return time.monotonic() - self.loaded_at >= ttl_seconds
+
+    def matches(self, if_none_match: str | None) -> bool:
+        if if_none_match is None:
+            return False
+
+        etags = [etag.strip().removeprefix("W/") for etag in if_none_match.split(",")]
+        return "*" in etags or self.etag in etags
+
+
+class MovieListingCache:
+    def __init__(self, ttl_seconds: float, replica_lag_seconds: float = 0.0) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._replica_lag_seconds = replica_lag_seconds
+        self._listings: dict[tuple[Date, Id | None], MovieListing] = {}
+        self._generation = 0
+        self._cleared_at: float | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, showtime_date: Date, genre_id: Id | None) -> MovieListing | None:
+        with self._lock:
+            listing = self._listings.get((showtime_date, genre_id))
+            if listing is None:
+                return None
+
+            if listing.is_expired(self._ttl_seconds):
+                del self._listings[(showtime_date, genre_id)]
+                return None
+            return listing
+
+    def put(self, showtime_date: Date, genre_id: Id | None, body: bytes, generation: int) -> MovieListing:
+        listing = MovieListing.from_body(body)
+        with self._lock:
+            if generation == self._generation and not self._replica_may_be_behind():
+                self._listings[(showtime_date, genre_id)] = listing
+        return listing
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._cleared_at = time.monotonic()
+            self._listings.clear()
+
+    def _replica_may_be_behind(self) -> bool:
+        return self._cleared_at is not None and time.monotonic() - self._cleared_at < self._replica_lag_seconds
+
+
+movie_listing_cache = MovieListingCache(
+    ttl_seconds=settings.MOVIE_LISTING_CACHE_TTL_SECONDS, replica_lag_seconds=settings.READ_YOUR_WRITES_WINDOW_SECONDS
+)
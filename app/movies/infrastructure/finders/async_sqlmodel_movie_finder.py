@@ -0,0 +1,107 @@
+from collections.abc import Sequence
+from datetime import datetime, time, timedelta
+from uuid import UUID
+
+from sqlalchemy import ColumnElement
+from sqlalchemy.orm import selectinload
+from sqlmodel import select
+from sqlmodel.sql.expression import Select
+
+from app.movies.domain.finders.async_movie_finder import AsyncMovieFinder
+from app.movies.domain.movie import Movie
+from app.movies.domain.movie_showtime import MovieShowtime
+from app.movies.infrastructure.models import MovieGenreLink, MovieModel
+from app.shared.domain.value_objects.date import Date
+from app.shared.domain.value_objects.date_time import DateTime
+from app.shared.domain.value_objects.id import Id
+from app.shared.infrastructure.finders.async_sqlmodel_finder import AsyncSqlModelFinder
+from app.showtimes.infrastructure.models import ShowtimeModel
+
+
+class AsyncSqlModelMovieFinder(AsyncMovieFinder, AsyncSqlModelFinder):
+    async def find_movie_by_showtime_date(self, movie_id: Id, showtime_date: Date) -> Movie | None:
+        result = await self._session.exec(
+            select(MovieModel, ShowtimeModel)
+            .options(selectinload(MovieModel.genres))  # type: ignore
+            .join(ShowtimeModel)
+            .where(
+                *self._showtime_date_range(showtime_date),
+                MovieModel.id == movie_id.to_uuid(),
+            )
+            .order_by(ShowtimeModel.show_datetime)  # type: ignore
+        )
+        movie_showtime_models: Sequence[tuple[MovieModel, ShowtimeModel]] = result.all()
+
+        if not movie_showtime_models:
+            return None
+
+        movie_model = movie_showtime_models[0][0]
+        movie = movie_model.to_domain()
+
+        for genre_model in movie_model.genres:
+            movie.add_genre(genre_model.to_domain())
+
+        for _, showtime_model in movie_showtime_models:
+            movie_showtime = self._build_movie_showtime(showtime_model)
+            movie.add_showtime(movie_showtime)
+
+        return movie
+
+    async def find_movies_by_showtime_date(self, showtime_date: Date) -> list[Movie]:
+        statement = self._movies_by_showtime_date_statement(showtime_date)
+        return await self._find_movies(statement)
+
+    async def find_movies_by_showtime_date_and_genre(self, showtime_date: Date, genre_id: Id) -> list[Movie]:
+        statement = (
+            self._movies_by_showtime_date_statement(showtime_date)
+            .join(MovieGenreLink, MovieGenreLink.movie_id == MovieModel.id)  # type: ignore
+            .where(MovieGenreLink.genre_id == genre_id.to_uuid())
+        )
+        return await self._find_movies(statement)
+
+    @classmethod
+    def _movies_by_showtime_date_statement(cls, showtime_date: Date) -> Select[tuple[MovieModel, ShowtimeModel]]:
+        return (
+            select(MovieModel, ShowtimeModel)
+            .options(selectinload(MovieModel.genres))  # type: ignore
+            .join(ShowtimeModel)
+            .where(
+                *cls._showtime_date_range(showtime_date),
+                MovieModel.id == ShowtimeModel.movie_id,
+            )
+            .order_by(MovieModel.title, ShowtimeModel.show_datetime)  # type: ignore
+        )
+
+    async def _find_movies(self, statement: Select[tuple[MovieModel, ShowtimeModel]]) -> list[Movie]:
+        result = await self._session.exec(statement)
+        movie_showtime_models: Sequence[tuple[MovieModel, ShowtimeModel]] = result.all()
+
+        movies: dict[UUID, Movie] = {}
+        for movie_model, showtime_model in movie_showtime_models:
+            if movie_model.id not in movies:
+                movie = movie_model.to_domain()
+
+                for genre_model in movie_model.genres:
+                    movie.add_genre(genre_model.to_domain())
+                movies[movie_model.id] = movie
+
+            movie_showtime = self._build_movie_showtime(showtime_model)
+            movies[movie_model.id].add_showtime(movie_showtime)
+
+        return list(movies.values())
+
+    @staticmethod
+    def _showtime_date_range(showtime_date: Date) -> tuple[ColumnElement[bool], ColumnElement[bool]]:
+        day_start = datetime.combine(showtime_date.value, time.min)
+        next_day_start = day_start + timedelta(days=1)
+        return (
+            ShowtimeModel.show_datetime >= day_start,  # type: ignore
+            ShowtimeModel.show_datetime < next_day_start,
+        )
+
+    @staticmethod
+    def _build_movie_showtime(showtime_model: ShowtimeModel) -> MovieShowtime:
+        return MovieShowtime(
+            id=Id.from_uuid(showtime_model.id),
+            show_datetime=DateTime.from_datetime(showtime_model.show_datetime),
+        )
@@ -1,5 +1,6 @@
 from app.movies.domain.movie import Movie
 from app.movies.domain.repositories.movie_repository import MovieRepository
+from app.movies.infrastructure.caches.movie_listing_cache import movie_listing_cache
 from app.movies.infrastructure.models import GenreModel, MovieModel
 from app.shared.domain.value_objects.id import Id
 from app.shared.infrastructure.repositories.sqlmodel_repository import SqlModelRepository
@@ -10,11 +11,13 @@ class SqlModelMovieRepository(MovieRepository, SqlModelRepository):
         movie_model = MovieModel.from_domain(movie=movie)
         self._session.merge(movie_model)
         self._session.commit()
+        movie_listing_cache.clear()
 
     def delete(self, id: Id) -> None:
         movie_model = self._session.get(MovieModel, id.to_uuid())
         self._session.delete(movie_model)
         self._session.commit()
+        movie_listing_cache.clear()
 
     def add_genre(self, movie_id: Id, genre_id: Id) -> None:
         movie_model = self._session.get_one(MovieModel, movie_id.to_uuid())
@@ -24,6 +27,7 @@ class SqlModelMovieRepository(MovieRepository, SqlModelRepository):
             movie_model.genres.append(genre_model)
             self._session.add(movie_model)
             self._session.commit()
+            movie_listing_cache.clear()
 
     def remove_genre(self, movie_id: Id, genre_id: Id) -> None:
         movie_model = self._session.get_one(MovieModel, movie_id.to_uuid())
@@ -33,3 +37,4 @@ class SqlModelMovieRepository(MovieRepository, SqlModelRepository):
             movie_model.genres.remove(genre_model)
             self._session.add(movie_model)
             self._session.commit()
+            movie_listing_cache.clear()
@@ -9,7 +9,7 @@ from app.movies.application.queries.find_movie import FindMovie, FindMovieParams
 from app.movies.domain.collections.movie_genres import MovieGenres
 from app.movies.domain.collections.movie_showtimes import MovieShowtimes
 from app.movies.domain.exceptions import MovieDoesNotExist
-from app.movies.domain.finders.movie_finder import MovieFinder
+from app.movies.domain.finders.async_movie_finder import AsyncMovieFinder
 from app.movies.domain.genre import Genre
 from app.movies.domain.movie import Movie
 from app.movies.domain.movie_showtime import MovieShowtime
@@ -25,9 +25,10 @@ from app.shared.tests.domain.builders.movie_builder import MovieBuilder
 class TestFindMovie:
     @pytest.fixture
     def mock_movie_finder(self) -> Any:
-        return create_autospec(spec=MovieFinder, instance=True, spec_set=True)
+        return create_autospec(spec=AsyncMovieFinder, instance=True, spec_set=True)
 
-    def test_find_movie(self, mock_movie_finder: Mock) -> None:
+    @pytest.mark.anyio
+    async def test_find_movie(self, mock_movie_finder: Mock) -> None:
         mock_movie_finder.find_movie_by_showtime_date.return_value = (
             MovieBuilder()
             .with_id(id=Id("913822a0-750b-4cb6-b7b9-e01869d7d62d"))
@@ -39,7 +40,7 @@ class TestFindMovie:
             .build()
         )
 
-        movie = FindMovie(finder=mock_movie_finder).execute(
+        movie = await FindMovie(finder=mock_movie_finder).execute(
             params=FindMovieParams(
                 movie_id=Id("913822a0-750b-4cb6-b7b9-e01869d7d62d"),
                 showtime_date=Date.from_datetime_date(date(2023, 4, 3)),
@@ -67,11 +68,12 @@ class TestFindMovie:
             ),
         )
 
-    def test_raise_exception_when_movie_does_not_exist(self, mock_movie_finder: Mock) -> None:
+    @pytest.mark.anyio
+    async def test_raise_exception_when_movie_does_not_exist(self, mock_movie_finder: Mock) -> None:
         mock_movie_finder.find_movie_by_showtime_date.return_value = None
 
         with pytest.raises(MovieDoesNotExist):
-            FindMovie(finder=mock_movie_finder).execute(
+            await FindMovie(finder=mock_movie_finder).execute(
                 params=FindMovieParams(
                     movie_id=Id("913822a0-750b-4cb6-b7b9-e01869d7d62d"),
                     showtime_date=Date.from_datetime_date(date(2023, 4, 3)),
@@ -8,7 +8,7 @@ from freezegun import freeze_time
 from app.movies.application.queries.find_movies import FindMovies, FindMoviesParams
 from app.movies.domain.collections.movie_genres import MovieGenres
 from app.movies.domain.collections.movie_showtimes import MovieShowtimes
-from app.movies.domain.finders.movie_finder import MovieFinder
+from app.movies.domain.finders.async_movie_finder import AsyncMovieFinder
 from app.movies.domain.genre import Genre
 from app.movies.domain.movie import Movie
 from app.movies.domain.movie_showtime import MovieShowtime
@@ -24,7 +24,7 @@ from app.shared.tests.domain.builders.movie_builder import MovieBuilder
 class TestFindMovies:
     @pytest.fixture
     def mock_movie_finder(self) -> Any:
-        return create_autospec(spec=MovieFinder, instance=True, spec_set=True)
+        return create_autospec(spec=AsyncMovieFinder, instance=True, spec_set=True)
 
     @pytest.fixture
     def showtime_date(self) -> Date:
@@ -63,12 +63,13 @@ class TestFindMovies:
             .build(),
         ]
 
-    def test_find_movies_by_showtime_date(
+    @pytest.mark.anyio
+    async def test_find_movies_by_showtime_date(
         self, mock_movie_finder: Mock, movies: list[Movie], showtime_date: Date
     ) -> None:
         mock_movie_finder.find_movies_by_showtime_date.return_value = movies
 
-        data = FindMovies(finder=mock_movie_finder).execute(
+        data = await FindMovies(finder=mock_movie_finder).execute(
             params=FindMoviesParams(showtime_date=showtime_date, genre_id=None)
         )
 
@@ -114,16 +115,20 @@ class TestFindMovies:
             ),
         ]
 
-    def test_find_movies_by_showtime_date_and_genre(
+    @pytest.mark.anyio
+    async def test_find_movies_by_showtime_date_and_genre(
         self, mock_movie_finder: Mock, movies: list[Movie], showtime_date: Date
     ) -> None:
-        mock_movie_finder.find_movies_by_showtime_date.return_value = movies
+        mock_movie_finder.find_movies_by_showtime_date_and_genre.return_value = movies[1:]
 
-        data = FindMovies(finder=mock_movie_finder).execute(
+        data = await FindMovies(finder=mock_movie_finder).execute(
             params=FindMoviesParams(showtime_date=showtime_date, genre_id=Id("d108f84b-3568-446b-896c-3ba2bc74cda9"))
         )
 
-        mock_movie_finder.find_movies_by_showtime_date.assert_called_once_with(showtime_date=showtime_date)
+        mock_movie_finder.find_movies_by_showtime_date_and_genre.assert_called_once_with(
+            showtime_date=showtime_date, genre_id=Id("d108f84b-3568-446b-896c-3ba2bc74cda9")
+        )
+        mock_movie_finder.find_movies_by_showtime_date.assert_not_called()
 
         assert data == [
             Movie(
@@ -142,16 +147,3 @@ class TestFindMovies:
                 ),
             ),
         ]
-
-    def test_find_movies_by_showtime_date_and_genre_when_genre_is_not_associated_to_any_movie(
-        self, mock_movie_finder: Mock, movies: list[Movie], showtime_date: Date
-    ) -> None:
-        mock_movie_finder.find_movies_by_showtime_date.return_value = movies
-
-        data = FindMovies(finder=mock_movie_finder).execute(
-            params=FindMoviesParams(showtime_date=showtime_date, genre_id=Id("b108f84b-3568-446b-896c-3ba2bc74cda9"))
-        )
-
-        mock_movie_finder.find_movies_by_showtime_date.assert_called_once_with(showtime_date=showtime_date)
-
-        assert data == []
@@ -1,6 +1,6 @@
 from collections.abc import Generator
 from datetime import date, datetime, timezone
-from unittest.mock import ANY, Mock, patch
+from unittest.mock import ANY, AsyncMock, Mock, patch
 from uuid import UUID
 
 import pytest
@@ -22,6 +22,7 @@ from app.movies.domain.genre import Genre
 from app.movies.domain.movie import Movie
 from app.movies.domain.poster_image import PosterImage
 from app.movies.infrastructure.models import MovieModel
+from app.movies.infrastructure.repositories.sqlmodel_movie_repository import SqlModelMovieRepository
 from app.movies.tests.domain.mothers.genre_mother import GenreMother
 from app.movies.tests.domain.mothers.movie_showtime_mother import (
     MovieShowtimeMother,
@@ -764,11 +765,12 @@ class TestGetMovieEndpoint:
     @pytest.fixture
     def mock_find_movie(self) -> Generator[Mock, None, None]:
         with patch("app.movies.infrastructure.api.endpoints.FindMovie") as mock:
+            mock.return_value.execute = AsyncMock()
             yield mock
 
     @pytest.fixture
     def mock_movie_finder(self) -> Generator[Mock, None, None]:
-        with patch("app.movies.infrastructure.api.endpoints.SqlModelMovieFinder") as mock:
+        with patch("app.movies.infrastructure.api.endpoints.AsyncSqlModelMovieFinder") as mock:
             yield mock.return_value
 
     @pytest.mark.integration
@@ -784,6 +786,8 @@ class TestGetMovieEndpoint:
             .build()
         )
 
+        session.commit()
+
         response = client.get("api/v1/movies/913822a0-750b-4cb6-b7b9-e01869d7d62d/?showtime_date=2023-04-03")
 
         assert response.status_code == 200
@@ -869,11 +873,12 @@ class TestListMoviesEndpoint:
     @pytest.fixture
     def mock_find_movies(self) -> Generator[Mock, None, None]:
         with patch("app.movies.infrastructure.api.endpoints.FindMovies") as mock:
+            mock.return_value.execute = AsyncMock()
             yield mock
 
     @pytest.fixture
     def mock_movie_finder(self) -> Generator[Mock, None, None]:
-        with patch("app.movies.infrastructure.api.endpoints.SqlModelMovieFinder") as mock:
+        with patch("app.movies.infrastructure.api.endpoints.AsyncSqlModelMovieFinder") as mock:
             yield mock.return_value
 
     @pytest.mark.integration
@@ -902,6 +907,8 @@ class TestListMoviesEndpoint:
             show_datetime=datetime(2023, 4, 4, 22, 0, tzinfo=timezone.utc),
         ).build()
 
+        session.commit()
+
         response = client.get(f"api/v1/movies/?showtime_date=2023-04-03&genre_id={action_genre.id}")
 
         assert response.status_code == 200
@@ -1051,3 +1058,55 @@ class TestListMoviesEndpoint:
 
         assert response.status_code == 200
         assert response.json() == []
+
+    def test_returns_etag_and_serves_cached_listing(
+        self, client: TestClient, mock_find_movies: Mock, mock_movie_finder: Mock
+    ) -> None:
+        mock_find_movies.return_value.execute.return_value = [
+            MovieBuilder().with_id(id=Id("ec725625-f502-4d39-9401-a415d8c1f964")).build()
+        ]
+
+        first_response = client.get("api/v1/movies/?showtime_date=2023-04-03")
+        second_response = client.get("api/v1/movies/?showtime_date=2023-04-03")
+
+        mock_find_movies.return_value.execute.assert_called_once()
+
+        assert first_response.status_code == 200
+        assert second_response.status_code == 200
+        assert first_response.headers["ETag"] == second_response.headers["ETag"]
+        assert first_response.json() == second_response.json()
+
+    def test_returns_304_when_etag_matches(
+        self, client: TestClient, mock_find_movies: Mock, mock_movie_finder: Mock
+    ) -> None:
+        mock_find_movies.return_value.execute.return_value = [
+            MovieBuilder().with_id(id=Id("ec725625-f502-4d39-9401-a415d8c1f964")).build()
+        ]
+        etag = client.get("api/v1/movies/?showtime_date=2023-04-03").headers["ETag"]
+
+        response = client.get("api/v1/movies/?showtime_date=2023-04-03", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+
+    @pytest.mark.integration
+    def test_integration_refreshes_listing_when_movie_changes(self, session: Session, client: TestClient) -> None:
+        movie_model = (
+            SqlModelMovieBuilder(session)
+            .with_showtime(
+                show_datetime=datetime(2023, 4, 3, 22, 0, tzinfo=timezone.utc),
+            )
+            .build()
+        )
+        session.commit()
+        etag = client.get("api/v1/movies/?showtime_date=2023-04-03").headers["ETag"]
+
+        SqlModelMovieRepository(session=session).save(
+            MovieBuilder().with_id(Id.from_uuid(movie_model.id)).with_title("Robot Salvaje").build()
+        )
+        response = client.get("api/v1/movies/?showtime_date=2023-04-03", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert response.json()[0]["title"] == "Robot Salvaje"
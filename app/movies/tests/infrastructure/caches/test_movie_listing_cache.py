@@ -0,0 +1,108 @@
+from datetime import date
+
+from freezegun import freeze_time
+
+from app.movies.infrastructure.caches.movie_listing_cache import MovieListing, MovieListingCache
+from app.shared.domain.value_objects.date import Date
+from app.shared.domain.value_objects.id import Id
+
+
+class TestMovieListingCache:
+    def test_returns_none_when_listing_is_not_cached(self) -> None:
+        cache = MovieListingCache(ttl_seconds=60)
+
+        assert cache.get(showtime_date=Date.from_datetime_date(date(2023, 4, 3)), genre_id=None) is None
+
+    def test_returns_cached_listing_by_showtime_date_and_genre(self) -> None:
+        cache = MovieListingCache(ttl_seconds=60)
+        listing = cache.put(
+            showtime_date=Date.from_datetime_date(date(2023, 4, 3)),
+            genre_id=Id("d108f84b-3568-446b-896c-3ba2bc74cda9"),
+            body=b"[]",
+            generation=cache.generation,
+        )
+
+        assert (
+            cache.get(
+                showtime_date=Date.from_datetime_date(date(2023, 4, 3)),
+                genre_id=Id("d108f84b-3568-446b-896c-3ba2bc74cda9"),
+            )
+            == listing
+        )
+        assert cache.get(showtime_date=Date.from_datetime_date(date(2023, 4, 3)), genre_id=None) is None
+
+    def test_returns_none_when_listing_has_expired(self) -> None:
+        cache = MovieListingCache(ttl_seconds=60)
+
+        with freeze_time("2025-01-10T12:00:00Z") as frozen_datetime:
+            cache.put(
+                showtime_date=Date.from_datetime_date(date(2023, 4, 3)),
+                genre_id=None,
+                body=b"[]",
+                generation=cache.generation,
+            )
+            frozen_datetime.tick(60)
+
+            assert cache.get(showtime_date=Date.from_datetime_date(date(2023, 4, 3)), genre_id=None) is None
+
+    def test_clear_removes_cached_listings(self) -> None:
+        cache = MovieListingCache(ttl_seconds=60)
+        cache.put(
+            showtime_date=Date.from_datetime_date(date(2023, 4, 3)),
+            genre_id=None,
+            body=b"[]",
+            generation=cache.generation,
+        )
+
+        cache.clear()
+
+        assert cache.get(showtime_date=Date.from_datetime_date(date(2023, 4, 3)), genre_id=None) is None
+
+    def test_does_not_cache_listing_loaded_before_clear(self) -> None:
+        cache = MovieListingCache(ttl_seconds=60)
+        generation = cache.generation
+
+        cache.clear()
+        cache.put(
+            showtime_date=Date.from_datetime_date(date(2023, 4, 3)),
+            genre_id=None,
+            body=b"[]",
+            generation=generation,
+        )
+
+        assert cache.get(showtime_date=Date.from_datetime_date(date(2023, 4, 3)), genre_id=None) is None
+
+    def test_does_not_cache_listings_while_replicas_may_be_behind_a_clear(self) -> None:
+        cache = MovieListingCache(ttl_seconds=60, replica_lag_seconds=60)
+        cache.put(
+            showtime_date=Date.from_datetime_date(date(2023, 4, 3)),
+            genre_id=None,
+            body=b"[]",
+            generation=cache.generation,
+        )
+        assert cache.get(showtime_date=Date.from_datetime_date(date(2023, 4, 3)), genre_id=None) is not None
+
+        cache.clear()
+        cache.put(
+            showtime_date=Date.from_datetime_date(date(2023, 4, 3)),
+            genre_id=None,
+            body=b"[]",
+            generation=cache.generation,
+        )
+
+        assert cache.get(showtime_date=Date.from_datetime_date(date(2023, 4, 3)), genre_id=None) is None
+
+
+class TestMovieListing:
+    def test_etag_depends_on_body(self) -> None:
+        assert MovieListing.from_body(b"[]").etag == MovieListing.from_body(b"[]").etag
+        assert MovieListing.from_body(b"[]").etag != MovieListing.from_body(b"[{}]").etag
+
+    def test_matches_if_none_match(self) -> None:
+        listing = MovieListing.from_body(b"[]")
+
+        assert listing.matches(listing.etag) is True
+        assert listing.matches(f'"other", W/{listing.etag}') is True
+        assert listing.matches("*") is True
+        assert listing.matches('"other"') is False
+        assert listing.matches(None) is False
@@ -0,0 +1,345 @@
+from datetime import date, datetime, timezone
+from uuid import UUID
+
+import pytest
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.movies.domain.collections.movie_genres import MovieGenres
+from app.movies.domain.collections.movie_showtimes import MovieShowtimes
+from app.movies.domain.genre import Genre
+from app.movies.domain.movie import Movie
+from app.movies.domain.movie_showtime import MovieShowtime
+from app.movies.infrastructure.finders.async_sqlmodel_movie_finder import AsyncSqlModelMovieFinder
+from app.movies.tests.infrastructure.mothers.sqlmodel_genre_mother import SqlModelGenreMother
+from app.shared.domain.value_objects.date import Date
+from app.shared.domain.value_objects.date_time import DateTime
+from app.shared.domain.value_objects.id import Id
+from app.shared.tests.infrastructure.builders.sqlmodel_movie_builder import SqlModelMovieBuilder
+
+
+class TestAsyncSqlModelMovieFinder:
+    @pytest.fixture
+    def finder(self, async_session: AsyncSession) -> AsyncSqlModelMovieFinder:
+        return AsyncSqlModelMovieFinder(async_session)
+
+    @pytest.mark.anyio
+    async def test_find_movie_by_showtime_date(self, session: Session, finder: AsyncSqlModelMovieFinder) -> None:
+        (
+            SqlModelMovieBuilder(session)
+            .with_id(UUID("ec725625-f502-4d39-9401-a415d8c1f964"))
+            .with_showtime(
+                id=UUID("ebdd7b54-c561-4cbb-a55f-15853c60e601"),
+                show_datetime=datetime(2023, 4, 3, 23, 0, tzinfo=timezone.utc),
+            )
+            .with_showtime(
+                id=UUID("cbdd7b54-c561-4cbb-a55f-15853c60e601"),
+                show_datetime=datetime(2023, 4, 3, 22, 0, tzinfo=timezone.utc),
+            )
+            .with_showtime(
+                id=UUID("dbdd7b54-c561-4cbb-a55f-15853c60e601"),
+                show_datetime=datetime(2023, 4, 4, 22, 0, tzinfo=timezone.utc),
+            )
+            .build()
+        )
+
+        session.commit()
+
+        movie = await finder.find_movie_by_showtime_date(
+            movie_id=Id("ec725625-f502-4d39-9401-a415d8c1f964"),
+            showtime_date=Date.from_datetime_date(date(2023, 4, 3)),
+        )
+
+        assert movie == Movie(
+            id=Id("ec725625-f502-4d39-9401-a415d8c1f964"),
+            title="Deadpool & Wolverine",
+            description="Deadpool and a variant of Wolverine.",
+            poster_image="deadpool_and_wolverine.jpg",
+            genres=MovieGenres([]),
+            showtimes=MovieShowtimes(
+                [
+                    MovieShowtime(
+                        id=Id("cbdd7b54-c561-4cbb-a55f-15853c60e601"),
+                        show_datetime=DateTime.from_datetime(datetime(2023, 4, 3, 22, 0)),
+                    ),
+                    MovieShowtime(
+                        id=Id("ebdd7b54-c561-4cbb-a55f-15853c60e601"),
+                        show_datetime=DateTime.from_datetime(datetime(2023, 4, 3, 23, 0)),
+                    ),
+                ]
+            ),
+        )
+
+    @pytest.mark.anyio
+    async def test_find_movie_by_showtime_date_when_does_not_exist(self, finder: AsyncSqlModelMovieFinder) -> None:
+        movie = await finder.find_movie_by_showtime_date(
+            movie_id=Id("ec725625-f502-4d39-9401-a415d8c1f964"),
+            showtime_date=Date.from_datetime_date(date(2023, 4, 3)),
+        )
+
+        assert movie is None
+
+    @pytest.mark.anyio
+    async def test_find_movies_by_showtime_date(self, session: Session, finder: AsyncSqlModelMovieFinder) -> None:
+        (
+            SqlModelMovieBuilder(session)
+            .with_id(UUID("ec725625-f502-4d39-9401-a415d8c1f964"))
+            .with_showtime(
+                id=UUID("cbdd7b54-c561-4cbb-a55f-15853c60e601"),
+                show_datetime=datetime(2023, 4, 3, 22, 0, tzinfo=timezone.utc),
+            )
+            .build()
+        )
+        (
+            SqlModelMovieBuilder(session)
+            .with_id(UUID("fc725625-f502-4d39-9401-a415d8c1f964"))
+            .with_showtime(
+                id=UUID("dbdd7b54-c561-4cbb-a55f-15853c60e601"),
+                show_datetime=datetime(2023, 4, 4, 22, 0, tzinfo=timezone.utc),
+            )
+            .build()
+        )
+
+        session.commit()
+
+        movies = await finder.find_movies_by_showtime_date(showtime_date=Date.from_datetime_date(date(2023, 4, 3)))
+
+        assert movies == [
+            Movie(
+                id=Id("ec725625-f502-4d39-9401-a415d8c1f964"),
+                title="Deadpool & Wolverine",
+                description="Deadpool and a variant of Wolverine.",
+                poster_image="deadpool_and_wolverine.jpg",
+                genres=MovieGenres([]),
+                showtimes=MovieShowtimes(
+                    [
+                        MovieShowtime(
+                            id=Id("cbdd7b54-c561-4cbb-a55f-15853c60e601"),
+                            show_datetime=DateTime.from_datetime(datetime(2023, 4, 3, 22, 0)),
+                        ),
+                    ],
+                ),
+            ),
+        ]
+
+    @pytest.mark.anyio
+    async def test_find_movies_by_showtime_date_with_showtimes_on_date(
+        self, session: Session, finder: AsyncSqlModelMovieFinder
+    ) -> None:
+        (
+            SqlModelMovieBuilder(session)
+            .with_id(UUID("ec725625-f502-4d39-9401-a415d8c1f964"))
+            .with_showtime(
+                id=UUID("cbdd7b54-c561-4cbb-a55f-15853c60e601"),
+                show_datetime=datetime(2023, 4, 3, 22, 0, tzinfo=timezone.utc),
+            )
+            .build()
+        )
+        (
+            SqlModelMovieBuilder(session)
+            .with_id(UUID("fc725625-f502-4d39-9401-a415d8c1f964"))
+            .with_showtime(
+                id=UUID("dbdd7b54-c561-4cbb-a55f-15853c60e601"),
+                show_datetime=datetime(2023, 4, 4, 22, 0, tzinfo=timezone.utc),
+            )
+            .build()
+        )
+
+        session.commit()
+
+        movies = await finder.find_movies_by_showtime_date(showtime_date=Date.from_datetime_date(date(2023, 4, 3)))
+
+        assert movies == [
+            Movie(
+                id=Id("ec725625-f502-4d39-9401-a415d8c1f964"),
+                title="Deadpool & Wolverine",
+                description="Deadpool and a variant of Wolverine.",
+                poster_image="deadpool_and_wolverine.jpg",
+                genres=MovieGenres([]),
+                showtimes=MovieShowtimes(
+                    [
+                        MovieShowtime(
+                            id=Id("cbdd7b54-c561-4cbb-a55f-15853c60e601"),
+                            show_datetime=DateTime.from_datetime(datetime(2023, 4, 3, 22, 0)),
+                        ),
+                    ],
+                ),
+            ),
+        ]
+
+    @pytest.mark.anyio
+    async def test_find_movies_by_showtime_date_with_showtimes_ordered(
+        self, session: Session, finder: AsyncSqlModelMovieFinder
+    ) -> None:
+        (
+            SqlModelMovieBuilder(session)
+            .with_id(UUID("ec725625-f502-4d39-9401-a415d8c1f964"))
+            .with_showtime(
+                id=UUID("ebdd7b54-c561-4cbb-a55f-15853c60e601"),
+                show_datetime=datetime(2023, 4, 3, 23, 0, tzinfo=timezone.utc),
+            )
+            .with_showtime(
+                id=UUID("cbdd7b54-c561-4cbb-a55f-15853c60e601"),
+                show_datetime=datetime(2023, 4, 3, 22, 0, tzinfo=timezone.utc),
+            )
+            .build()
+        )
+
+        session.commit()
+
+        movies = await finder.find_movies_by_showtime_date(showtime_date=Date.from_datetime_date(date(2023, 4, 3)))
+
+        assert movies == [
+            Movie(
+                id=Id("ec725625-f502-4d39-9401-a415d8c1f964"),
+                title="Deadpool & Wolverine",
+                description="Deadpool and a variant of Wolverine.",
+                poster_image="deadpool_and_wolverine.jpg",
+                genres=MovieGenres([]),
+                showtimes=MovieShowtimes(
+                    [
+                        MovieShowtime(
+                            id=Id("cbdd7b54-c561-4cbb-a55f-15853c60e601"),
+                            show_datetime=DateTime.from_datetime(datetime(2023, 4, 3, 22, 0)),
+                        ),
+                        MovieShowtime(
+                            id=Id("ebdd7b54-c561-4cbb-a55f-15853c60e601"),
+                            show_datetime=DateTime.from_datetime(datetime(2023, 4, 3, 23, 0)),
+                        ),
+                    ],
+                ),
+            ),
+        ]
+
+    @pytest.mark.anyio
+    async def test_find_movies_by_showtime_date_and_genre(
+        self, session: Session, finder: AsyncSqlModelMovieFinder
+    ) -> None:
+        action_genre = SqlModelGenreMother(session).create()
+        comedy_genre = (
+            SqlModelGenreMother(session)
+            .with_id(UUID("d108f84b-3568-446b-896c-3ba2bc74cda9"))
+            .with_name("Comedy")
+            .create()
+        )
+        (
+            SqlModelMovieBuilder(session)
+            .with_id(UUID("ec725625-f502-4d39-9401-a415d8c1f964"))
+            .with_genre(action_genre)
+            .with_genre(comedy_genre)
+            .with_showtime(
+                id=UUID("cbdd7b54-c561-4cbb-a55f-15853c60e601"),
+                show_datetime=datetime(2023, 4, 3, 22, 0, tzinfo=timezone.utc),
+            )
+            .build()
+        )
+        (
+            SqlModelMovieBuilder(session)
+            .with_id(UUID("fc725625-f502-4d39-9401-a415d8c1f964"))
+            .with_genre(comedy_genre)
+            .with_showtime(
+                id=UUID("dbdd7b54-c561-4cbb-a55f-15853c60e601"),
+                show_datetime=datetime(2023, 4, 3, 23, 0, tzinfo=timezone.utc),
+            )
+            .build()
+        )
+        (
+            SqlModelMovieBuilder(session)
+            .with_id(UUID("ac725625-f502-4d39-9401-a415d8c1f964"))
+            .with_genre(action_genre)
+            .with_showtime(
+                id=UUID("abdd7b54-c561-4cbb-a55f-15853c60e601"),
+                show_datetime=datetime(2023, 4, 4, 22, 0, tzinfo=timezone.utc),
+            )
+            .build()
+        )
+        session.commit()
+
+        movies = await finder.find_movies_by_showtime_date_and_genre(
+            showtime_date=Date.from_datetime_date(date(2023, 4, 3)),
+            genre_id=Id("393210d5-80ce-4d03-b896-5d89f15aa77a"),
+        )
+
+        assert movies == [
+            Movie(
+                id=Id("ec725625-f502-4d39-9401-a415d8c1f964"),
+                title="Deadpool & Wolverine",
+                description="Deadpool and a variant of Wolverine.",
+                poster_image="deadpool_and_wolverine.jpg",
+                genres=MovieGenres(
+                    [
+                        Genre(id=Id("393210d5-80ce-4d03-b896-5d89f15aa77a"), name="Action"),
+                        Genre(id=Id("d108f84b-3568-446b-896c-3ba2bc74cda9"), name="Comedy"),
+                    ]
+                ),
+                showtimes=MovieShowtimes(
+                    [
+                        MovieShowtime(
+                            id=Id("cbdd7b54-c561-4cbb-a55f-15853c60e601"),
+                            show_datetime=DateTime.from_datetime(datetime(2023, 4, 3, 22, 0)),
+                        ),
+                    ],
+                ),
+            ),
+        ]
+
+    @pytest.mark.anyio
+    async def test_find_movies_by_showtime_date_and_genre_when_genre_is_not_associated_to_any_movie(
+        self, session: Session, finder: AsyncSqlModelMovieFinder
+    ) -> None:
+        SqlModelGenreMother(session).create()
+        (
+            SqlModelMovieBuilder(session)
+            .with_showtime(show_datetime=datetime(2023, 4, 3, 22, 0, tzinfo=timezone.utc))
+            .build()
+        )
+        session.commit()
+
+        movies = await finder.find_movies_by_showtime_date_and_genre(
+            showtime_date=Date.from_datetime_date(date(2023, 4, 3)),
+            genre_id=Id("393210d5-80ce-4d03-b896-5d89f15aa77a"),
+        )
+
+        assert movies == []
+
+    @pytest.mark.anyio
+    async def test_find_movies_by_showtime_date_includes_whole_day_only(
+        self, session: Session, finder: AsyncSqlModelMovieFinder
+    ) -> None:
+        (
+            SqlModelMovieBuilder(session)
+            .with_id(UUID("ec725625-f502-4d39-9401-a415d8c1f964"))
+            .with_showtime(
+                id=UUID("abdd7b54-c561-4cbb-a55f-15853c60e601"),
+                show_datetime=datetime(2023, 4, 2, 23, 59, 59, tzinfo=timezone.utc),
+            )
+            .with_showtime(
+                id=UUID("bbdd7b54-c561-4cbb-a55f-15853c60e601"),
+                show_datetime=datetime(2023, 4, 3, 0, 0, tzinfo=timezone.utc),
+            )
+            .with_showtime(
+                id=UUID("cbdd7b54-c561-4cbb-a55f-15853c60e601"),
+                show_datetime=datetime(2023, 4, 3, 23, 59, 59, tzinfo=timezone.utc),
+            )
+            .with_showtime(
+                id=UUID("dbdd7b54-c561-4cbb-a55f-15853c60e601"),
+                show_datetime=datetime(2023, 4, 4, 0, 0, tzinfo=timezone.utc),
+            )
+            .build()
+        )
+        session.commit()
+
+        movies = await finder.find_movies_by_showtime_date(showtime_date=Date.from_datetime_date(date(2023, 4, 3)))
+
+        assert movies[0].showtimes == MovieShowtimes(
+            [
+                MovieShowtime(
+                    id=Id("bbdd7b54-c561-4cbb-a55f-15853c60e601"),
+                    show_datetime=DateTime.from_datetime(datetime(2023, 4, 3, 0, 0)),
+                ),
+                MovieShowtime(
+                    id=Id("cbdd7b54-c561-4cbb-a55f-15853c60e601"),
+                    show_datetime=DateTime.from_datetime(datetime(2023, 4, 3, 23, 59, 59)),
+                ),
+            ]
+        )
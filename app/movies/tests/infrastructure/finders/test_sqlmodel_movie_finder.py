@@ -1,18 +1,13 @@
-from datetime import date, datetime, timezone
 from uuid import UUID
 
 import pytest
 from sqlmodel import Session
 
 from app.movies.domain.collections.movie_genres import MovieGenres
-from app.movies.domain.collections.movie_showtimes import MovieShowtimes
 from app.movies.domain.genre import Genre
 from app.movies.domain.movie import Movie
-from app.movies.domain.movie_showtime import MovieShowtime
 from app.movies.infrastructure.finders.sqlmodel_movie_finder import SqlModelMovieFinder
 from app.movies.tests.infrastructure.mothers.sqlmodel_genre_mother import SqlModelGenreMother
-from app.shared.domain.value_objects.date import Date
-from app.shared.domain.value_objects.date_time import DateTime
 from app.shared.domain.value_objects.id import Id
 from app.shared.tests.infrastructure.builders.sqlmodel_movie_builder import SqlModelMovieBuilder
 
@@ -39,178 +34,3 @@ class TestSqlModelMovieFinder:
             poster_image="deadpool_and_wolverine.jpg",
             genres=MovieGenres([Genre(id=Id("393210d5-80ce-4d03-b896-5d89f15aa77a"), name="Action")]),
         )
-
-    def test_find_movie_by_showtime_date(self, session: Session, finder: SqlModelMovieFinder) -> None:
-        (
-            SqlModelMovieBuilder(session)
-            .with_id(UUID("ec725625-f502-4d39-9401-a415d8c1f964"))
-            .with_showtime(
-                id=UUID("ebdd7b54-c561-4cbb-a55f-15853c60e601"),
-                show_datetime=datetime(2023, 4, 3, 23, 0, tzinfo=timezone.utc),
-            )
-            .with_showtime(
-                id=UUID("cbdd7b54-c561-4cbb-a55f-15853c60e601"),
-                show_datetime=datetime(2023, 4, 3, 22, 0, tzinfo=timezone.utc),
-            )
-            .with_showtime(
-                id=UUID("dbdd7b54-c561-4cbb-a55f-15853c60e601"),
-                show_datetime=datetime(2023, 4, 4, 22, 0, tzinfo=timezone.utc),
-            )
-            .build()
-        )
-
-        movie = finder.find_movie_by_showtime_date(
-            movie_id=Id("ec725625-f502-4d39-9401-a415d8c1f964"),
-            showtime_date=Date.from_datetime_date(date(2023, 4, 3)),
-        )
-
-        assert movie == Movie(
-            id=Id("ec725625-f502-4d39-9401-a415d8c1f964"),
-            title="Deadpool & Wolverine",
-            description="Deadpool and a variant of Wolverine.",
-            poster_image="deadpool_and_wolverine.jpg",
-            genres=MovieGenres([]),
-            showtimes=MovieShowtimes(
-                [
-                    MovieShowtime(
-                        id=Id("cbdd7b54-c561-4cbb-a55f-15853c60e601"),
-                        show_datetime=DateTime.from_datetime(datetime(2023, 4, 3, 22, 0)),
-                    ),
-                    MovieShowtime(
-                        id=Id("ebdd7b54-c561-4cbb-a55f-15853c60e601"),
-                        show_datetime=DateTime.from_datetime(datetime(2023, 4, 3, 23, 0)),
-                    ),
-                ]
-            ),
-        )
-
-    def test_find_movie_by_showtime_date_when_does_not_exist(self, finder: SqlModelMovieFinder) -> None:
-        movie = finder.find_movie_by_showtime_date(
-            movie_id=Id("ec725625-f502-4d39-9401-a415d8c1f964"),
-            showtime_date=Date.from_datetime_date(date(2023, 4, 3)),
-        )
-
-        assert movie is None
-
-    def test_find_movies_by_showtime_date(self, session: Session, finder: SqlModelMovieFinder) -> None:
-        (
-            SqlModelMovieBuilder(session)
-            .with_id(UUID("ec725625-f502-4d39-9401-a415d8c1f964"))
-            .with_showtime(
-                id=UUID("cbdd7b54-c561-4cbb-a55f-15853c60e601"),
-                show_datetime=datetime(2023, 4, 3, 22, 0, tzinfo=timezone.utc),
-            )
-            .build()
-        )
-        (
-            SqlModelMovieBuilder(session)
-            .with_id(UUID("fc725625-f502-4d39-9401-a415d8c1f964"))
-            .with_showtime(
-                id=UUID("dbdd7b54-c561-4cbb-a55f-15853c60e601"),
-                show_datetime=datetime(2023, 4, 4, 22, 0, tzinfo=timezone.utc),
-            )
-            .build()
-        )
-
-        movies = finder.find_movies_by_showtime_date(showtime_date=Date.from_datetime_date(date(2023, 4, 3)))
-
-        assert movies == [
-            Movie(
-                id=Id("ec725625-f502-4d39-9401-a415d8c1f964"),
-                title="Deadpool & Wolverine",
-                description="Deadpool and a variant of Wolverine.",
-                poster_image="deadpool_and_wolverine.jpg",
-                genres=MovieGenres([]),
-                showtimes=MovieShowtimes(
-                    [
-                        MovieShowtime(
-                            id=Id("cbdd7b54-c561-4cbb-a55f-15853c60e601"),
-                            show_datetime=DateTime.from_datetime(datetime(2023, 4, 3, 22, 0)),
-                        ),
-                    ],
-                ),
-            ),
-        ]
-
-    def test_find_movies_by_showtime_date_with_showtimes_on_date(
-        self, session: Session, finder: SqlModelMovieFinder
-    ) -> None:
-        (
-            SqlModelMovieBuilder(session)
-            .with_id(UUID("ec725625-f502-4d39-9401-a415d8c1f964"))
-            .with_showtime(
-                id=UUID("cbdd7b54-c561-4cbb-a55f-15853c60e601"),
-                show_datetime=datetime(2023, 4, 3, 22, 0, tzinfo=timezone.utc),
-            )
-            .build()
-        )
-        (
-            SqlModelMovieBuilder(session)
-            .with_id(UUID("fc725625-f502-4d39-9401-a415d8c1f964"))
-            .with_showtime(
-                id=UUID("dbdd7b54-c561-4cbb-a55f-15853c60e601"),
-                show_datetime=datetime(2023, 4, 4, 22, 0, tzinfo=timezone.utc),
-            )
-            .build()
-        )
-
-        movies = finder.find_movies_by_showtime_date(showtime_date=Date.from_datetime_date(date(2023, 4, 3)))
-
-        assert movies == [
-            Movie(
-                id=Id("ec725625-f502-4d39-9401-a415d8c1f964"),
-                title="Deadpool & Wolverine",
-                description="Deadpool and a variant of Wolverine.",
-                poster_image="deadpool_and_wolverine.jpg",
-                genres=MovieGenres([]),
-                showtimes=MovieShowtimes(
-                    [
-                        MovieShowtime(
-                            id=Id("cbdd7b54-c561-4cbb-a55f-15853c60e601"),
-                            show_datetime=DateTime.from_datetime(datetime(2023, 4, 3, 22, 0)),
-                        ),
-                    ],
-                ),
-            ),
-        ]
-
-    def test_find_movies_by_showtime_date_with_showtimes_ordered(
-        self, session: Session, finder: SqlModelMovieFinder
-    ) -> None:
-        (
-            SqlModelMovieBuilder(session)
-            .with_id(UUID("ec725625-f502-4d39-9401-a415d8c1f964"))
-            .with_showtime(
-                id=UUID("ebdd7b54-c561-4cbb-a55f-15853c60e601"),
-                show_datetime=datetime(2023, 4, 3, 23, 0, tzinfo=timezone.utc),
-            )
-            .with_showtime(
-                id=UUID("cbdd7b54-c561-4cbb-a55f-15853c60e601"),
-                show_datetime=datetime(2023, 4, 3, 22, 0, tzinfo=timezone.utc),
-            )
-            .build()
-        )
-
-        movies = finder.find_movies_by_showtime_date(showtime_date=Date.from_datetime_date(date(2023, 4, 3)))
-
-        assert movies == [
-            Movie(
-                id=Id("ec725625-f502-4d39-9401-a415d8c1f964"),
-                title="Deadpool & Wolverine",
-                description="Deadpool and a variant of Wolverine.",
-                poster_image="deadpool_and_wolverine.jpg",
-                genres=MovieGenres([]),
-                showtimes=MovieShowtimes(
-                    [
-                        MovieShowtime(
-                            id=Id("cbdd7b54-c561-4cbb-a55f-15853c60e601"),
-                            show_datetime=DateTime.from_datetime(datetime(2023, 4, 3, 22, 0)),
-                        ),
-                        MovieShowtime(
-                            id=Id("ebdd7b54-c561-4cbb-a55f-15853c60e601"),
-                            show_datetime=DateTime.from_datetime(datetime(2023, 4, 3, 23, 0)),
-                        ),
-                    ],
-                ),
-            ),
-        ]
@@ -0,0 +1,28 @@
+import logging
+from dataclasses import dataclass
+
+from app.shared.domain.clients.payment_client import PaymentClient
+from app.shared.domain.exceptions import PaymentCancellationError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CancelPaymentIntentParams:
+    reservation_id: str
+    provider_payment_id: str
+
+
+class CancelPaymentIntent:
+    def __init__(self, payment_client: PaymentClient) -> None:
+        self._payment_client = payment_client
+
+    def execute(self, params: CancelPaymentIntentParams) -> None:
+        try:
+            self._payment_client.cancel_payment_intent(payment_id=params.provider_payment_id)
+        except PaymentCancellationError:
+            logger.error(
+                "Cancelling payment intent for expired reservation failed",
+                extra={"reservation_id": params.reservation_id, "payment_id": params.provider_payment_id},
+            )
+            raise
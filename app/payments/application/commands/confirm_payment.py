@@ -1,9 +1,14 @@
+import logging
 from dataclasses import dataclass
 
 from app.payments.domain.exceptions import ReservationNotFound
 from app.payments.domain.finders.reservation_finder import ReservationFinder
+from app.payments.domain.repositories.payment_event_repository import PaymentEventRepository
 from app.payments.domain.repositories.reservation_repository import ReservationRepository
 from app.shared.domain.clients.payment_client import PaymentClient
+from app.shared.domain.schedulers.expiry_scheduler import ExpiryScheduler
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass(frozen=True)
@@ -17,11 +22,15 @@ class ConfirmPayment:
         self,
         reservation_finder: ReservationFinder,
         reservation_repository: ReservationRepository,
+        payment_event_repository: PaymentEventRepository,
         payment_client: PaymentClient,
+        expiry_scheduler: ExpiryScheduler,
     ):
         self._reservation_finder = reservation_finder
         self._reservation_repository = reservation_repository
+        self._payment_event_repository = payment_event_repository
         self._payment_client = payment_client
+        self._expiry_scheduler = expiry_scheduler
 
     def execute(self, params: ConfirmPaymentParams) -> None:
         payment_event = self._payment_client.verify_payment(payload=params.payload, signature=params.signature)
@@ -29,10 +38,24 @@ class ConfirmPayment:
         if not payment_event.was_successful():
             return
 
+        if not self._payment_event_repository.add(event_id=payment_event.id):
+            return
+
         reservation = self._reservation_finder.find_by_payment_id(provider_payment_id=payment_event.payment_intent_id)
 
         if not reservation:
             raise ReservationNotFound()
 
+        if not reservation.is_pending():
+            if not reservation.is_confirmed():
+                logger.warning(
+                    "Payment %s matched %s reservation %s",
+                    payment_event.payment_intent_id,
+                    reservation.status,
+                    reservation.id.value,
+                )
+            return
+
         reservation.confirm()
         self._reservation_repository.update(reservation=reservation)
+        self._expiry_scheduler.discard(id=reservation.id)
@@ -0,0 +1,49 @@
+import logging
+
+from app.payments.domain.repositories.payment_event_inbox_repository import PaymentEventInboxRepository
+from app.payments.domain.repositories.payment_event_repository import PaymentEventRepository
+from app.payments.domain.repositories.reservation_repository import ReservationRepository
+from app.shared.domain.schedulers.expiry_scheduler import ExpiryScheduler
+
+logger = logging.getLogger(__name__)
+
+
+class ConfirmPayments:
+    def __init__(
+        self,
+        inbox: PaymentEventInboxRepository,
+        reservation_repository: ReservationRepository,
+        payment_event_repository: PaymentEventRepository,
+        expiry_scheduler: ExpiryScheduler,
+    ) -> None:
+        self._inbox = inbox
+        self._reservation_repository = reservation_repository
+        self._payment_event_repository = payment_event_repository
+        self._expiry_scheduler = expiry_scheduler
+
+    def execute(self, limit: int) -> int:
+        payment_events = self._inbox.take(limit=limit)
+        if not payment_events:
+            return 0
+
+        new_event_ids = set(
+            self._payment_event_repository.add_all(event_ids=[payment_event.id for payment_event in payment_events])
+        )
+        provider_payment_ids = [
+            payment_event.payment_intent_id for payment_event in payment_events if payment_event.id in new_event_ids
+        ]
+        if not provider_payment_ids:
+            return len(payment_events)
+
+        confirmed_ids = self._reservation_repository.confirm_many(provider_payment_ids=provider_payment_ids)
+        unmatched_payment_ids = [
+            provider_payment_id
+            for provider_payment_id in provider_payment_ids
+            if provider_payment_id not in confirmed_ids
+        ]
+        if unmatched_payment_ids:
+            logger.warning("Payments matched no pending reservation: %s", ", ".join(unmatched_payment_ids))
+
+        for reservation_id in confirmed_ids.values():
+            self._expiry_scheduler.discard(id=reservation_id)
+        return len(payment_events)
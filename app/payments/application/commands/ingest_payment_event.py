@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+
+from app.payments.domain.repositories.async_payment_event_inbox_repository import AsyncPaymentEventInboxRepository
+from app.shared.domain.clients.payment_client import PaymentClient
+
+
+@dataclass(frozen=True)
+class IngestPaymentEventParams:
+    signature: str
+    payload: bytes
+
+
+class IngestPaymentEvent:
+    def __init__(self, payment_client: PaymentClient, inbox: AsyncPaymentEventInboxRepository) -> None:
+        self._payment_client = payment_client
+        self._inbox = inbox
+
+    async def execute(self, params: IngestPaymentEventParams) -> None:
+        payment_event = self._payment_client.verify_payment(payload=params.payload, signature=params.signature)
+
+        if not payment_event.was_successful():
+            return
+
+        await self._inbox.add(payment_event=payment_event)
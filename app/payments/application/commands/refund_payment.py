@@ -33,7 +33,7 @@ class RefundPayment:
                 "Refunding payment for reservation failed",
                 extra={"reservation_id": params.reservation_id, "payment_id": params.provider_payment_id},
             )
-            return
+            raise
 
         self._reservation_repository.update(
             reservation=Reservation.update_status(id=params.reservation_id, status=ReservationStatus.REFUNDED)
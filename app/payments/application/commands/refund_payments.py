@@ -0,0 +1,52 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from app.payments.application.commands.refund_payment import RefundPaymentParams
+from app.payments.domain.repositories.reservation_repository import ReservationRepository
+from app.payments.domain.reservation import Reservation
+from app.shared.domain.clients.payment_client import PaymentClient
+from app.shared.domain.exceptions import RefundError
+from app.shared.domain.value_objects.reservation_status import ReservationStatus
+
+logger = logging.getLogger(__name__)
+
+
+class RefundPayments:
+    def __init__(
+        self, payment_client: PaymentClient, reservation_repository: ReservationRepository, concurrency: int
+    ) -> None:
+        self._payment_client = payment_client
+        self._reservation_repository = reservation_repository
+        self._concurrency = concurrency
+
+    def execute(self, params: list[RefundPaymentParams]) -> list[RefundPaymentParams]:
+        if not params:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(self._concurrency, len(params))) as executor:
+            refunded = list(executor.map(self._refund, params))
+
+        self._reservation_repository.update_all(
+            reservations=[
+                Reservation.update_status(id=refund.reservation_id, status=ReservationStatus.REFUNDED)
+                for refund, succeeded in zip(params, refunded, strict=True)
+                if succeeded
+            ]
+        )
+        return [refund for refund, succeeded in zip(params, refunded, strict=True) if not succeeded]
+
+    def _refund(self, params: RefundPaymentParams) -> bool:
+        try:
+            self._payment_client.refund_payment(payment_id=params.provider_payment_id)
+        except RefundError:
+            logger.error(
+                "Refunding payment for reservation failed",
+                extra={"reservation_id": params.reservation_id, "payment_id": params.provider_payment_id},
+            )
+            return False
+
+        logger.info(
+            "Refunding payment for reservation succeeded",
+            extra={"reservation_id": params.reservation_id, "payment_id": params.provider_payment_id},
+        )
+        return True
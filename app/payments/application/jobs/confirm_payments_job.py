@@ -0,0 +1,50 @@
+import logging
+
+from app.database import get_session
+from app.payments.application.commands.confirm_payments import ConfirmPayments
+from app.payments.infrastructure.caches.processed_payment_event_cache import processed_payment_event_cache
+from app.payments.infrastructure.metrics.payment_event_metrics import payment_event_metrics
+from app.payments.infrastructure.repositories.cached_payment_event_repository import CachedPaymentEventRepository
+from app.payments.infrastructure.repositories.sqlmodel_payment_event_inbox_repository import (
+    SqlModelPaymentEventInboxRepository,
+)
+from app.payments.infrastructure.repositories.sqlmodel_payment_event_repository import SqlModelPaymentEventRepository
+from app.payments.infrastructure.repositories.sqlmodel_reservation_repository import SqlModelReservationRepository
+from app.reservations.infrastructure.schedulers.reservation_expiry_scheduler import reservation_expiry_scheduler
+from app.settings import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+def confirm_payments_job() -> int:
+    batch_size = settings.PAYMENT_INBOX_BATCH_SIZE
+
+    processed = 0
+    while True:
+        with get_session() as session:
+            taken = ConfirmPayments(
+                inbox=SqlModelPaymentEventInboxRepository(session),
+                reservation_repository=SqlModelReservationRepository(session),
+                payment_event_repository=CachedPaymentEventRepository(
+                    repository=SqlModelPaymentEventRepository(session),
+                    cache=processed_payment_event_cache,
+                    metrics=payment_event_metrics,
+                ),
+                expiry_scheduler=reservation_expiry_scheduler,
+            ).execute(limit=batch_size)
+        processed += taken
+        if taken < batch_size:
+            break
+
+    if processed:
+        stats = payment_event_metrics.snapshot()
+        logger.info(
+            "Processed %d payment events duplicate_rate=%.2f (%d/%d, %d cached)",
+            processed,
+            stats.duplicate_rate,
+            stats.duplicates,
+            stats.received,
+            stats.cached_duplicates,
+        )
+    return processed
@@ -0,0 +1,15 @@
+from app.payments.application.commands.cancel_payment_intent import CancelPaymentIntent, CancelPaymentIntentParams
+from app.reservations.domain.events import ReservationExpired
+from app.shared.domain.events.event_subscriber import EventSubscriber
+from app.shared.infrastructure.clients.stripe_client import stripe_client
+
+
+class CancelPaymentWhenReservationExpired(EventSubscriber[ReservationExpired]):
+    action: str = "cancel_payment"
+
+    def on(self, event: ReservationExpired) -> None:
+        CancelPaymentIntent(payment_client=stripe_client).execute(
+            params=CancelPaymentIntentParams(
+                reservation_id=event.reservation_id, provider_payment_id=event.provider_payment_id
+            )
+        )
@@ -1,25 +1,37 @@
 from app.database import get_session
-from app.payments.application.commands.refund_payment import RefundPayment, RefundPaymentParams
+from app.payments.application.commands.refund_payment import RefundPaymentParams
+from app.payments.application.commands.refund_payments import RefundPayments
 from app.payments.infrastructure.repositories.sqlmodel_reservation_repository import SqlModelReservationRepository
 from app.reservations.domain.events import ReservationCancelled
-from app.shared.domain.events.event_subscriber import EventSubscriber
-from app.shared.infrastructure.clients.stripe_client import StripeClient
+from app.settings import get_settings
+from app.shared.domain.events.batch_event_subscriber import BatchEventSubscriber
+from app.shared.infrastructure.clients.stripe_client import stripe_client
 
+settings = get_settings()
 
-class RefundWhenReservationCancelled(EventSubscriber[ReservationCancelled]):
+
+class RefundWhenReservationCancelled(BatchEventSubscriber[ReservationCancelled]):
     action: str = "refund"
+    batch_size: int = settings.REFUND_BATCH_SIZE
+    batch_timeout_seconds: float = settings.REFUND_BATCH_TIMEOUT_SECONDS
 
-    def on(self, event: ReservationCancelled) -> None:
-        if event.provider_payment_id is None:
-            return
+    def on_batch(self, events: list[ReservationCancelled]) -> list[ReservationCancelled]:
+        refunds = {
+            event.reservation_id: RefundPaymentParams(
+                reservation_id=event.reservation_id, provider_payment_id=event.provider_payment_id
+            )
+            for event in events
+            if event.provider_payment_id is not None
+        }
+        if not refunds:
+            return []
 
         with get_session() as session:
-            RefundPayment(
-                payment_client=StripeClient(),
+            failed = RefundPayments(
+                payment_client=stripe_client,
                 reservation_repository=SqlModelReservationRepository(session),
-            ).execute(
-                params=RefundPaymentParams(
-                    reservation_id=event.reservation_id,
-                    provider_payment_id=event.provider_payment_id,
-                )
-            )
+                concurrency=settings.REFUND_CONCURRENCY,
+            ).execute(params=list(refunds.values()))
+
+        failed_reservation_ids = {refund.reservation_id for refund in failed}
+        return [event for event in events if event.reservation_id in failed_reservation_ids]
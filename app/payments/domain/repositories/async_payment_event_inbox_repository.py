@@ -0,0 +1,7 @@
+from typing import Protocol
+
+from app.shared.domain.payment_event import PaymentEvent
+
+
+class AsyncPaymentEventInboxRepository(Protocol):
+    async def add(self, payment_event: PaymentEvent) -> None: ...
@@ -0,0 +1,7 @@
+from typing import Protocol
+
+from app.shared.domain.payment_event import PaymentEvent
+
+
+class PaymentEventInboxRepository(Protocol):
+    def take(self, limit: int) -> list[PaymentEvent]: ...
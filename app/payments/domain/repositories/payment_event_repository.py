@@ -0,0 +1,6 @@
+from typing import Protocol
+
+
+class PaymentEventRepository(Protocol):
+    def add(self, event_id: str) -> bool: ...
+    def add_all(self, event_ids: list[str]) -> list[str]: ...
@@ -1,7 +1,10 @@
 from typing import Protocol
 
 from app.payments.domain.reservation import Reservation
+from app.shared.domain.value_objects.id import Id
 
 
 class ReservationRepository(Protocol):
     def update(self, reservation: Reservation) -> None: ...
+    def update_all(self, reservations: list[Reservation]) -> None: ...
+    def confirm_many(self, provider_payment_ids: list[str]) -> dict[str, Id]: ...
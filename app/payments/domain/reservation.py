@@ -14,5 +14,11 @@ class Reservation:
     def update_status(cls, id: str, status: ReservationStatus) -> Self:
         return cls(id=Id(id), status=status)
 
+    def is_pending(self) -> bool:
+        return self.status == ReservationStatus.PENDING
+
+    def is_confirmed(self) -> bool:
+        return self.status == ReservationStatus.CONFIRMED
+
     def confirm(self) -> None:
         self.status = ReservationStatus.CONFIRMED
@@ -1,27 +1,62 @@
 from fastapi import APIRouter, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
 
-from app.api.deps import SessionDep
+from app.database import get_async_session, get_session
 from app.payments.application.commands.confirm_payment import ConfirmPayment, ConfirmPaymentParams
+from app.payments.application.commands.ingest_payment_event import IngestPaymentEvent, IngestPaymentEventParams
 from app.payments.domain.exceptions import InvalidSignature, ReservationNotFound
+from app.payments.infrastructure.caches.processed_payment_event_cache import processed_payment_event_cache
 from app.payments.infrastructure.finders.sqlmodel_reservation_finder import SqlModelReservationFinder
+from app.payments.infrastructure.metrics.payment_event_metrics import payment_event_metrics
+from app.payments.infrastructure.repositories.async_sqlmodel_payment_event_inbox_repository import (
+    AsyncSqlModelPaymentEventInboxRepository,
+)
+from app.payments.infrastructure.repositories.cached_payment_event_repository import CachedPaymentEventRepository
+from app.payments.infrastructure.repositories.sqlmodel_payment_event_repository import SqlModelPaymentEventRepository
 from app.payments.infrastructure.repositories.sqlmodel_reservation_repository import SqlModelReservationRepository
-from app.shared.infrastructure.clients.stripe_client import StripeClient
+from app.reservations.infrastructure.schedulers.reservation_expiry_scheduler import reservation_expiry_scheduler
+from app.settings import get_settings
+from app.shared.infrastructure.clients.stripe_client import stripe_client
+
+settings = get_settings()
 
 router = APIRouter()
 
 
 @router.post("/stripe/", status_code=status.HTTP_200_OK)
-async def stripe(request: Request, session: SessionDep) -> None:
+async def stripe(request: Request) -> None:
     try:
         payload = await request.body()
         signature = request.headers["stripe-signature"]
 
-        ConfirmPayment(
-            reservation_finder=SqlModelReservationFinder(session=session),
-            reservation_repository=SqlModelReservationRepository(session=session),
-            payment_client=StripeClient(),
-        ).execute(params=ConfirmPaymentParams(payload=payload, signature=signature))
+        if settings.PAYMENT_WEBHOOK_INGESTION:
+            await ingest_payment_event(payload=payload, signature=signature)
+        else:
+            await run_in_threadpool(confirm_payment, payload=payload, signature=signature)
     except InvalidSignature:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid signature")
     except ReservationNotFound:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Reservation not found")
+
+
+async def ingest_payment_event(payload: bytes, signature: str) -> None:
+    async with get_async_session() as session:
+        await IngestPaymentEvent(
+            payment_client=stripe_client,
+            inbox=AsyncSqlModelPaymentEventInboxRepository(session=session),
+        ).execute(params=IngestPaymentEventParams(payload=payload, signature=signature))
+
+
+def confirm_payment(payload: bytes, signature: str) -> None:
+    with get_session() as session:
+        ConfirmPayment(
+            reservation_finder=SqlModelReservationFinder(session=session),
+            reservation_repository=SqlModelReservationRepository(session=session),
+            payment_event_repository=CachedPaymentEventRepository(
+                repository=SqlModelPaymentEventRepository(session=session),
+                cache=processed_payment_event_cache,
+                metrics=payment_event_metrics,
+            ),
+            payment_client=stripe_client,
+            expiry_scheduler=reservation_expiry_scheduler,
+        ).execute(params=ConfirmPaymentParams(payload=payload, signature=signature))
@@ -0,0 +1,34 @@
+import threading
+from collections import OrderedDict
+
+from app.settings import get_settings
+
+settings = get_settings()
+
+
+class ProcessedPaymentEventCache:
+    def __init__(self, max_size: int) -> None:
+        self._max_size = max_size
+        self._event_ids: OrderedDict[str, None] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def contains(self, event_id: str) -> bool:
+        with self._lock:
+            if event_id not in self._event_ids:
+                return False
+            self._event_ids.move_to_end(event_id)
+            return True
+
+    def add(self, event_id: str) -> None:
+        with self._lock:
+            self._event_ids[event_id] = None
+            self._event_ids.move_to_end(event_id)
+            while len(self._event_ids) > self._max_size:
+                self._event_ids.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._event_ids.clear()
+
+
+processed_payment_event_cache = ProcessedPaymentEventCache(max_size=settings.PAYMENT_EVENT_CACHE_SIZE)
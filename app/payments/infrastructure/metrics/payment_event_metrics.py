@@ -0,0 +1,38 @@
+import threading
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class PaymentEventStats:
+    received: int
+    duplicates: int
+    cached_duplicates: int
+
+    @property
+    def duplicate_rate(self) -> float:
+        return self.duplicates / self.received if self.received else 0.0
+
+
+class PaymentEventMetrics:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._received = 0
+        self._duplicates = 0
+        self._cached_duplicates = 0
+
+    def record(self, duplicate: bool, cached: bool = False) -> None:
+        with self._lock:
+            self._received += 1
+            if duplicate:
+                self._duplicates += 1
+            if cached:
+                self._cached_duplicates += 1
+
+    def snapshot(self) -> PaymentEventStats:
+        with self._lock:
+            return PaymentEventStats(
+                received=self._received, duplicates=self._duplicates, cached_duplicates=self._cached_duplicates
+            )
+
+
+payment_event_metrics = PaymentEventMetrics()
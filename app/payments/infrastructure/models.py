@@ -0,0 +1,31 @@
+from datetime import datetime
+from typing import Self
+
+from sqlmodel import Field, SQLModel
+
+from app.shared.domain.payment_event import PaymentEvent
+from app.shared.domain.value_objects.date_time import DateTime
+
+
+class PaymentEventModel(SQLModel, table=True):
+    id: str = Field(primary_key=True)
+    processed_at: datetime
+
+
+class PaymentInboxEventModel(SQLModel, table=True):
+    id: str = Field(primary_key=True)
+    type: str
+    payment_intent_id: str
+    received_at: datetime = Field(index=True)
+
+    @classmethod
+    def from_domain(cls, payment_event: PaymentEvent) -> Self:
+        return cls(
+            id=payment_event.id,
+            type=payment_event.type,
+            payment_intent_id=payment_event.payment_intent_id,
+            received_at=DateTime.now().to_naive_utc(),
+        )
+
+    def to_domain(self) -> PaymentEvent:
+        return PaymentEvent(id=self.id, type=self.type, payment_intent_id=self.payment_intent_id)
@@ -0,0 +1,18 @@
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.payments.domain.repositories.async_payment_event_inbox_repository import AsyncPaymentEventInboxRepository
+from app.payments.infrastructure.models import PaymentInboxEventModel
+from app.shared.domain.payment_event import PaymentEvent
+from app.shared.infrastructure.repositories.async_sqlmodel_repository import AsyncSqlModelRepository
+
+
+class AsyncSqlModelPaymentEventInboxRepository(AsyncPaymentEventInboxRepository, AsyncSqlModelRepository):
+    async def add(self, payment_event: PaymentEvent) -> None:
+        inbox_event_model = PaymentInboxEventModel.from_domain(payment_event)
+        insert = postgresql.insert if self._session.get_bind().dialect.name == "postgresql" else sqlite.insert
+        await self._session.exec(  # type: ignore
+            insert(PaymentInboxEventModel)
+            .values(inbox_event_model.model_dump())
+            .on_conflict_do_nothing(index_elements=["id"])
+        )
+        await self._session.commit()
@@ -0,0 +1,40 @@
+from app.payments.domain.repositories.payment_event_repository import PaymentEventRepository
+from app.payments.infrastructure.caches.processed_payment_event_cache import ProcessedPaymentEventCache
+from app.payments.infrastructure.metrics.payment_event_metrics import PaymentEventMetrics
+
+
+class CachedPaymentEventRepository(PaymentEventRepository):
+    def __init__(
+        self, repository: PaymentEventRepository, cache: ProcessedPaymentEventCache, metrics: PaymentEventMetrics
+    ) -> None:
+        self._repository = repository
+        self._cache = cache
+        self._metrics = metrics
+
+    def add(self, event_id: str) -> bool:
+        if self._cache.contains(event_id):
+            self._metrics.record(duplicate=True, cached=True)
+            return False
+
+        added = self._repository.add(event_id)
+        if not added:
+            self._cache.add(event_id)
+        self._metrics.record(duplicate=not added)
+        return added
+
+    def add_all(self, event_ids: list[str]) -> list[str]:
+        uncached_ids = []
+        for event_id in event_ids:
+            if self._cache.contains(event_id):
+                self._metrics.record(duplicate=True, cached=True)
+            else:
+                uncached_ids.append(event_id)
+
+        added_ids = self._repository.add_all(uncached_ids) if uncached_ids else []
+        added_id_set = set(added_ids)
+        for event_id in uncached_ids:
+            added = event_id in added_id_set
+            if not added:
+                self._cache.add(event_id)
+            self._metrics.record(duplicate=not added)
+        return added_ids
@@ -0,0 +1,21 @@
+from sqlmodel import delete, select
+
+from app.payments.domain.repositories.payment_event_inbox_repository import PaymentEventInboxRepository
+from app.payments.infrastructure.models import PaymentInboxEventModel
+from app.shared.domain.payment_event import PaymentEvent
+from app.shared.infrastructure.repositories.sqlmodel_repository import SqlModelRepository
+
+
+class SqlModelPaymentEventInboxRepository(PaymentEventInboxRepository, SqlModelRepository):
+    def take(self, limit: int) -> list[PaymentEvent]:
+        inbox_event_models = self._session.exec(
+            select(PaymentInboxEventModel)
+            .order_by(PaymentInboxEventModel.received_at)  # type: ignore
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        ).all()
+
+        inbox_event_ids = [inbox_event_model.id for inbox_event_model in inbox_event_models]
+        if inbox_event_ids:
+            self._session.exec(delete(PaymentInboxEventModel).where(PaymentInboxEventModel.id.in_(inbox_event_ids)))  # type: ignore
+        return [inbox_event_model.to_domain() for inbox_event_model in inbox_event_models]
@@ -0,0 +1,27 @@
+from sqlalchemy.dialects import postgresql, sqlite
+
+from app.payments.domain.repositories.payment_event_repository import PaymentEventRepository
+from app.payments.infrastructure.models import PaymentEventModel
+from app.shared.domain.value_objects.date_time import DateTime
+from app.shared.infrastructure.repositories.sqlmodel_repository import SqlModelRepository
+
+
+class SqlModelPaymentEventRepository(PaymentEventRepository, SqlModelRepository):
+    def add(self, event_id: str) -> bool:
+        return self.add_all([event_id]) == [event_id]
+
+    def add_all(self, event_ids: list[str]) -> list[str]:
+        if not event_ids:
+            return []
+
+        insert = postgresql.insert if self._session.get_bind().dialect.name == "postgresql" else sqlite.insert
+        processed_at = DateTime.now().to_naive_utc()
+        inserted_ids = set(
+            self._session.exec(
+                insert(PaymentEventModel)
+                .values([{"id": event_id, "processed_at": processed_at} for event_id in dict.fromkeys(event_ids)])
+                .on_conflict_do_nothing(index_elements=["id"])
+                .returning(PaymentEventModel.id)  # type: ignore
+            ).scalars()
+        )
+        return [event_id for event_id in dict.fromkeys(event_ids) if event_id in inserted_ids]
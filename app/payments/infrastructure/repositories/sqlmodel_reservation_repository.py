@@ -1,8 +1,13 @@
-from sqlmodel import select
+from collections import defaultdict
+from uuid import UUID
+
+from sqlmodel import select, update
 
 from app.payments.domain.repositories.reservation_repository import ReservationRepository
 from app.payments.domain.reservation import Reservation
 from app.reservations.infrastructure.models import ReservationModel
+from app.shared.domain.value_objects.id import Id
+from app.shared.domain.value_objects.reservation_status import ReservationStatus
 from app.shared.infrastructure.repositories.sqlmodel_repository import SqlModelRepository
 
 
@@ -14,3 +19,37 @@ class SqlModelReservationRepository(ReservationRepository, SqlModelRepository):
         reservation_model.status = reservation.status.value
         self._session.add(reservation_model)
         self._session.commit()
+
+    def update_all(self, reservations: list[Reservation]) -> None:
+        if not reservations:
+            return
+
+        ids_by_status: defaultdict[ReservationStatus, list[UUID]] = defaultdict(list)
+        for reservation in reservations:
+            ids_by_status[reservation.status].append(reservation.id.to_uuid())
+
+        for status, reservation_ids in ids_by_status.items():
+            self._session.exec(
+                update(ReservationModel)
+                .where(ReservationModel.id.in_(reservation_ids))  # type: ignore
+                .values(status=status.value)
+            )
+        self._session.commit()
+
+    def confirm_many(self, provider_payment_ids: list[str]) -> dict[str, Id]:
+        if not provider_payment_ids:
+            return {}
+
+        confirmed_rows = self._session.exec(
+            update(ReservationModel)
+            .where(
+                ReservationModel.provider_payment_id.in_(provider_payment_ids),  # type: ignore
+                ReservationModel.status == ReservationStatus.PENDING.value,  # type: ignore
+            )
+            .values(status=ReservationStatus.CONFIRMED.value)
+            .returning(ReservationModel.provider_payment_id, ReservationModel.id)
+        ).all()
+        self._session.commit()
+        return {
+            provider_payment_id: Id.from_uuid(reservation_id) for provider_payment_id, reservation_id in confirmed_rows
+        }
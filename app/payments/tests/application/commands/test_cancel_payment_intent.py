@@ -0,0 +1,38 @@
+import logging
+from typing import Any
+from unittest.mock import Mock, create_autospec
+
+import pytest
+
+from app.payments.application.commands.cancel_payment_intent import CancelPaymentIntent, CancelPaymentIntentParams
+from app.shared.domain.clients.payment_client import PaymentClient
+from app.shared.domain.exceptions import PaymentCancellationError
+
+
+class TestCancelPaymentIntent:
+    @pytest.fixture
+    def mock_payment_client(self) -> Any:
+        return create_autospec(spec=PaymentClient, spec_set=True, instance=True)
+
+    def test_cancels_payment_intent(self, mock_payment_client: Mock) -> None:
+        CancelPaymentIntent(payment_client=mock_payment_client).execute(
+            params=CancelPaymentIntentParams(
+                reservation_id="5661455d-de5a-47ba-b99f-f6d50fdfc00b", provider_payment_id="test_payment_id"
+            )
+        )
+
+        mock_payment_client.cancel_payment_intent.assert_called_once_with(payment_id="test_payment_id")
+
+    def test_raises_when_cancellation_fails(self, mock_payment_client: Mock, caplog: pytest.LogCaptureFixture) -> None:
+        mock_payment_client.cancel_payment_intent.side_effect = PaymentCancellationError
+
+        with pytest.raises(PaymentCancellationError):
+            CancelPaymentIntent(payment_client=mock_payment_client).execute(
+                params=CancelPaymentIntentParams(
+                    reservation_id="5661455d-de5a-47ba-b99f-f6d50fdfc00b", provider_payment_id="test_payment_id"
+                )
+            )
+
+        assert caplog.records[0].levelno == logging.ERROR
+        assert caplog.records[0].message == "Cancelling payment intent for expired reservation failed"
+        assert caplog.records[0].payment_id == "test_payment_id"  # type: ignore
@@ -1,3 +1,4 @@
+import logging
 from typing import Any
 from unittest.mock import Mock, create_autospec
 
@@ -6,10 +7,12 @@ import pytest
 from app.payments.application.commands.confirm_payment import ConfirmPayment, ConfirmPaymentParams
 from app.payments.domain.exceptions import ReservationNotFound
 from app.payments.domain.finders.reservation_finder import ReservationFinder
+from app.payments.domain.repositories.payment_event_repository import PaymentEventRepository
 from app.payments.domain.repositories.reservation_repository import ReservationRepository
 from app.payments.domain.reservation import Reservation
 from app.shared.domain.clients.payment_client import PaymentClient
 from app.shared.domain.payment_event import PaymentEvent
+from app.shared.domain.schedulers.expiry_scheduler import ExpiryScheduler
 from app.shared.domain.value_objects.id import Id
 from app.shared.domain.value_objects.reservation_status import ReservationStatus
 
@@ -19,6 +22,12 @@ class TestConfirmPayment:
     def mock_reservation_repository(self) -> Any:
         return create_autospec(spec=ReservationRepository, spec_set=True, instance=True)
 
+    @pytest.fixture
+    def mock_payment_event_repository(self) -> Any:
+        mock_payment_event_repository = create_autospec(spec=PaymentEventRepository, spec_set=True, instance=True)
+        mock_payment_event_repository.add.return_value = True
+        return mock_payment_event_repository
+
     @pytest.fixture
     def mock_reservation_finder(self) -> Any:
         return create_autospec(spec=ReservationFinder, spec_set=True, instance=True)
@@ -27,10 +36,20 @@ class TestConfirmPayment:
     def mock_payment_client(self) -> Any:
         return create_autospec(spec=PaymentClient, spec_set=True, instance=True)
 
+    @pytest.fixture
+    def mock_expiry_scheduler(self) -> Any:
+        return create_autospec(spec=ExpiryScheduler, instance=True, spec_set=True)
+
     def test_confirms_reservation_when_payment_is_successful(
-        self, mock_payment_client: Mock, mock_reservation_repository: Mock, mock_reservation_finder: Mock
+        self,
+        mock_expiry_scheduler: Mock,
+        mock_payment_client: Mock,
+        mock_reservation_repository: Mock,
+        mock_payment_event_repository: Mock,
+        mock_reservation_finder: Mock,
     ) -> None:
         mock_payment_client.verify_payment.return_value = PaymentEvent(
+            id="evt_1",
             type="payment_intent.succeeded",
             payment_intent_id="test_provider_payment_id",
         )
@@ -42,7 +61,9 @@ class TestConfirmPayment:
         ConfirmPayment(
             reservation_finder=mock_reservation_finder,
             reservation_repository=mock_reservation_repository,
+            payment_event_repository=mock_payment_event_repository,
             payment_client=mock_payment_client,
+            expiry_scheduler=mock_expiry_scheduler,
         ).execute(
             params=ConfirmPaymentParams(payload=b'{"type": "payment_intent.succeeded"}', signature="test_signature")
         )
@@ -50,6 +71,7 @@ class TestConfirmPayment:
         mock_payment_client.verify_payment.assert_called_once_with(
             payload=b'{"type": "payment_intent.succeeded"}', signature="test_signature"
         )
+        mock_payment_event_repository.add.assert_called_once_with(event_id="evt_1")
         mock_reservation_finder.find_by_payment_id.assert_called_once_with(
             provider_payment_id="test_provider_payment_id"
         )
@@ -59,6 +81,7 @@ class TestConfirmPayment:
                 status=ReservationStatus.CONFIRMED,
             )
         )
+        mock_expiry_scheduler.discard.assert_called_once_with(id=Id("3b74494d-0a95-49b1-91ef-bb211f802961"))
 
     @pytest.mark.parametrize(
         "payment_event_type, payload",
@@ -70,13 +93,16 @@ class TestConfirmPayment:
     )
     def test_does_not_confirm_reservation_when_payment_is_not_successful(
         self,
+        mock_expiry_scheduler: Mock,
         mock_payment_client: Mock,
         mock_reservation_repository: Mock,
+        mock_payment_event_repository: Mock,
         mock_reservation_finder: Mock,
         payment_event_type: str,
         payload: bytes,
     ) -> None:
         mock_payment_client.verify_payment.return_value = PaymentEvent(
+            id="evt_1",
             type=payment_event_type,
             payment_intent_id="test_provider_payment_id",
         )
@@ -88,17 +114,27 @@ class TestConfirmPayment:
         ConfirmPayment(
             reservation_finder=mock_reservation_finder,
             reservation_repository=mock_reservation_repository,
+            payment_event_repository=mock_payment_event_repository,
             payment_client=mock_payment_client,
+            expiry_scheduler=mock_expiry_scheduler,
         ).execute(params=ConfirmPaymentParams(payload=payload, signature="test_signature"))
 
         mock_payment_client.verify_payment.assert_called_once_with(payload=payload, signature="test_signature")
+        mock_payment_event_repository.add.assert_not_called()
         mock_reservation_finder.find_by_payment_id.assert_not_called()
         mock_reservation_repository.update.assert_not_called()
+        mock_expiry_scheduler.discard.assert_not_called()
 
     def test_raises_reservation_not_found_exception_when_reservation_is_not_found(
-        self, mock_payment_client: Mock, mock_reservation_repository: Mock, mock_reservation_finder: Mock
+        self,
+        mock_expiry_scheduler: Mock,
+        mock_payment_client: Mock,
+        mock_reservation_repository: Mock,
+        mock_payment_event_repository: Mock,
+        mock_reservation_finder: Mock,
     ) -> None:
         mock_payment_client.verify_payment.return_value = PaymentEvent(
+            id="evt_1",
             type="payment_intent.succeeded",
             payment_intent_id="test_provider_payment_id",
         )
@@ -108,7 +144,98 @@ class TestConfirmPayment:
             ConfirmPayment(
                 reservation_finder=mock_reservation_finder,
                 reservation_repository=mock_reservation_repository,
+                payment_event_repository=mock_payment_event_repository,
                 payment_client=mock_payment_client,
+                expiry_scheduler=mock_expiry_scheduler,
             ).execute(
                 params=ConfirmPaymentParams(payload=b'{"type": "payment_intent.succeeded"}', signature="test_signature")
             )
+
+    def test_skips_duplicate_payment_event(
+        self,
+        mock_expiry_scheduler: Mock,
+        mock_payment_client: Mock,
+        mock_reservation_repository: Mock,
+        mock_payment_event_repository: Mock,
+        mock_reservation_finder: Mock,
+    ) -> None:
+        mock_payment_client.verify_payment.return_value = PaymentEvent(
+            id="evt_1", type="payment_intent.succeeded", payment_intent_id="test_provider_payment_id"
+        )
+        mock_payment_event_repository.add.return_value = False
+
+        ConfirmPayment(
+            reservation_finder=mock_reservation_finder,
+            reservation_repository=mock_reservation_repository,
+            payment_event_repository=mock_payment_event_repository,
+            payment_client=mock_payment_client,
+            expiry_scheduler=mock_expiry_scheduler,
+        ).execute(
+            params=ConfirmPaymentParams(payload=b'{"type": "payment_intent.succeeded"}', signature="test_signature")
+        )
+
+        mock_payment_event_repository.add.assert_called_once_with(event_id="evt_1")
+        mock_reservation_finder.find_by_payment_id.assert_not_called()
+        mock_reservation_repository.update.assert_not_called()
+        mock_expiry_scheduler.discard.assert_not_called()
+
+    def test_does_not_update_already_confirmed_reservation(
+        self,
+        mock_expiry_scheduler: Mock,
+        mock_payment_client: Mock,
+        mock_reservation_repository: Mock,
+        mock_payment_event_repository: Mock,
+        mock_reservation_finder: Mock,
+    ) -> None:
+        mock_payment_client.verify_payment.return_value = PaymentEvent(
+            id="evt_2", type="payment_intent.succeeded", payment_intent_id="test_provider_payment_id"
+        )
+        mock_reservation_finder.find_by_payment_id.return_value = Reservation(
+            id=Id("3b74494d-0a95-49b1-91ef-bb211f802961"), status=ReservationStatus.CONFIRMED
+        )
+
+        ConfirmPayment(
+            reservation_finder=mock_reservation_finder,
+            reservation_repository=mock_reservation_repository,
+            payment_event_repository=mock_payment_event_repository,
+            payment_client=mock_payment_client,
+            expiry_scheduler=mock_expiry_scheduler,
+        ).execute(
+            params=ConfirmPaymentParams(payload=b'{"type": "payment_intent.succeeded"}', signature="test_signature")
+        )
+
+        mock_reservation_repository.update.assert_not_called()
+        mock_expiry_scheduler.discard.assert_not_called()
+
+    def test_does_not_confirm_cancelled_reservation(
+        self,
+        caplog: pytest.LogCaptureFixture,
+        mock_expiry_scheduler: Mock,
+        mock_payment_client: Mock,
+        mock_reservation_repository: Mock,
+        mock_payment_event_repository: Mock,
+        mock_reservation_finder: Mock,
+    ) -> None:
+        mock_payment_client.verify_payment.return_value = PaymentEvent(
+            id="evt_3", type="payment_intent.succeeded", payment_intent_id="test_provider_payment_id"
+        )
+        mock_reservation_finder.find_by_payment_id.return_value = Reservation(
+            id=Id("3b74494d-0a95-49b1-91ef-bb211f802961"), status=ReservationStatus.CANCELLED
+        )
+
+        with caplog.at_level(logging.WARNING):
+            ConfirmPayment(
+                reservation_finder=mock_reservation_finder,
+                reservation_repository=mock_reservation_repository,
+                payment_event_repository=mock_payment_event_repository,
+                payment_client=mock_payment_client,
+                expiry_scheduler=mock_expiry_scheduler,
+            ).execute(
+                params=ConfirmPaymentParams(payload=b'{"type": "payment_intent.succeeded"}', signature="test_signature")
+            )
+
+        mock_reservation_repository.update.assert_not_called()
+        mock_expiry_scheduler.discard.assert_not_called()
+        assert caplog.messages == [
+            "Payment test_provider_payment_id matched cancelled reservation 3b74494d-0a95-49b1-91ef-bb211f802961"
+        ]
@@ -0,0 +1,123 @@
+import logging
+from typing import Any
+from unittest.mock import Mock, call, create_autospec
+
+import pytest
+
+from app.payments.application.commands.confirm_payments import ConfirmPayments
+from app.payments.domain.repositories.payment_event_inbox_repository import PaymentEventInboxRepository
+from app.payments.domain.repositories.payment_event_repository import PaymentEventRepository
+from app.payments.domain.repositories.reservation_repository import ReservationRepository
+from app.shared.domain.payment_event import PaymentEvent
+from app.shared.domain.schedulers.expiry_scheduler import ExpiryScheduler
+from app.shared.domain.value_objects.id import Id
+
+
+class TestConfirmPayments:
+    @pytest.fixture
+    def mock_inbox(self) -> Any:
+        return create_autospec(spec=PaymentEventInboxRepository, spec_set=True, instance=True)
+
+    @pytest.fixture
+    def mock_reservation_repository(self) -> Any:
+        return create_autospec(spec=ReservationRepository, spec_set=True, instance=True)
+
+    @pytest.fixture
+    def mock_payment_event_repository(self) -> Any:
+        return create_autospec(spec=PaymentEventRepository, spec_set=True, instance=True)
+
+    @pytest.fixture
+    def mock_expiry_scheduler(self) -> Any:
+        return create_autospec(spec=ExpiryScheduler, spec_set=True, instance=True)
+
+    @pytest.fixture
+    def confirm_payments(
+        self,
+        mock_inbox: Mock,
+        mock_reservation_repository: Mock,
+        mock_payment_event_repository: Mock,
+        mock_expiry_scheduler: Mock,
+    ) -> ConfirmPayments:
+        return ConfirmPayments(
+            inbox=mock_inbox,
+            reservation_repository=mock_reservation_repository,
+            payment_event_repository=mock_payment_event_repository,
+            expiry_scheduler=mock_expiry_scheduler,
+        )
+
+    def test_confirms_batch_of_reservations(
+        self,
+        confirm_payments: ConfirmPayments,
+        mock_inbox: Mock,
+        mock_reservation_repository: Mock,
+        mock_payment_event_repository: Mock,
+        mock_expiry_scheduler: Mock,
+    ) -> None:
+        mock_inbox.take.return_value = [
+            PaymentEvent(id="evt_1", type="payment_intent.succeeded", payment_intent_id="pi_1"),
+            PaymentEvent(id="evt_2", type="payment_intent.succeeded", payment_intent_id="pi_2"),
+            PaymentEvent(id="evt_3", type="payment_intent.succeeded", payment_intent_id="pi_3"),
+        ]
+        mock_payment_event_repository.add_all.return_value = ["evt_1", "evt_3"]
+        mock_reservation_repository.confirm_many.return_value = {"pi_1": Id("3b74494d-0a95-49b1-91ef-bb211f802961")}
+
+        processed = confirm_payments.execute(limit=10)
+
+        assert processed == 3
+        mock_inbox.take.assert_called_once_with(limit=10)
+        mock_payment_event_repository.add_all.assert_called_once_with(event_ids=["evt_1", "evt_2", "evt_3"])
+        mock_reservation_repository.confirm_many.assert_called_once_with(provider_payment_ids=["pi_1", "pi_3"])
+        assert mock_expiry_scheduler.discard.call_args_list == [call(id=Id("3b74494d-0a95-49b1-91ef-bb211f802961"))]
+
+    def test_warns_about_payments_without_pending_reservation(
+        self,
+        confirm_payments: ConfirmPayments,
+        mock_inbox: Mock,
+        mock_reservation_repository: Mock,
+        mock_payment_event_repository: Mock,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        mock_inbox.take.return_value = [
+            PaymentEvent(id="evt_1", type="payment_intent.succeeded", payment_intent_id="pi_1"),
+            PaymentEvent(id="evt_2", type="payment_intent.succeeded", payment_intent_id="pi_2"),
+            PaymentEvent(id="evt_3", type="payment_intent.succeeded", payment_intent_id="pi_3"),
+        ]
+        mock_payment_event_repository.add_all.return_value = ["evt_1", "evt_2", "evt_3"]
+        mock_reservation_repository.confirm_many.return_value = {"pi_2": Id("3b74494d-0a95-49b1-91ef-bb211f802961")}
+
+        with caplog.at_level(logging.WARNING):
+            confirm_payments.execute(limit=10)
+
+        assert caplog.messages == ["Payments matched no pending reservation: pi_1, pi_3"]
+
+    def test_skips_batch_of_duplicates(
+        self,
+        confirm_payments: ConfirmPayments,
+        mock_inbox: Mock,
+        mock_reservation_repository: Mock,
+        mock_payment_event_repository: Mock,
+        mock_expiry_scheduler: Mock,
+    ) -> None:
+        mock_inbox.take.return_value = [
+            PaymentEvent(id="evt_1", type="payment_intent.succeeded", payment_intent_id="pi_1")
+        ]
+        mock_payment_event_repository.add_all.return_value = []
+
+        processed = confirm_payments.execute(limit=10)
+
+        assert processed == 1
+        mock_reservation_repository.confirm_many.assert_not_called()
+        mock_expiry_scheduler.discard.assert_not_called()
+
+    def test_does_nothing_when_inbox_is_empty(
+        self,
+        confirm_payments: ConfirmPayments,
+        mock_inbox: Mock,
+        mock_reservation_repository: Mock,
+        mock_payment_event_repository: Mock,
+    ) -> None:
+        mock_inbox.take.return_value = []
+
+        assert confirm_payments.execute(limit=10) == 0
+        mock_payment_event_repository.add_all.assert_not_called()
+        mock_reservation_repository.confirm_many.assert_not_called()
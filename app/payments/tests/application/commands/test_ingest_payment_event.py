@@ -0,0 +1,61 @@
+from typing import Any
+from unittest.mock import Mock, create_autospec
+
+import pytest
+
+from app.payments.application.commands.ingest_payment_event import IngestPaymentEvent, IngestPaymentEventParams
+from app.payments.domain.exceptions import InvalidSignature
+from app.payments.domain.repositories.async_payment_event_inbox_repository import AsyncPaymentEventInboxRepository
+from app.shared.domain.clients.payment_client import PaymentClient
+from app.shared.domain.payment_event import PaymentEvent
+
+
+class TestIngestPaymentEvent:
+    @pytest.fixture
+    def mock_payment_client(self) -> Any:
+        return create_autospec(spec=PaymentClient, spec_set=True, instance=True)
+
+    @pytest.fixture
+    def mock_inbox(self) -> Any:
+        return create_autospec(spec=AsyncPaymentEventInboxRepository, spec_set=True, instance=True)
+
+    @pytest.mark.anyio
+    async def test_enqueues_successful_payment_event(self, mock_payment_client: Mock, mock_inbox: Mock) -> None:
+        payment_event = PaymentEvent(
+            id="evt_1", type="payment_intent.succeeded", payment_intent_id="pi_3MtwBwLkdIwHu7ix28a3tqPa"
+        )
+        mock_payment_client.verify_payment.return_value = payment_event
+
+        await IngestPaymentEvent(payment_client=mock_payment_client, inbox=mock_inbox).execute(
+            params=IngestPaymentEventParams(payload=b'{"type": "payment_intent.succeeded"}', signature="test_signature")
+        )
+
+        mock_payment_client.verify_payment.assert_called_once_with(
+            payload=b'{"type": "payment_intent.succeeded"}', signature="test_signature"
+        )
+        mock_inbox.add.assert_awaited_once_with(payment_event=payment_event)
+
+    @pytest.mark.anyio
+    async def test_does_not_enqueue_unsuccessful_payment_event(
+        self, mock_payment_client: Mock, mock_inbox: Mock
+    ) -> None:
+        mock_payment_client.verify_payment.return_value = PaymentEvent(
+            id="evt_1", type="payment_intent.payment_failed", payment_intent_id="pi_3MtwBwLkdIwHu7ix28a3tqPa"
+        )
+
+        await IngestPaymentEvent(payment_client=mock_payment_client, inbox=mock_inbox).execute(
+            params=IngestPaymentEventParams(payload=b"{}", signature="test_signature")
+        )
+
+        mock_inbox.add.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_raises_when_signature_is_invalid(self, mock_payment_client: Mock, mock_inbox: Mock) -> None:
+        mock_payment_client.verify_payment.side_effect = InvalidSignature
+
+        with pytest.raises(InvalidSignature):
+            await IngestPaymentEvent(payment_client=mock_payment_client, inbox=mock_inbox).execute(
+                params=IngestPaymentEventParams(payload=b"{}", signature="invalid_signature")
+            )
+
+        mock_inbox.add.assert_not_called()
@@ -46,16 +46,19 @@ class TestRefundPayment:
         assert caplog.records[0].reservation_id == "5661455d-de5a-47ba-b99f-f6d50fdfc00b"  # type: ignore
         assert caplog.records[0].payment_id == "test_payment_id"  # type: ignore
 
-    def test_does_not_refund_payment_when_refund_fails(
+    def test_raises_when_refund_fails(
         self, mock_payment_client: Mock, mock_reservation_repository: Mock, caplog: pytest.LogCaptureFixture
     ) -> None:
         mock_payment_client.refund_payment.side_effect = RefundError
 
-        RefundPayment(payment_client=mock_payment_client, reservation_repository=mock_reservation_repository).execute(
-            params=RefundPaymentParams(
-                reservation_id="5661455d-de5a-47ba-b99f-f6d50fdfc00b", provider_payment_id="test_payment_id"
+        with pytest.raises(RefundError):
+            RefundPayment(
+                payment_client=mock_payment_client, reservation_repository=mock_reservation_repository
+            ).execute(
+                params=RefundPaymentParams(
+                    reservation_id="5661455d-de5a-47ba-b99f-f6d50fdfc00b", provider_payment_id="test_payment_id"
+                )
             )
-        )
 
         mock_payment_client.refund_payment.assert_called_once_with(payment_id="test_payment_id")
         mock_reservation_repository.update.assert_not_called()
@@ -0,0 +1,68 @@
+from typing import Any
+from unittest.mock import Mock, create_autospec
+
+import pytest
+
+from app.payments.application.commands.refund_payment import RefundPaymentParams
+from app.payments.application.commands.refund_payments import RefundPayments
+from app.payments.domain.repositories.reservation_repository import ReservationRepository
+from app.payments.domain.reservation import Reservation
+from app.shared.domain.clients.payment_client import PaymentClient
+from app.shared.domain.exceptions import RefundError
+from app.shared.domain.value_objects.id import Id
+from app.shared.domain.value_objects.reservation_status import ReservationStatus
+
+
+class TestRefundPayments:
+    @pytest.fixture
+    def mock_payment_client(self) -> Any:
+        return create_autospec(spec=PaymentClient, spec_set=True, instance=True)
+
+    @pytest.fixture
+    def mock_reservation_repository(self) -> Any:
+        return create_autospec(spec=ReservationRepository, spec_set=True, instance=True)
+
+    def test_refunds_payments_and_marks_refunded_reservations_at_once(
+        self, mock_payment_client: Mock, mock_reservation_repository: Mock
+    ) -> None:
+        def refund_payment(payment_id: str) -> None:
+            if payment_id == "pi_failing":
+                raise RefundError()
+
+        mock_payment_client.refund_payment.side_effect = refund_payment
+
+        failed = RefundPayments(
+            payment_client=mock_payment_client, reservation_repository=mock_reservation_repository, concurrency=2
+        ).execute(
+            params=[
+                RefundPaymentParams(reservation_id="5661455d-de5a-47ba-b99f-f6d50fdfc00b", provider_payment_id="pi_1"),
+                RefundPaymentParams(
+                    reservation_id="ffd7e9f4-bec7-4487-8f2f-d84b49d0bcee", provider_payment_id="pi_failing"
+                ),
+                RefundPaymentParams(reservation_id="a41707bd-ae9c-43b8-bba5-8c4844e73e77", provider_payment_id="pi_3"),
+            ]
+        )
+
+        assert sorted(refund.kwargs["payment_id"] for refund in mock_payment_client.refund_payment.call_args_list) == [
+            "pi_1",
+            "pi_3",
+            "pi_failing",
+        ]
+        mock_reservation_repository.update_all.assert_called_once_with(
+            reservations=[
+                Reservation(id=Id("5661455d-de5a-47ba-b99f-f6d50fdfc00b"), status=ReservationStatus.REFUNDED),
+                Reservation(id=Id("a41707bd-ae9c-43b8-bba5-8c4844e73e77"), status=ReservationStatus.REFUNDED),
+            ]
+        )
+        assert failed == [
+            RefundPaymentParams(reservation_id="ffd7e9f4-bec7-4487-8f2f-d84b49d0bcee", provider_payment_id="pi_failing")
+        ]
+
+    def test_does_nothing_without_payments(self, mock_payment_client: Mock, mock_reservation_repository: Mock) -> None:
+        failed = RefundPayments(
+            payment_client=mock_payment_client, reservation_repository=mock_reservation_repository, concurrency=2
+        ).execute(params=[])
+
+        assert failed == []
+        mock_payment_client.refund_payment.assert_not_called()
+        mock_reservation_repository.update_all.assert_not_called()
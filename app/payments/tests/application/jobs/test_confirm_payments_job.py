@@ -0,0 +1,96 @@
+import logging
+from collections.abc import Generator
+from datetime import datetime
+from unittest.mock import Mock, call, patch
+
+import pytest
+from sqlmodel import Session, select
+
+from app.payments.application.jobs.confirm_payments_job import confirm_payments_job
+from app.payments.infrastructure.caches.processed_payment_event_cache import processed_payment_event_cache
+from app.payments.infrastructure.metrics.payment_event_metrics import PaymentEventStats
+from app.payments.infrastructure.models import PaymentEventModel, PaymentInboxEventModel
+from app.settings import Settings
+from app.shared.domain.value_objects.reservation_status import ReservationStatus
+from app.shared.tests.infrastructure.builders.sqlmodel_reservation_builder import SqlModelReservationBuilder
+
+
+class TestConfirmPaymentsJob:
+    @pytest.fixture
+    def mock_confirm_payments(self) -> Generator[Mock, None, None]:
+        with patch("app.payments.application.jobs.confirm_payments_job.ConfirmPayments") as mock:
+            yield mock.return_value
+
+    @pytest.fixture
+    def mock_db_session(self, session: Session) -> Generator[Session, None, None]:
+        with patch("app.payments.application.jobs.confirm_payments_job.get_session") as mock:
+            mock.return_value.__enter__.return_value = session
+            yield session
+
+    @pytest.fixture(autouse=True)
+    def override_settings(self) -> Generator[None, None, None]:
+        with patch("app.payments.application.jobs.confirm_payments_job.settings", Settings(PAYMENT_INBOX_BATCH_SIZE=2)):
+            yield
+
+    @pytest.fixture(autouse=True)
+    def clear_processed_payment_event_cache(self) -> Generator[None, None, None]:
+        yield
+        processed_payment_event_cache.clear()
+
+    @pytest.mark.integration
+    def test_integration(self, mock_db_session: Session) -> None:
+        reservation_model = (
+            SqlModelReservationBuilder(mock_db_session).with_provider_payment_id("pi_1").pending().build()
+        )
+        mock_db_session.add(
+            PaymentInboxEventModel(
+                id="evt_1",
+                type="payment_intent.succeeded",
+                payment_intent_id="pi_1",
+                received_at=datetime(2025, 1, 1, 10, 0, 0),
+            )
+        )
+        mock_db_session.commit()
+
+        processed = confirm_payments_job()
+
+        assert processed == 1
+        mock_db_session.refresh(reservation_model)
+        assert reservation_model.status == ReservationStatus.CONFIRMED.value
+        assert mock_db_session.exec(select(PaymentInboxEventModel)).all() == []
+        assert [model.id for model in mock_db_session.exec(select(PaymentEventModel)).all()] == ["evt_1"]
+
+    def test_confirms_batches_until_a_batch_is_not_full(
+        self, mock_db_session: Session, mock_confirm_payments: Mock
+    ) -> None:
+        mock_confirm_payments.execute.side_effect = [2, 2, 0]
+
+        processed = confirm_payments_job()
+
+        assert processed == 4
+        assert mock_confirm_payments.execute.call_args_list == [call(limit=2), call(limit=2), call(limit=2)]
+
+    def test_logs_duplicate_rate_after_processing(
+        self, mock_db_session: Session, mock_confirm_payments: Mock, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        mock_confirm_payments.execute.side_effect = [1]
+        stats = PaymentEventStats(received=4, duplicates=1, cached_duplicates=1)
+
+        with (
+            patch("app.payments.application.jobs.confirm_payments_job.payment_event_metrics") as mock_metrics,
+            caplog.at_level(logging.INFO),
+        ):
+            mock_metrics.snapshot.return_value = stats
+            confirm_payments_job()
+
+        assert "Processed 1 payment events duplicate_rate=0.25 (1/4, 1 cached)" in caplog.messages
+
+    def test_does_not_log_when_nothing_was_processed(
+        self, mock_db_session: Session, mock_confirm_payments: Mock, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        mock_confirm_payments.execute.side_effect = [0]
+
+        with caplog.at_level(logging.INFO):
+            confirm_payments_job()
+
+        assert caplog.messages == []
@@ -0,0 +1,44 @@
+from collections.abc import Generator
+from unittest.mock import Mock, patch
+
+import pytest
+
+from app.payments.application.commands.cancel_payment_intent import CancelPaymentIntentParams
+from app.payments.application.subscribers.cancel_payment_when_reservation_expired import (
+    CancelPaymentWhenReservationExpired,
+)
+from app.reservations.domain.events import ReservationExpired
+
+
+class TestCancelPaymentWhenReservationExpired:
+    @pytest.fixture
+    def mock_cancel_payment_intent(self) -> Generator[Mock, None, None]:
+        with patch(
+            "app.payments.application.subscribers.cancel_payment_when_reservation_expired.CancelPaymentIntent",
+            autospec=True,
+        ) as mock:
+            yield mock
+
+    @pytest.fixture
+    def mock_stripe_client(self) -> Generator[Mock, None, None]:
+        with patch(
+            "app.payments.application.subscribers.cancel_payment_when_reservation_expired.stripe_client"
+        ) as mock:
+            yield mock
+
+    def test_has_correct_event_class_and_action(self) -> None:
+        subscriber = CancelPaymentWhenReservationExpired()
+        assert subscriber.event_class == ReservationExpired
+        assert subscriber.action == "cancel_payment"
+
+    def test_cancels_payment_intent(self, mock_cancel_payment_intent: Mock, mock_stripe_client: Mock) -> None:
+        CancelPaymentWhenReservationExpired().on(
+            ReservationExpired(reservation_id="test_reservation_id", provider_payment_id="test_payment_id")
+        )
+
+        mock_cancel_payment_intent.assert_called_once_with(payment_client=mock_stripe_client)
+        mock_cancel_payment_intent.return_value.execute.assert_called_once_with(
+            params=CancelPaymentIntentParams(
+                reservation_id="test_reservation_id", provider_payment_id="test_payment_id"
+            )
+        )
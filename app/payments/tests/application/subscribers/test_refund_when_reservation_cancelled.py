@@ -6,14 +6,16 @@ import pytest
 from app.payments.application.commands.refund_payment import RefundPaymentParams
 from app.payments.application.subscribers.refund_when_reservation_cancelled import RefundWhenReservationCancelled
 from app.reservations.domain.events import ReservationCancelled
+from app.shared.domain.exceptions import EventHandlingFailed
 
 
 class TestRefundWhenReservationCancelled:
     @pytest.fixture
-    def mock_refund_payment(self) -> Generator[Mock, None, None]:
+    def mock_refund_payments(self) -> Generator[Mock, None, None]:
         with patch(
-            "app.payments.application.subscribers.refund_when_reservation_cancelled.RefundPayment", autospec=True
+            "app.payments.application.subscribers.refund_when_reservation_cancelled.RefundPayments", autospec=True
         ) as mock:
+            mock.return_value.execute.return_value = []
             yield mock
 
     @pytest.fixture
@@ -25,31 +27,68 @@ class TestRefundWhenReservationCancelled:
 
     @pytest.fixture
     def mock_stripe_client(self) -> Generator[Mock, None, None]:
-        with patch("app.payments.application.subscribers.refund_when_reservation_cancelled.StripeClient") as mock:
-            yield mock.return_value
+        with patch("app.payments.application.subscribers.refund_when_reservation_cancelled.stripe_client") as mock:
+            yield mock
 
     def test_has_correct_event_class_and_action(self) -> None:
         subscriber = RefundWhenReservationCancelled()
         assert subscriber.event_class == ReservationCancelled
         assert subscriber.action == "refund"
 
-    def test_calls_refund_payment(
-        self, mock_refund_payment: Mock, mock_stripe_client: Mock, mock_reservation_repository: Mock
+    def test_refunds_batch_of_payments(
+        self, mock_refund_payments: Mock, mock_stripe_client: Mock, mock_reservation_repository: Mock
     ) -> None:
-        RefundWhenReservationCancelled().on(
-            ReservationCancelled(reservation_id="test_reservation_id", provider_payment_id="test_payment_id")
+        failed = RefundWhenReservationCancelled().on_batch(
+            [
+                ReservationCancelled(reservation_id="reservation_1", provider_payment_id="pi_1"),
+                ReservationCancelled(reservation_id="reservation_2", provider_payment_id=None),
+                ReservationCancelled(reservation_id="reservation_3", provider_payment_id="pi_3"),
+                ReservationCancelled(reservation_id="reservation_1", provider_payment_id="pi_1"),
+            ]
         )
 
-        mock_refund_payment.assert_called_once_with(
-            payment_client=mock_stripe_client, reservation_repository=mock_reservation_repository
+        assert failed == []
+        mock_refund_payments.assert_called_once_with(
+            payment_client=mock_stripe_client, reservation_repository=mock_reservation_repository, concurrency=8
         )
-        mock_refund_payment.return_value.execute.assert_called_once_with(
-            RefundPaymentParams(reservation_id="test_reservation_id", provider_payment_id="test_payment_id")
+        mock_refund_payments.return_value.execute.assert_called_once_with(
+            params=[
+                RefundPaymentParams(reservation_id="reservation_1", provider_payment_id="pi_1"),
+                RefundPaymentParams(reservation_id="reservation_3", provider_payment_id="pi_3"),
+            ]
         )
 
-    def test_does_not_call_refund_payment_if_no_provider_payment_id(self, mock_refund_payment: Mock) -> None:
+    def test_returns_events_whose_refund_failed(
+        self, mock_refund_payments: Mock, mock_stripe_client: Mock, mock_reservation_repository: Mock
+    ) -> None:
+        mock_refund_payments.return_value.execute.return_value = [
+            RefundPaymentParams(reservation_id="reservation_3", provider_payment_id="pi_3")
+        ]
+
+        failed = RefundWhenReservationCancelled().on_batch(
+            [
+                ReservationCancelled(reservation_id="reservation_1", provider_payment_id="pi_1"),
+                ReservationCancelled(reservation_id="reservation_3", provider_payment_id="pi_3"),
+            ]
+        )
+
+        assert failed == [ReservationCancelled(reservation_id="reservation_3", provider_payment_id="pi_3")]
+
+    def test_does_not_refund_payments_without_provider_payment_id(self, mock_refund_payments: Mock) -> None:
         RefundWhenReservationCancelled().on(
             ReservationCancelled(reservation_id="test_reservation_id", provider_payment_id=None)
         )
 
-        mock_refund_payment.assert_not_called()
+        mock_refund_payments.assert_not_called()
+
+    def test_raises_when_single_refund_fails(
+        self, mock_refund_payments: Mock, mock_stripe_client: Mock, mock_reservation_repository: Mock
+    ) -> None:
+        mock_refund_payments.return_value.execute.return_value = [
+            RefundPaymentParams(reservation_id="test_reservation_id", provider_payment_id="test_payment_id")
+        ]
+
+        with pytest.raises(EventHandlingFailed):
+            RefundWhenReservationCancelled().on(
+                ReservationCancelled(reservation_id="test_reservation_id", provider_payment_id="test_payment_id")
+            )
@@ -1,13 +1,21 @@
-from collections.abc import Generator
-from unittest.mock import Mock, patch
+from collections.abc import AsyncGenerator, Generator
+from contextlib import asynccontextmanager
+from unittest.mock import ANY, Mock, patch
 from uuid import UUID
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlmodel import Session
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.payments.application.commands.confirm_payment import ConfirmPaymentParams
 from app.payments.domain.exceptions import InvalidSignature, ReservationNotFound
+from app.payments.infrastructure.caches.processed_payment_event_cache import processed_payment_event_cache
+from app.payments.infrastructure.metrics.payment_event_metrics import payment_event_metrics
+from app.payments.infrastructure.models import PaymentEventModel, PaymentInboxEventModel
+from app.reservations.infrastructure.schedulers.reservation_expiry_scheduler import reservation_expiry_scheduler
+from app.settings import Settings
 from app.shared.domain.payment_event import PaymentEvent
 from app.shared.domain.value_objects.reservation_status import ReservationStatus
 from app.shared.tests.infrastructure.builders.sqlmodel_reservation_builder import SqlModelReservationBuilder
@@ -21,14 +29,40 @@ class TestStripeWebhook:
 
     @pytest.fixture
     def mock_stripe_client(self) -> Generator[Mock, None, None]:
-        with patch("app.payments.infrastructure.api.webhooks.StripeClient") as mock:
-            yield mock.return_value
+        with patch("app.payments.infrastructure.api.webhooks.stripe_client") as mock:
+            yield mock
 
     @pytest.fixture
     def mock_reservation_repository(self) -> Generator[Mock, None, None]:
         with patch("app.payments.infrastructure.api.webhooks.SqlModelReservationRepository") as mock:
             yield mock.return_value
 
+    @pytest.fixture
+    def mock_payment_event_repository(self) -> Generator[Mock, None, None]:
+        with patch("app.payments.infrastructure.api.webhooks.CachedPaymentEventRepository") as mock:
+            yield mock.return_value
+
+    @pytest.fixture(autouse=True)
+    def clear_processed_payment_event_cache(self) -> Generator[None, None, None]:
+        yield
+        processed_payment_event_cache.clear()
+
+    @pytest.fixture(autouse=True)
+    def synchronous_confirmation(self) -> Generator[None, None, None]:
+        with patch("app.payments.infrastructure.api.webhooks.settings", Settings(PAYMENT_WEBHOOK_INGESTION=False)):
+            yield
+
+    @pytest.fixture(autouse=True)
+    def mock_db_session(self, session: Session) -> Generator[Session, None, None]:
+        with patch("app.payments.infrastructure.api.webhooks.get_session") as mock:
+            mock.return_value.__enter__.return_value = session
+            yield session
+
+    @pytest.fixture(autouse=True)
+    def mock_get_async_session(self) -> Generator[Mock, None, None]:
+        with patch("app.payments.infrastructure.api.webhooks.get_async_session") as mock:
+            yield mock
+
     @pytest.fixture
     def mock_reservation_finder(self) -> Generator[Mock, None, None]:
         with patch("app.payments.infrastructure.api.webhooks.SqlModelReservationFinder") as mock:
@@ -45,7 +79,7 @@ class TestStripeWebhook:
         )
 
         mock_stripe_client.verify_payment.return_value = PaymentEvent(
-            type="payment_intent.succeeded", payment_intent_id="pi_3MtwBwLkdIwHu7ix28a3tqPa"
+            id="evt_1", type="payment_intent.succeeded", payment_intent_id="pi_3MtwBwLkdIwHu7ix28a3tqPa"
         )
 
         response = client.post(
@@ -57,13 +91,39 @@ class TestStripeWebhook:
         assert response.status_code == 200
         assert reservation_model.status == ReservationStatus.CONFIRMED.value
 
+    @pytest.mark.integration
+    def test_integration_skips_duplicate_deliveries(
+        self, client: TestClient, session: Session, mock_stripe_client: Mock
+    ) -> None:
+        SqlModelReservationBuilder(session).with_provider_payment_id("pi_3MtwBwLkdIwHu7ix28a3tqPa").pending().build()
+        mock_stripe_client.verify_payment.return_value = PaymentEvent(
+            id="evt_1", type="payment_intent.succeeded", payment_intent_id="pi_3MtwBwLkdIwHu7ix28a3tqPa"
+        )
+        received_before = payment_event_metrics.snapshot()
+
+        for _ in range(3):
+            response = client.post(
+                "api/v1/payments/stripe/",
+                content=b'{"type": "payment_intent.succeeded"}',
+                headers={"stripe-signature": "test_signature"},
+            )
+            assert response.status_code == 200
+
+        received_after = payment_event_metrics.snapshot()
+        assert session.exec(select(PaymentEventModel)).all() == [PaymentEventModel(id="evt_1", processed_at=ANY)]
+        assert received_after.received - received_before.received == 3
+        assert received_after.duplicates - received_before.duplicates == 2
+        assert received_after.cached_duplicates - received_before.cached_duplicates == 1
+
     def test_returns_200_and_calls_confirm_payment(
         self,
         client: TestClient,
         mock_confirm_payment: Mock,
         mock_reservation_repository: Mock,
+        mock_payment_event_repository: Mock,
         mock_reservation_finder: Mock,
         mock_stripe_client: Mock,
+        mock_get_async_session: Mock,
     ) -> None:
         response = client.post(
             "api/v1/payments/stripe/",
@@ -73,8 +133,10 @@ class TestStripeWebhook:
 
         mock_confirm_payment.assert_called_once_with(
             reservation_repository=mock_reservation_repository,
+            payment_event_repository=mock_payment_event_repository,
             reservation_finder=mock_reservation_finder,
             payment_client=mock_stripe_client,
+            expiry_scheduler=reservation_expiry_scheduler,
         )
         mock_confirm_payment.return_value.execute.assert_called_once_with(
             params=ConfirmPaymentParams(
@@ -82,6 +144,7 @@ class TestStripeWebhook:
                 signature="test_signature",
             )
         )
+        mock_get_async_session.assert_not_called()
 
         assert response.status_code == 200
 
@@ -108,3 +171,82 @@ class TestStripeWebhook:
 
         assert response.status_code == 404
         assert response.json()["detail"] == "Reservation not found"
+
+
+class TestStripeWebhookIngestion:
+    @pytest.fixture(autouse=True)
+    def ingestion(self) -> Generator[None, None, None]:
+        with patch("app.payments.infrastructure.api.webhooks.settings", Settings(PAYMENT_WEBHOOK_INGESTION=True)):
+            yield
+
+    @pytest.fixture(autouse=True)
+    def mock_async_db_session(self, async_engine: AsyncEngine) -> Generator[None, None, None]:
+        @asynccontextmanager
+        async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+            async with AsyncSession(async_engine) as async_session:
+                yield async_session
+                await async_session.commit()
+
+        with patch("app.payments.infrastructure.api.webhooks.get_async_session", get_async_session):
+            yield
+
+    @pytest.fixture(autouse=True)
+    def mock_get_session(self) -> Generator[Mock, None, None]:
+        with patch("app.payments.infrastructure.api.webhooks.get_session") as mock:
+            yield mock
+
+    @pytest.fixture
+    def mock_stripe_client(self) -> Generator[Mock, None, None]:
+        with patch("app.payments.infrastructure.api.webhooks.stripe_client") as mock:
+            yield mock
+
+    @pytest.fixture
+    def mock_confirm_payment(self) -> Generator[Mock, None, None]:
+        with patch("app.payments.infrastructure.api.webhooks.ConfirmPayment") as mock:
+            yield mock
+
+    @pytest.mark.integration
+    def test_integration_enqueues_payment_event(
+        self,
+        client: TestClient,
+        session: Session,
+        mock_stripe_client: Mock,
+        mock_confirm_payment: Mock,
+        mock_get_session: Mock,
+    ) -> None:
+        reservation_model = (
+            SqlModelReservationBuilder(session)
+            .with_provider_payment_id("pi_3MtwBwLkdIwHu7ix28a3tqPa")
+            .pending()
+            .build()
+        )
+        mock_stripe_client.verify_payment.return_value = PaymentEvent(
+            id="evt_1", type="payment_intent.succeeded", payment_intent_id="pi_3MtwBwLkdIwHu7ix28a3tqPa"
+        )
+
+        response = client.post(
+            "api/v1/payments/stripe/",
+            content=b'{"type": "payment_intent.succeeded"}',
+            headers={"stripe-signature": "test_signature"},
+        )
+
+        assert response.status_code == 200
+        mock_confirm_payment.assert_not_called()
+        mock_get_session.assert_not_called()
+        assert reservation_model.status == ReservationStatus.PENDING.value
+        inbox_event_models = session.exec(select(PaymentInboxEventModel)).all()
+        assert [model.to_domain() for model in inbox_event_models] == [
+            PaymentEvent(id="evt_1", type="payment_intent.succeeded", payment_intent_id="pi_3MtwBwLkdIwHu7ix28a3tqPa")
+        ]
+
+    def test_returns_400_when_signature_is_invalid(self, client: TestClient, mock_stripe_client: Mock) -> None:
+        mock_stripe_client.verify_payment.side_effect = InvalidSignature
+
+        response = client.post(
+            "api/v1/payments/stripe/",
+            content=b'{"type": "payment_intent.succeeded"}',
+            headers={"stripe-signature": "invalid_signature"},
+        )
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid signature"
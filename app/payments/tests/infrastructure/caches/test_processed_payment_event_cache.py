@@ -0,0 +1,23 @@
+from app.payments.infrastructure.caches.processed_payment_event_cache import ProcessedPaymentEventCache
+
+
+class TestProcessedPaymentEventCache:
+    def test_contains_added_events(self) -> None:
+        cache = ProcessedPaymentEventCache(max_size=2)
+
+        cache.add("evt_1")
+
+        assert cache.contains("evt_1") is True
+        assert cache.contains("evt_2") is False
+
+    def test_evicts_least_recently_used_event(self) -> None:
+        cache = ProcessedPaymentEventCache(max_size=2)
+        cache.add("evt_1")
+        cache.add("evt_2")
+        cache.contains("evt_1")
+
+        cache.add("evt_3")
+
+        assert cache.contains("evt_1") is True
+        assert cache.contains("evt_2") is False
+        assert cache.contains("evt_3") is True
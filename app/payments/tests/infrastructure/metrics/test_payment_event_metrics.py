@@ -0,0 +1,18 @@
+from app.payments.infrastructure.metrics.payment_event_metrics import PaymentEventMetrics, PaymentEventStats
+
+
+class TestPaymentEventMetrics:
+    def test_reports_duplicate_rate(self) -> None:
+        metrics = PaymentEventMetrics()
+
+        metrics.record(duplicate=False)
+        metrics.record(duplicate=True)
+        metrics.record(duplicate=True, cached=True)
+        metrics.record(duplicate=False)
+
+        stats = metrics.snapshot()
+        assert stats == PaymentEventStats(received=4, duplicates=2, cached_duplicates=1)
+        assert stats.duplicate_rate == 0.5
+
+    def test_duplicate_rate_without_events(self) -> None:
+        assert PaymentEventMetrics().snapshot().duplicate_rate == 0.0
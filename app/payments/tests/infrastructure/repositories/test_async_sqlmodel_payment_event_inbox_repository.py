@@ -0,0 +1,22 @@
+import pytest
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.payments.infrastructure.models import PaymentInboxEventModel
+from app.payments.infrastructure.repositories.async_sqlmodel_payment_event_inbox_repository import (
+    AsyncSqlModelPaymentEventInboxRepository,
+)
+from app.shared.domain.payment_event import PaymentEvent
+
+
+class TestAsyncSqlModelPaymentEventInboxRepository:
+    @pytest.mark.anyio
+    async def test_adds_payment_event_once(self, async_session: AsyncSession) -> None:
+        repository = AsyncSqlModelPaymentEventInboxRepository(async_session)
+        payment_event = PaymentEvent(id="evt_1", type="payment_intent.succeeded", payment_intent_id="pi_1")
+
+        await repository.add(payment_event=payment_event)
+        await repository.add(payment_event=payment_event)
+
+        inbox_event_models = (await async_session.exec(select(PaymentInboxEventModel))).all()
+        assert [model.to_domain() for model in inbox_event_models] == [payment_event]
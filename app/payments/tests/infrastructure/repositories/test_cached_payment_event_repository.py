@@ -0,0 +1,63 @@
+from typing import Any
+from unittest.mock import Mock, create_autospec
+
+import pytest
+
+from app.payments.domain.repositories.payment_event_repository import PaymentEventRepository
+from app.payments.infrastructure.caches.processed_payment_event_cache import ProcessedPaymentEventCache
+from app.payments.infrastructure.metrics.payment_event_metrics import PaymentEventMetrics, PaymentEventStats
+from app.payments.infrastructure.repositories.cached_payment_event_repository import CachedPaymentEventRepository
+
+
+class TestCachedPaymentEventRepository:
+    @pytest.fixture
+    def mock_repository(self) -> Any:
+        return create_autospec(spec=PaymentEventRepository, spec_set=True, instance=True)
+
+    @pytest.fixture
+    def cache(self) -> ProcessedPaymentEventCache:
+        return ProcessedPaymentEventCache(max_size=10)
+
+    @pytest.fixture
+    def metrics(self) -> PaymentEventMetrics:
+        return PaymentEventMetrics()
+
+    def test_adds_new_event(
+        self, mock_repository: Mock, cache: ProcessedPaymentEventCache, metrics: PaymentEventMetrics
+    ) -> None:
+        mock_repository.add.return_value = True
+
+        added = CachedPaymentEventRepository(repository=mock_repository, cache=cache, metrics=metrics).add("evt_1")
+
+        assert added is True
+        mock_repository.add.assert_called_once_with("evt_1")
+        assert cache.contains("evt_1") is False
+        assert metrics.snapshot() == PaymentEventStats(received=1, duplicates=0, cached_duplicates=0)
+
+    def test_caches_duplicates_found_in_repository(
+        self, mock_repository: Mock, cache: ProcessedPaymentEventCache, metrics: PaymentEventMetrics
+    ) -> None:
+        mock_repository.add.return_value = False
+        repository = CachedPaymentEventRepository(repository=mock_repository, cache=cache, metrics=metrics)
+
+        assert repository.add("evt_1") is False
+        assert repository.add("evt_1") is False
+
+        mock_repository.add.assert_called_once_with("evt_1")
+        assert metrics.snapshot() == PaymentEventStats(received=2, duplicates=2, cached_duplicates=1)
+
+    def test_adds_all_events_skipping_cached_duplicates(
+        self, mock_repository: Mock, cache: ProcessedPaymentEventCache, metrics: PaymentEventMetrics
+    ) -> None:
+        cache.add("evt_1")
+        mock_repository.add_all.return_value = ["evt_2"]
+
+        added_ids = CachedPaymentEventRepository(repository=mock_repository, cache=cache, metrics=metrics).add_all(
+            ["evt_1", "evt_2", "evt_3"]
+        )
+
+        assert added_ids == ["evt_2"]
+        mock_repository.add_all.assert_called_once_with(["evt_2", "evt_3"])
+        assert cache.contains("evt_2") is False
+        assert cache.contains("evt_3") is True
+        assert metrics.snapshot() == PaymentEventStats(received=3, duplicates=2, cached_duplicates=1)
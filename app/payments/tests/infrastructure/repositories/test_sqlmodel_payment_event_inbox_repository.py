@@ -0,0 +1,47 @@
+from datetime import datetime
+
+from sqlmodel import Session, select
+
+from app.payments.infrastructure.models import PaymentInboxEventModel
+from app.payments.infrastructure.repositories.sqlmodel_payment_event_inbox_repository import (
+    SqlModelPaymentEventInboxRepository,
+)
+from app.shared.domain.payment_event import PaymentEvent
+
+
+class TestSqlModelPaymentEventInboxRepository:
+    def test_takes_oldest_events_and_removes_them(self, session: Session) -> None:
+        session.add_all(
+            [
+                PaymentInboxEventModel(
+                    id="evt_2",
+                    type="payment_intent.succeeded",
+                    payment_intent_id="pi_2",
+                    received_at=datetime(2025, 1, 1, 10, 0, 2),
+                ),
+                PaymentInboxEventModel(
+                    id="evt_1",
+                    type="payment_intent.succeeded",
+                    payment_intent_id="pi_1",
+                    received_at=datetime(2025, 1, 1, 10, 0, 1),
+                ),
+                PaymentInboxEventModel(
+                    id="evt_3",
+                    type="payment_intent.succeeded",
+                    payment_intent_id="pi_3",
+                    received_at=datetime(2025, 1, 1, 10, 0, 3),
+                ),
+            ]
+        )
+        session.commit()
+
+        payment_events = SqlModelPaymentEventInboxRepository(session).take(limit=2)
+
+        assert payment_events == [
+            PaymentEvent(id="evt_1", type="payment_intent.succeeded", payment_intent_id="pi_1"),
+            PaymentEvent(id="evt_2", type="payment_intent.succeeded", payment_intent_id="pi_2"),
+        ]
+        assert [model.id for model in session.exec(select(PaymentInboxEventModel)).all()] == ["evt_3"]
+
+    def test_takes_nothing_from_empty_inbox(self, session: Session) -> None:
+        assert SqlModelPaymentEventInboxRepository(session).take(limit=2) == []
@@ -0,0 +1,22 @@
+from sqlmodel import Session
+
+from app.payments.infrastructure.repositories.sqlmodel_payment_event_repository import SqlModelPaymentEventRepository
+
+
+class TestSqlModelPaymentEventRepository:
+    def test_adds_new_event(self, session: Session) -> None:
+        assert SqlModelPaymentEventRepository(session).add(event_id="evt_1") is True
+
+    def test_does_not_add_processed_event(self, session: Session) -> None:
+        repository = SqlModelPaymentEventRepository(session)
+        repository.add(event_id="evt_1")
+
+        assert repository.add(event_id="evt_1") is False
+        assert repository.add(event_id="evt_2") is True
+
+    def test_adds_all_new_events(self, session: Session) -> None:
+        repository = SqlModelPaymentEventRepository(session)
+        repository.add(event_id="evt_2")
+
+        assert repository.add_all(event_ids=["evt_1", "evt_2", "evt_3", "evt_1"]) == ["evt_1", "evt_3"]
+        assert repository.add_all(event_ids=["evt_1", "evt_3"]) == []
@@ -1,3 +1,5 @@
+from uuid import UUID
+
 from sqlmodel import Session
 
 from app.payments.domain.reservation import Reservation
@@ -15,3 +17,51 @@ class TestSqlModelReservationRepository:
         SqlModelReservationRepository(session).update(reservation)
 
         assert reservation_model.status == ReservationStatus.CONFIRMED.value
+
+    def test_update_all_reservations(self, session: Session) -> None:
+        first_model = SqlModelReservationBuilder(session).with_provider_payment_id("pi_1").cancelled().build()
+        second_model = SqlModelReservationBuilder(session).with_provider_payment_id("pi_2").cancelled().build()
+        untouched_model = SqlModelReservationBuilder(session).with_provider_payment_id("pi_3").cancelled().build()
+
+        SqlModelReservationRepository(session).update_all(
+            [
+                Reservation(id=Id.from_uuid(first_model.id), status=ReservationStatus.REFUNDED),
+                Reservation(id=Id.from_uuid(second_model.id), status=ReservationStatus.REFUNDED),
+            ]
+        )
+
+        session.refresh(first_model)
+        session.refresh(second_model)
+        session.refresh(untouched_model)
+        assert first_model.status == ReservationStatus.REFUNDED.value
+        assert second_model.status == ReservationStatus.REFUNDED.value
+        assert untouched_model.status == ReservationStatus.CANCELLED.value
+
+    def test_confirm_many_reservations(self, session: Session) -> None:
+        pending_model = (
+            SqlModelReservationBuilder(session)
+            .with_id(UUID("92ab35a6-ae79-4039-85b3-e8b2b8abb27d"))
+            .with_provider_payment_id("pi_1")
+            .pending()
+            .build()
+        )
+        confirmed_model = SqlModelReservationBuilder(session).with_provider_payment_id("pi_2").confirmed().build()
+        untouched_model = SqlModelReservationBuilder(session).with_provider_payment_id("pi_3").pending().build()
+        cancelled_model = SqlModelReservationBuilder(session).with_provider_payment_id("pi_4").cancelled().build()
+
+        confirmed_ids = SqlModelReservationRepository(session).confirm_many(
+            provider_payment_ids=["pi_1", "pi_2", "pi_4", "pi_unknown"]
+        )
+
+        assert confirmed_ids == {"pi_1": Id("92ab35a6-ae79-4039-85b3-e8b2b8abb27d")}
+        session.refresh(pending_model)
+        session.refresh(confirmed_model)
+        session.refresh(untouched_model)
+        session.refresh(cancelled_model)
+        assert pending_model.status == ReservationStatus.CONFIRMED.value
+        assert confirmed_model.status == ReservationStatus.CONFIRMED.value
+        assert untouched_model.status == ReservationStatus.PENDING.value
+        assert cancelled_model.status == ReservationStatus.CANCELLED.value
+
+    def test_confirm_many_without_payment_ids(self, session: Session) -> None:
+        assert SqlModelReservationRepository(session).confirm_many(provider_payment_ids=[]) == {}
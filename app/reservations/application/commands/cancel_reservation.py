@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from app.reservations.domain.exceptions import ReservationNotFound
 from app.reservations.domain.finders.reservation_finder import ReservationFinder
 from app.reservations.domain.repositories.reservation_repository import ReservationRepository
-from app.shared.domain.events.event_bus import EventBus
+from app.shared.domain.schedulers.expiry_scheduler import ExpiryScheduler
 from app.shared.domain.value_objects.id import Id
 
 
@@ -14,10 +14,15 @@ class CancelReservationParams:
 
 
 class CancelReservation:
-    def __init__(self, finder: ReservationFinder, repository: ReservationRepository, event_bus: EventBus) -> None:
+    def __init__(
+        self,
+        finder: ReservationFinder,
+        repository: ReservationRepository,
+        expiry_scheduler: ExpiryScheduler,
+    ) -> None:
         self._finder = finder
         self._repository = repository
-        self._event_bus = event_bus
+        self._expiry_scheduler = expiry_scheduler
 
     def execute(self, params: CancelReservationParams) -> None:
         cancellable_reservation = self._finder.find_cancellable_reservation(params.reservation_id)
@@ -26,5 +31,7 @@ class CancelReservation:
             raise ReservationNotFound()
 
         cancellable_reservation.cancel_by_owner(user_id=params.user_id)
-        self._repository.release(reservation=cancellable_reservation.reservation)
-        self._event_bus.publish(events=cancellable_reservation.collect_events())
+        self._repository.release(
+            reservation=cancellable_reservation.reservation, events=cancellable_reservation.collect_events()
+        )
+        self._expiry_scheduler.discard(id=cancellable_reservation.reservation_id)
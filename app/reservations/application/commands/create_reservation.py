@@ -1,15 +1,21 @@
+import logging
 from dataclasses import dataclass
 
-from app.reservations.domain.exceptions import SeatsNotAvailable
-from app.reservations.domain.finders.seat_finder import SeatFinder
-from app.reservations.domain.repositories.reservation_repository import ReservationRepository
+from app.reservations.domain.exceptions import ReservationNotPending, SeatsNotAvailable
+from app.reservations.domain.finders.async_seat_finder import AsyncSeatFinder
+from app.reservations.domain.locks.seat_lock_table import SeatLockTable
+from app.reservations.domain.repositories.async_reservation_repository import AsyncReservationRepository
 from app.reservations.domain.reservation import Reservation
+from app.reservations.domain.reservation_payment import ReservationPayment
 from app.settings import get_settings
-from app.shared.domain.clients.payment_client import PaymentClient
+from app.shared.domain.clients.async_payment_client import AsyncPaymentClient
+from app.shared.domain.exceptions import PaymentCancellationError, PaymentProviderUnavailable
 from app.shared.domain.payment_intent import PaymentIntent
+from app.shared.domain.schedulers.expiry_scheduler import ExpiryScheduler
 from app.shared.domain.value_objects.id import Id
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
 
 
 @dataclass(frozen=True)
@@ -21,27 +27,68 @@ class CreateReservationParams:
 
 class CreateReservation:
     def __init__(
-        self, reservation_repository: ReservationRepository, seat_finder: SeatFinder, payment_client: PaymentClient
+        self,
+        reservation_repository: AsyncReservationRepository,
+        seat_finder: AsyncSeatFinder,
+        payment_client: AsyncPaymentClient,
+        expiry_scheduler: ExpiryScheduler,
+        seat_lock_table: SeatLockTable,
     ) -> None:
         self._reservation_repository = reservation_repository
         self._seat_finder = seat_finder
         self._payment_client = payment_client
+        self._expiry_scheduler = expiry_scheduler
+        self._seat_lock_table = seat_lock_table
 
-    def execute(self, params: CreateReservationParams) -> PaymentIntent:
-        seats = self._seat_finder.find_seats(seat_ids=params.seat_ids)
-
-        if not seats.are_available():
+    async def execute(self, params: CreateReservationParams) -> ReservationPayment:
+        if not self._seat_lock_table.acquire(showtime_id=params.showtime_id, seat_ids=params.seat_ids):
             raise SeatsNotAvailable()
 
-        total_amount = seats.calculate_total_price(settings.GENERAL_ADMISSION_PRICE)
-        payment_intent = self._payment_client.create_payment_intent(amount=total_amount)
+        try:
+            reservation = await self._hold_seats(params)
+        except Exception:
+            self._seat_lock_table.release(showtime_id=params.showtime_id, seat_ids=params.seat_ids)
+            raise
 
-        reservation = Reservation.create(
-            user_id=params.user_id,
-            showtime_id=params.showtime_id,
-            provider_payment_id=payment_intent.provider_payment_id,
-            seats=seats,
+        self._expiry_scheduler.schedule(
+            id=reservation.id, expires_at=reservation.expires_at(settings.RESERVATION_EXPIRATION_MINUTES)
         )
-        self._reservation_repository.create(reservation=reservation)
 
-        return payment_intent
+        try:
+            payment_intent = await self._payment_client.create_payment_intent(
+                amount=reservation.seats.calculate_total_price(settings.GENERAL_ADMISSION_PRICE),
+                idempotency_key=reservation.id.value,
+            )
+        except PaymentProviderUnavailable:
+            logger.warning("Payment intent deferred for reservation", extra={"reservation_id": reservation.id.value})
+            return ReservationPayment(reservation_id=reservation.id, payment_intent=None)
+
+        if not await self._reservation_repository.attach_payment(
+            reservation_id=reservation.id, provider_payment_id=payment_intent.provider_payment_id
+        ):
+            await self._cancel_payment_intent(reservation_id=reservation.id, payment_intent=payment_intent)
+            raise ReservationNotPending()
+
+        return ReservationPayment(reservation_id=reservation.id, payment_intent=payment_intent)
+
+    async def _cancel_payment_intent(self, reservation_id: Id, payment_intent: PaymentIntent) -> None:
+        try:
+            await self._payment_client.cancel_payment_intent(payment_id=payment_intent.provider_payment_id)
+        except (PaymentCancellationError, PaymentProviderUnavailable):
+            logger.error(
+                "Failed to cancel payment intent of reservation",
+                extra={
+                    "reservation_id": reservation_id.value,
+                    "provider_payment_id": payment_intent.provider_payment_id,
+                },
+            )
+
+    async def _hold_seats(self, params: CreateReservationParams) -> Reservation:
+        seats = await self._seat_finder.find_seats(seat_ids=params.seat_ids)
+
+        if not seats.are_available():
+            raise SeatsNotAvailable()
+
+        reservation = Reservation.create(user_id=params.user_id, showtime_id=params.showtime_id, seats=seats)
+        await self._reservation_repository.create(reservation=reservation)
+        return reservation
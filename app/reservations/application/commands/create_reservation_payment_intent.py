@@ -0,0 +1,64 @@
+import logging
+from dataclasses import dataclass
+
+from app.reservations.domain.exceptions import ReservationNotFound, ReservationNotPending
+from app.reservations.domain.finders.async_reservation_finder import AsyncReservationFinder
+from app.reservations.domain.repositories.async_reservation_repository import AsyncReservationRepository
+from app.settings import get_settings
+from app.shared.domain.clients.async_payment_client import AsyncPaymentClient
+from app.shared.domain.exceptions import PaymentCancellationError, PaymentProviderUnavailable
+from app.shared.domain.payment_intent import PaymentIntent
+from app.shared.domain.value_objects.id import Id
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CreateReservationPaymentIntentParams:
+    reservation_id: Id
+    user_id: Id
+
+
+class CreateReservationPaymentIntent:
+    def __init__(
+        self,
+        reservation_finder: AsyncReservationFinder,
+        reservation_repository: AsyncReservationRepository,
+        payment_client: AsyncPaymentClient,
+    ) -> None:
+        self._reservation_finder = reservation_finder
+        self._reservation_repository = reservation_repository
+        self._payment_client = payment_client
+
+    async def execute(self, params: CreateReservationPaymentIntentParams) -> PaymentIntent:
+        reservation = await self._reservation_finder.find_reservation(reservation_id=params.reservation_id)
+
+        if not reservation:
+            raise ReservationNotFound()
+
+        reservation.check_payable_by(user_id=params.user_id)
+        payment_intent = await self._payment_client.create_payment_intent(
+            amount=reservation.seats.calculate_total_price(settings.GENERAL_ADMISSION_PRICE),
+            idempotency_key=reservation.id.value,
+        )
+
+        if not await self._reservation_repository.attach_payment(
+            reservation_id=reservation.id, provider_payment_id=payment_intent.provider_payment_id
+        ):
+            await self._cancel_payment_intent(reservation_id=reservation.id, payment_intent=payment_intent)
+            raise ReservationNotPending()
+
+        return payment_intent
+
+    async def _cancel_payment_intent(self, reservation_id: Id, payment_intent: PaymentIntent) -> None:
+        try:
+            await self._payment_client.cancel_payment_intent(payment_id=payment_intent.provider_payment_id)
+        except (PaymentCancellationError, PaymentProviderUnavailable):
+            logger.error(
+                "Failed to cancel payment intent of reservation",
+                extra={
+                    "reservation_id": reservation_id.value,
+                    "provider_payment_id": payment_intent.provider_payment_id,
+                },
+            )
@@ -0,0 +1,10 @@
+from app.reservations.domain.repositories.reservation_repository import ReservationRepository
+from app.shared.domain.value_objects.id import Id
+
+
+class ExpireReservations:
+    def __init__(self, repository: ReservationRepository) -> None:
+        self._repository = repository
+
+    def execute(self, reservation_ids: list[Id]) -> int:
+        return self._repository.cancel_pending_reservations(reservation_ids=reservation_ids)
@@ -1,11 +1,14 @@
+import logging
+
 from app.database import get_session
 from app.reservations.application.commands.cancel_expired_reservations import CancelExpiredReservations
-from app.reservations.infrastructure.finders.sqlmodel_reservation_finder import SqlModelReservationFinder
 from app.reservations.infrastructure.repositories.sqlmodel_reservation_repository import SqlModelReservationRepository
 
+logger = logging.getLogger(__name__)
+
 
-def cancel_expired_reservations_job() -> None:
+def cancel_expired_reservations_job() -> int:
     with get_session() as session:
-        CancelExpiredReservations(
-            repository=SqlModelReservationRepository(session), finder=SqlModelReservationFinder(session)
-        ).execute()
+        expired = CancelExpiredReservations(repository=SqlModelReservationRepository(session)).execute()
+    logger.info("Expired %d pending reservations", expired)
+    return expired
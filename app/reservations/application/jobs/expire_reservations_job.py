@@ -0,0 +1,17 @@
+import logging
+
+from app.database import get_session
+from app.reservations.application.commands.expire_reservations import ExpireReservations
+from app.reservations.infrastructure.repositories.sqlmodel_reservation_repository import SqlModelReservationRepository
+from app.shared.domain.value_objects.id import Id
+
+logger = logging.getLogger(__name__)
+
+
+def expire_reservations_job(reservation_ids: list[Id]) -> int:
+    with get_session() as session:
+        expired = ExpireReservations(repository=SqlModelReservationRepository(session)).execute(
+            reservation_ids=reservation_ids
+        )
+    logger.info("Expired %d of %d due reservations", expired, len(reservation_ids))
+    return expired
@@ -0,0 +1,35 @@
+import logging
+
+from app.database import get_session
+from app.reservations.domain.events import ReservationCancelled, ReservationExpired
+from app.settings import get_settings
+from app.shared.domain.events.event import Event
+from app.shared.infrastructure.events.rabbitmq_event_bus import RabbitMQEventBus
+from app.shared.infrastructure.events.rabbitmq_publisher import rabbitmq_publisher
+from app.shared.infrastructure.outbox.sqlmodel_outbox import SqlModelOutbox
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+EVENT_CLASSES: dict[str, type[Event]] = {
+    ReservationCancelled.topic(): ReservationCancelled,
+    ReservationExpired.topic(): ReservationExpired,
+}
+
+
+def relay_outbox_job() -> int:
+    event_bus = RabbitMQEventBus(publisher=rabbitmq_publisher)
+    batch_size = settings.OUTBOX_RELAY_BATCH_SIZE
+
+    published = 0
+    with get_session() as session:
+        outbox = SqlModelOutbox(session)
+        while True:
+            relayed = outbox.relay(event_bus=event_bus, event_classes=EVENT_CLASSES, limit=batch_size)
+            published += relayed
+            if relayed < batch_size:
+                break
+
+    if published:
+        logger.info("Relayed %d outbox events", published)
+    return published
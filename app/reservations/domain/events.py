@@ -16,3 +16,17 @@ class ReservationCancelled(Event):
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Self:
         return cls(reservation_id=data["reservation_id"], provider_payment_id=data["provider_payment_id"])
+
+
+@dataclass(frozen=True)
+class ReservationExpired(Event):
+    reservation_id: str
+    provider_payment_id: str
+
+    @classmethod
+    def topic(cls) -> str:
+        return "reservation.expired"
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Self:
+        return cls(reservation_id=data["reservation_id"], provider_payment_id=data["provider_payment_id"])
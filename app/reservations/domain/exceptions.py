@@ -8,3 +8,9 @@ class UnauthorizedCancellation(Exception): ...
 
 
 class CancellationNotAllowed(Exception): ...
+
+
+class UnauthorizedPayment(Exception): ...
+
+
+class ReservationNotPending(Exception): ...
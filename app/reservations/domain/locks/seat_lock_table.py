@@ -0,0 +1,8 @@
+from typing import Protocol
+
+from app.shared.domain.value_objects.id import Id
+
+
+class SeatLockTable(Protocol):
+    def acquire(self, showtime_id: Id, seat_ids: list[Id]) -> bool: ...
+    def release(self, showtime_id: Id, seat_ids: list[Id]) -> None: ...
@@ -0,0 +1,9 @@
+from typing import Protocol
+
+from app.reservations.domain.reservation import Reservation
+from app.shared.domain.value_objects.id import Id
+
+
+class AsyncReservationRepository(Protocol):
+    async def create(self, reservation: Reservation) -> None: ...
+    async def attach_payment(self, reservation_id: Id, provider_payment_id: str) -> bool: ...
@@ -1,10 +1,12 @@
 from typing import Protocol
 
 from app.reservations.domain.reservation import Reservation
+from app.shared.domain.events.event import Event
+from app.shared.domain.value_objects.date_time import DateTime
 from app.shared.domain.value_objects.id import Id
 
 
 class ReservationRepository(Protocol):
-    def create(self, reservation: Reservation) -> None: ...
-    def release(self, reservation: Reservation) -> None: ...
-    def cancel_reservations(self, reservation_ids: list[Id]) -> None: ...
+    def release(self, reservation: Reservation, events: list[Event]) -> None: ...
+    def cancel_expired_reservations(self, expiration_datetime: DateTime, limit: int) -> int: ...
+    def cancel_pending_reservations(self, reservation_ids: list[Id]) -> int: ...
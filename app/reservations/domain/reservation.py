@@ -3,7 +3,12 @@ from dataclasses import dataclass
 
 from app.reservations.domain.collections.seats import Seats
 from app.reservations.domain.events import ReservationCancelled
-from app.reservations.domain.exceptions import CancellationNotAllowed, UnauthorizedCancellation
+from app.reservations.domain.exceptions import (
+    CancellationNotAllowed,
+    ReservationNotPending,
+    UnauthorizedCancellation,
+    UnauthorizedPayment,
+)
 from app.shared.domain.events.aggregate_root import AggregateRoot
 from app.shared.domain.value_objects.date_time import DateTime
 from app.shared.domain.value_objects.id import Id
@@ -21,22 +26,30 @@ class Reservation:
     created_at: DateTime
 
     @classmethod
-    def create(
-        cls, user_id: Id, showtime_id: Id, provider_payment_id: str, seats: Seats | None = None
-    ) -> "Reservation":
+    def create(cls, user_id: Id, showtime_id: Id, seats: Seats | None = None) -> "Reservation":
         return cls(
             id=Id.from_uuid(uuid.uuid4()),
             user_id=user_id,
             showtime_id=showtime_id,
             status=ReservationStatus.PENDING,
             seats=seats or Seats(),
-            provider_payment_id=provider_payment_id,
+            provider_payment_id=None,
             created_at=DateTime.now(),
         )
 
     def cancel(self) -> None:
         self.status = ReservationStatus.CANCELLED
 
+    def check_payable_by(self, user_id: Id) -> None:
+        if self.user_id != user_id:
+            raise UnauthorizedPayment()
+
+        if self.status != ReservationStatus.PENDING:
+            raise ReservationNotPending()
+
+    def expires_at(self, expiration_minutes: int) -> DateTime:
+        return self.created_at.add_minutes(expiration_minutes)
+
 
 @dataclass
 class CancellableReservation(AggregateRoot):
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+from app.shared.domain.payment_intent import PaymentIntent
+from app.shared.domain.value_objects.id import Id
+
+
+@dataclass(frozen=True)
+class ReservationPayment:
+    reservation_id: Id
+    payment_intent: PaymentIntent | None
@@ -1,37 +1,54 @@
 from fastapi import APIRouter, HTTPException, status
 
-from app.api.deps import CurrentUser, SessionDep
+from app.api.deps import AsyncSessionDep, CurrentUser, SessionDep, UserAsyncReadSessionDep
 from app.reservations.application.commands.cancel_reservation import CancelReservation, CancelReservationParams
 from app.reservations.application.commands.create_reservation import CreateReservation, CreateReservationParams
+from app.reservations.application.commands.create_reservation_payment_intent import (
+    CreateReservationPaymentIntent,
+    CreateReservationPaymentIntentParams,
+)
 from app.reservations.application.queries.find_reservations import FindReservations
 from app.reservations.domain.exceptions import (
     CancellationNotAllowed,
     ReservationNotFound,
+    ReservationNotPending,
     SeatsNotAvailable,
     UnauthorizedCancellation,
+    UnauthorizedPayment,
 )
 from app.reservations.infrastructure.api.payloads import CreateReservationPayload
-from app.reservations.infrastructure.api.responses import PaymentIntentResponse, ReservationResponse
+from app.reservations.infrastructure.api.responses import (
+    PaymentIntentResponse,
+    ReservationPaymentResponse,
+    ReservationResponse,
+)
+from app.reservations.infrastructure.finders.async_sqlmodel_reservation_finder import AsyncSqlModelReservationFinder
+from app.reservations.infrastructure.finders.async_sqlmodel_seat_finder import AsyncSqlModelSeatFinder
 from app.reservations.infrastructure.finders.sqlmodel_reservation_finder import SqlModelReservationFinder
-from app.reservations.infrastructure.finders.sqlmodel_seat_finder import SqlModelSeatFinder
+from app.reservations.infrastructure.locks.in_memory_seat_lock_table import seat_lock_table
+from app.reservations.infrastructure.repositories.async_sqlmodel_reservation_repository import (
+    AsyncSqlModelReservationRepository,
+)
 from app.reservations.infrastructure.repositories.sqlmodel_reservation_repository import SqlModelReservationRepository
+from app.reservations.infrastructure.schedulers.reservation_expiry_scheduler import reservation_expiry_scheduler
+from app.shared.domain.exceptions import PaymentIntentRejected, PaymentProviderUnavailable
 from app.shared.domain.value_objects.id import Id
-from app.shared.infrastructure.clients.stripe_client import StripeClient
-from app.shared.infrastructure.events.rabbitmq_configurer import RabbitMQConfigurer
-from app.shared.infrastructure.events.rabbitmq_event_bus import RabbitMQEventBus
+from app.shared.infrastructure.clients.async_payment_clients import async_payment_client
 
 router = APIRouter()
 
 
 @router.post("/", status_code=status.HTTP_201_CREATED)
-def create_reservation(
-    session: SessionDep, request_body: CreateReservationPayload, current_user: CurrentUser
-) -> PaymentIntentResponse:
+async def create_reservation(
+    session: AsyncSessionDep, request_body: CreateReservationPayload, current_user: CurrentUser
+) -> ReservationPaymentResponse:
     try:
-        payment_intent = CreateReservation(
-            reservation_repository=SqlModelReservationRepository(session=session),
-            seat_finder=SqlModelSeatFinder(session=session),
-            payment_client=StripeClient(),
+        reservation_payment = await CreateReservation(
+            reservation_repository=AsyncSqlModelReservationRepository(session=session),
+            seat_finder=AsyncSqlModelSeatFinder(session=session),
+            payment_client=async_payment_client,
+            expiry_scheduler=reservation_expiry_scheduler,
+            seat_lock_table=seat_lock_table,
         ).execute(
             params=CreateReservationParams(
                 showtime_id=Id(request_body.showtime_id),
@@ -41,12 +58,45 @@ def create_reservation(
         )
     except SeatsNotAvailable:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Seats not available")
+    except ReservationNotPending:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Reservation is not pending")
+    except PaymentProviderUnavailable:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Payment provider unavailable")
+    except PaymentIntentRejected:
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail="Payment provider rejected the request")
+    return ReservationPaymentResponse.from_domain(reservation_payment)
+
+
+@router.post("/{reservation_id}/payment-intent/", status_code=status.HTTP_201_CREATED)
+async def create_reservation_payment_intent(
+    session: AsyncSessionDep, reservation_id: str, current_user: CurrentUser
+) -> PaymentIntentResponse:
+    try:
+        payment_intent = await CreateReservationPaymentIntent(
+            reservation_finder=AsyncSqlModelReservationFinder(session=session),
+            reservation_repository=AsyncSqlModelReservationRepository(session=session),
+            payment_client=async_payment_client,
+        ).execute(
+            params=CreateReservationPaymentIntentParams(
+                reservation_id=Id(reservation_id), user_id=Id.from_uuid(current_user.id)
+            )
+        )
+    except ReservationNotFound:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Reservation not found")
+    except UnauthorizedPayment:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Unauthorized to pay this reservation")
+    except ReservationNotPending:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Reservation is not pending")
+    except PaymentProviderUnavailable:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Payment provider unavailable")
+    except PaymentIntentRejected:
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail="Payment provider rejected the request")
     return PaymentIntentResponse.from_domain(payment_intent)
 
 
 @router.get("/", response_model=list[ReservationResponse], status_code=status.HTTP_200_OK)
-def list_reservations(session: SessionDep, current_user: CurrentUser) -> list[ReservationResponse]:
-    movie_reservations = FindReservations(finder=SqlModelReservationFinder(session=session)).execute(
+async def list_reservations(session: UserAsyncReadSessionDep, current_user: CurrentUser) -> list[ReservationResponse]:
+    movie_reservations = await FindReservations(finder=AsyncSqlModelReservationFinder(session=session)).execute(
         user_id=Id.from_uuid(current_user.id)
     )
     return ReservationResponse.from_domain_list(movie_reservations)
@@ -58,7 +108,7 @@ def cancel_reservation(session: SessionDep, reservation_id: str, current_user: C
         CancelReservation(
             finder=SqlModelReservationFinder(session=session),
             repository=SqlModelReservationRepository(session=session),
-            event_bus=RabbitMQEventBus(configurer=RabbitMQConfigurer()),
+            expiry_scheduler=reservation_expiry_scheduler,
         ).execute(
             params=CancelReservationParams(
                 reservation_id=Id(reservation_id),
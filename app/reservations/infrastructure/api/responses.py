@@ -1,6 +1,7 @@
 from sqlmodel import SQLModel
 
 from app.reservations.domain.movie_show_reservation import Movie, MovieShowReservation, SeatLocation
+from app.reservations.domain.reservation_payment import ReservationPayment
 from app.shared.domain.payment_intent import PaymentIntent
 
 
@@ -55,3 +56,17 @@ class PaymentIntentResponse(SQLModel):
             provider_payment_id=payment_intent.provider_payment_id,
             amount=payment_intent.amount,
         )
+
+
+class ReservationPaymentResponse(SQLModel):
+    reservation_id: str
+    payment_intent: PaymentIntentResponse | None
+
+    @classmethod
+    def from_domain(cls, reservation_payment: ReservationPayment) -> "ReservationPaymentResponse":
+        return cls(
+            reservation_id=reservation_payment.reservation_id.value,
+            payment_intent=PaymentIntentResponse.from_domain(reservation_payment.payment_intent)
+            if reservation_payment.payment_intent
+            else None,
+        )
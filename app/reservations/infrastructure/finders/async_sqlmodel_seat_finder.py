@@ -0,0 +1,14 @@
+from sqlmodel import select
+
+from app.reservations.domain.collections.seats import Seats
+from app.reservations.domain.finders.async_seat_finder import AsyncSeatFinder
+from app.reservations.infrastructure.models import SeatModel
+from app.shared.domain.value_objects.id import Id
+from app.shared.infrastructure.finders.async_sqlmodel_finder import AsyncSqlModelFinder
+
+
+class AsyncSqlModelSeatFinder(AsyncSeatFinder, AsyncSqlModelFinder):
+    async def find_seats(self, seat_ids: list[Id]) -> Seats:
+        seat_uuids = [seat_id.to_uuid() for seat_id in seat_ids]
+        result = await self._session.exec(select(SeatModel).filter(SeatModel.id.in_(seat_uuids)))  # type: ignore
+        return Seats([seat_model.to_domain() for seat_model in result.all()])
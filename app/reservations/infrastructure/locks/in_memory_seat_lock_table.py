@@ -0,0 +1,57 @@
+import threading
+import time
+
+from app.reservations.domain.locks.seat_lock_table import SeatLockTable
+from app.settings import Settings, get_settings
+from app.shared.domain.value_objects.id import Id
+
+
+class InMemorySeatLockTable(SeatLockTable):
+    def __init__(self, ttl_seconds: float) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._expirations: dict[Id, dict[Id, float]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, showtime_id: Id, seat_ids: list[Id]) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            expirations = self._expirations.setdefault(showtime_id, {})
+            if any(expirations.get(seat_id, 0.0) > now for seat_id in seat_ids):
+                return False
+
+            for seat_id in seat_ids:
+                expirations[seat_id] = now + self._ttl_seconds
+            return True
+
+    def release(self, showtime_id: Id, seat_ids: list[Id]) -> None:
+        with self._lock:
+            expirations = self._expirations.get(showtime_id)
+            if expirations is None:
+                return
+
+            for seat_id in seat_ids:
+                expirations.pop(seat_id, None)
+            if not expirations:
+                del self._expirations[showtime_id]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._expirations.clear()
+
+
+class DisabledSeatLockTable(SeatLockTable):
+    def acquire(self, showtime_id: Id, seat_ids: list[Id]) -> bool:
+        return True
+
+    def release(self, showtime_id: Id, seat_ids: list[Id]) -> None:
+        pass
+
+
+def create_seat_lock_table(settings: Settings) -> SeatLockTable:
+    if not settings.SEAT_LOCK_TABLE_ENABLED:
+        return DisabledSeatLockTable()
+
+    return InMemorySeatLockTable(ttl_seconds=settings.SEAT_LOCK_TTL_SECONDS)
+
+
+seat_lock_table = create_seat_lock_table(get_settings())
@@ -2,6 +2,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
+from sqlalchemy import Index, text
 from sqlmodel import Field, Relationship, SQLModel
 
 from app.reservations.domain.collections.seats import Seats
@@ -18,9 +19,11 @@ if TYPE_CHECKING:
 
 
 class SeatModel(SQLModel, table=True):
+    __table_args__ = (Index("ix_seatmodel_showtime_id_row_number", "showtime_id", "row", "number"),)
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     showtime_id: uuid.UUID = Field(foreign_key="showtimemodel.id")
-    reservation_id: uuid.UUID = Field(foreign_key="reservationmodel.id", nullable=True)
+    reservation_id: uuid.UUID = Field(foreign_key="reservationmodel.id", nullable=True, index=True)
     row: int
     number: int
     status: str
@@ -47,10 +50,19 @@ class SeatModel(SQLModel, table=True):
 
 
 class ReservationModel(SQLModel, table=True):
+    __table_args__ = (
+        Index(
+            "ix_reservationmodel_pending_created_at",
+            "created_at",
+            postgresql_where=text("status = 'pending'"),
+            sqlite_where=text("status = 'pending'"),
+        ),
+    )
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
-    user_id: uuid.UUID = Field(foreign_key="usermodel.id")
+    user_id: uuid.UUID = Field(foreign_key="usermodel.id", index=True)
     showtime_id: uuid.UUID = Field(foreign_key="showtimemodel.id")
-    provider_payment_id: str | None = None
+    provider_payment_id: str | None = Field(default=None, unique=True, index=True)
     status: str
     created_at: datetime
 
@@ -0,0 +1,57 @@
+from collections.abc import Sequence
+from uuid import UUID
+
+from sqlalchemy import Row
+from sqlmodel import update
+
+from app.reservations.domain.exceptions import SeatsNotAvailable
+from app.reservations.domain.repositories.async_reservation_repository import AsyncReservationRepository
+from app.reservations.domain.reservation import Reservation
+from app.reservations.infrastructure.models import ReservationModel, SeatModel
+from app.shared.domain.value_objects.id import Id
+from app.shared.domain.value_objects.reservation_status import ReservationStatus
+from app.shared.domain.value_objects.seat_status import SeatStatus
+from app.shared.infrastructure.repositories.async_sqlmodel_repository import AsyncSqlModelRepository
+from app.showtimes.infrastructure.caches.seat_map_cache import seat_map_cache
+
+
+class AsyncSqlModelReservationRepository(AsyncReservationRepository, AsyncSqlModelRepository):
+    async def create(self, reservation: Reservation) -> None:
+        reservation_model = ReservationModel.from_domain(reservation)
+        self._session.add(reservation_model)
+        reserved_seats = await self._reserve_seats(reservation)
+        await self._session.commit()
+
+        for showtime_id, row, number in reserved_seats:
+            seat_map_cache.update_seat_status(
+                Id.from_uuid(showtime_id), row=row, number=number, status=SeatStatus.RESERVED
+            )
+
+    async def attach_payment(self, reservation_id: Id, provider_payment_id: str) -> bool:
+        result = await self._session.exec(
+            update(ReservationModel)
+            .where(
+                ReservationModel.id == reservation_id.to_uuid(),  # type: ignore
+                ReservationModel.status == ReservationStatus.PENDING.value,  # type: ignore
+            )
+            .values(provider_payment_id=provider_payment_id)
+            .returning(ReservationModel.id)
+        )
+        attached = result.first() is not None
+        await self._session.commit()
+        return attached
+
+    async def _reserve_seats(self, reservation: Reservation) -> Sequence[Row[tuple[UUID, int, int]]]:
+        seat_ids = {seat.id.to_uuid() for seat in reservation.seats}
+        result = await self._session.exec(
+            update(SeatModel)
+            .where(SeatModel.id.in_(seat_ids), SeatModel.status == SeatStatus.AVAILABLE.value)  # type: ignore
+            .values(status=SeatStatus.RESERVED.value, reservation_id=reservation.id.to_uuid())
+            .returning(SeatModel.showtime_id, SeatModel.row, SeatModel.number)
+        )
+        reserved_seats = result.all()
+
+        if len(reserved_seats) != len(seat_ids):
+            await self._session.rollback()
+            raise SeatsNotAvailable()
+        return reserved_seats
@@ -1,50 +1,106 @@
-from sqlmodel import update
+from collections import defaultdict
+from collections.abc import Sequence
+from uuid import UUID
 
+from sqlalchemy import Row, literal
+from sqlmodel import select, update
+from sqlmodel.sql.expression import Select
+
+from app.reservations.domain.events import ReservationExpired
 from app.reservations.domain.repositories.reservation_repository import ReservationRepository
 from app.reservations.domain.reservation import Reservation
+from app.reservations.infrastructure.locks.in_memory_seat_lock_table import seat_lock_table
 from app.reservations.infrastructure.models import ReservationModel, SeatModel
+from app.shared.domain.events.event import Event
+from app.shared.domain.value_objects.date_time import DateTime
 from app.shared.domain.value_objects.id import Id
 from app.shared.domain.value_objects.reservation_status import ReservationStatus
 from app.shared.domain.value_objects.seat_status import SeatStatus
+from app.shared.infrastructure.outbox.sqlmodel_outbox import SqlModelOutbox
 from app.shared.infrastructure.repositories.sqlmodel_repository import SqlModelRepository
+from app.showtimes.infrastructure.caches.seat_map_cache import seat_map_cache
 
 
 class SqlModelReservationRepository(ReservationRepository, SqlModelRepository):
-    def create(self, reservation: Reservation) -> None:
-        reservation_model = ReservationModel.from_domain(reservation)
-        self._session.add(reservation_model)
-        self._reserve_seats(reservation)
-        self._session.commit()
-
-    def _reserve_seats(self, reservation: Reservation) -> None:
-        for seat in reservation.seats:
-            seat_model = self._session.get_one(SeatModel, seat.id.to_uuid())
-            seat_model.status = SeatStatus.RESERVED.value
-            seat_model.reservation_id = reservation.id.to_uuid()
-
-    def release(self, reservation: Reservation) -> None:
+    def release(self, reservation: Reservation, events: list[Event]) -> None:
         self._session.exec(
             update(ReservationModel)
             .where(ReservationModel.id == reservation.id.to_uuid())  # type: ignore
             .values(status=reservation.status)
         )
-        self._session.exec(
+        released_seats = self._session.exec(
             update(SeatModel)
             .where(SeatModel.reservation_id == reservation.id.to_uuid())  # type: ignore
             .values(status=SeatStatus.AVAILABLE.value, reservation_id=None)
+            .returning(SeatModel.id, SeatModel.showtime_id, SeatModel.row, SeatModel.number)
+        ).all()
+        SqlModelOutbox(self._session).add(events=events)
+        self._session.commit()
+        self._free_seats(seats=released_seats)
+
+    def cancel_expired_reservations(self, expiration_datetime: DateTime, limit: int) -> int:
+        return self._cancel_pending(
+            select(ReservationModel.id, ReservationModel.provider_payment_id)
+            .where(
+                ReservationModel.status == literal(ReservationStatus.PENDING.value, literal_execute=True),
+                ReservationModel.created_at < expiration_datetime.to_naive_utc(),
+            )
+            .order_by(ReservationModel.created_at)  # type: ignore
+            .limit(limit)
+        )
+
+    def cancel_pending_reservations(self, reservation_ids: list[Id]) -> int:
+        return self._cancel_pending(
+            select(ReservationModel.id, ReservationModel.provider_payment_id).where(
+                ReservationModel.id.in_([reservation_id.to_uuid() for reservation_id in reservation_ids]),  # type: ignore
+                ReservationModel.status == ReservationStatus.PENDING.value,
+            )
+        )
+
+    def _cancel_pending(self, statement: Select[tuple[UUID, str | None]]) -> int:
+        pending_reservations = self._session.exec(statement.with_for_update(skip_locked=True)).all()
+
+        if not pending_reservations:
+            self._session.rollback()
+            return 0
+
+        released_seats = self._cancel(
+            reservation_model_ids=[reservation_id for reservation_id, _ in pending_reservations]
+        )
+        SqlModelOutbox(self._session).add(
+            events=[
+                ReservationExpired(
+                    reservation_id=Id.from_uuid(reservation_id).value, provider_payment_id=provider_payment_id
+                )
+                for reservation_id, provider_payment_id in pending_reservations
+                if provider_payment_id is not None
+            ]
         )
         self._session.commit()
+        self._free_seats(seats=released_seats)
+        return len(pending_reservations)
 
-    def cancel_reservations(self, reservation_ids: list[Id]) -> None:
-        reversation_model_ids = [reservation_id.to_uuid() for reservation_id in reservation_ids]
+    def _cancel(self, reservation_model_ids: list[UUID]) -> Sequence[Row[tuple[UUID, UUID, int, int]]]:
         self._session.exec(
             update(ReservationModel)
-            .where(ReservationModel.id.in_(reversation_model_ids))  # type: ignore
+            .where(ReservationModel.id.in_(reservation_model_ids))  # type: ignore
             .values(status=ReservationStatus.CANCELLED.value)
         )
-        self._session.exec(
+        return self._session.exec(
             update(SeatModel)
-            .where(SeatModel.reservation_id.in_(reversation_model_ids))  # type: ignore
+            .where(SeatModel.reservation_id.in_(reservation_model_ids))  # type: ignore
             .values(status=SeatStatus.AVAILABLE.value, reservation_id=None)
-        )
-        self._session.commit()
+            .returning(SeatModel.id, SeatModel.showtime_id, SeatModel.row, SeatModel.number)
+        ).all()
+
+    @staticmethod
+    def _free_seats(seats: Sequence[Row[tuple[UUID, UUID, int, int]]]) -> None:
+        seat_ids_by_showtime: dict[Id, list[Id]] = defaultdict(list)
+        for seat_id, showtime_id, row, number in seats:
+            seat_map_cache.update_seat_status(
+                Id.from_uuid(showtime_id), row=row, number=number, status=SeatStatus.AVAILABLE
+            )
+            seat_ids_by_showtime[Id.from_uuid(showtime_id)].append(Id.from_uuid(seat_id))
+
+        for showtime_id, seat_ids in seat_ids_by_showtime.items():
+            seat_lock_table.release(showtime_id=showtime_id, seat_ids=seat_ids)
@@ -0,0 +1,4 @@
+from app.reservations.application.jobs.expire_reservations_job import expire_reservations_job
+from app.shared.infrastructure.schedulers.heap_expiry_scheduler import HeapExpiryScheduler
+
+reservation_expiry_scheduler = HeapExpiryScheduler(on_expire=expire_reservations_job)
@@ -12,7 +12,7 @@ from app.reservations.domain.finders.reservation_finder import ReservationFinder
 from app.reservations.domain.repositories.reservation_repository import ReservationRepository
 from app.reservations.domain.reservation import CancellableReservation
 from app.reservations.tests.domain.mothers.reservation_mother import ReservationMother
-from app.shared.domain.events.event_bus import EventBus
+from app.shared.domain.schedulers.expiry_scheduler import ExpiryScheduler
 from app.shared.domain.value_objects.date_time import DateTime
 from app.shared.domain.value_objects.id import Id
 
@@ -28,11 +28,14 @@ class TestCancelReservation:
         return create_autospec(spec=ReservationFinder, instance=True, spec_set=True)
 
     @pytest.fixture
-    def mock_event_bus(self) -> Any:
-        return create_autospec(spec=EventBus, instance=True, spec_set=True)
+    def mock_expiry_scheduler(self) -> Any:
+        return create_autospec(spec=ExpiryScheduler, instance=True, spec_set=True)
 
     def test_cancels_reservation(
-        self, mock_reservation_repository: Mock, mock_reservation_finder: Mock, mock_event_bus: Mock
+        self,
+        mock_expiry_scheduler: Mock,
+        mock_reservation_repository: Mock,
+        mock_reservation_finder: Mock,
     ) -> None:
         reservation = ReservationMother().create()
         mock_reservation_finder.find_cancellable_reservation.return_value = CancellableReservation(
@@ -40,30 +43,36 @@ class TestCancelReservation:
         )
 
         CancelReservation(
-            finder=mock_reservation_finder, repository=mock_reservation_repository, event_bus=mock_event_bus
+            finder=mock_reservation_finder,
+            repository=mock_reservation_repository,
+            expiry_scheduler=mock_expiry_scheduler,
         ).execute(CancelReservationParams(reservation_id=reservation.id, user_id=reservation.user_id))
 
         mock_reservation_finder.find_cancellable_reservation.assert_called_once_with(reservation_id=reservation.id)
         mock_reservation_repository.release.assert_called_once_with(
-            reservation=ReservationMother().cancelled().create()
-        )
-        mock_event_bus.publish.assert_called_once_with(
-            [
+            reservation=ReservationMother().cancelled().create(),
+            events=[
                 ReservationCancelled(
                     reservation_id=reservation.id.value,
                     provider_payment_id="pi_3MtwBwLkdIwHu7ix28a3tqPa",
                 )
-            ]
+            ],
         )
+        mock_expiry_scheduler.discard.assert_called_once_with(id=reservation.id)
 
     def test_raise_exception_when_reservation_not_found(
-        self, mock_reservation_finder: Mock, mock_reservation_repository: Mock, mock_event_bus: Mock
+        self,
+        mock_expiry_scheduler: Mock,
+        mock_reservation_finder: Mock,
+        mock_reservation_repository: Mock,
     ) -> None:
         mock_reservation_finder.find_cancellable_reservation.return_value = None
 
         with pytest.raises(ReservationNotFound):
             CancelReservation(
-                finder=mock_reservation_finder, repository=mock_reservation_repository, event_bus=mock_event_bus
+                finder=mock_reservation_finder,
+                repository=mock_reservation_repository,
+                expiry_scheduler=mock_expiry_scheduler,
             ).execute(
                 CancelReservationParams(
                     reservation_id=Id("434d5682-0a19-499e-a72a-c08f47b43e09"),
@@ -75,10 +84,13 @@ class TestCancelReservation:
             reservation_id=Id("434d5682-0a19-499e-a72a-c08f47b43e09")
         )
         mock_reservation_repository.release.assert_not_called()
-        mock_event_bus.publish.assert_not_called()
+        mock_expiry_scheduler.discard.assert_not_called()
 
     def test_raise_exception_when_user_is_not_the_owner_of_the_reservation(
-        self, mock_reservation_finder: Mock, mock_reservation_repository: Mock, mock_event_bus: Mock
+        self,
+        mock_expiry_scheduler: Mock,
+        mock_reservation_finder: Mock,
+        mock_reservation_repository: Mock,
     ) -> None:
         reservation = ReservationMother().create()
         mock_reservation_finder.find_cancellable_reservation.return_value = CancellableReservation(
@@ -87,7 +99,9 @@ class TestCancelReservation:
 
         with pytest.raises(UnauthorizedCancellation):
             CancelReservation(
-                finder=mock_reservation_finder, repository=mock_reservation_repository, event_bus=mock_event_bus
+                finder=mock_reservation_finder,
+                repository=mock_reservation_repository,
+                expiry_scheduler=mock_expiry_scheduler,
             ).execute(
                 CancelReservationParams(
                     reservation_id=reservation.id, user_id=Id("6ae2c28b-fed8-4699-872b-6b889ea27bee")
@@ -96,10 +110,13 @@ class TestCancelReservation:
 
         mock_reservation_finder.find_cancellable_reservation.assert_called_once_with(reservation_id=reservation.id)
         mock_reservation_repository.release.assert_not_called()
-        mock_event_bus.publish.assert_not_called()
+        mock_expiry_scheduler.discard.assert_not_called()
 
     def test_raise_exception_when_showtime_has_started(
-        self, mock_reservation_finder: Mock, mock_reservation_repository: Mock, mock_event_bus: Mock
+        self,
+        mock_expiry_scheduler: Mock,
+        mock_reservation_finder: Mock,
+        mock_reservation_repository: Mock,
     ) -> None:
         reservation = ReservationMother().create()
         mock_reservation_finder.find_cancellable_reservation.return_value = CancellableReservation(
@@ -108,9 +125,11 @@ class TestCancelReservation:
 
         with pytest.raises(CancellationNotAllowed):
             CancelReservation(
-                finder=mock_reservation_finder, repository=mock_reservation_repository, event_bus=mock_event_bus
+                finder=mock_reservation_finder,
+                repository=mock_reservation_repository,
+                expiry_scheduler=mock_expiry_scheduler,
             ).execute(CancelReservationParams(reservation_id=reservation.id, user_id=reservation.user_id))
 
         mock_reservation_finder.find_cancellable_reservation.assert_called_once_with(reservation_id=reservation.id)
         mock_reservation_repository.release.assert_not_called()
-        mock_event_bus.publish.assert_not_called()
+        mock_expiry_scheduler.discard.assert_not_called()
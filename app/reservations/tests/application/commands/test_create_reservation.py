@@ -8,14 +8,18 @@ from freezegun import freeze_time
 
 from app.reservations.application.commands.create_reservation import CreateReservation, CreateReservationParams
 from app.reservations.domain.collections.seats import Seats
-from app.reservations.domain.exceptions import SeatsNotAvailable
-from app.reservations.domain.finders.seat_finder import SeatFinder
-from app.reservations.domain.repositories.reservation_repository import ReservationRepository
+from app.reservations.domain.exceptions import ReservationNotPending, SeatsNotAvailable
+from app.reservations.domain.finders.async_seat_finder import AsyncSeatFinder
+from app.reservations.domain.locks.seat_lock_table import SeatLockTable
+from app.reservations.domain.repositories.async_reservation_repository import AsyncReservationRepository
 from app.reservations.domain.reservation import Reservation
+from app.reservations.domain.reservation_payment import ReservationPayment
 from app.reservations.domain.seat import Seat
 from app.settings import Settings
-from app.shared.domain.clients.payment_client import PaymentClient
+from app.shared.domain.clients.async_payment_client import AsyncPaymentClient
+from app.shared.domain.exceptions import PaymentCancellationError, PaymentProviderUnavailable
 from app.shared.domain.payment_intent import PaymentIntent
+from app.shared.domain.schedulers.expiry_scheduler import ExpiryScheduler
 from app.shared.domain.value_objects.date_time import DateTime
 from app.shared.domain.value_objects.id import Id
 from app.shared.domain.value_objects.reservation_status import ReservationStatus
@@ -26,56 +30,92 @@ from app.shared.domain.value_objects.seat_status import SeatStatus
 class TestCreateReservation:
     @pytest.fixture
     def mock_reservation_repository(self) -> Any:
-        return create_autospec(spec=ReservationRepository, instance=True, spec_set=True)
+        return create_autospec(spec=AsyncReservationRepository, instance=True, spec_set=True)
 
     @pytest.fixture
     def mock_seat_finder(self) -> Any:
-        return create_autospec(spec=SeatFinder, instance=True, spec_set=True)
+        return create_autospec(spec=AsyncSeatFinder, instance=True, spec_set=True)
 
     @pytest.fixture
     def mock_payment_client(self) -> Any:
-        return create_autospec(spec=PaymentClient, instance=True, spec_set=True)
+        return create_autospec(spec=AsyncPaymentClient, instance=True, spec_set=True)
 
-    @pytest.fixture(autouse=True)
-    def override_settings(self) -> Generator[None, None, None]:
-        with patch(
-            "app.reservations.application.commands.create_reservation.settings",
-            Settings(GENERAL_ADMISSION_PRICE=15.0),
-        ):
-            yield
+    @pytest.fixture
+    def mock_expiry_scheduler(self) -> Any:
+        return create_autospec(spec=ExpiryScheduler, instance=True, spec_set=True)
 
-    def test_creates_reservation(
-        self, mock_reservation_repository: Mock, mock_seat_finder: Mock, mock_payment_client: Mock
-    ) -> None:
-        mock_seat_finder.find_seats.return_value = Seats(
+    @pytest.fixture
+    def mock_seat_lock_table(self) -> Any:
+        seat_lock_table = create_autospec(spec=SeatLockTable, instance=True, spec_set=True)
+        seat_lock_table.acquire.return_value = True
+        return seat_lock_table
+
+    @pytest.fixture
+    def available_seats(self) -> Seats:
+        return Seats(
             [
                 Seat(id=Id("c555276e-0be4-48ea-9e27-fe1500384380"), row=1, number=1, status=SeatStatus.AVAILABLE),
                 Seat(id=Id("bb07c2f1-33f4-4987-ad02-8a420104f810"), row=1, number=2, status=SeatStatus.AVAILABLE),
             ]
         )
-        mock_payment_client.create_payment_intent.return_value = PaymentIntent(
+
+    @pytest.fixture
+    def params(self) -> CreateReservationParams:
+        return CreateReservationParams(
+            showtime_id=Id("aa7a9372-09a0-415a-8c65-ec5aa6026e72"),
+            seat_ids=[Id("c555276e-0be4-48ea-9e27-fe1500384380"), Id("bb07c2f1-33f4-4987-ad02-8a420104f810")],
+            user_id=Id("1553d340-89eb-433b-a101-981bdaa740ed"),
+        )
+
+    @pytest.fixture
+    def payment_intent(self) -> PaymentIntent:
+        return PaymentIntent(
             client_secret="test_client_secret",
             provider_payment_id="pi_3MtwBwLkdIwHu7ix28a3tqPa",
             amount=30.0,
         )
 
-        CreateReservation(
+    @pytest.fixture(autouse=True)
+    def override_settings(self) -> Generator[None, None, None]:
+        with patch(
+            "app.reservations.application.commands.create_reservation.settings",
+            Settings(GENERAL_ADMISSION_PRICE=15.0, RESERVATION_EXPIRATION_MINUTES=30),
+        ):
+            yield
+
+    @pytest.mark.anyio
+    async def test_creates_reservation(
+        self,
+        mock_expiry_scheduler: Mock,
+        mock_reservation_repository: Mock,
+        mock_seat_finder: Mock,
+        mock_payment_client: Mock,
+        mock_seat_lock_table: Mock,
+        available_seats: Seats,
+        params: CreateReservationParams,
+        payment_intent: PaymentIntent,
+    ) -> None:
+        mock_seat_finder.find_seats.return_value = available_seats
+        mock_payment_client.create_payment_intent.return_value = payment_intent
+        mock_reservation_repository.attach_payment.return_value = True
+
+        reservation_payment = await CreateReservation(
             reservation_repository=mock_reservation_repository,
             seat_finder=mock_seat_finder,
             payment_client=mock_payment_client,
-        ).execute(
-            params=CreateReservationParams(
-                showtime_id=Id("aa7a9372-09a0-415a-8c65-ec5aa6026e72"),
-                seat_ids=[Id("c555276e-0be4-48ea-9e27-fe1500384380"), Id("bb07c2f1-33f4-4987-ad02-8a420104f810")],
-                user_id=Id("1553d340-89eb-433b-a101-981bdaa740ed"),
-            )
-        )
+            expiry_scheduler=mock_expiry_scheduler,
+            seat_lock_table=mock_seat_lock_table,
+        ).execute(params=params)
 
-        mock_seat_finder.find_seats.assert_called_once_with(
+        mock_seat_lock_table.acquire.assert_called_once_with(
+            showtime_id=Id("aa7a9372-09a0-415a-8c65-ec5aa6026e72"),
+            seat_ids=[Id("c555276e-0be4-48ea-9e27-fe1500384380"), Id("bb07c2f1-33f4-4987-ad02-8a420104f810")],
+        )
+        mock_seat_lock_table.release.assert_not_called()
+        mock_seat_finder.find_seats.assert_awaited_once_with(
             seat_ids=[Id("c555276e-0be4-48ea-9e27-fe1500384380"), Id("bb07c2f1-33f4-4987-ad02-8a420104f810")]
         )
-        mock_payment_client.create_payment_intent.assert_called_once_with(amount=30.0)
-        mock_reservation_repository.create.assert_called_once_with(
+        mock_reservation_repository.create.assert_awaited_once_with(
             reservation=Reservation(
                 id=ANY,
                 user_id=Id("1553d340-89eb-433b-a101-981bdaa740ed"),
@@ -97,17 +137,146 @@ class TestCreateReservation:
                         ),
                     ]
                 ),
-                provider_payment_id="pi_3MtwBwLkdIwHu7ix28a3tqPa",
+                provider_payment_id=None,
                 created_at=DateTime.from_datetime(datetime(2025, 1, 10, 12, 0, 0)),
             )
         )
+        reservation_id = mock_reservation_repository.create.call_args.kwargs["reservation"].id
+        mock_expiry_scheduler.schedule.assert_called_once_with(
+            id=reservation_id, expires_at=DateTime.from_datetime(datetime(2025, 1, 10, 12, 30, 0))
+        )
+        mock_payment_client.create_payment_intent.assert_awaited_once_with(
+            amount=30.0, idempotency_key=reservation_id.value
+        )
+        mock_reservation_repository.attach_payment.assert_awaited_once_with(
+            reservation_id=reservation_id, provider_payment_id="pi_3MtwBwLkdIwHu7ix28a3tqPa"
+        )
+        mock_payment_client.cancel_payment_intent.assert_not_called()
+
+        assert reservation_payment == ReservationPayment(reservation_id=reservation_id, payment_intent=payment_intent)
 
+    @pytest.mark.anyio
+    async def test_does_not_create_payment_intent_when_seats_are_taken_concurrently(
+        self,
+        mock_expiry_scheduler: Mock,
+        mock_reservation_repository: Mock,
+        mock_seat_finder: Mock,
+        mock_payment_client: Mock,
+        mock_seat_lock_table: Mock,
+        available_seats: Seats,
+        params: CreateReservationParams,
+    ) -> None:
+        mock_seat_finder.find_seats.return_value = available_seats
+        mock_reservation_repository.create.side_effect = SeatsNotAvailable()
+
+        with pytest.raises(SeatsNotAvailable):
+            await CreateReservation(
+                reservation_repository=mock_reservation_repository,
+                seat_finder=mock_seat_finder,
+                payment_client=mock_payment_client,
+                expiry_scheduler=mock_expiry_scheduler,
+                seat_lock_table=mock_seat_lock_table,
+            ).execute(params=params)
+
+        mock_expiry_scheduler.schedule.assert_not_called()
+        mock_payment_client.create_payment_intent.assert_not_called()
+        mock_seat_lock_table.release.assert_called_once_with(
+            showtime_id=Id("aa7a9372-09a0-415a-8c65-ec5aa6026e72"),
+            seat_ids=[Id("c555276e-0be4-48ea-9e27-fe1500384380"), Id("bb07c2f1-33f4-4987-ad02-8a420104f810")],
+        )
+
+    @pytest.mark.anyio
+    async def test_keeps_hold_without_payment_intent_when_provider_is_unavailable(
+        self,
+        mock_expiry_scheduler: Mock,
+        mock_reservation_repository: Mock,
+        mock_seat_finder: Mock,
+        mock_payment_client: Mock,
+        mock_seat_lock_table: Mock,
+        available_seats: Seats,
+        params: CreateReservationParams,
+    ) -> None:
+        mock_seat_finder.find_seats.return_value = available_seats
+        mock_payment_client.create_payment_intent.side_effect = PaymentProviderUnavailable()
+
+        reservation_payment = await CreateReservation(
+            reservation_repository=mock_reservation_repository,
+            seat_finder=mock_seat_finder,
+            payment_client=mock_payment_client,
+            expiry_scheduler=mock_expiry_scheduler,
+            seat_lock_table=mock_seat_lock_table,
+        ).execute(params=params)
+
+        reservation_id = mock_reservation_repository.create.call_args.kwargs["reservation"].id
+        mock_expiry_scheduler.schedule.assert_called_once()
+        mock_reservation_repository.attach_payment.assert_not_called()
+
+        assert reservation_payment == ReservationPayment(reservation_id=reservation_id, payment_intent=None)
+
+    @pytest.mark.anyio
+    async def test_cancels_payment_intent_when_reservation_is_no_longer_pending(
+        self,
+        mock_expiry_scheduler: Mock,
+        mock_reservation_repository: Mock,
+        mock_seat_finder: Mock,
+        mock_payment_client: Mock,
+        mock_seat_lock_table: Mock,
+        available_seats: Seats,
+        params: CreateReservationParams,
+        payment_intent: PaymentIntent,
+    ) -> None:
+        mock_seat_finder.find_seats.return_value = available_seats
+        mock_payment_client.create_payment_intent.return_value = payment_intent
+        mock_reservation_repository.attach_payment.return_value = False
+
+        with pytest.raises(ReservationNotPending):
+            await CreateReservation(
+                reservation_repository=mock_reservation_repository,
+                seat_finder=mock_seat_finder,
+                payment_client=mock_payment_client,
+                expiry_scheduler=mock_expiry_scheduler,
+                seat_lock_table=mock_seat_lock_table,
+            ).execute(params=params)
+
+        mock_payment_client.cancel_payment_intent.assert_awaited_once_with(payment_id="pi_3MtwBwLkdIwHu7ix28a3tqPa")
+
+    @pytest.mark.anyio
+    async def test_raises_reservation_not_pending_when_payment_intent_cannot_be_cancelled(
+        self,
+        mock_expiry_scheduler: Mock,
+        mock_reservation_repository: Mock,
+        mock_seat_finder: Mock,
+        mock_payment_client: Mock,
+        mock_seat_lock_table: Mock,
+        available_seats: Seats,
+        params: CreateReservationParams,
+        payment_intent: PaymentIntent,
+    ) -> None:
+        mock_seat_finder.find_seats.return_value = available_seats
+        mock_payment_client.create_payment_intent.return_value = payment_intent
+        mock_payment_client.cancel_payment_intent.side_effect = PaymentCancellationError
+        mock_reservation_repository.attach_payment.return_value = False
+
+        with pytest.raises(ReservationNotPending):
+            await CreateReservation(
+                reservation_repository=mock_reservation_repository,
+                seat_finder=mock_seat_finder,
+                payment_client=mock_payment_client,
+                expiry_scheduler=mock_expiry_scheduler,
+                seat_lock_table=mock_seat_lock_table,
+            ).execute(params=params)
+
+        mock_payment_client.cancel_payment_intent.assert_awaited_once_with(payment_id="pi_3MtwBwLkdIwHu7ix28a3tqPa")
+
+    @pytest.mark.anyio
     @pytest.mark.parametrize("seat_status", [SeatStatus.RESERVED, SeatStatus.OCCUPIED])
-    def test_does_not_create_reservation_when_seats_are_not_available(
+    async def test_does_not_create_reservation_when_seats_are_not_available(
         self,
+        mock_expiry_scheduler: Mock,
         mock_reservation_repository: Mock,
         mock_seat_finder: Mock,
         mock_payment_client: Mock,
+        mock_seat_lock_table: Mock,
         seat_status: SeatStatus,
     ) -> None:
         mock_seat_finder.find_seats.return_value = Seats(
@@ -118,10 +287,12 @@ class TestCreateReservation:
         )
 
         with pytest.raises(SeatsNotAvailable):
-            CreateReservation(
+            await CreateReservation(
                 reservation_repository=mock_reservation_repository,
                 seat_finder=mock_seat_finder,
                 payment_client=mock_payment_client,
+                expiry_scheduler=mock_expiry_scheduler,
+                seat_lock_table=mock_seat_lock_table,
             ).execute(
                 params=CreateReservationParams(
                     showtime_id=Id("aa7a9372-09a0-415a-8c65-ec5aa6026e72"),
@@ -133,8 +304,38 @@ class TestCreateReservation:
                 )
             )
 
-        mock_seat_finder.find_seats.assert_called_once_with(
+        mock_seat_finder.find_seats.assert_awaited_once_with(
             seat_ids=[Id("c555276e-0be4-48ea-9e27-fe1500384380"), Id("bb07c2f1-33f4-4987-ad02-8a420104f810")]
         )
         mock_payment_client.create_payment_intent.assert_not_called()
         mock_reservation_repository.create.assert_not_called()
+        mock_expiry_scheduler.schedule.assert_not_called()
+        mock_seat_lock_table.release.assert_called_once_with(
+            showtime_id=Id("aa7a9372-09a0-415a-8c65-ec5aa6026e72"),
+            seat_ids=[Id("c555276e-0be4-48ea-9e27-fe1500384380"), Id("bb07c2f1-33f4-4987-ad02-8a420104f810")],
+        )
+
+    @pytest.mark.anyio
+    async def test_rejects_seats_locked_by_another_buyer_without_querying_the_database(
+        self,
+        mock_expiry_scheduler: Mock,
+        mock_reservation_repository: Mock,
+        mock_seat_finder: Mock,
+        mock_payment_client: Mock,
+        mock_seat_lock_table: Mock,
+        params: CreateReservationParams,
+    ) -> None:
+        mock_seat_lock_table.acquire.return_value = False
+
+        with pytest.raises(SeatsNotAvailable):
+            await CreateReservation(
+                reservation_repository=mock_reservation_repository,
+                seat_finder=mock_seat_finder,
+                payment_client=mock_payment_client,
+                expiry_scheduler=mock_expiry_scheduler,
+                seat_lock_table=mock_seat_lock_table,
+            ).execute(params=params)
+
+        mock_seat_finder.find_seats.assert_not_called()
+        mock_reservation_repository.create.assert_not_called()
+        mock_seat_lock_table.release.assert_not_called()
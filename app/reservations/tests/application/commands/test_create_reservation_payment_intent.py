@@ -0,0 +1,222 @@
+from collections.abc import Generator
+from typing import Any
+from unittest.mock import Mock, create_autospec, patch
+
+import pytest
+
+from app.reservations.application.commands.create_reservation_payment_intent import (
+    CreateReservationPaymentIntent,
+    CreateReservationPaymentIntentParams,
+)
+from app.reservations.domain.collections.seats import Seats
+from app.reservations.domain.exceptions import ReservationNotFound, ReservationNotPending, UnauthorizedPayment
+from app.reservations.domain.finders.async_reservation_finder import AsyncReservationFinder
+from app.reservations.domain.repositories.async_reservation_repository import AsyncReservationRepository
+from app.reservations.domain.reservation import Reservation
+from app.reservations.tests.domain.builders.reservation_builder import ReservationBuilder
+from app.reservations.tests.domain.builders.seat_builder import SeatBuilder
+from app.settings import Settings
+from app.shared.domain.clients.async_payment_client import AsyncPaymentClient
+from app.shared.domain.exceptions import PaymentProviderUnavailable
+from app.shared.domain.payment_intent import PaymentIntent
+from app.shared.domain.value_objects.id import Id
+from app.shared.domain.value_objects.reservation_status import ReservationStatus
+
+
+class TestCreateReservationPaymentIntent:
+    @pytest.fixture
+    def mock_reservation_finder(self) -> Any:
+        return create_autospec(spec=AsyncReservationFinder, instance=True, spec_set=True)
+
+    @pytest.fixture
+    def mock_reservation_repository(self) -> Any:
+        return create_autospec(spec=AsyncReservationRepository, instance=True, spec_set=True)
+
+    @pytest.fixture
+    def mock_payment_client(self) -> Any:
+        return create_autospec(spec=AsyncPaymentClient, instance=True, spec_set=True)
+
+    @pytest.fixture(autouse=True)
+    def override_settings(self) -> Generator[None, None, None]:
+        with patch(
+            "app.reservations.application.commands.create_reservation_payment_intent.settings",
+            Settings(GENERAL_ADMISSION_PRICE=15.0),
+        ):
+            yield
+
+    @pytest.fixture
+    def reservation(self) -> Reservation:
+        return (
+            ReservationBuilder()
+            .with_id(Id("5661455d-de5a-47ba-b99f-f6d50fdfc00b"))
+            .with_user_id(Id("1553d340-89eb-433b-a101-981bdaa740ed"))
+            .with_seats(Seats([SeatBuilder().build(), SeatBuilder().build()]))
+            .without_provider_payment_id()
+            .build()
+        )
+
+    @pytest.fixture
+    def params(self) -> CreateReservationPaymentIntentParams:
+        return CreateReservationPaymentIntentParams(
+            reservation_id=Id("5661455d-de5a-47ba-b99f-f6d50fdfc00b"),
+            user_id=Id("1553d340-89eb-433b-a101-981bdaa740ed"),
+        )
+
+    @pytest.fixture
+    def payment_intent(self) -> PaymentIntent:
+        return PaymentIntent(
+            client_secret="test_client_secret", provider_payment_id="pi_3MtwBwLkdIwHu7ix28a3tqPa", amount=30.0
+        )
+
+    @pytest.mark.anyio
+    async def test_creates_and_attaches_payment_intent(
+        self,
+        mock_reservation_finder: Mock,
+        mock_reservation_repository: Mock,
+        mock_payment_client: Mock,
+        reservation: Reservation,
+        params: CreateReservationPaymentIntentParams,
+        payment_intent: PaymentIntent,
+    ) -> None:
+        mock_reservation_finder.find_reservation.return_value = reservation
+        mock_payment_client.create_payment_intent.return_value = payment_intent
+        mock_reservation_repository.attach_payment.return_value = True
+
+        result = await CreateReservationPaymentIntent(
+            reservation_finder=mock_reservation_finder,
+            reservation_repository=mock_reservation_repository,
+            payment_client=mock_payment_client,
+        ).execute(params=params)
+
+        mock_reservation_finder.find_reservation.assert_awaited_once_with(
+            reservation_id=Id("5661455d-de5a-47ba-b99f-f6d50fdfc00b")
+        )
+        mock_payment_client.create_payment_intent.assert_awaited_once_with(
+            amount=30.0, idempotency_key="5661455d-de5a-47ba-b99f-f6d50fdfc00b"
+        )
+        mock_reservation_repository.attach_payment.assert_awaited_once_with(
+            reservation_id=Id("5661455d-de5a-47ba-b99f-f6d50fdfc00b"),
+            provider_payment_id="pi_3MtwBwLkdIwHu7ix28a3tqPa",
+        )
+        mock_payment_client.cancel_payment_intent.assert_not_called()
+
+        assert result == payment_intent
+
+    @pytest.mark.anyio
+    async def test_raises_when_reservation_does_not_exist(
+        self,
+        mock_reservation_finder: Mock,
+        mock_reservation_repository: Mock,
+        mock_payment_client: Mock,
+        params: CreateReservationPaymentIntentParams,
+    ) -> None:
+        mock_reservation_finder.find_reservation.return_value = None
+
+        with pytest.raises(ReservationNotFound):
+            await CreateReservationPaymentIntent(
+                reservation_finder=mock_reservation_finder,
+                reservation_repository=mock_reservation_repository,
+                payment_client=mock_payment_client,
+            ).execute(params=params)
+
+        mock_payment_client.create_payment_intent.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_raises_when_reservation_belongs_to_another_user(
+        self,
+        mock_reservation_finder: Mock,
+        mock_reservation_repository: Mock,
+        mock_payment_client: Mock,
+        reservation: Reservation,
+    ) -> None:
+        mock_reservation_finder.find_reservation.return_value = reservation
+
+        with pytest.raises(UnauthorizedPayment):
+            await CreateReservationPaymentIntent(
+                reservation_finder=mock_reservation_finder,
+                reservation_repository=mock_reservation_repository,
+                payment_client=mock_payment_client,
+            ).execute(
+                params=CreateReservationPaymentIntentParams(
+                    reservation_id=Id("5661455d-de5a-47ba-b99f-f6d50fdfc00b"),
+                    user_id=Id("0d6b1a43-9d4f-4b5c-8c8e-2c1b0f6f1a11"),
+                )
+            )
+
+        mock_payment_client.create_payment_intent.assert_not_called()
+
+    @pytest.mark.anyio
+    @pytest.mark.parametrize(
+        "status", [ReservationStatus.CONFIRMED, ReservationStatus.CANCELLED, ReservationStatus.REFUNDED]
+    )
+    async def test_raises_when_reservation_is_not_pending(
+        self,
+        mock_reservation_finder: Mock,
+        mock_reservation_repository: Mock,
+        mock_payment_client: Mock,
+        params: CreateReservationPaymentIntentParams,
+        status: ReservationStatus,
+    ) -> None:
+        mock_reservation_finder.find_reservation.return_value = (
+            ReservationBuilder()
+            .with_id(Id("5661455d-de5a-47ba-b99f-f6d50fdfc00b"))
+            .with_user_id(Id("1553d340-89eb-433b-a101-981bdaa740ed"))
+            .with_status(status)
+            .build()
+        )
+
+        with pytest.raises(ReservationNotPending):
+            await CreateReservationPaymentIntent(
+                reservation_finder=mock_reservation_finder,
+                reservation_repository=mock_reservation_repository,
+                payment_client=mock_payment_client,
+            ).execute(params=params)
+
+        mock_payment_client.create_payment_intent.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_cancels_payment_intent_when_reservation_expires_meanwhile(
+        self,
+        mock_reservation_finder: Mock,
+        mock_reservation_repository: Mock,
+        mock_payment_client: Mock,
+        reservation: Reservation,
+        params: CreateReservationPaymentIntentParams,
+        payment_intent: PaymentIntent,
+    ) -> None:
+        mock_reservation_finder.find_reservation.return_value = reservation
+        mock_payment_client.create_payment_intent.return_value = payment_intent
+        mock_reservation_repository.attach_payment.return_value = False
+
+        with pytest.raises(ReservationNotPending):
+            await CreateReservationPaymentIntent(
+                reservation_finder=mock_reservation_finder,
+                reservation_repository=mock_reservation_repository,
+                payment_client=mock_payment_client,
+            ).execute(params=params)
+
+        mock_payment_client.cancel_payment_intent.assert_awaited_once_with(payment_id="pi_3MtwBwLkdIwHu7ix28a3tqPa")
+
+    @pytest.mark.anyio
+    async def test_raises_reservation_not_pending_when_payment_intent_cannot_be_cancelled(
+        self,
+        mock_reservation_finder: Mock,
+        mock_reservation_repository: Mock,
+        mock_payment_client: Mock,
+        reservation: Reservation,
+        params: CreateReservationPaymentIntentParams,
+        payment_intent: PaymentIntent,
+    ) -> None:
+        mock_reservation_finder.find_reservation.return_value = reservation
+        mock_payment_client.create_payment_intent.return_value = payment_intent
+        mock_payment_client.cancel_payment_intent.side_effect = PaymentProviderUnavailable
+        mock_reservation_repository.attach_payment.return_value = False
+
+        with pytest.raises(ReservationNotPending):
+            await CreateReservationPaymentIntent(
+                reservation_finder=mock_reservation_finder,
+                reservation_repository=mock_reservation_repository,
+                payment_client=mock_payment_client,
+            ).execute(params=params)
+
+        mock_payment_client.cancel_payment_intent.assert_awaited_once_with(payment_id="pi_3MtwBwLkdIwHu7ix28a3tqPa")
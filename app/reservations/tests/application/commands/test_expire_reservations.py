@@ -0,0 +1,26 @@
+from typing import Any
+from unittest.mock import Mock, create_autospec
+
+import pytest
+
+from app.reservations.application.commands.expire_reservations import ExpireReservations
+from app.reservations.domain.repositories.reservation_repository import ReservationRepository
+from app.shared.domain.value_objects.id import Id
+
+
+class TestExpireReservations:
+    @pytest.fixture
+    def mock_reservation_repository(self) -> Any:
+        return create_autospec(spec=ReservationRepository, instance=True, spec_set=True)
+
+    def test_cancels_reservations_that_are_still_pending(self, mock_reservation_repository: Mock) -> None:
+        mock_reservation_repository.cancel_pending_reservations.return_value = 1
+
+        expired = ExpireReservations(repository=mock_reservation_repository).execute(
+            reservation_ids=[Id("b6439a2d-c0c0-45c8-81b7-7d7b155830ba"), Id("f48c4dae-b0e2-43f6-a659-599f5e254270")]
+        )
+
+        mock_reservation_repository.cancel_pending_reservations.assert_called_once_with(
+            reservation_ids=[Id("b6439a2d-c0c0-45c8-81b7-7d7b155830ba"), Id("f48c4dae-b0e2-43f6-a659-599f5e254270")]
+        )
+        assert expired == 1
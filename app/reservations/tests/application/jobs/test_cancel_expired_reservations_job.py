@@ -29,13 +29,6 @@ class TestCancelExpiredReservationsJob:
         ) as mock:
             yield mock.return_value
 
-    @pytest.fixture
-    def mock_reservation_finder(self) -> Generator[Mock, None, None]:
-        with patch(
-            "app.reservations.application.jobs.cancel_expired_reservations_job.SqlModelReservationFinder"
-        ) as mock:
-            yield mock.return_value
-
     @pytest.fixture
     def mock_db_session(self, session: Session) -> Generator[Session, None, None]:
         with patch("app.reservations.application.jobs.cancel_expired_reservations_job.get_session") as mock:
@@ -68,11 +61,11 @@ class TestCancelExpiredReservationsJob:
         assert seat_model.reservation_id is None
 
     def test_calls_cancel_expired_reservations(
-        self, mock_cancel_expired_reservations: Mock, mock_reservation_repository: Mock, mock_reservation_finder: Mock
+        self, mock_cancel_expired_reservations: Mock, mock_reservation_repository: Mock
     ) -> None:
+        mock_cancel_expired_reservations.return_value.execute.return_value = 0
+
         cancel_expired_reservations_job()
 
-        mock_cancel_expired_reservations.assert_called_once_with(
-            repository=mock_reservation_repository, finder=mock_reservation_finder
-        )
+        mock_cancel_expired_reservations.assert_called_once_with(repository=mock_reservation_repository)
         mock_cancel_expired_reservations.return_value.execute.assert_called_once()
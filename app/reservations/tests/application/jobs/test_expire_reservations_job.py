@@ -0,0 +1,52 @@
+from collections.abc import Generator
+from unittest.mock import Mock, patch
+
+import pytest
+from sqlmodel import Session
+
+from app.reservations.application.jobs.expire_reservations_job import expire_reservations_job
+from app.reservations.tests.infrastructure.builders.sqlmodel_seat_builder import SqlModelSeatBuilder
+from app.shared.domain.value_objects.id import Id
+from app.shared.domain.value_objects.reservation_status import ReservationStatus
+from app.shared.domain.value_objects.seat_status import SeatStatus
+from app.shared.tests.infrastructure.builders.sqlmodel_reservation_builder import SqlModelReservationBuilder
+
+
+class TestExpireReservationsJob:
+    @pytest.fixture
+    def mock_expire_reservations(self) -> Generator[Mock, None, None]:
+        with patch("app.reservations.application.jobs.expire_reservations_job.ExpireReservations") as mock:
+            yield mock
+
+    @pytest.fixture
+    def mock_reservation_repository(self) -> Generator[Mock, None, None]:
+        with patch("app.reservations.application.jobs.expire_reservations_job.SqlModelReservationRepository") as mock:
+            yield mock.return_value
+
+    @pytest.fixture
+    def mock_db_session(self, session: Session) -> Generator[Session, None, None]:
+        with patch("app.reservations.application.jobs.expire_reservations_job.get_session") as mock:
+            mock.return_value.__enter__.return_value = session
+            yield session
+
+    @pytest.mark.integration
+    def test_integration(self, mock_db_session: Session) -> None:
+        reservation_model = SqlModelReservationBuilder(mock_db_session).pending().build()
+        seat_model = SqlModelSeatBuilder(mock_db_session).reserved().with_reservation_id(reservation_model.id).build()
+
+        expired = expire_reservations_job([Id.from_uuid(reservation_model.id)])
+
+        assert expired == 1
+        assert reservation_model.status == ReservationStatus.CANCELLED.value
+        assert seat_model.status == SeatStatus.AVAILABLE.value
+        assert seat_model.reservation_id is None
+
+    def test_calls_expire_reservations(self, mock_expire_reservations: Mock, mock_reservation_repository: Mock) -> None:
+        mock_expire_reservations.return_value.execute.return_value = 1
+
+        expire_reservations_job([Id("b6439a2d-c0c0-45c8-81b7-7d7b155830ba")])
+
+        mock_expire_reservations.assert_called_once_with(repository=mock_reservation_repository)
+        mock_expire_reservations.return_value.execute.assert_called_once_with(
+            reservation_ids=[Id("b6439a2d-c0c0-45c8-81b7-7d7b155830ba")]
+        )
@@ -0,0 +1,64 @@
+from collections.abc import Generator
+from unittest.mock import Mock, call, patch
+
+import pytest
+from sqlmodel import Session
+
+from app.reservations.application.jobs.relay_outbox_job import EVENT_CLASSES, relay_outbox_job
+from app.reservations.domain.events import ReservationCancelled
+from app.settings import Settings
+from app.shared.infrastructure.outbox.sqlmodel_outbox import SqlModelOutbox
+
+
+class TestRelayOutboxJob:
+    @pytest.fixture
+    def mock_outbox(self) -> Generator[Mock, None, None]:
+        with patch("app.reservations.application.jobs.relay_outbox_job.SqlModelOutbox") as mock:
+            yield mock.return_value
+
+    @pytest.fixture
+    def mock_event_bus(self) -> Generator[Mock, None, None]:
+        with patch("app.reservations.application.jobs.relay_outbox_job.RabbitMQEventBus") as mock:
+            yield mock.return_value
+
+    @pytest.fixture
+    def mock_db_session(self, session: Session) -> Generator[Session, None, None]:
+        with patch("app.reservations.application.jobs.relay_outbox_job.get_session") as mock:
+            mock.return_value.__enter__.return_value = session
+            yield session
+
+    @pytest.fixture(autouse=True)
+    def override_settings(self) -> Generator[None, None, None]:
+        with patch("app.reservations.application.jobs.relay_outbox_job.settings", Settings(OUTBOX_RELAY_BATCH_SIZE=2)):
+            yield
+
+    @pytest.mark.integration
+    def test_integration(self, mock_db_session: Session, mock_event_bus: Mock) -> None:
+        SqlModelOutbox(mock_db_session).add(
+            events=[
+                ReservationCancelled(reservation_id="5661455d-de5a-47ba-b99f-f6d50fdfc00b", provider_payment_id=None)
+            ]
+        )
+        mock_db_session.commit()
+
+        published = relay_outbox_job()
+
+        assert published == 1
+        mock_event_bus.publish.assert_called_once_with(
+            events=[
+                ReservationCancelled(reservation_id="5661455d-de5a-47ba-b99f-f6d50fdfc00b", provider_payment_id=None)
+            ]
+        )
+
+    def test_relays_batches_until_a_batch_is_not_full(
+        self, mock_db_session: Session, mock_outbox: Mock, mock_event_bus: Mock
+    ) -> None:
+        mock_outbox.relay.side_effect = [2, 1]
+
+        published = relay_outbox_job()
+
+        assert published == 3
+        assert mock_outbox.relay.call_args_list == [
+            call(event_bus=mock_event_bus, event_classes=EVENT_CLASSES, limit=2),
+            call(event_bus=mock_event_bus, event_classes=EVENT_CLASSES, limit=2),
+        ]
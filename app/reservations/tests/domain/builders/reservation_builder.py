@@ -15,7 +15,7 @@ class ReservationBuilder:
         self.showtime_id: Id = Id.from_uuid(uuid.uuid4())
         self.status: ReservationStatus = ReservationStatus.PENDING
         self.seats: Seats = Seats()
-        self.provider_payment_id: str = "pi_3MtwBwLkdIwHu7ix28a3tqPa"
+        self.provider_payment_id: str | None = "pi_3MtwBwLkdIwHu7ix28a3tqPa"
         self.created_at: DateTime = DateTime.now()
 
     def with_id(self, id: Id) -> Self:
@@ -30,6 +30,10 @@ class ReservationBuilder:
         self.showtime_id = showtime_id
         return self
 
+    def with_status(self, status: ReservationStatus) -> Self:
+        self.status = status
+        return self
+
     def with_seats(self, seats: Seats) -> Self:
         self.seats = seats
         return self
@@ -42,6 +46,10 @@ class ReservationBuilder:
         self.provider_payment_id = provider_payment_id
         return self
 
+    def without_provider_payment_id(self) -> Self:
+        self.provider_payment_id = None
+        return self
+
     def build(self) -> Reservation:
         return Reservation(
             id=self.id,
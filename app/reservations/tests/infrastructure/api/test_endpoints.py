@@ -1,28 +1,38 @@
 from collections.abc import Generator
 from datetime import datetime, timezone
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, AsyncMock, Mock, patch
 from uuid import UUID
 
 import pytest
 from fastapi.testclient import TestClient
 from freezegun import freeze_time
-from sqlmodel import Session
+from sqlmodel import Session, select
 
 from app.reservations.application.commands.cancel_reservation import CancelReservationParams
 from app.reservations.application.commands.create_reservation import CreateReservationParams
+from app.reservations.application.commands.create_reservation_payment_intent import (
+    CreateReservationPaymentIntentParams,
+)
 from app.reservations.domain.exceptions import (
     CancellationNotAllowed,
     ReservationNotFound,
+    ReservationNotPending,
     SeatsNotAvailable,
     UnauthorizedCancellation,
+    UnauthorizedPayment,
 )
 from app.reservations.domain.movie_show_reservation import Movie, MovieShowReservation, SeatLocation
+from app.reservations.domain.reservation_payment import ReservationPayment
+from app.reservations.infrastructure.locks.in_memory_seat_lock_table import seat_lock_table
+from app.reservations.infrastructure.schedulers.reservation_expiry_scheduler import reservation_expiry_scheduler
 from app.reservations.tests.infrastructure.builders.sqlmodel_seat_builder import SqlModelSeatBuilder
+from app.shared.domain.exceptions import PaymentIntentRejected, PaymentProviderUnavailable
 from app.shared.domain.payment_intent import PaymentIntent
 from app.shared.domain.value_objects.date_time import DateTime
 from app.shared.domain.value_objects.id import Id
 from app.shared.domain.value_objects.reservation_status import ReservationStatus
 from app.shared.domain.value_objects.seat_status import SeatStatus
+from app.shared.infrastructure.outbox.models import OutboxEventModel
 from app.shared.tests.infrastructure.builders.sqlmodel_movie_builder import SqlModelMovieBuilder
 from app.shared.tests.infrastructure.builders.sqlmodel_reservation_builder import SqlModelReservationBuilder
 from app.shared.tests.infrastructure.builders.sqlmodel_showtime_builder import SqlModelShowtimeBuilder
@@ -33,22 +43,25 @@ class TestCreateReservationEndpoint:
     @pytest.fixture
     def mock_create_reservation(self) -> Generator[Mock, None, None]:
         with patch("app.reservations.infrastructure.api.endpoints.CreateReservation") as mock:
+            mock.return_value.execute = AsyncMock()
             yield mock
 
     @pytest.fixture
     def mock_reservation_repository(self) -> Generator[Mock, None, None]:
-        with patch("app.reservations.infrastructure.api.endpoints.SqlModelReservationRepository") as mock:
+        with patch("app.reservations.infrastructure.api.endpoints.AsyncSqlModelReservationRepository") as mock:
             yield mock.return_value
 
     @pytest.fixture
     def mock_seat_finder(self) -> Generator[Mock, None, None]:
-        with patch("app.reservations.infrastructure.api.endpoints.SqlModelSeatFinder") as mock:
+        with patch("app.reservations.infrastructure.api.endpoints.AsyncSqlModelSeatFinder") as mock:
             yield mock.return_value
 
     @pytest.fixture
-    def mock_stripe_client(self) -> Generator[Mock, None, None]:
-        with patch("app.reservations.infrastructure.api.endpoints.StripeClient") as mock:
-            yield mock.return_value
+    def mock_payment_client(self) -> Generator[Mock, None, None]:
+        with patch(
+            "app.reservations.infrastructure.api.endpoints.async_payment_client", new_callable=AsyncMock
+        ) as mock:
+            yield mock
 
     @pytest.mark.integration
     def test_integration(
@@ -57,11 +70,12 @@ class TestCreateReservationEndpoint:
         client: TestClient,
         user_token_headers: dict[str, str],
         user: UserModel,
-        mock_stripe_client: Mock,
+        mock_payment_client: Mock,
     ) -> None:
         seat = SqlModelSeatBuilder(session).available().build()
+        session.commit()
 
-        mock_stripe_client.create_payment_intent.return_value = PaymentIntent(
+        mock_payment_client.create_payment_intent.return_value = PaymentIntent(
             client_secret="test_client_secret",
             provider_payment_id="test_payment_id",
             amount=42.99,
@@ -72,14 +86,16 @@ class TestCreateReservationEndpoint:
             headers=user_token_headers,
         )
 
+        session.refresh(seat)
         assert response.status_code == 201
         assert response.json() == {
-            "client_secret": "test_client_secret",
-            "provider_payment_id": "test_payment_id",
-            "amount": 42.99,
+            "reservation_id": str(seat.reservation_id),
+            "payment_intent": {
+                "client_secret": "test_client_secret",
+                "provider_payment_id": "test_payment_id",
+                "amount": 42.99,
+            },
         }
-
-        session.refresh(seat)
         assert seat.status == SeatStatus.RESERVED
         assert seat.reservation_id is not None
         assert seat.reservation.user_id == user.id
@@ -91,14 +107,17 @@ class TestCreateReservationEndpoint:
         mock_create_reservation: Mock,
         mock_reservation_repository: Mock,
         mock_seat_finder: Mock,
-        mock_stripe_client: Mock,
+        mock_payment_client: Mock,
         user_token_headers: dict[str, str],
         user: UserModel,
     ) -> None:
-        mock_create_reservation.return_value.execute.return_value = PaymentIntent(
-            client_secret="test_client_secret",
-            provider_payment_id="test_payment_id",
-            amount=42.99,
+        mock_create_reservation.return_value.execute.return_value = ReservationPayment(
+            reservation_id=Id("5661455d-de5a-47ba-b99f-f6d50fdfc00b"),
+            payment_intent=PaymentIntent(
+                client_secret="test_client_secret",
+                provider_payment_id="test_payment_id",
+                amount=42.99,
+            ),
         )
 
         response = client.post(
@@ -113,7 +132,9 @@ class TestCreateReservationEndpoint:
         mock_create_reservation.assert_called_once_with(
             reservation_repository=mock_reservation_repository,
             seat_finder=mock_seat_finder,
-            payment_client=mock_stripe_client,
+            payment_client=mock_payment_client,
+            expiry_scheduler=reservation_expiry_scheduler,
+            seat_lock_table=seat_lock_table,
         )
         mock_create_reservation.return_value.execute.assert_called_once_with(
             params=CreateReservationParams(
@@ -125,9 +146,12 @@ class TestCreateReservationEndpoint:
 
         assert response.status_code == 201
         assert response.json() == {
-            "client_secret": "test_client_secret",
-            "provider_payment_id": "test_payment_id",
-            "amount": 42.99,
+            "reservation_id": "5661455d-de5a-47ba-b99f-f6d50fdfc00b",
+            "payment_intent": {
+                "client_secret": "test_client_secret",
+                "provider_payment_id": "test_payment_id",
+                "amount": 42.99,
+            },
         }
 
     def test_returns_400_when_seats_not_available(
@@ -136,7 +160,7 @@ class TestCreateReservationEndpoint:
         mock_create_reservation: Mock,
         mock_reservation_repository: Mock,
         mock_seat_finder: Mock,
-        mock_stripe_client: Mock,
+        mock_payment_client: Mock,
         user_token_headers: dict[str, str],
         user: UserModel,
     ) -> None:
@@ -154,7 +178,9 @@ class TestCreateReservationEndpoint:
         mock_create_reservation.assert_called_once_with(
             reservation_repository=mock_reservation_repository,
             seat_finder=mock_seat_finder,
-            payment_client=mock_stripe_client,
+            payment_client=mock_payment_client,
+            expiry_scheduler=reservation_expiry_scheduler,
+            seat_lock_table=seat_lock_table,
         )
         mock_create_reservation.return_value.execute.assert_called_once_with(
             params=CreateReservationParams(
@@ -167,6 +193,77 @@ class TestCreateReservationEndpoint:
         assert response.status_code == 400
         assert response.json() == {"detail": "Seats not available"}
 
+    def test_returns_201_without_payment_intent_when_payment_provider_is_unavailable(
+        self,
+        client: TestClient,
+        mock_create_reservation: Mock,
+        mock_reservation_repository: Mock,
+        mock_seat_finder: Mock,
+        mock_payment_client: Mock,
+        user_token_headers: dict[str, str],
+    ) -> None:
+        mock_create_reservation.return_value.execute.return_value = ReservationPayment(
+            reservation_id=Id("5661455d-de5a-47ba-b99f-f6d50fdfc00b"), payment_intent=None
+        )
+
+        response = client.post(
+            "api/v1/reservations/",
+            json={
+                "showtime_id": "913822a0-750b-4cb6-b7b9-e01869d7d62d",
+                "seat_ids": ["b0ed1c31-9877-4d05-bb1c-0c1385ae4fd1"],
+            },
+            headers=user_token_headers,
+        )
+
+        assert response.status_code == 201
+        assert response.json() == {"reservation_id": "5661455d-de5a-47ba-b99f-f6d50fdfc00b", "payment_intent": None}
+
+    def test_returns_400_when_reservation_is_no_longer_pending(
+        self,
+        client: TestClient,
+        mock_create_reservation: Mock,
+        mock_reservation_repository: Mock,
+        mock_seat_finder: Mock,
+        mock_payment_client: Mock,
+        user_token_headers: dict[str, str],
+    ) -> None:
+        mock_create_reservation.return_value.execute.side_effect = ReservationNotPending
+
+        response = client.post(
+            "api/v1/reservations/",
+            json={
+                "showtime_id": "913822a0-750b-4cb6-b7b9-e01869d7d62d",
+                "seat_ids": ["b0ed1c31-9877-4d05-bb1c-0c1385ae4fd1"],
+            },
+            headers=user_token_headers,
+        )
+
+        assert response.status_code == 400
+        assert response.json() == {"detail": "Reservation is not pending"}
+
+    def test_returns_502_when_payment_provider_rejects_the_payment_intent(
+        self,
+        client: TestClient,
+        mock_create_reservation: Mock,
+        mock_reservation_repository: Mock,
+        mock_seat_finder: Mock,
+        mock_payment_client: Mock,
+        user_token_headers: dict[str, str],
+    ) -> None:
+        mock_create_reservation.return_value.execute.side_effect = PaymentIntentRejected
+
+        response = client.post(
+            "api/v1/reservations/",
+            json={
+                "showtime_id": "913822a0-750b-4cb6-b7b9-e01869d7d62d",
+                "seat_ids": ["b0ed1c31-9877-4d05-bb1c-0c1385ae4fd1"],
+            },
+            headers=user_token_headers,
+        )
+
+        assert response.status_code == 502
+        assert response.json() == {"detail": "Payment provider rejected the request"}
+
     def test_returns_401_when_user_is_not_authenticated(
         self, client: TestClient, mock_create_reservation: Mock
     ) -> None:
@@ -184,15 +281,211 @@ class TestCreateReservationEndpoint:
         assert response.json() == {"detail": "Not authenticated"}
 
 
+class TestCreateReservationPaymentIntentEndpoint:
+    @pytest.fixture
+    def mock_create_reservation_payment_intent(self) -> Generator[Mock, None, None]:
+        with patch("app.reservations.infrastructure.api.endpoints.CreateReservationPaymentIntent") as mock:
+            mock.return_value.execute = AsyncMock()
+            yield mock
+
+    @pytest.fixture
+    def mock_reservation_finder(self) -> Generator[Mock, None, None]:
+        with patch("app.reservations.infrastructure.api.endpoints.AsyncSqlModelReservationFinder") as mock:
+            yield mock.return_value
+
+    @pytest.fixture
+    def mock_reservation_repository(self) -> Generator[Mock, None, None]:
+        with patch("app.reservations.infrastructure.api.endpoints.AsyncSqlModelReservationRepository") as mock:
+            yield mock.return_value
+
+    @pytest.fixture
+    def mock_payment_client(self) -> Generator[Mock, None, None]:
+        with patch(
+            "app.reservations.infrastructure.api.endpoints.async_payment_client", new_callable=AsyncMock
+        ) as mock:
+            yield mock
+
+    @pytest.mark.integration
+    def test_integration(
+        self,
+        session: Session,
+        client: TestClient,
+        user_token_headers: dict[str, str],
+        user: UserModel,
+        mock_payment_client: Mock,
+    ) -> None:
+        reservation_model = (
+            SqlModelReservationBuilder(session)
+            .with_id(UUID("5661455d-de5a-47ba-b99f-f6d50fdfc00b"))
+            .with_user_id(user.id)
+            .pending()
+            .without_provider_payment_id()
+            .build()
+        )
+        SqlModelSeatBuilder(session).reserved().with_reservation_id(reservation_model.id).build()
+        session.commit()
+
+        mock_payment_client.create_payment_intent.return_value = PaymentIntent(
+            client_secret="test_client_secret",
+            provider_payment_id="test_payment_id",
+            amount=42.99,
+        )
+        response = client.post(
+            "api/v1/reservations/5661455d-de5a-47ba-b99f-f6d50fdfc00b/payment-intent/", headers=user_token_headers
+        )
+
+        assert response.status_code == 201
+        assert response.json() == {
+            "client_secret": "test_client_secret",
+            "provider_payment_id": "test_payment_id",
+            "amount": 42.99,
+        }
+        mock_payment_client.create_payment_intent.assert_awaited_once_with(
+            amount=ANY, idempotency_key="5661455d-de5a-47ba-b99f-f6d50fdfc00b"
+        )
+
+        session.refresh(reservation_model)
+        assert reservation_model.provider_payment_id == "test_payment_id"
+
+    def test_returns_201_and_calls_create_reservation_payment_intent(
+        self,
+        client: TestClient,
+        mock_create_reservation_payment_intent: Mock,
+        mock_reservation_finder: Mock,
+        mock_reservation_repository: Mock,
+        mock_payment_client: Mock,
+        user_token_headers: dict[str, str],
+        user: UserModel,
+    ) -> None:
+        mock_create_reservation_payment_intent.return_value.execute.return_value = PaymentIntent(
+            client_secret="test_client_secret",
+            provider_payment_id="test_payment_id",
+            amount=42.99,
+        )
+
+        response = client.post(
+            "api/v1/reservations/5661455d-de5a-47ba-b99f-f6d50fdfc00b/payment-intent/", headers=user_token_headers
+        )
+
+        mock_create_reservation_payment_intent.assert_called_once_with(
+            reservation_finder=mock_reservation_finder,
+            reservation_repository=mock_reservation_repository,
+            payment_client=mock_payment_client,
+        )
+        mock_create_reservation_payment_intent.return_value.execute.assert_called_once_with(
+            params=CreateReservationPaymentIntentParams(
+                reservation_id=Id("5661455d-de5a-47ba-b99f-f6d50fdfc00b"), user_id=Id.from_uuid(user.id)
+            )
+        )
+
+        assert response.status_code == 201
+        assert response.json() == {
+            "client_secret": "test_client_secret",
+            "provider_payment_id": "test_payment_id",
+            "amount": 42.99,
+        }
+
+    def test_returns_401_when_user_is_not_authenticated(
+        self, client: TestClient, mock_create_reservation_payment_intent: Mock
+    ) -> None:
+        response = client.post("api/v1/reservations/5661455d-de5a-47ba-b99f-f6d50fdfc00b/payment-intent/")
+
+        mock_create_reservation_payment_intent.assert_not_called()
+
+        assert response.status_code == 401
+        assert response.json() == {"detail": "Not authenticated"}
+
+    def test_returns_404_when_reservation_does_not_exist(
+        self,
+        client: TestClient,
+        mock_create_reservation_payment_intent: Mock,
+        mock_payment_client: Mock,
+        user_token_headers: dict[str, str],
+    ) -> None:
+        mock_create_reservation_payment_intent.return_value.execute.side_effect = ReservationNotFound
+
+        response = client.post(
+            "api/v1/reservations/5661455d-de5a-47ba-b99f-f6d50fdfc00b/payment-intent/", headers=user_token_headers
+        )
+
+        assert response.status_code == 404
+        assert response.json() == {"detail": "Reservation not found"}
+
+    def test_returns_400_when_reservation_does_not_belong_to_user(
+        self,
+        client: TestClient,
+        mock_create_reservation_payment_intent: Mock,
+        mock_payment_client: Mock,
+        user_token_headers: dict[str, str],
+    ) -> None:
+        mock_create_reservation_payment_intent.return_value.execute.side_effect = UnauthorizedPayment
+
+        response = client.post(
+            "api/v1/reservations/5661455d-de5a-47ba-b99f-f6d50fdfc00b/payment-intent/", headers=user_token_headers
+        )
+
+        assert response.status_code == 400
+        assert response.json() == {"detail": "Unauthorized to pay this reservation"}
+
+    def test_returns_400_when_reservation_is_not_pending(
+        self,
+        client: TestClient,
+        mock_create_reservation_payment_intent: Mock,
+        mock_payment_client: Mock,
+        user_token_headers: dict[str, str],
+    ) -> None:
+        mock_create_reservation_payment_intent.return_value.execute.side_effect = ReservationNotPending
+
+        response = client.post(
+            "api/v1/reservations/5661455d-de5a-47ba-b99f-f6d50fdfc00b/payment-intent/", headers=user_token_headers
+        )
+
+        assert response.status_code == 400
+        assert response.json() == {"detail": "Reservation is not pending"}
+
+    def test_returns_503_when_payment_provider_is_unavailable(
+        self,
+        client: TestClient,
+        mock_create_reservation_payment_intent: Mock,
+        mock_payment_client: Mock,
+        user_token_headers: dict[str, str],
+    ) -> None:
+        mock_create_reservation_payment_intent.return_value.execute.side_effect = PaymentProviderUnavailable
+
+        response = client.post(
+            "api/v1/reservations/5661455d-de5a-47ba-b99f-f6d50fdfc00b/payment-intent/", headers=user_token_headers
+        )
+
+        assert response.status_code == 503
+        assert response.json() == {"detail": "Payment provider unavailable"}
+
+    def test_returns_502_when_payment_provider_rejects_the_payment_intent(
+        self,
+        client: TestClient,
+        mock_create_reservation_payment_intent: Mock,
+        mock_payment_client: Mock,
+        user_token_headers: dict[str, str],
+    ) -> None:
+        mock_create_reservation_payment_intent.return_value.execute.side_effect = PaymentIntentRejected
+
+        response = client.post(
+            "api/v1/reservations/5661455d-de5a-47ba-b99f-f6d50fdfc00b/payment-intent/", headers=user_token_headers
+        )
+
+        assert response.status_code == 502
+        assert response.json() == {"detail": "Payment provider rejected the request"}
+
+
 class TestListReservationsEndpoint:
     @pytest.fixture
     def mock_find_reservations(self) -> Generator[Mock, None, None]:
         with patch("app.reservations.infrastructure.api.endpoints.FindReservations") as mock:
+            mock.return_value.execute = AsyncMock()
             yield mock
 
     @pytest.fixture
     def mock_reservation_finder(self) -> Generator[Mock, None, None]:
-        with patch("app.reservations.infrastructure.api.endpoints.SqlModelReservationFinder") as mock:
+        with patch("app.reservations.infrastructure.api.endpoints.AsyncSqlModelReservationFinder") as mock:
             yield mock.return_value
 
     @pytest.mark.integration
@@ -231,6 +524,8 @@ class TestListReservationsEndpoint:
             .build()
         )
 
+        session.commit()
+
         response = client.get("api/v1/reservations/", headers=user_token_headers)
 
         assert response.status_code == 200
@@ -335,11 +630,6 @@ class TestCancelReservationEndpoint:
         with patch("app.reservations.infrastructure.api.endpoints.SqlModelReservationFinder") as mock:
             yield mock.return_value
 
-    @pytest.fixture(autouse=True)
-    def mock_event_bus(self) -> Generator[Mock, None, None]:
-        with patch("app.reservations.infrastructure.api.endpoints.RabbitMQEventBus") as mock:
-            yield mock.return_value
-
     @pytest.mark.integration
     @freeze_time("2025-01-22T21:00:00Z")
     def test_integration(
@@ -348,7 +638,6 @@ class TestCancelReservationEndpoint:
         client: TestClient,
         user_token_headers: dict[str, str],
         user: UserModel,
-        mock_event_bus: Mock,
     ) -> None:
         showtime_model = (
             SqlModelShowtimeBuilder(session)
@@ -376,11 +665,10 @@ class TestCancelReservationEndpoint:
             "api/v1/reservations/5661455d-de5a-47ba-b99f-f6d50fdfc00b/", headers=user_token_headers
         )
 
-        mock_event_bus.publish.assert_called_once()
-
         assert response.status_code == 204
         assert reservation_model.status == ReservationStatus.CANCELLED.value
         assert seat_model.status == SeatStatus.AVAILABLE.value
+        assert session.exec(select(OutboxEventModel.topic)).all() == ["reservation.cancelled"]
 
     def test_returns_204_and_calls_cancel_reservation(
         self,
@@ -388,7 +676,6 @@ class TestCancelReservationEndpoint:
         mock_cancel_reservation: Mock,
         mock_reservation_repository: Mock,
         mock_reservation_finder: Mock,
-        mock_event_bus: Mock,
         user_token_headers: dict[str, str],
         user: UserModel,
     ) -> None:
@@ -397,7 +684,9 @@ class TestCancelReservationEndpoint:
         )
 
         mock_cancel_reservation.assert_called_once_with(
-            finder=mock_reservation_finder, repository=mock_reservation_repository, event_bus=mock_event_bus
+            finder=mock_reservation_finder,
+            repository=mock_reservation_repository,
+            expiry_scheduler=reservation_expiry_scheduler,
         )
         mock_cancel_reservation.return_value.execute.assert_called_once_with(
             params=CancelReservationParams(
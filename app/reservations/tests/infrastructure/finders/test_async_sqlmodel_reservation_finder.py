@@ -0,0 +1,327 @@
+from datetime import datetime, timezone
+from uuid import UUID
+
+import pytest
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.reservations.domain.collections.seats import Seats
+from app.reservations.domain.movie_show_reservation import Movie, MovieShowReservation, SeatLocation
+from app.reservations.domain.reservation import Reservation
+from app.reservations.domain.seat import Seat
+from app.reservations.infrastructure.finders.async_sqlmodel_reservation_finder import AsyncSqlModelReservationFinder
+from app.reservations.tests.infrastructure.builders.sqlmodel_seat_builder import SqlModelSeatBuilder
+from app.shared.domain.value_objects.date_time import DateTime
+from app.shared.domain.value_objects.id import Id
+from app.shared.domain.value_objects.reservation_status import ReservationStatus
+from app.shared.domain.value_objects.seat_status import SeatStatus
+from app.shared.tests.infrastructure.builders.sqlmodel_movie_builder import SqlModelMovieBuilder
+from app.shared.tests.infrastructure.builders.sqlmodel_reservation_builder import SqlModelReservationBuilder
+
+
+class TestAsyncSqlModelReservationFinder:
+    @pytest.mark.anyio
+    async def test_find_movie_show_reservations_by_user_id(self, session: Session, async_session: AsyncSession) -> None:
+        (
+            SqlModelMovieBuilder(session)
+            .with_id(UUID("8c8ec976-9692-4c86-921d-28cf1302550c"))
+            .with_title("Robot Salvaje")
+            .with_poster_image("robot_salvaje.jpg")
+            .with_showtime(
+                id=UUID("cbdd7b54-c561-4cbb-a55f-15853c60e601"),
+                show_datetime=datetime(2023, 4, 3, 22, 0, tzinfo=timezone.utc),
+            )
+            .build()
+        )
+        (
+            SqlModelReservationBuilder(session)
+            .with_id(UUID("a41707bd-ae9c-43b8-bba5-8c4844e73e77"))
+            .with_user_id(UUID("bee0a37c-67bc-4038-a8fc-39e68ea1453a"))
+            .with_showtime_id(UUID("cbdd7b54-c561-4cbb-a55f-15853c60e601"))
+            .confirmed()
+            .build()
+        )
+        (
+            SqlModelSeatBuilder(session)
+            .with_row(1)
+            .with_number(2)
+            .occupied()
+            .with_reservation_id(UUID("a41707bd-ae9c-43b8-bba5-8c4844e73e77"))
+            .build()
+        )
+
+        session.commit()
+
+        reservations = await AsyncSqlModelReservationFinder(async_session).find_movie_show_reservations_by_user_id(
+            user_id=Id("bee0a37c-67bc-4038-a8fc-39e68ea1453a")
+        )
+
+        assert reservations == [
+            MovieShowReservation(
+                reservation_id=Id("a41707bd-ae9c-43b8-bba5-8c4844e73e77"),
+                show_datetime=DateTime.from_datetime(datetime(2023, 4, 3, 22, 0)),
+                movie=Movie(
+                    id=Id("8c8ec976-9692-4c86-921d-28cf1302550c"),
+                    title="Robot Salvaje",
+                    poster_image="robot_salvaje.jpg",
+                ),
+                seats=[SeatLocation(row=1, number=2)],
+            )
+        ]
+
+    @pytest.mark.anyio
+    async def test_find_movie_show_reservations_by_user_id_sorting_reservations_by_show_datetime_most_recent(
+        self, session: Session, async_session: AsyncSession
+    ) -> None:
+        (
+            SqlModelMovieBuilder(session)
+            .with_id(UUID("421d2efb-7523-43e1-ba97-f9057f08d468"))
+            .with_title("La Sustancia")
+            .with_poster_image("la_sustancia.jpg")
+            .with_showtime(
+                id=UUID("ef18bb4c-2109-443f-883d-cb48cfbddd58"),
+                show_datetime=datetime(2023, 4, 3, 20, 0, tzinfo=timezone.utc),
+            )
+            .build(),
+            SqlModelMovieBuilder(session)
+            .with_id(UUID("8c8ec976-9692-4c86-921d-28cf1302550c"))
+            .with_title("Robot Salvaje")
+            .with_poster_image("robot_salvaje.jpg")
+            .with_showtime(
+                id=UUID("cbdd7b54-c561-4cbb-a55f-15853c60e601"),
+                show_datetime=datetime(2023, 4, 3, 22, 0, tzinfo=timezone.utc),
+            )
+            .build(),
+        )
+        (
+            SqlModelReservationBuilder(session)
+            .with_id(UUID("a41707bd-ae9c-43b8-bba5-8c4844e73e77"))
+            .with_user_id(UUID("bee0a37c-67bc-4038-a8fc-39e68ea1453a"))
+            .with_showtime_id(UUID("cbdd7b54-c561-4cbb-a55f-15853c60e601"))
+            .confirmed()
+            .build(),
+            SqlModelReservationBuilder(session)
+            .with_id(UUID("89ad8d2e-e9c1-4fd0-b2be-0e6295b6b886"))
+            .with_user_id(UUID("bee0a37c-67bc-4038-a8fc-39e68ea1453a"))
+            .with_showtime_id(UUID("ef18bb4c-2109-443f-883d-cb48cfbddd58"))
+            .with_provider_payment_id("pi_3MtwBwLkdIwHu7ix28a3tqPb")
+            .confirmed()
+            .build(),
+        )
+        (
+            SqlModelSeatBuilder(session)
+            .with_row(1)
+            .with_number(2)
+            .occupied()
+            .with_reservation_id(UUID("a41707bd-ae9c-43b8-bba5-8c4844e73e77"))
+            .build(),
+            SqlModelSeatBuilder(session)
+            .with_row(1)
+            .with_number(3)
+            .occupied()
+            .with_reservation_id(UUID("89ad8d2e-e9c1-4fd0-b2be-0e6295b6b886"))
+            .build(),
+        )
+
+        session.commit()
+
+        reservations = await AsyncSqlModelReservationFinder(async_session).find_movie_show_reservations_by_user_id(
+            user_id=Id("bee0a37c-67bc-4038-a8fc-39e68ea1453a")
+        )
+
+        assert reservations == [
+            MovieShowReservation(
+                reservation_id=Id("a41707bd-ae9c-43b8-bba5-8c4844e73e77"),
+                show_datetime=DateTime.from_datetime(datetime(2023, 4, 3, 22, 0)),
+                movie=Movie(
+                    id=Id("8c8ec976-9692-4c86-921d-28cf1302550c"),
+                    title="Robot Salvaje",
+                    poster_image="robot_salvaje.jpg",
+                ),
+                seats=[SeatLocation(row=1, number=2)],
+            ),
+            MovieShowReservation(
+                reservation_id=Id("89ad8d2e-e9c1-4fd0-b2be-0e6295b6b886"),
+                show_datetime=DateTime.from_datetime(datetime(2023, 4, 3, 20, 0)),
+                movie=Movie(
+                    id=Id("421d2efb-7523-43e1-ba97-f9057f08d468"),
+                    title="La Sustancia",
+                    poster_image="la_sustancia.jpg",
+                ),
+                seats=[SeatLocation(row=1, number=3)],
+            ),
+        ]
+
+    @pytest.mark.anyio
+    async def test_find_movie_show_reservations_by_user_id_sorting_seats_by_row_and_number(
+        self, session: Session, async_session: AsyncSession
+    ) -> None:
+        (
+            SqlModelMovieBuilder(session)
+            .with_id(UUID("8c8ec976-9692-4c86-921d-28cf1302550c"))
+            .with_title("Robot Salvaje")
+            .with_poster_image("robot_salvaje.jpg")
+            .with_showtime(
+                id=UUID("cbdd7b54-c561-4cbb-a55f-15853c60e601"),
+                show_datetime=datetime(2023, 4, 3, 22, 0, tzinfo=timezone.utc),
+            )
+            .build(),
+        )
+        (
+            SqlModelReservationBuilder(session)
+            .with_id(UUID("a41707bd-ae9c-43b8-bba5-8c4844e73e77"))
+            .with_user_id(UUID("bee0a37c-67bc-4038-a8fc-39e68ea1453a"))
+            .with_showtime_id(UUID("cbdd7b54-c561-4cbb-a55f-15853c60e601"))
+            .confirmed()
+            .build(),
+        )
+        (
+            SqlModelSeatBuilder(session)
+            .with_row(1)
+            .with_number(3)
+            .occupied()
+            .with_reservation_id(UUID("a41707bd-ae9c-43b8-bba5-8c4844e73e77"))
+            .build(),
+            SqlModelSeatBuilder(session)
+            .with_row(1)
+            .with_number(2)
+            .occupied()
+            .with_reservation_id(UUID("a41707bd-ae9c-43b8-bba5-8c4844e73e77"))
+            .build(),
+        )
+
+        session.commit()
+
+        reservations = await AsyncSqlModelReservationFinder(async_session).find_movie_show_reservations_by_user_id(
+            user_id=Id("bee0a37c-67bc-4038-a8fc-39e68ea1453a")
+        )
+
+        assert reservations == [
+            MovieShowReservation(
+                reservation_id=Id("a41707bd-ae9c-43b8-bba5-8c4844e73e77"),
+                show_datetime=DateTime.from_datetime(datetime(2023, 4, 3, 22, 0)),
+                movie=Movie(
+                    id=Id("8c8ec976-9692-4c86-921d-28cf1302550c"),
+                    title="Robot Salvaje",
+                    poster_image="robot_salvaje.jpg",
+                ),
+                seats=[SeatLocation(row=1, number=2), SeatLocation(row=1, number=3)],
+            ),
+        ]
+
+    @pytest.mark.anyio
+    async def test_does_not_find_movie_show_reservations_by_user_id_when_user_id_does_not_exist(
+        self, session: Session, async_session: AsyncSession
+    ) -> None:
+        (
+            SqlModelMovieBuilder(session)
+            .with_showtime(
+                id=UUID("cbdd7b54-c561-4cbb-a55f-15853c60e601"),
+                show_datetime=datetime(2023, 4, 3, 22, 0, tzinfo=timezone.utc),
+            )
+            .build()
+        )
+        (
+            SqlModelReservationBuilder(session)
+            .with_id(UUID("a41707bd-ae9c-43b8-bba5-8c4844e73e77"))
+            .with_user_id(UUID("bee0a37c-67bc-4038-a8fc-39e68ea1453a"))
+            .with_showtime_id(UUID("cbdd7b54-c561-4cbb-a55f-15853c60e601"))
+            .confirmed()
+            .build()
+        )
+        (
+            SqlModelSeatBuilder(session)
+            .occupied()
+            .with_reservation_id(UUID("a41707bd-ae9c-43b8-bba5-8c4844e73e77"))
+            .build()
+        )
+
+        session.commit()
+
+        reservations = await AsyncSqlModelReservationFinder(async_session).find_movie_show_reservations_by_user_id(
+            user_id=Id("cee0a37c-67bc-4038-a8fc-39e68ea1453a")
+        )
+
+        assert reservations == []
+
+    @pytest.mark.anyio
+    async def test_does_not_find_movie_show_reservations_by_user_id_when_reservation_is_pending(
+        self, session: Session, async_session: AsyncSession
+    ) -> None:
+        (
+            SqlModelMovieBuilder(session)
+            .with_showtime(
+                id=UUID("cbdd7b54-c561-4cbb-a55f-15853c60e601"),
+                show_datetime=datetime(2023, 4, 3, 22, 0, tzinfo=timezone.utc),
+            )
+            .build()
+        )
+        (
+            SqlModelReservationBuilder(session)
+            .with_id(UUID("a41707bd-ae9c-43b8-bba5-8c4844e73e77"))
+            .with_user_id(UUID("bee0a37c-67bc-4038-a8fc-39e68ea1453a"))
+            .with_showtime_id(UUID("cbdd7b54-c561-4cbb-a55f-15853c60e601"))
+            .pending()
+            .build()
+        )
+        (
+            SqlModelSeatBuilder(session)
+            .with_reservation_id(UUID("a41707bd-ae9c-43b8-bba5-8c4844e73e77"))
+            .reserved()
+            .build()
+        )
+
+        session.commit()
+
+        reservations = await AsyncSqlModelReservationFinder(async_session).find_movie_show_reservations_by_user_id(
+            user_id=Id("bee0a37c-67bc-4038-a8fc-39e68ea1453a")
+        )
+
+        assert reservations == []
+
+    @pytest.mark.anyio
+    async def test_find_reservation(self, session: Session, async_session: AsyncSession) -> None:
+        reservation_model = (
+            SqlModelReservationBuilder(session)
+            .with_id(UUID("5661455d-de5a-47ba-b99f-f6d50fdfc00b"))
+            .with_user_id(UUID("1553d340-89eb-433b-a101-981bdaa740ed"))
+            .with_showtime_id(UUID("aa7a9372-09a0-415a-8c65-ec5aa6026e72"))
+            .with_created_at(datetime(2025, 1, 10, 12, 0))
+            .without_provider_payment_id()
+            .pending()
+            .build()
+        )
+        (
+            SqlModelSeatBuilder(session)
+            .with_id(UUID("c555276e-0be4-48ea-9e27-fe1500384380"))
+            .with_row(1)
+            .with_number(2)
+            .reserved()
+            .with_reservation_id(reservation_model.id)
+            .build()
+        )
+        session.commit()
+
+        reservation = await AsyncSqlModelReservationFinder(async_session).find_reservation(
+            reservation_id=Id("5661455d-de5a-47ba-b99f-f6d50fdfc00b")
+        )
+
+        assert reservation == Reservation(
+            id=Id("5661455d-de5a-47ba-b99f-f6d50fdfc00b"),
+            user_id=Id("1553d340-89eb-433b-a101-981bdaa740ed"),
+            showtime_id=Id("aa7a9372-09a0-415a-8c65-ec5aa6026e72"),
+            status=ReservationStatus.PENDING,
+            seats=Seats(
+                [Seat(id=Id("c555276e-0be4-48ea-9e27-fe1500384380"), row=1, number=2, status=SeatStatus.RESERVED)]
+            ),
+            provider_payment_id=None,
+            created_at=DateTime.from_datetime(datetime(2025, 1, 10, 12, 0)),
+        )
+
+    @pytest.mark.anyio
+    async def test_does_not_find_reservation_when_it_does_not_exist(self, async_session: AsyncSession) -> None:
+        reservation = await AsyncSqlModelReservationFinder(async_session).find_reservation(
+            reservation_id=Id("5661455d-de5a-47ba-b99f-f6d50fdfc00b")
+        )
+
+        assert reservation is None
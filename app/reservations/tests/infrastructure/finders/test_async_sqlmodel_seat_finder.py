@@ -1,17 +1,20 @@
 from uuid import UUID
 
+import pytest
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.reservations.domain.collections.seats import Seats
 from app.reservations.domain.seat import Seat
-from app.reservations.infrastructure.finders.sqlmodel_seat_finder import SqlModelSeatFinder
+from app.reservations.infrastructure.finders.async_sqlmodel_seat_finder import AsyncSqlModelSeatFinder
 from app.reservations.tests.infrastructure.builders.sqlmodel_seat_builder import SqlModelSeatBuilder
 from app.shared.domain.value_objects.id import Id
 from app.shared.domain.value_objects.seat_status import SeatStatus
 
 
-class TestSqlModelSeatFinder:
-    def test_find_seats(self, session: Session) -> None:
+class TestAsyncSqlModelSeatFinder:
+    @pytest.mark.anyio
+    async def test_find_seats(self, session: Session, async_session: AsyncSession) -> None:
         seat_available = (
             SqlModelSeatBuilder(session)
             .with_id(UUID("0a157516-12cd-4633-af2c-ae8d74f7edce"))
@@ -37,7 +40,9 @@ class TestSqlModelSeatFinder:
             .build()
         )
 
-        seats = SqlModelSeatFinder(session).find_seats(
+        session.commit()
+
+        seats = await AsyncSqlModelSeatFinder(async_session).find_seats(
             seat_ids=[Id.from_uuid(seat_available.id), Id.from_uuid(seat_reserved.id)],
         )
 
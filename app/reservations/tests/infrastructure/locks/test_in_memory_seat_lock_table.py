@@ -0,0 +1,120 @@
+from freezegun import freeze_time
+
+from app.reservations.infrastructure.locks.in_memory_seat_lock_table import (
+    DisabledSeatLockTable,
+    InMemorySeatLockTable,
+    create_seat_lock_table,
+)
+from app.settings import Settings
+from app.shared.domain.value_objects.id import Id
+
+
+class TestInMemorySeatLockTable:
+    def test_acquires_free_seats(self) -> None:
+        seat_lock_table = InMemorySeatLockTable(ttl_seconds=1800)
+
+        assert seat_lock_table.acquire(
+            showtime_id=Id("cbdd7b54-c561-4cbb-a55f-15853c60e600"),
+            seat_ids=[Id("537cc255-2e01-4f32-9ee2-eb56aded66ef"), Id("b43ecf0f-24f7-429e-bbce-5b389de2f297")],
+        )
+
+    def test_rejects_when_any_seat_is_locked(self) -> None:
+        seat_lock_table = InMemorySeatLockTable(ttl_seconds=1800)
+        seat_lock_table.acquire(
+            showtime_id=Id("cbdd7b54-c561-4cbb-a55f-15853c60e600"),
+            seat_ids=[Id("537cc255-2e01-4f32-9ee2-eb56aded66ef")],
+        )
+
+        assert not seat_lock_table.acquire(
+            showtime_id=Id("cbdd7b54-c561-4cbb-a55f-15853c60e600"),
+            seat_ids=[Id("b43ecf0f-24f7-429e-bbce-5b389de2f297"), Id("537cc255-2e01-4f32-9ee2-eb56aded66ef")],
+        )
+        assert seat_lock_table.acquire(
+            showtime_id=Id("cbdd7b54-c561-4cbb-a55f-15853c60e600"),
+            seat_ids=[Id("b43ecf0f-24f7-429e-bbce-5b389de2f297")],
+        )
+
+    def test_locks_seats_per_showtime(self) -> None:
+        seat_lock_table = InMemorySeatLockTable(ttl_seconds=1800)
+        seat_lock_table.acquire(
+            showtime_id=Id("cbdd7b54-c561-4cbb-a55f-15853c60e600"),
+            seat_ids=[Id("537cc255-2e01-4f32-9ee2-eb56aded66ef")],
+        )
+
+        assert seat_lock_table.acquire(
+            showtime_id=Id("f48c4dae-b0e2-43f6-a659-599f5e254270"),
+            seat_ids=[Id("537cc255-2e01-4f32-9ee2-eb56aded66ef")],
+        )
+
+    def test_acquires_released_seats(self) -> None:
+        seat_lock_table = InMemorySeatLockTable(ttl_seconds=1800)
+        seat_lock_table.acquire(
+            showtime_id=Id("cbdd7b54-c561-4cbb-a55f-15853c60e600"),
+            seat_ids=[Id("537cc255-2e01-4f32-9ee2-eb56aded66ef")],
+        )
+
+        seat_lock_table.release(
+            showtime_id=Id("cbdd7b54-c561-4cbb-a55f-15853c60e600"),
+            seat_ids=[Id("537cc255-2e01-4f32-9ee2-eb56aded66ef")],
+        )
+
+        assert seat_lock_table.acquire(
+            showtime_id=Id("cbdd7b54-c561-4cbb-a55f-15853c60e600"),
+            seat_ids=[Id("537cc255-2e01-4f32-9ee2-eb56aded66ef")],
+        )
+
+    def test_acquires_seats_whose_lock_expired(self) -> None:
+        seat_lock_table = InMemorySeatLockTable(ttl_seconds=1800)
+
+        with freeze_time("2025-01-10T12:00:00Z") as frozen_time:
+            seat_lock_table.acquire(
+                showtime_id=Id("cbdd7b54-c561-4cbb-a55f-15853c60e600"),
+                seat_ids=[Id("537cc255-2e01-4f32-9ee2-eb56aded66ef")],
+            )
+            frozen_time.tick(1800)
+
+            assert seat_lock_table.acquire(
+                showtime_id=Id("cbdd7b54-c561-4cbb-a55f-15853c60e600"),
+                seat_ids=[Id("537cc255-2e01-4f32-9ee2-eb56aded66ef")],
+            )
+
+    def test_stops_rejecting_seats_freed_by_another_process_after_ttl(self) -> None:
+        settings = Settings(SEAT_LOCK_TABLE_ENABLED=True, SEAT_LOCK_TTL_SECONDS=5)
+        holding_process = create_seat_lock_table(settings)
+        cancelling_process = create_seat_lock_table(settings)
+
+        with freeze_time("2025-01-10T12:00:00Z") as frozen_time:
+            holding_process.acquire(
+                showtime_id=Id("cbdd7b54-c561-4cbb-a55f-15853c60e600"),
+                seat_ids=[Id("537cc255-2e01-4f32-9ee2-eb56aded66ef")],
+            )
+            cancelling_process.release(
+                showtime_id=Id("cbdd7b54-c561-4cbb-a55f-15853c60e600"),
+                seat_ids=[Id("537cc255-2e01-4f32-9ee2-eb56aded66ef")],
+            )
+
+            assert not holding_process.acquire(
+                showtime_id=Id("cbdd7b54-c561-4cbb-a55f-15853c60e600"),
+                seat_ids=[Id("537cc255-2e01-4f32-9ee2-eb56aded66ef")],
+            )
+
+            frozen_time.tick(5)
+
+            assert holding_process.acquire(
+                showtime_id=Id("cbdd7b54-c561-4cbb-a55f-15853c60e600"),
+                seat_ids=[Id("537cc255-2e01-4f32-9ee2-eb56aded66ef")],
+            )
+
+
+class TestDisabledSeatLockTable:
+    def test_always_acquires_seats(self) -> None:
+        seat_lock_table = DisabledSeatLockTable()
+        seat_lock_table.acquire(
+            showtime_id=Id("cbdd7b54-c561-4cbb-a55f-15853c60e600"),
+            seat_ids=[Id("537cc255-2e01-4f32-9ee2-eb56aded66ef")],
+        )
+
+        assert seat_lock_table.acquire(
+            showtime_id=Id("cbdd7b54-c561-4cbb-a55f-15853c60e600"),
+            seat_ids=[Id("537cc255-2e01-4f32-9ee2-eb56aded66ef")],
+        )
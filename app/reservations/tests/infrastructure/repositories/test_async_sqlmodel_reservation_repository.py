@@ -0,0 +1,140 @@
+from uuid import UUID
+
+import pytest
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.reservations.domain.collections.seats import Seats
+from app.reservations.domain.exceptions import SeatsNotAvailable
+from app.reservations.infrastructure.models import ReservationModel
+from app.reservations.infrastructure.repositories.async_sqlmodel_reservation_repository import (
+    AsyncSqlModelReservationRepository,
+)
+from app.reservations.tests.domain.builders.reservation_builder import ReservationBuilder
+from app.reservations.tests.domain.builders.seat_builder import SeatBuilder
+from app.reservations.tests.infrastructure.builders.sqlmodel_seat_builder import SqlModelSeatBuilder
+from app.shared.domain.value_objects.id import Id
+from app.shared.domain.value_objects.reservation_status import ReservationStatus
+from app.shared.domain.value_objects.seat_status import SeatStatus
+from app.shared.tests.infrastructure.builders.sqlmodel_reservation_builder import SqlModelReservationBuilder
+from app.showtimes.domain.seat import Seat as ShowtimeSeat
+from app.showtimes.infrastructure.caches.seat_map_cache import seat_map_cache
+
+
+class TestAsyncSqlModelReservationRepository:
+    @pytest.mark.anyio
+    async def test_create_reservation_and_reserve_seats(self, session: Session, async_session: AsyncSession) -> None:
+        main_seat = SqlModelSeatBuilder(session).available().build()
+        parent_seat = SqlModelSeatBuilder(session).available().build()
+        session.commit()
+
+        reservation = (
+            ReservationBuilder()
+            .with_user_id(Id("47d653d5-971e-42c3-86ab-2c7f40ef783a"))
+            .with_showtime_id(Id("ffa502e6-8869-490c-8799-5bea26c7146d"))
+            .with_provider_payment_id("pi_3MtwBwLkdIwHu7ix28a3tqPa")
+            .with_seats(
+                Seats(
+                    [
+                        SeatBuilder().with_id(Id.from_uuid(main_seat.id)).build(),
+                        SeatBuilder().with_id(Id.from_uuid(parent_seat.id)).build(),
+                    ]
+                ),
+            )
+            .build()
+        )
+
+        await AsyncSqlModelReservationRepository(async_session).create(reservation)
+
+        reservation_model = session.get_one(ReservationModel, reservation.id.to_uuid())
+        assert reservation_model.user_id == UUID("47d653d5-971e-42c3-86ab-2c7f40ef783a")
+        assert reservation_model.showtime_id == UUID("ffa502e6-8869-490c-8799-5bea26c7146d")
+        assert reservation_model.status == ReservationStatus.PENDING.value
+        assert reservation_model.provider_payment_id == "pi_3MtwBwLkdIwHu7ix28a3tqPa"
+
+        session.refresh(main_seat)
+        assert main_seat.reservation_id == reservation.id.to_uuid()
+        assert main_seat.status == SeatStatus.RESERVED.value
+
+        session.refresh(parent_seat)
+        assert parent_seat.reservation_id == reservation.id.to_uuid()
+        assert parent_seat.status == SeatStatus.RESERVED.value
+
+    @pytest.mark.anyio
+    async def test_does_not_create_reservation_when_any_seat_was_already_reserved(
+        self, session: Session, async_session: AsyncSession
+    ) -> None:
+        available_seat = SqlModelSeatBuilder(session).available().build()
+        reserved_seat = SqlModelSeatBuilder(session).reserved().build()
+        session.commit()
+
+        reservation = (
+            ReservationBuilder()
+            .with_seats(
+                Seats(
+                    [
+                        SeatBuilder().with_id(Id.from_uuid(available_seat.id)).build(),
+                        SeatBuilder().with_id(Id.from_uuid(reserved_seat.id)).build(),
+                    ]
+                ),
+            )
+            .build()
+        )
+
+        with pytest.raises(SeatsNotAvailable):
+            await AsyncSqlModelReservationRepository(async_session).create(reservation)
+
+        assert session.get(ReservationModel, reservation.id.to_uuid()) is None
+
+        session.refresh(available_seat)
+        assert available_seat.reservation_id is None
+        assert available_seat.status == SeatStatus.AVAILABLE.value
+
+    @pytest.mark.anyio
+    async def test_create_reservation_updates_cached_seat_map(
+        self, session: Session, async_session: AsyncSession
+    ) -> None:
+        seat_model = SqlModelSeatBuilder(session).with_row(3).with_number(7).available().build()
+        session.commit()
+        seat_map_cache.put(
+            Id.from_uuid(seat_model.showtime_id),
+            [ShowtimeSeat(id=Id.from_uuid(seat_model.id), row=3, number=7, status=SeatStatus.AVAILABLE)],
+            generation=seat_map_cache.generation(Id.from_uuid(seat_model.showtime_id)),
+        )
+
+        reservation = (
+            ReservationBuilder().with_seats(Seats([SeatBuilder().with_id(Id.from_uuid(seat_model.id)).build()])).build()
+        )
+        await AsyncSqlModelReservationRepository(async_session).create(reservation)
+
+        assert seat_map_cache.get(Id.from_uuid(seat_model.showtime_id)) == [
+            ShowtimeSeat(id=Id.from_uuid(seat_model.id), row=3, number=7, status=SeatStatus.RESERVED)
+        ]
+
+    @pytest.mark.anyio
+    async def test_attach_payment_to_pending_reservation(self, session: Session, async_session: AsyncSession) -> None:
+        reservation_model = SqlModelReservationBuilder(session).pending().without_provider_payment_id().build()
+        session.commit()
+
+        attached = await AsyncSqlModelReservationRepository(async_session).attach_payment(
+            reservation_id=Id.from_uuid(reservation_model.id), provider_payment_id="pi_3MtwBwLkdIwHu7ix28a3tqPa"
+        )
+
+        assert attached is True
+        session.refresh(reservation_model)
+        assert reservation_model.provider_payment_id == "pi_3MtwBwLkdIwHu7ix28a3tqPa"
+
+    @pytest.mark.anyio
+    async def test_does_not_attach_payment_to_cancelled_reservation(
+        self, session: Session, async_session: AsyncSession
+    ) -> None:
+        reservation_model = SqlModelReservationBuilder(session).cancelled().without_provider_payment_id().build()
+        session.commit()
+
+        attached = await AsyncSqlModelReservationRepository(async_session).attach_payment(
+            reservation_id=Id.from_uuid(reservation_model.id), provider_payment_id="pi_3MtwBwLkdIwHu7ix28a3tqPa"
+        )
+
+        assert attached is False
+        session.refresh(reservation_model)
+        assert reservation_model.provider_payment_id is None
@@ -1,56 +1,25 @@
-from uuid import UUID
+import json
+from datetime import datetime
+from unittest.mock import patch
 
-from sqlmodel import Session
+from freezegun import freeze_time
+from sqlmodel import Session, select
 
-from app.reservations.domain.collections.seats import Seats
-from app.reservations.infrastructure.models import ReservationModel
+from app.reservations.domain.events import ReservationCancelled
+from app.reservations.infrastructure.locks.in_memory_seat_lock_table import InMemorySeatLockTable
 from app.reservations.infrastructure.repositories.sqlmodel_reservation_repository import SqlModelReservationRepository
-from app.reservations.tests.domain.builders.reservation_builder import ReservationBuilder
-from app.reservations.tests.domain.builders.seat_builder import SeatBuilder
 from app.reservations.tests.infrastructure.builders.sqlmodel_seat_builder import SqlModelSeatBuilder
+from app.shared.domain.value_objects.date_time import DateTime
 from app.shared.domain.value_objects.id import Id
 from app.shared.domain.value_objects.reservation_status import ReservationStatus
 from app.shared.domain.value_objects.seat_status import SeatStatus
+from app.shared.infrastructure.outbox.models import OutboxEventModel
 from app.shared.tests.infrastructure.builders.sqlmodel_reservation_builder import SqlModelReservationBuilder
+from app.showtimes.domain.seat import Seat as ShowtimeSeat
+from app.showtimes.infrastructure.caches.seat_map_cache import seat_map_cache
 
 
 class TestSqlModelReservationRepository:
-    def test_create_reservation_and_reserve_seats(self, session: Session) -> None:
-        main_seat = SqlModelSeatBuilder(session).available().build()
-        parent_seat = SqlModelSeatBuilder(session).available().build()
-
-        reservation = (
-            ReservationBuilder()
-            .with_user_id(Id("47d653d5-971e-42c3-86ab-2c7f40ef783a"))
-            .with_showtime_id(Id("ffa502e6-8869-490c-8799-5bea26c7146d"))
-            .with_provider_payment_id("pi_3MtwBwLkdIwHu7ix28a3tqPa")
-            .with_seats(
-                Seats(
-                    [
-                        SeatBuilder().with_id(Id.from_uuid(main_seat.id)).build(),
-                        SeatBuilder().with_id(Id.from_uuid(parent_seat.id)).build(),
-                    ]
-                ),
-            )
-            .build()
-        )
-
-        SqlModelReservationRepository(session).create(reservation)
-
-        reservation_model = session.get_one(ReservationModel, reservation.id.to_uuid())
-        assert reservation_model.user_id == UUID("47d653d5-971e-42c3-86ab-2c7f40ef783a")
-        assert reservation_model.showtime_id == UUID("ffa502e6-8869-490c-8799-5bea26c7146d")
-        assert reservation_model.status == ReservationStatus.PENDING.value
-        assert reservation_model.provider_payment_id == "pi_3MtwBwLkdIwHu7ix28a3tqPa"
-
-        session.refresh(main_seat)
-        assert main_seat.reservation_id == reservation.id.to_uuid()
-        assert main_seat.status == SeatStatus.RESERVED.value
-
-        session.refresh(parent_seat)
-        assert parent_seat.reservation_id == reservation.id.to_uuid()
-        assert parent_seat.status == SeatStatus.RESERVED.value
-
     def test_release_reservation(self, session: Session) -> None:
         reservation_model = SqlModelReservationBuilder(session).pending().build()
         seat_model = SqlModelSeatBuilder(session).reserved().with_reservation_id(reservation_model.id).build()
@@ -58,20 +27,190 @@ class TestSqlModelReservationRepository:
         reservation = reservation_model.to_domain()
         reservation.cancel()
 
-        SqlModelReservationRepository(session).release(reservation=reservation)
+        SqlModelReservationRepository(session).release(
+            reservation=reservation,
+            events=[ReservationCancelled(reservation_id=reservation.id.value, provider_payment_id="pi_1")],
+        )
 
         assert reservation_model.status == ReservationStatus.CANCELLED.value
         assert seat_model.status == SeatStatus.AVAILABLE.value
         assert seat_model.reservation_id is None
+        outbox_event_model = session.exec(select(OutboxEventModel)).one()
+        assert outbox_event_model.topic == "reservation.cancelled"
+        assert json.loads(outbox_event_model.payload) == {
+            "reservation_id": reservation.id.value,
+            "provider_payment_id": "pi_1",
+        }
+
+    def test_release_reservation_updates_cached_seat_map(self, session: Session) -> None:
+        reservation_model = SqlModelReservationBuilder(session).pending().build()
+        seat_model = (
+            SqlModelSeatBuilder(session)
+            .with_showtime_id(reservation_model.showtime_id)
+            .with_row(3)
+            .with_number(7)
+            .reserved()
+            .with_reservation_id(reservation_model.id)
+            .build()
+        )
+        seat_map_cache.put(
+            Id.from_uuid(reservation_model.showtime_id),
+            [ShowtimeSeat(id=Id.from_uuid(seat_model.id), row=3, number=7, status=SeatStatus.RESERVED)],
+            generation=seat_map_cache.generation(Id.from_uuid(reservation_model.showtime_id)),
+        )
+
+        reservation = reservation_model.to_domain()
+        reservation.cancel()
 
-    def test_cancel_reservations_and_release_seats(self, session: Session) -> None:
+        SqlModelReservationRepository(session).release(reservation=reservation, events=[])
+
+        assert seat_map_cache.get(Id.from_uuid(reservation_model.showtime_id)) == [
+            ShowtimeSeat(id=Id.from_uuid(seat_model.id), row=3, number=7, status=SeatStatus.AVAILABLE)
+        ]
+
+    def test_release_reservation_releases_seat_locks(self, session: Session) -> None:
         reservation_model = SqlModelReservationBuilder(session).pending().build()
-        seat_model = SqlModelSeatBuilder(session).with_reservation_id(reservation_model.id).reserved().build()
+        seat_model = (
+            SqlModelSeatBuilder(session)
+            .with_showtime_id(reservation_model.showtime_id)
+            .reserved()
+            .with_reservation_id(reservation_model.id)
+            .build()
+        )
+        seat_lock_table = InMemorySeatLockTable(ttl_seconds=1800)
+        seat_lock_table.acquire(
+            showtime_id=Id.from_uuid(reservation_model.showtime_id), seat_ids=[Id.from_uuid(seat_model.id)]
+        )
+
+        reservation = reservation_model.to_domain()
+        reservation.cancel()
 
-        SqlModelReservationRepository(session).cancel_reservations(
-            reservation_ids=[Id.from_uuid(reservation_model.id)],
+        with patch(
+            "app.reservations.infrastructure.repositories.sqlmodel_reservation_repository.seat_lock_table",
+            seat_lock_table,
+        ):
+            SqlModelReservationRepository(session).release(reservation=reservation, events=[])
+
+        assert seat_lock_table.acquire(
+            showtime_id=Id.from_uuid(reservation_model.showtime_id), seat_ids=[Id.from_uuid(seat_model.id)]
         )
 
-        assert reservation_model.status == ReservationStatus.CANCELLED.value
-        assert seat_model.status == SeatStatus.AVAILABLE.value
-        assert seat_model.reservation_id is None
+    @freeze_time("2025-01-10T00:30:00Z")
+    def test_cancel_expired_reservations_and_release_seats(self, session: Session) -> None:
+        expired_reservation_model = (
+            SqlModelReservationBuilder(session)
+            .with_provider_payment_id("pi_expired")
+            .with_created_at(datetime(2025, 1, 10, 0, 19, 59))
+            .pending()
+            .build()
+        )
+        expired_seat_model = (
+            SqlModelSeatBuilder(session).with_reservation_id(expired_reservation_model.id).reserved().build()
+        )
+        recent_reservation_model = (
+            SqlModelReservationBuilder(session)
+            .with_provider_payment_id("pi_recent")
+            .with_created_at(datetime(2025, 1, 10, 0, 20, 0))
+            .pending()
+            .build()
+        )
+        confirmed_reservation_model = (
+            SqlModelReservationBuilder(session)
+            .with_provider_payment_id("pi_confirmed")
+            .with_created_at(datetime(2025, 1, 10, 0, 0, 0))
+            .confirmed()
+            .build()
+        )
+
+        expired = SqlModelReservationRepository(session).cancel_expired_reservations(
+            expiration_datetime=DateTime.from_datetime(datetime(2025, 1, 10, 0, 20, 0)), limit=500
+        )
+
+        assert expired == 1
+        assert expired_reservation_model.status == ReservationStatus.CANCELLED.value
+        assert expired_seat_model.status == SeatStatus.AVAILABLE.value
+        assert expired_seat_model.reservation_id is None
+        assert recent_reservation_model.status == ReservationStatus.PENDING.value
+        assert confirmed_reservation_model.status == ReservationStatus.CONFIRMED.value
+
+    @freeze_time("2025-01-10T00:30:00Z")
+    def test_cancel_expired_reservations_emits_expired_events_for_payment_intents(self, session: Session) -> None:
+        reservation_model = (
+            SqlModelReservationBuilder(session)
+            .with_provider_payment_id("pi_expired")
+            .with_created_at(datetime(2025, 1, 10, 0, 0, 0))
+            .pending()
+            .build()
+        )
+        (
+            SqlModelReservationBuilder(session)
+            .without_provider_payment_id()
+            .with_created_at(datetime(2025, 1, 10, 0, 0, 0))
+            .pending()
+            .build()
+        )
+
+        expired = SqlModelReservationRepository(session).cancel_expired_reservations(
+            expiration_datetime=DateTime.from_datetime(datetime(2025, 1, 10, 0, 20, 0)), limit=500
+        )
+
+        assert expired == 2
+        outbox_event_model = session.exec(select(OutboxEventModel)).one()
+        assert outbox_event_model.topic == "reservation.expired"
+        assert json.loads(outbox_event_model.payload) == {
+            "reservation_id": str(reservation_model.id),
+            "provider_payment_id": "pi_expired",
+        }
+
+    def test_cancel_expired_reservations_up_to_limit_oldest_first(self, session: Session) -> None:
+        oldest_reservation_model = (
+            SqlModelReservationBuilder(session)
+            .with_provider_payment_id("pi_oldest")
+            .with_created_at(datetime(2025, 1, 10, 0, 0, 0))
+            .pending()
+            .build()
+        )
+        newest_reservation_model = (
+            SqlModelReservationBuilder(session)
+            .with_provider_payment_id("pi_newest")
+            .with_created_at(datetime(2025, 1, 10, 0, 10, 0))
+            .pending()
+            .build()
+        )
+
+        expired = SqlModelReservationRepository(session).cancel_expired_reservations(
+            expiration_datetime=DateTime.from_datetime(datetime(2025, 1, 10, 0, 20, 0)), limit=1
+        )
+
+        assert expired == 1
+        assert oldest_reservation_model.status == ReservationStatus.CANCELLED.value
+        assert newest_reservation_model.status == ReservationStatus.PENDING.value
+
+    def test_cancel_pending_reservations_and_release_seats(self, session: Session) -> None:
+        pending_reservation_model = (
+            SqlModelReservationBuilder(session).with_provider_payment_id("pi_pending").pending().build()
+        )
+        pending_seat_model = (
+            SqlModelSeatBuilder(session).with_reservation_id(pending_reservation_model.id).reserved().build()
+        )
+        confirmed_reservation_model = (
+            SqlModelReservationBuilder(session).with_provider_payment_id("pi_confirmed").confirmed().build()
+        )
+        confirmed_seat_model = (
+            SqlModelSeatBuilder(session).with_reservation_id(confirmed_reservation_model.id).occupied().build()
+        )
+
+        expired = SqlModelReservationRepository(session).cancel_pending_reservations(
+            reservation_ids=[
+                Id.from_uuid(pending_reservation_model.id),
+                Id.from_uuid(confirmed_reservation_model.id),
+            ]
+        )
+
+        assert expired == 1
+        assert pending_reservation_model.status == ReservationStatus.CANCELLED.value
+        assert pending_seat_model.status == SeatStatus.AVAILABLE.value
+        assert pending_seat_model.reservation_id is None
+        assert confirmed_reservation_model.status == ReservationStatus.CONFIRMED.value
+        assert confirmed_seat_model.status == SeatStatus.OCCUPIED.value
+        assert confirmed_seat_model.reservation_id == confirmed_reservation_model.id
@@ -0,0 +1,117 @@
+from collections.abc import Generator
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any
+
+import pytest
+from sqlalchemy import Engine, event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.payments.infrastructure.finders.sqlmodel_reservation_finder import (
+    SqlModelReservationFinder as SqlModelPaymentReservationFinder,
+)
+from app.reservations.infrastructure.finders.async_sqlmodel_reservation_finder import AsyncSqlModelReservationFinder
+from app.reservations.infrastructure.repositories.sqlmodel_reservation_repository import (
+    SqlModelReservationRepository,
+)
+from app.reservations.tests.domain.builders.reservation_builder import ReservationBuilder
+from app.shared.domain.value_objects.date_time import DateTime
+from app.shared.domain.value_objects.id import Id
+from app.showtimes.infrastructure.finders.async_sqlmodel_seat_finder import AsyncSqlModelSeatFinder
+
+
+@contextmanager
+def capture_statements(engine: Engine) -> Generator[list[tuple[str, Any]], None, None]:
+    statements: list[tuple[str, Any]] = []
+
+    def before_cursor_execute(
+        conn: Any,  # noqa: ARG001
+        cursor: Any,  # noqa: ARG001
+        statement: str,
+        parameters: Any,
+        context: Any,  # noqa: ARG001
+        executemany: bool,  # noqa: ARG001
+    ) -> None:
+        statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def query_plan(engine: Engine, statement: str, parameters: Any) -> list[str]:
+    with engine.connect() as connection:
+        rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+    return [row[-1] for row in rows]
+
+
+def sequential_scans(plan: list[str]) -> list[str]:
+    return [step for step in plan if step.startswith("SCAN") and "INDEX" not in step]
+
+
+class TestQueryPlans:
+    def test_find_by_payment_id_searches_provider_payment_id_index(self, engine: Engine, session: Session) -> None:
+        with capture_statements(engine) as statements:
+            SqlModelPaymentReservationFinder(session).find_by_payment_id(
+                provider_payment_id="pi_3MtwBwLkdIwHu7ix28a3tqPa"
+            )
+
+        plan = query_plan(engine, *statements[-1])
+
+        assert sequential_scans(plan) == []
+        assert any("ix_reservationmodel_provider_payment_id" in step for step in plan)
+
+    def test_cancel_expired_reservations_uses_pending_created_at_index(self, engine: Engine, session: Session) -> None:
+        with capture_statements(engine) as statements:
+            SqlModelReservationRepository(session).cancel_expired_reservations(
+                expiration_datetime=DateTime.from_datetime(datetime(2025, 1, 10, 0, 20, 0)), limit=500
+            )
+
+        plan = query_plan(engine, *statements[0])
+
+        assert sequential_scans(plan) == []
+        assert any("ix_reservationmodel_pending_created_at" in step for step in plan)
+
+    def test_release_searches_seats_by_reservation_id_index(self, engine: Engine, session: Session) -> None:
+        reservation = ReservationBuilder().with_id(Id("92ab35a6-ae79-4039-85b3-e8b2b8abb27d")).build()
+        reservation.cancel()
+
+        with capture_statements(engine) as statements:
+            SqlModelReservationRepository(session).release(reservation=reservation, events=[])
+
+        plans = [query_plan(engine, statement, parameters) for statement, parameters in statements]
+
+        assert all(sequential_scans(plan) == [] for plan in plans)
+        assert any("ix_seatmodel_reservation_id" in step for plan in plans for step in plan)
+
+    @pytest.mark.anyio
+    async def test_find_seats_by_showtime_id_searches_showtime_seat_index(
+        self, engine: Engine, async_engine: AsyncEngine, async_session: AsyncSession
+    ) -> None:
+        with capture_statements(async_engine.sync_engine) as statements:
+            await AsyncSqlModelSeatFinder(async_session).find_seats_by_showtime_id(
+                showtime_id=Id("cbdd7b54-c561-4cbb-a55f-15853c60e601")
+            )
+
+        plan = query_plan(engine, *statements[-1])
+
+        assert sequential_scans(plan) == []
+        assert any("ix_seatmodel_showtime_id_row_number" in step for step in plan)
+
+    @pytest.mark.anyio
+    async def test_find_movie_show_reservations_by_user_id_searches_user_id_index(
+        self, engine: Engine, async_engine: AsyncEngine, async_session: AsyncSession
+    ) -> None:
+        with capture_statements(async_engine.sync_engine) as statements:
+            await AsyncSqlModelReservationFinder(async_session).find_movie_show_reservations_by_user_id(
+                user_id=Id("bee0a37c-67bc-4038-a8fc-39e68ea1453a")
+            )
+
+        plan = query_plan(engine, *statements[-1])
+
+        assert sequential_scans(plan) == []
+        assert any("ix_reservationmodel_user_id" in step for step in plan)
@@ -1,9 +1,55 @@
 from apscheduler.schedulers.background import BackgroundScheduler
 
+from app.database import database_pool_metrics, engine
+from app.payments.application.jobs.confirm_payments_job import confirm_payments_job
 from app.reservations.application.jobs.cancel_expired_reservations_job import cancel_expired_reservations_job
+from app.reservations.application.jobs.relay_outbox_job import relay_outbox_job
+from app.settings import get_settings
+from app.shared.infrastructure.pools.pool_metrics import log_pool_metrics
+from app.shared.infrastructure.scheduling.leader_election import LeaderElection
+from app.shared.infrastructure.scheduling.scheduled_job import ScheduledJob
 
+settings = get_settings()
 
-def init_apscheduler() -> None:
-    scheduler = BackgroundScheduler()
-    scheduler.add_job(cancel_expired_reservations_job, "interval", minutes=1)
+leader_election = LeaderElection(engine=engine, name="scheduler")
+
+
+def init_apscheduler() -> BackgroundScheduler:
+    scheduler = BackgroundScheduler(job_defaults={"coalesce": True, "max_instances": 1})
+    scheduler.add_job(
+        ScheduledJob(
+            name="cancel_expired_reservations",
+            job=cancel_expired_reservations_job,
+            leader_election=leader_election,
+        ),
+        "interval",
+        minutes=settings.RESERVATION_EXPIRATION_SWEEP_MINUTES,
+    )
+    scheduler.add_job(
+        ScheduledJob(
+            name="relay_outbox",
+            job=relay_outbox_job,
+            leader_election=leader_election,
+            flush_interval_seconds=settings.JOB_RUN_FLUSH_INTERVAL_SECONDS,
+        ),
+        "interval",
+        seconds=settings.OUTBOX_RELAY_INTERVAL_SECONDS,
+    )
+    scheduler.add_job(
+        ScheduledJob(
+            name="confirm_payments",
+            job=confirm_payments_job,
+            leader_election=leader_election,
+            flush_interval_seconds=settings.JOB_RUN_FLUSH_INTERVAL_SECONDS,
+        ),
+        "interval",
+        seconds=settings.PAYMENT_INBOX_INTERVAL_SECONDS,
+    )
+    scheduler.add_job(
+        log_pool_metrics,
+        "interval",
+        seconds=settings.POSTGRES_POOL_METRICS_INTERVAL_SECONDS,
+        args=[database_pool_metrics],
+    )
     scheduler.start()
+    return scheduler
@@ -1,6 +1,6 @@
 import secrets
 from functools import lru_cache
-from typing import Literal
+from typing import Any, Literal
 
 from pydantic import computed_field
 from pydantic_core import MultiHostUrl
@@ -18,11 +18,23 @@ class Settings(BaseSettings):
     ENVIRONMENT: Literal["local", "staging", "production"] = "local"
 
     RESERVATION_EXPIRATION_MINUTES: int = 30
+    RESERVATION_EXPIRATION_BATCH_SIZE: int = 500
+    RESERVATION_EXPIRATION_SWEEP_MINUTES: int = 5
     GENERAL_ADMISSION_PRICE: float = 10.0
+    SEAT_MAP_CACHE_TTL_SECONDS: float = 5.0
+    SEAT_LOCK_TABLE_ENABLED: bool = False
+    SEAT_LOCK_TTL_SECONDS: float = 5.0
+    MOVIE_LISTING_CACHE_TTL_SECONDS: float = 60.0
 
     STRIPE_API_KEY: str = ""
     STRIPE_DEFAULT_CURRENCY: str = "eur"
     STRIPE_WEBHOOK_SECRET: str = ""
+    PAYMENT_PROVIDER: Literal["stripe", "fake"] = "stripe"
+    PAYMENT_CLIENT_TIMEOUT_SECONDS: float = 5.0
+    PAYMENT_CLIENT_MAX_CONCURRENCY: int = 32
+    PAYMENT_CLIENT_FAILURE_THRESHOLD: int = 5
+    PAYMENT_CLIENT_RECOVERY_SECONDS: float = 30.0
+    FAKE_PAYMENT_LATENCY_SECONDS: float = 0.05
 
     AWS_ACCESS_KEY_ID: str = ""
     AWS_SECRET_ACCESS_KEY: str = ""
@@ -33,12 +45,40 @@ class Settings(BaseSettings):
     RABBITMQ_PORT: int = 5672
     RABBITMQ_USER: str = ""
     RABBITMQ_PASSWORD: str = ""
+    RABBITMQ_PUBLISHER_POOL_SIZE: int = 4
+    RABBITMQ_PUBLISHER_POOL_TIMEOUT: float = 5.0
+    RABBITMQ_CONSUMER_CONCURRENCY: int = 8
+    RABBITMQ_CONSUMER_PREFETCH_COUNT: int = 16
+    RABBITMQ_CONSUMER_METRICS_INTERVAL_SECONDS: float = 60.0
+    RABBITMQ_CONSUMER_MAX_ATTEMPTS: int = 5
+    RABBITMQ_CONSUMER_RETRY_BASE_DELAY_SECONDS: float = 30.0
+    EVENT_CONTENT_TYPE: str = "application/msgpack"
+    PAYMENT_EVENT_CACHE_SIZE: int = 10_000
+    PAYMENT_WEBHOOK_INGESTION: bool = True
+    PAYMENT_INBOX_INTERVAL_SECONDS: float = 1.0
+    PAYMENT_INBOX_BATCH_SIZE: int = 100
+    REFUND_BATCH_SIZE: int = 50
+    REFUND_BATCH_TIMEOUT_SECONDS: float = 0.2
+    REFUND_CONCURRENCY: int = 8
+    EVENT_SUBSCRIBERS_IN_PROCESS: bool = True
+    OUTBOX_RELAY_INTERVAL_SECONDS: float = 1.0
+    OUTBOX_RELAY_BATCH_SIZE: int = 100
+    JOB_RUN_FLUSH_INTERVAL_SECONDS: float = 60.0
 
     POSTGRES_SERVER: str = "localhost"
     POSTGRES_PORT: int = 5432
     POSTGRES_USER: str = "postgres"
     POSTGRES_PASSWORD: str = ""
     POSTGRES_DB: str = ""
+    POSTGRES_POOL_SIZE: int = 5
+    POSTGRES_MAX_OVERFLOW: int = 10
+    POSTGRES_POOL_TIMEOUT: float = 30.0
+    POSTGRES_POOL_RECYCLE: int = 1800
+    POSTGRES_POOL_PRE_PING: bool = True
+    POSTGRES_POOL_METRICS_INTERVAL_SECONDS: float = 60.0
+    POSTGRES_STATEMENT_TIMEOUT_MS: int = 0
+    POSTGRES_READ_REPLICA_URIS: list[str] = []
+    READ_YOUR_WRITES_WINDOW_SECONDS: float = 0.0
 
     @computed_field  # type: ignore[prop-decorator]
     @property
@@ -52,6 +92,20 @@ class Settings(BaseSettings):
             path=self.POSTGRES_DB,
         )
 
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def SQLALCHEMY_ENGINE_OPTIONS(self) -> dict[str, Any]:
+        options: dict[str, Any] = {
+            "pool_size": self.POSTGRES_POOL_SIZE,
+            "max_overflow": self.POSTGRES_MAX_OVERFLOW,
+            "pool_timeout": self.POSTGRES_POOL_TIMEOUT,
+            "pool_recycle": self.POSTGRES_POOL_RECYCLE,
+            "pool_pre_ping": self.POSTGRES_POOL_PRE_PING,
+        }
+        if self.POSTGRES_STATEMENT_TIMEOUT_MS > 0:
+            options["connect_args"] = {"options": f"-c statement_timeout={self.POSTGRES_STATEMENT_TIMEOUT_MS}"}
+        return options
+
 
 @lru_cache
 def get_settings() -> Settings:
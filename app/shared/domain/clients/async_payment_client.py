@@ -0,0 +1,8 @@
+from typing import Protocol
+
+from app.shared.domain.payment_intent import PaymentIntent
+
+
+class AsyncPaymentClient(Protocol):
+    async def create_payment_intent(self, amount: float, idempotency_key: str) -> PaymentIntent: ...
+    async def cancel_payment_intent(self, payment_id: str) -> None: ...
@@ -8,3 +8,4 @@ class PaymentClient(Protocol):
     def create_payment_intent(self, amount: float) -> PaymentIntent: ...
     def verify_payment(self, payload: bytes, signature: str) -> PaymentEvent: ...
     def refund_payment(self, payment_id: str) -> None: ...
+    def cancel_payment_intent(self, payment_id: str) -> None: ...
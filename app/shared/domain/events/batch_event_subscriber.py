@@ -0,0 +1,17 @@
+from abc import abstractmethod
+
+from app.shared.domain.events.event_subscriber import EventSubscriber, TypeEvent
+from app.shared.domain.exceptions import EventHandlingFailed
+
+
+class BatchEventSubscriber(EventSubscriber[TypeEvent]):
+    batch_size: int
+    batch_timeout_seconds: float
+
+    def on(self, event: TypeEvent) -> None:
+        if self.on_batch(events=[event]):
+            raise EventHandlingFailed()
+
+    @abstractmethod
+    def on_batch(self, events: list[TypeEvent]) -> list[TypeEvent]:
+        raise NotImplementedError
@@ -1,10 +1,12 @@
 from abc import ABC, abstractmethod
-from dataclasses import asdict, dataclass
-from typing import Any, Self
+from dataclasses import dataclass, fields
+from typing import Any, ClassVar, Self
 
 
 @dataclass(frozen=True)
 class Event(ABC):
+    schema_version: ClassVar[int] = 1
+
     @classmethod
     @abstractmethod
     def topic(cls) -> str:
@@ -16,4 +18,4 @@ class Event(ABC):
         raise NotImplementedError
 
     def to_dict(self) -> dict[str, Any]:
-        return asdict(self)
+        return {field.name: getattr(self, field.name) for field in fields(self)}
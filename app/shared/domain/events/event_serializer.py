@@ -0,0 +1,12 @@
+from typing import Protocol, TypeVar
+
+from app.shared.domain.events.event import Event
+
+TypeEvent = TypeVar("TypeEvent", bound=Event)
+
+
+class EventSerializer(Protocol):
+    content_type: str
+
+    def serialize(self, event: Event) -> bytes: ...
+    def deserialize(self, event_class: type[TypeEvent], body: bytes) -> TypeEvent: ...
@@ -1 +1,13 @@
 class RefundError(Exception): ...
+
+
+class EventHandlingFailed(Exception): ...
+
+
+class PaymentProviderUnavailable(Exception): ...
+
+
+class PaymentCancellationError(Exception): ...
+
+
+class PaymentIntentRejected(Exception): ...
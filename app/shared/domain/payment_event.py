@@ -3,6 +3,7 @@ from dataclasses import dataclass
 
 @dataclass(frozen=True)
 class PaymentEvent:
+    id: str
     type: str
     payment_intent_id: str
 
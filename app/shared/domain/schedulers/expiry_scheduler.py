@@ -0,0 +1,9 @@
+from typing import Protocol
+
+from app.shared.domain.value_objects.date_time import DateTime
+from app.shared.domain.value_objects.id import Id
+
+
+class ExpiryScheduler(Protocol):
+    def schedule(self, id: Id, expires_at: DateTime) -> None: ...
+    def discard(self, id: Id) -> None: ...
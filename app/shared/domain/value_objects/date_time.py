@@ -14,6 +14,9 @@ class DateTime:
     def subtract_minutes(self, minutes: int) -> Self:
         return self.from_datetime(self._value - timedelta(minutes=minutes))
 
+    def add_minutes(self, minutes: int) -> Self:
+        return self.from_datetime(self._value + timedelta(minutes=minutes))
+
     @classmethod
     def from_datetime(cls, value: datetime) -> Self:
         if value.tzinfo is None:
@@ -24,6 +27,9 @@ class DateTime:
     def now(cls) -> Self:
         return cls.from_datetime(datetime.now(timezone.utc))
 
+    def to_naive_utc(self) -> datetime:
+        return self._value.astimezone(timezone.utc).replace(tzinfo=None)
+
     def to_string(self) -> str:
         return self._value.strftime("%Y-%m-%dT%H:%M:%SZ")
 
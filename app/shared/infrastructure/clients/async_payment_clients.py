@@ -0,0 +1,28 @@
+import stripe
+
+from app.settings import Settings, get_settings
+from app.shared.domain.clients.async_payment_client import AsyncPaymentClient
+from app.shared.infrastructure.clients.async_stripe_client import AsyncStripeClient
+from app.shared.infrastructure.clients.circuit_breaker import CircuitBreaker
+from app.shared.infrastructure.clients.fake_payment_client import FakePaymentClient
+
+
+def create_async_payment_client(settings: Settings) -> AsyncPaymentClient:
+    if settings.PAYMENT_PROVIDER == "fake":
+        return FakePaymentClient(latency_seconds=settings.FAKE_PAYMENT_LATENCY_SECONDS)
+
+    return AsyncStripeClient(
+        provider=stripe.StripeClient(
+            api_key=settings.STRIPE_API_KEY,
+            http_client=stripe.HTTPXClient(timeout=settings.PAYMENT_CLIENT_TIMEOUT_SECONDS),
+        ),
+        timeout_seconds=settings.PAYMENT_CLIENT_TIMEOUT_SECONDS,
+        max_concurrency=settings.PAYMENT_CLIENT_MAX_CONCURRENCY,
+        circuit_breaker=CircuitBreaker(
+            failure_threshold=settings.PAYMENT_CLIENT_FAILURE_THRESHOLD,
+            recovery_seconds=settings.PAYMENT_CLIENT_RECOVERY_SECONDS,
+        ),
+    )
+
+
+async_payment_client = create_async_payment_client(get_settings())
@@ -0,0 +1,90 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+import stripe
+from stripe import RateLimitError, StripeError
+
+from app.shared.domain.clients.async_payment_client import AsyncPaymentClient
+from app.shared.domain.exceptions import PaymentCancellationError, PaymentIntentRejected, PaymentProviderUnavailable
+from app.shared.domain.payment_intent import PaymentIntent
+from app.shared.infrastructure.clients.circuit_breaker import CircuitBreaker
+from app.shared.infrastructure.clients.stripe_client import payment_intent_params
+
+T = TypeVar("T")
+
+
+class AsyncStripeClient(AsyncPaymentClient):
+    def __init__(
+        self,
+        provider: stripe.StripeClient,
+        timeout_seconds: float,
+        max_concurrency: int,
+        circuit_breaker: CircuitBreaker,
+    ) -> None:
+        self._provider = provider
+        self._timeout_seconds = timeout_seconds
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._circuit_breaker = circuit_breaker
+
+    async def create_payment_intent(self, amount: float, idempotency_key: str) -> PaymentIntent:
+        try:
+            payment_intent = await self._call(
+                lambda: self._provider.payment_intents.create_async(
+                    params=payment_intent_params(amount),  # type: ignore
+                    options={"idempotency_key": idempotency_key},
+                )
+            )
+        except StripeError:
+            raise PaymentIntentRejected()
+        return PaymentIntent(
+            client_secret=payment_intent.client_secret,  # type: ignore
+            provider_payment_id=payment_intent.id,
+            amount=amount,
+        )
+
+    async def cancel_payment_intent(self, payment_id: str) -> None:
+        try:
+            await self._call(lambda: self._provider.payment_intents.cancel_async(payment_id))
+        except StripeError:
+            raise PaymentCancellationError()
+
+    async def _call(self, request: Callable[[], Awaitable[T]]) -> T:
+        if not self._circuit_breaker.allow():
+            raise PaymentProviderUnavailable()
+
+        deadline = asyncio.get_running_loop().time() + self._timeout_seconds
+        try:
+            async with asyncio.timeout_at(deadline):
+                await self._semaphore.acquire()
+        except TimeoutError:
+            self._circuit_breaker.release()
+            raise PaymentProviderUnavailable()
+        except BaseException:
+            self._circuit_breaker.release()
+            raise
+
+        try:
+            async with asyncio.timeout_at(deadline):
+                response = await request()
+        except TimeoutError:
+            self._circuit_breaker.record_failure()
+            raise PaymentProviderUnavailable()
+        except StripeError as error:
+            if not self._is_provider_failure(error):
+                self._circuit_breaker.record_success()
+                raise
+            self._circuit_breaker.record_failure()
+            raise PaymentProviderUnavailable()
+        except BaseException:
+            self._circuit_breaker.release()
+            raise
+        finally:
+            self._semaphore.release()
+
+        self._circuit_breaker.record_success()
+        return response
+
+    @staticmethod
+    def _is_provider_failure(error: StripeError) -> bool:
+        return isinstance(error, RateLimitError) or error.http_status is None or error.http_status >= 500
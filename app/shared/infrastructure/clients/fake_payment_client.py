@@ -0,0 +1,35 @@
+import asyncio
+from uuid import uuid4
+
+from app.shared.domain.clients.async_payment_client import AsyncPaymentClient
+from app.shared.domain.payment_intent import PaymentIntent
+
+
+class FakePaymentClient(AsyncPaymentClient):
+    def __init__(self, latency_seconds: float) -> None:
+        self._latency_seconds = latency_seconds
+        self._payment_intents: dict[str, PaymentIntent] = {}
+        self._cancelled_payment_ids: set[str] = set()
+
+    @property
+    def payment_intents_created(self) -> int:
+        return len(self._payment_intents)
+
+    @property
+    def payment_intents_cancelled(self) -> int:
+        return len(self._cancelled_payment_ids)
+
+    async def create_payment_intent(self, amount: float, idempotency_key: str) -> PaymentIntent:
+        await asyncio.sleep(self._latency_seconds)
+        if idempotency_key not in self._payment_intents:
+            provider_payment_id = f"pi_fake_{uuid4().hex}"
+            self._payment_intents[idempotency_key] = PaymentIntent(
+                client_secret=f"{provider_payment_id}_secret_fake",
+                provider_payment_id=provider_payment_id,
+                amount=amount,
+            )
+        return self._payment_intents[idempotency_key]
+
+    async def cancel_payment_intent(self, payment_id: str) -> None:
+        await asyncio.sleep(self._latency_seconds)
+        self._cancelled_payment_ids.add(payment_id)
@@ -1,27 +1,32 @@
+from typing import Any
+
 import stripe
 from stripe import SignatureVerificationError, StripeError
 
 from app.payments.domain.exceptions import InvalidSignature
 from app.settings import get_settings
 from app.shared.domain.clients.payment_client import PaymentClient
-from app.shared.domain.exceptions import RefundError
+from app.shared.domain.exceptions import PaymentCancellationError, RefundError
 from app.shared.domain.payment_event import PaymentEvent
 from app.shared.domain.payment_intent import PaymentIntent
 
 settings = get_settings()
 
 
+def payment_intent_params(amount: float) -> dict[str, Any]:
+    return {
+        "amount": int(amount * 100),
+        "currency": settings.STRIPE_DEFAULT_CURRENCY,
+        "automatic_payment_methods": {"enabled": True},
+    }
+
+
 class StripeClient(PaymentClient):
-    def __init__(self) -> None:
-        self._provider = stripe
-        self._provider.api_key = settings.STRIPE_API_KEY
+    def __init__(self, provider: stripe.StripeClient) -> None:
+        self._provider = provider
 
     def create_payment_intent(self, amount: float) -> PaymentIntent:
-        payment_intent = self._provider.PaymentIntent.create(
-            amount=int(amount * 100),
-            currency=settings.STRIPE_DEFAULT_CURRENCY,
-            automatic_payment_methods={"enabled": True},
-        )
+        payment_intent = self._provider.payment_intents.create(params=payment_intent_params(amount))  # type: ignore
         return PaymentIntent(
             client_secret=payment_intent.client_secret,  # type: ignore
             provider_payment_id=payment_intent.id,
@@ -30,15 +35,24 @@ class StripeClient(PaymentClient):
 
     def verify_payment(self, payload: bytes, signature: str) -> PaymentEvent:
         try:
-            event = self._provider.Webhook.construct_event(  # type: ignore
+            event = self._provider.construct_event(
                 payload=payload, sig_header=signature, secret=settings.STRIPE_WEBHOOK_SECRET
             )
-            return PaymentEvent(type=event.type, payment_intent_id=event.data.object["id"])
+            return PaymentEvent(id=event.id, type=event.type, payment_intent_id=event.data.object["id"])
         except SignatureVerificationError:
             raise InvalidSignature()
 
     def refund_payment(self, payment_id: str) -> None:
         try:
-            self._provider.Refund.create(payment_intent=payment_id)
+            self._provider.refunds.create(params={"payment_intent": payment_id})
         except StripeError:
             raise RefundError()
+
+    def cancel_payment_intent(self, payment_id: str) -> None:
+        try:
+            self._provider.payment_intents.cancel(payment_id)
+        except StripeError:
+            raise PaymentCancellationError()
+
+
+stripe_client = StripeClient(provider=stripe.StripeClient(api_key=settings.STRIPE_API_KEY))
@@ -1,19 +1,81 @@
+import functools
+import logging
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
 from pika import BlockingConnection, ConnectionParameters, PlainCredentials
 from pika.adapters.blocking_connection import BlockingChannel
 from pika.exchange_type import ExchangeType
+from pika.spec import PERSISTENT_DELIVERY_MODE, Basic, BasicProperties
 
 from app.settings import get_settings
+from app.shared.domain.events.batch_event_subscriber import BatchEventSubscriber
 from app.shared.domain.events.event_subscriber import EventSubscriber, TypeEvent
+from app.shared.domain.exceptions import EventHandlingFailed
+from app.shared.infrastructure.events.serializers.event_serializers import EventSerializers, event_serializers
+from app.shared.infrastructure.events.subscriber_metrics import SubscriberMetrics, SubscriberStats
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
+
+EXCHANGE_NAME = "domain_events"
+ATTEMPTS_HEADER = "x-attempts"
+ERROR_HEADER = "x-error"
+
+
+def connection_parameters() -> ConnectionParameters:
+    return ConnectionParameters(
+        host=settings.RABBITMQ_HOST,
+        port=settings.RABBITMQ_PORT,
+        credentials=PlainCredentials(
+            username=settings.RABBITMQ_USER,
+            password=settings.RABBITMQ_PASSWORD,
+        ),
+        heartbeat=600,
+        blocked_connection_timeout=300,
+    )
+
+
+def retry_queue_name(queue_name: str, attempt: int) -> str:
+    return f"{queue_name}.retry.{attempt}"
+
+
+def dead_letter_queue_name(queue_name: str) -> str:
+    return f"{queue_name}.dead"
+
+
+@dataclass(frozen=True)
+class Delivery:
+    method: Basic.Deliver
+    properties: BasicProperties
+    body: bytes
 
 
 class RabbitMQConfigurer:
-    _exchange_name: str = "domain_events"
+    _exchange_name: str = EXCHANGE_NAME
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        concurrency: int = settings.RABBITMQ_CONSUMER_CONCURRENCY,
+        prefetch_count: int = settings.RABBITMQ_CONSUMER_PREFETCH_COUNT,
+        max_attempts: int = settings.RABBITMQ_CONSUMER_MAX_ATTEMPTS,
+        retry_base_delay_seconds: float = settings.RABBITMQ_CONSUMER_RETRY_BASE_DELAY_SECONDS,
+        serializers: EventSerializers = event_serializers,
+    ) -> None:
         self._connection: BlockingConnection | None = None
         self._channel: BlockingChannel | None = None
+        self._concurrency = concurrency
+        self._prefetch_count = prefetch_count
+        self._max_attempts = max_attempts
+        self._retry_base_delay_seconds = retry_base_delay_seconds
+        self._serializers = serializers
+        self._executor: ThreadPoolExecutor | None = None
+        self._metrics: dict[str, SubscriberMetrics] = {}
+        self._batches: dict[str, list[Delivery]] = {}
+        self._batch_timers: dict[str, object] = {}
 
     @property
     def exchange_name(self) -> str:
@@ -25,21 +87,60 @@ class RabbitMQConfigurer:
         if self._channel is None or self._channel.is_closed:
             self._channel = self._connection.channel()
             self._channel.exchange_declare(exchange=self._exchange_name, exchange_type=ExchangeType.topic, durable=True)
+            self._channel.basic_qos(prefetch_count=self._prefetch_count)
         return self._channel
 
     def add_subscriber(self, subscriber: type[EventSubscriber[TypeEvent]]) -> None:
         subscriber_instance = subscriber()
-        topic = subscriber_instance.event_class.topic()
-        queue_name = f"{topic}.{subscriber.action}"
+        queue_name = self._declare_queues(subscriber_instance)
+        self._metrics.setdefault(queue_name, SubscriberMetrics())
+        channel = self.get_channel()
+
+        if isinstance(subscriber_instance, BatchEventSubscriber):
+            channel.basic_qos(prefetch_count=max(self._prefetch_count, subscriber_instance.batch_size))
+            channel.basic_consume(
+                queue=queue_name,
+                on_message_callback=functools.partial(self._buffer, subscriber_instance, queue_name),
+                auto_ack=False,
+            )
+            channel.basic_qos(prefetch_count=self._prefetch_count)
+            return
+
+        channel.basic_consume(
+            queue=queue_name,
+            on_message_callback=functools.partial(self._dispatch, subscriber_instance, queue_name),
+            auto_ack=False,
+        )
 
+    def replay_dead_letters(self, subscriber: type[EventSubscriber[TypeEvent]], limit: int | None = None) -> int:
+        queue_name = self._declare_queues(subscriber())
         channel = self.get_channel()
-        channel.queue_declare(queue=queue_name, durable=True)
-        channel.queue_bind(exchange=self._exchange_name, queue=queue_name, routing_key=topic)
-        channel.basic_consume(queue=queue_name, on_message_callback=subscriber_instance.handle, auto_ack=True)
+
+        replayed = 0
+        while limit is None or replayed < limit:
+            method, properties, body = channel.basic_get(queue=dead_letter_queue_name(queue_name), auto_ack=False)
+            if method is None or properties is None or body is None:
+                break
+
+            headers = {
+                key: value
+                for key, value in (properties.headers or {}).items()
+                if key not in (ATTEMPTS_HEADER, ERROR_HEADER)
+            }
+            channel.basic_publish(
+                exchange="", routing_key=queue_name, body=body, properties=self._properties(properties, headers)
+            )
+            channel.basic_ack(delivery_tag=method.delivery_tag)  # type: ignore
+            replayed += 1
+        return replayed
+
+    def metrics(self) -> dict[str, SubscriberStats]:
+        return {queue_name: metrics.snapshot() for queue_name, metrics in self._metrics.items()}
 
     def start(self) -> None:
         try:
             channel = self.get_channel()
+            self._log_metrics()
             channel.start_consuming()
         except KeyboardInterrupt:
             self.stop()
@@ -47,23 +148,235 @@ class RabbitMQConfigurer:
     def stop(self) -> None:
         if self._channel and not self._channel.is_closed:
             self._channel.stop_consuming()
+
+        for timer in self._batch_timers.values():
+            if self._connection is not None:
+                self._connection.remove_timeout(timer)
+        self._batch_timers.clear()
+        self._batches.clear()
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        if self._connection and not self._connection.is_closed:
+            self._connection.process_data_events(time_limit=0)
+
+        if self._channel and not self._channel.is_closed:
             self._channel.close()
 
         if self._connection and not self._connection.is_closed:
             self._connection.close()
 
-    def _get_connection(self) -> BlockingConnection:
-        if self._connection is None or self._connection.is_closed:
-            self._connection = BlockingConnection(
-                ConnectionParameters(
-                    host=settings.RABBITMQ_HOST,
-                    port=settings.RABBITMQ_PORT,
-                    credentials=PlainCredentials(
-                        username=settings.RABBITMQ_USER,
-                        password=settings.RABBITMQ_PASSWORD,
-                    ),
-                    heartbeat=600,
-                    blocked_connection_timeout=300,
+    def _declare_queues(self, subscriber: EventSubscriber[TypeEvent]) -> str:
+        topic = subscriber.event_class.topic()
+        queue_name = f"{topic}.{subscriber.action}"
+
+        channel = self.get_channel()
+        channel.queue_declare(queue=queue_name, durable=True)
+        channel.queue_bind(exchange=self._exchange_name, queue=queue_name, routing_key=topic)
+        for attempt in range(1, self._max_attempts):
+            channel.queue_declare(
+                queue=retry_queue_name(queue_name, attempt),
+                durable=True,
+                arguments={
+                    "x-message-ttl": self._retry_delay_milliseconds(attempt),
+                    "x-dead-letter-exchange": "",
+                    "x-dead-letter-routing-key": queue_name,
+                },
+            )
+        channel.queue_declare(queue=dead_letter_queue_name(queue_name), durable=True)
+        return queue_name
+
+    def _retry_delay_milliseconds(self, attempt: int) -> int:
+        return int(self._retry_base_delay_seconds * 2 ** (attempt - 1) * 1000)
+
+    def _dispatch(
+        self,
+        subscriber: EventSubscriber[TypeEvent],
+        queue_name: str,
+        channel: BlockingChannel,
+        method: Basic.Deliver,
+        properties: BasicProperties,
+        body: bytes,
+    ) -> None:
+        self._metrics[queue_name].record_received(published_at=properties.timestamp)
+        self._submit(functools.partial(self._handle, subscriber, queue_name, channel, method, properties, body))
+
+    def _buffer(
+        self,
+        subscriber: BatchEventSubscriber[TypeEvent],
+        queue_name: str,
+        channel: BlockingChannel,
+        method: Basic.Deliver,
+        properties: BasicProperties,
+        body: bytes,
+    ) -> None:
+        self._metrics[queue_name].record_received(published_at=properties.timestamp)
+        batch = self._batches.setdefault(queue_name, [])
+        batch.append(Delivery(method=method, properties=properties, body=body))
+
+        if len(batch) >= subscriber.batch_size:
+            self._flush(subscriber, queue_name, channel)
+        elif len(batch) == 1 and self._connection is not None:
+            self._batch_timers[queue_name] = self._connection.call_later(
+                subscriber.batch_timeout_seconds, functools.partial(self._flush, subscriber, queue_name, channel)
+            )
+
+    def _flush(self, subscriber: BatchEventSubscriber[TypeEvent], queue_name: str, channel: BlockingChannel) -> None:
+        timer = self._batch_timers.pop(queue_name, None)
+        if timer is not None and self._connection is not None:
+            self._connection.remove_timeout(timer)
+
+        deliveries = self._batches.pop(queue_name, [])
+        if deliveries:
+            self._submit(functools.partial(self._handle_batch, subscriber, queue_name, channel, deliveries))
+
+    def _submit(self, task: Callable[[], None]) -> None:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._concurrency, thread_name_prefix="subscriber")
+        self._executor.submit(task)
+
+    def _handle(
+        self,
+        subscriber: EventSubscriber[TypeEvent],
+        queue_name: str,
+        channel: BlockingChannel,
+        method: Basic.Deliver,
+        properties: BasicProperties,
+        body: bytes,
+    ) -> None:
+        metrics = self._metrics[queue_name]
+        started_at = time.perf_counter()
+        try:
+            subscriber.on(event=self._serializers.deserialize(subscriber.event_class, properties, body))
+        except Exception as error:
+            logger.exception(
+                "Subscriber %s failed to handle message (attempt %d/%d)",
+                subscriber.__class__.__name__,
+                self._attempt(properties),
+                self._max_attempts,
+            )
+            metrics.record_handled(seconds=time.perf_counter() - started_at, failed=True)
+            self._threadsafe(
+                functools.partial(
+                    self._retry_or_dead_letter, channel, queue_name, method, properties, body, repr(error)
                 )
             )
+            return
+
+        metrics.record_handled(seconds=time.perf_counter() - started_at)
+        self._threadsafe(functools.partial(channel.basic_ack, delivery_tag=method.delivery_tag))  # type: ignore
+
+    def _handle_batch(
+        self,
+        subscriber: BatchEventSubscriber[TypeEvent],
+        queue_name: str,
+        channel: BlockingChannel,
+        deliveries: list[Delivery],
+    ) -> None:
+        started_at = time.perf_counter()
+        errors: dict[int, str] = {}
+        events: dict[int, TypeEvent] = {}
+        for position, delivery in enumerate(deliveries):
+            try:
+                events[position] = self._serializers.deserialize(
+                    subscriber.event_class, delivery.properties, delivery.body
+                )
+            except Exception as error:
+                errors[position] = repr(error)
+
+        try:
+            failed = {id(event) for event in subscriber.on_batch(events=list(events.values()))}
+            errors.update(
+                {position: repr(EventHandlingFailed()) for position, event in events.items() if id(event) in failed}
+            )
+        except Exception as error:
+            logger.exception("Subscriber %s failed to handle batch", subscriber.__class__.__name__)
+            errors.update({position: repr(error) for position in events})
+
+        if errors:
+            logger.warning(
+                "Subscriber %s failed to handle %d of %d messages",
+                subscriber.__class__.__name__,
+                len(errors),
+                len(deliveries),
+            )
+
+        metrics = self._metrics[queue_name]
+        seconds = (time.perf_counter() - started_at) / len(deliveries)
+        for position in range(len(deliveries)):
+            metrics.record_handled(seconds=seconds, failed=position in errors)
+        self._threadsafe(functools.partial(self._settle_batch, channel, queue_name, deliveries, errors))
+
+    def _settle_batch(
+        self, channel: BlockingChannel, queue_name: str, deliveries: list[Delivery], errors: dict[int, str]
+    ) -> None:
+        for position, delivery in enumerate(deliveries):
+            error = errors.get(position)
+            if error is None:
+                channel.basic_ack(delivery_tag=delivery.method.delivery_tag)  # type: ignore
+            else:
+                self._retry_or_dead_letter(
+                    channel, queue_name, delivery.method, delivery.properties, delivery.body, error
+                )
+
+    @staticmethod
+    def _attempt(properties: BasicProperties) -> int:
+        return int((properties.headers or {}).get(ATTEMPTS_HEADER, 0)) + 1
+
+    def _retry_or_dead_letter(
+        self,
+        channel: BlockingChannel,
+        queue_name: str,
+        method: Basic.Deliver,
+        properties: BasicProperties,
+        body: bytes,
+        error: str,
+    ) -> None:
+        attempt = self._attempt(properties)
+        if attempt < self._max_attempts:
+            routing_key = retry_queue_name(queue_name, attempt)
+        else:
+            routing_key = dead_letter_queue_name(queue_name)
+            logger.error("Dead-lettering message from %s after %d attempts", queue_name, attempt)
+
+        headers = {**(properties.headers or {}), ATTEMPTS_HEADER: attempt, ERROR_HEADER: error}
+        channel.basic_publish(
+            exchange="", routing_key=routing_key, body=body, properties=self._properties(properties, headers)
+        )
+        channel.basic_ack(delivery_tag=method.delivery_tag)  # type: ignore
+
+    @staticmethod
+    def _properties(properties: BasicProperties, headers: dict[str, Any]) -> BasicProperties:
+        return BasicProperties(
+            content_type=properties.content_type,
+            delivery_mode=PERSISTENT_DELIVERY_MODE,
+            timestamp=properties.timestamp,
+            headers=headers,
+        )
+
+    def _threadsafe(self, callback: Callable[[], None]) -> None:
+        if self._connection is not None and self._connection.is_open:
+            self._connection.add_callback_threadsafe(callback)
+
+    def _log_metrics(self) -> None:
+        for queue_name, stats in self.metrics().items():
+            logger.info(
+                "Subscriber %s handled=%d failed=%d in_flight=%d throughput=%.2f/s avg=%.3fs lag=%.1fs max_lag=%.1fs",
+                queue_name,
+                stats.handled,
+                stats.failed,
+                stats.in_flight,
+                stats.throughput_per_second,
+                stats.handle_seconds_avg,
+                stats.lag_seconds_last,
+                stats.lag_seconds_max,
+            )
+        if self._connection is not None and self._connection.is_open:
+            self._connection.call_later(settings.RABBITMQ_CONSUMER_METRICS_INTERVAL_SECONDS, self._log_metrics)
+
+    def _get_connection(self) -> BlockingConnection:
+        if self._connection is None or self._connection.is_closed:
+            self._connection = BlockingConnection(connection_parameters())
         return self._connection
@@ -1,19 +1,20 @@
-import json
-
 from app.shared.domain.events.event import Event
 from app.shared.domain.events.event_bus import EventBus
-from app.shared.infrastructure.events.rabbitmq_configurer import RabbitMQConfigurer
+from app.shared.domain.events.event_serializer import EventSerializer
+from app.shared.infrastructure.events.rabbitmq_publisher import RabbitMQPublisher
+from app.shared.infrastructure.events.serializers.event_serializers import SCHEMA_VERSION_HEADER, event_serializers
 
 
 class RabbitMQEventBus(EventBus):
-    def __init__(self, configurer: RabbitMQConfigurer) -> None:
-        self._configurer = configurer
-        self._channel = self._configurer.get_channel()
+    def __init__(self, publisher: RabbitMQPublisher, serializer: EventSerializer = event_serializers.default) -> None:
+        self._publisher = publisher
+        self._serializer = serializer
 
     def publish(self, events: list[Event]) -> None:
         for event in events:
-            self._channel.basic_publish(
-                exchange=self._configurer.exchange_name,
+            self._publisher.publish(
                 routing_key=event.topic(),
-                body=json.dumps(event.to_dict()),
+                body=self._serializer.serialize(event),
+                content_type=self._serializer.content_type,
+                headers={SCHEMA_VERSION_HEADER: event.schema_version},
             )
@@ -0,0 +1,150 @@
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable, Generator
+from contextlib import contextmanager
+from typing import Any
+
+from pika import BasicProperties, BlockingConnection
+from pika.adapters.blocking_connection import BlockingChannel
+from pika.exceptions import AMQPConnectionError, AMQPError, ChannelClosed, ChannelWrongStateError
+from pika.exchange_type import ExchangeType
+from pika.spec import PERSISTENT_DELIVERY_MODE
+
+from app.settings import get_settings
+from app.shared.infrastructure.events.rabbitmq_configurer import EXCHANGE_NAME, connection_parameters
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+RECONNECTABLE_ERRORS = (AMQPConnectionError, ChannelClosed, ChannelWrongStateError)
+
+
+def message_properties(content_type: str, headers: dict[str, Any] | None = None) -> BasicProperties:
+    return BasicProperties(
+        content_type=content_type, delivery_mode=PERSISTENT_DELIVERY_MODE, timestamp=int(time.time()), headers=headers
+    )
+
+
+class PublisherPoolExhausted(Exception):
+    pass
+
+
+class PublisherChannel:
+    def __init__(self, connection: BlockingConnection, exchange_name: str) -> None:
+        self.connection = connection
+        self.channel: BlockingChannel = connection.channel()
+        self.channel.confirm_delivery()
+        self.channel.exchange_declare(exchange=exchange_name, exchange_type=ExchangeType.topic, durable=True)
+
+    @property
+    def is_open(self) -> bool:
+        return bool(self.connection.is_open and self.channel.is_open)
+
+    def close(self) -> None:
+        try:
+            if self.connection.is_open:
+                self.connection.close()
+        except AMQPError:
+            logger.debug("Publisher connection was already gone", exc_info=True)
+
+
+class RabbitMQPublisher:
+    def __init__(
+        self,
+        connect: Callable[[], BlockingConnection],
+        exchange_name: str,
+        pool_size: int,
+        timeout: float,
+    ) -> None:
+        self._connect = connect
+        self._exchange_name = exchange_name
+        self._timeout = timeout
+        self._slots = threading.BoundedSemaphore(pool_size)
+        self._idle: queue.LifoQueue[PublisherChannel] = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._connections_opened = 0
+
+    @property
+    def connections_opened(self) -> int:
+        return self._connections_opened
+
+    def publish(
+        self,
+        routing_key: str,
+        body: bytes,
+        content_type: str = "application/json",
+        headers: dict[str, Any] | None = None,
+    ) -> None:
+        properties = message_properties(content_type=content_type, headers=headers)
+        try:
+            self._publish(routing_key=routing_key, body=body, properties=properties)
+        except RECONNECTABLE_ERRORS:
+            logger.warning("Lost RabbitMQ publisher connection, reconnecting", exc_info=True)
+            self._close_idle()
+            self._publish(routing_key=routing_key, body=body, properties=properties)
+
+    def close(self) -> None:
+        self._close_idle()
+
+    def _publish(self, routing_key: str, body: bytes, properties: BasicProperties) -> None:
+        with self._checkout() as publisher_channel:
+            publisher_channel.channel.basic_publish(
+                exchange=self._exchange_name,
+                routing_key=routing_key,
+                body=body,
+                properties=properties,
+            )
+
+    @contextmanager
+    def _checkout(self) -> Generator[PublisherChannel, None, None]:
+        if not self._slots.acquire(timeout=self._timeout):
+            raise PublisherPoolExhausted()
+
+        try:
+            publisher_channel = self._idle_channel() or self._open_channel()
+            try:
+                yield publisher_channel
+            except RECONNECTABLE_ERRORS:
+                publisher_channel.close()
+                raise
+            except Exception:
+                self._idle.put(publisher_channel)
+                raise
+            else:
+                self._idle.put(publisher_channel)
+        finally:
+            self._slots.release()
+
+    def _idle_channel(self) -> PublisherChannel | None:
+        while True:
+            try:
+                publisher_channel = self._idle.get_nowait()
+            except queue.Empty:
+                return None
+
+            if publisher_channel.is_open:
+                return publisher_channel
+            publisher_channel.close()
+
+    def _open_channel(self) -> PublisherChannel:
+        publisher_channel = PublisherChannel(connection=self._connect(), exchange_name=self._exchange_name)
+        with self._lock:
+            self._connections_opened += 1
+        return publisher_channel
+
+    def _close_idle(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+rabbitmq_publisher = RabbitMQPublisher(
+    connect=lambda: BlockingConnection(connection_parameters()),
+    exchange_name=EXCHANGE_NAME,
+    pool_size=settings.RABBITMQ_PUBLISHER_POOL_SIZE,
+    timeout=settings.RABBITMQ_PUBLISHER_POOL_TIMEOUT,
+)
@@ -0,0 +1,46 @@
+from pika.spec import BasicProperties
+
+from app.settings import get_settings
+from app.shared.domain.events.event_serializer import EventSerializer, TypeEvent
+from app.shared.infrastructure.events.serializers.json_event_serializer import JSON_CONTENT_TYPE, JsonEventSerializer
+from app.shared.infrastructure.events.serializers.msgpack_event_serializer import MsgpackEventSerializer
+
+settings = get_settings()
+
+SCHEMA_VERSION_HEADER = "x-schema-version"
+
+
+class UnsupportedContentType(Exception):
+    pass
+
+
+class UnsupportedSchemaVersion(Exception):
+    pass
+
+
+class EventSerializers:
+    def __init__(self, serializers: list[EventSerializer], default_content_type: str) -> None:
+        self._serializers = {serializer.content_type: serializer for serializer in serializers}
+        self._default = self.for_content_type(default_content_type)
+
+    @property
+    def default(self) -> EventSerializer:
+        return self._default
+
+    def for_content_type(self, content_type: str | None) -> EventSerializer:
+        try:
+            return self._serializers[content_type or JSON_CONTENT_TYPE]
+        except KeyError:
+            raise UnsupportedContentType(content_type)
+
+    def deserialize(self, event_class: type[TypeEvent], properties: BasicProperties, body: bytes) -> TypeEvent:
+        schema_version = (properties.headers or {}).get(SCHEMA_VERSION_HEADER, 1)
+        if schema_version > event_class.schema_version:
+            raise UnsupportedSchemaVersion(f"{event_class.topic()} v{schema_version}")
+        return self.for_content_type(properties.content_type).deserialize(event_class, body)
+
+
+event_serializers = EventSerializers(
+    serializers=[JsonEventSerializer(), MsgpackEventSerializer()],
+    default_content_type=settings.EVENT_CONTENT_TYPE,
+)
@@ -0,0 +1,16 @@
+import json
+
+from app.shared.domain.events.event import Event
+from app.shared.domain.events.event_serializer import EventSerializer, TypeEvent
+
+JSON_CONTENT_TYPE = "application/json"
+
+
+class JsonEventSerializer(EventSerializer):
+    content_type: str = JSON_CONTENT_TYPE
+
+    def serialize(self, event: Event) -> bytes:
+        return json.dumps(event.to_dict(), separators=(",", ":")).encode()
+
+    def deserialize(self, event_class: type[TypeEvent], body: bytes) -> TypeEvent:
+        return event_class.from_dict(data=json.loads(body))
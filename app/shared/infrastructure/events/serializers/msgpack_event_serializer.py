@@ -0,0 +1,17 @@
+import msgpack
+
+from app.shared.domain.events.event import Event
+from app.shared.domain.events.event_serializer import EventSerializer, TypeEvent
+
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+
+
+class MsgpackEventSerializer(EventSerializer):
+    content_type: str = MSGPACK_CONTENT_TYPE
+
+    def serialize(self, event: Event) -> bytes:
+        body: bytes = msgpack.packb(event.to_dict())
+        return body
+
+    def deserialize(self, event_class: type[TypeEvent], body: bytes) -> TypeEvent:
+        return event_class.from_dict(data=msgpack.unpackb(body))
@@ -0,0 +1,67 @@
+import threading
+import time
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class SubscriberStats:
+    handled: int
+    failed: int
+    in_flight: int
+    handle_seconds_total: float
+    handle_seconds_max: float
+    lag_seconds_last: float
+    lag_seconds_max: float
+    uptime_seconds: float
+
+    @property
+    def handle_seconds_avg(self) -> float:
+        return self.handle_seconds_total / self.handled if self.handled else 0.0
+
+    @property
+    def throughput_per_second(self) -> float:
+        return self.handled / self.uptime_seconds if self.uptime_seconds else 0.0
+
+
+class SubscriberMetrics:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._started_at = time.monotonic()
+        self._handled = 0
+        self._failed = 0
+        self._in_flight = 0
+        self._handle_seconds_total = 0.0
+        self._handle_seconds_max = 0.0
+        self._lag_seconds_last = 0.0
+        self._lag_seconds_max = 0.0
+
+    def record_received(self, published_at: float | None) -> None:
+        with self._lock:
+            self._in_flight += 1
+            if published_at is not None:
+                self._lag_seconds_last = max(time.time() - published_at, 0.0)
+                self._lag_seconds_max = max(self._lag_seconds_max, self._lag_seconds_last)
+
+    def record_handled(self, seconds: float, failed: bool = False) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            if failed:
+                self._failed += 1
+                return
+
+            self._handled += 1
+            self._handle_seconds_total += seconds
+            self._handle_seconds_max = max(self._handle_seconds_max, seconds)
+
+    def snapshot(self) -> SubscriberStats:
+        with self._lock:
+            return SubscriberStats(
+                handled=self._handled,
+                failed=self._failed,
+                in_flight=self._in_flight,
+                handle_seconds_total=self._handle_seconds_total,
+                handle_seconds_max=self._handle_seconds_max,
+                lag_seconds_last=self._lag_seconds_last,
+                lag_seconds_max=self._lag_seconds_max,
+                uptime_seconds=time.monotonic() - self._started_at,
+            )
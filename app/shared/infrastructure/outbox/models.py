@@ -0,0 +1,24 @@
+import json
+import uuid
+from datetime import datetime
+
+from sqlmodel import Field, SQLModel
+
+from app.shared.domain.events.event import Event
+from app.shared.domain.value_objects.date_time import DateTime
+
+
+class OutboxEventModel(SQLModel, table=True):
+    id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
+    topic: str
+    payload: str
+    created_at: datetime = Field(index=True)
+    failed_at: datetime | None = None
+    error: str | None = None
+
+    @classmethod
+    def from_domain(cls, event: Event) -> "OutboxEventModel":
+        return cls(topic=event.topic(), payload=json.dumps(event.to_dict()), created_at=DateTime.now().to_naive_utc())
+
+    def to_domain(self, event_classes: dict[str, type[Event]]) -> Event:
+        return event_classes[self.topic].from_dict(data=json.loads(self.payload))
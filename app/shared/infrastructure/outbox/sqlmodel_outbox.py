@@ -0,0 +1,54 @@
+import logging
+
+from sqlmodel import Session, delete, select
+
+from app.shared.domain.events.event import Event
+from app.shared.domain.events.event_bus import EventBus
+from app.shared.domain.value_objects.date_time import DateTime
+from app.shared.infrastructure.outbox.models import OutboxEventModel
+
+logger = logging.getLogger(__name__)
+
+
+class SqlModelOutbox:
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def add(self, events: list[Event]) -> None:
+        self._session.add_all(OutboxEventModel.from_domain(event) for event in events)
+
+    def relay(self, event_bus: EventBus, event_classes: dict[str, type[Event]], limit: int) -> int:
+        outbox_event_models = self._session.exec(
+            select(OutboxEventModel)
+            .where(OutboxEventModel.failed_at.is_(None))  # type: ignore
+            .order_by(OutboxEventModel.created_at)  # type: ignore
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        ).all()
+
+        published_ids = []
+        try:
+            for outbox_event_model in outbox_event_models:
+                try:
+                    event = outbox_event_model.to_domain(event_classes)
+                except (KeyError, TypeError, ValueError) as error:
+                    self._dead_letter(outbox_event_model, error)
+                    continue
+                event_bus.publish(events=[event])
+                published_ids.append(outbox_event_model.id)
+        finally:
+            if published_ids:
+                self._session.exec(delete(OutboxEventModel).where(OutboxEventModel.id.in_(published_ids)))  # type: ignore
+            self._session.commit()
+        return len(published_ids)
+
+    def _dead_letter(self, outbox_event_model: OutboxEventModel, error: Exception) -> None:
+        logger.error(
+            "Dead-lettering outbox event %s with topic %s that cannot be decoded",
+            outbox_event_model.id,
+            outbox_event_model.topic,
+            exc_info=error,
+        )
+        outbox_event_model.failed_at = DateTime.now().to_naive_utc()
+        outbox_event_model.error = repr(error)
+        self._session.add(outbox_event_model)
@@ -0,0 +1,46 @@
+import logging
+import time
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, PoolProxiedConnection, QueuePool
+
+from app.shared.infrastructure.pools.pool_metrics import PoolMetrics
+
+logger = logging.getLogger(__name__)
+
+
+class InstrumentedQueuePool(QueuePool):
+    metrics: PoolMetrics | None = None
+
+    def connect(self) -> PoolProxiedConnection:
+        if self.metrics is None:
+            return super().connect()
+
+        started_at = time.monotonic()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            self.metrics.record_wait(seconds=time.monotonic() - started_at, timed_out=True)
+            logger.warning("Timed out waiting for a database connection: %s", self.status())
+            raise
+        self.metrics.record_wait(seconds=time.monotonic() - started_at)
+        return connection
+
+    def recreate(self) -> QueuePool:
+        pool = super().recreate()
+        if isinstance(pool, InstrumentedQueuePool) and self.metrics is not None:
+            pool.metrics = self.metrics
+            self.metrics.bind(pool)
+        return pool
+
+
+class InstrumentedAsyncAdaptedQueuePool(InstrumentedQueuePool, AsyncAdaptedQueuePool):
+    pass
+
+
+def instrument_pool(pool: Pool, metrics: PoolMetrics) -> None:
+    if not isinstance(pool, InstrumentedQueuePool):
+        raise TypeError(f"{type(pool).__name__} is not an instrumented pool")
+
+    pool.metrics = metrics
+    metrics.instrument(pool)
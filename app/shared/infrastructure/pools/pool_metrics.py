@@ -0,0 +1,118 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.pool import ConnectionPoolEntry, Pool, QueuePool
+
+CONNECTED_AT_KEY = "connected_at"
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    size: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    wait_seconds_total: float
+    wait_seconds_max: float
+    connections_opened: int
+    connections_closed: int
+    connection_lifetime_seconds_max: float
+
+    @property
+    def wait_seconds_avg(self) -> float:
+        return self.wait_seconds_total / self.checkouts if self.checkouts else 0.0
+
+    @property
+    def saturation(self) -> float:
+        return self.checked_out / self.size if self.size else 0.0
+
+
+class PoolMetrics:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pool: Pool | None = None
+        self._checkouts = 0
+        self._timeouts = 0
+        self._wait_seconds_total = 0.0
+        self._wait_seconds_max = 0.0
+        self._connections_opened = 0
+        self._connections_closed = 0
+        self._connection_lifetime_seconds_max = 0.0
+
+    def instrument(self, pool: Pool) -> None:
+        self._pool = pool
+        event.listen(pool, "connect", self._on_connect)
+        event.listen(pool, "close", self._on_close)
+
+    def bind(self, pool: Pool) -> None:
+        self._pool = pool
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            if timed_out:
+                self._timeouts += 1
+            else:
+                self._checkouts += 1
+                self._wait_seconds_total += seconds
+            self._wait_seconds_max = max(self._wait_seconds_max, seconds)
+
+    def snapshot(self) -> PoolStats:
+        size, checked_out, overflow = self._pool_status()
+        with self._lock:
+            return PoolStats(
+                size=size,
+                checked_out=checked_out,
+                overflow=overflow,
+                checkouts=self._checkouts,
+                timeouts=self._timeouts,
+                wait_seconds_total=self._wait_seconds_total,
+                wait_seconds_max=self._wait_seconds_max,
+                connections_opened=self._connections_opened,
+                connections_closed=self._connections_closed,
+                connection_lifetime_seconds_max=self._connection_lifetime_seconds_max,
+            )
+
+    def _pool_status(self) -> tuple[int, int, int]:
+        if not isinstance(self._pool, QueuePool):
+            return 0, 0, 0
+        return self._pool.size(), self._pool.checkedout(), max(self._pool.overflow(), 0)
+
+    def _on_connect(self, dbapi_connection: Any, connection_record: ConnectionPoolEntry) -> None:  # noqa: ARG002
+        connection_record.info[CONNECTED_AT_KEY] = time.monotonic()
+        with self._lock:
+            self._connections_opened += 1
+
+    def _on_close(self, dbapi_connection: Any, connection_record: ConnectionPoolEntry) -> None:  # noqa: ARG002
+        connected_at = connection_record.info.pop(CONNECTED_AT_KEY, None)
+        with self._lock:
+            self._connections_closed += 1
+            if connected_at is not None:
+                lifetime = time.monotonic() - connected_at
+                self._connection_lifetime_seconds_max = max(self._connection_lifetime_seconds_max, lifetime)
+
+
+def log_pool_metrics(metrics: dict[str, PoolMetrics]) -> None:
+    for name, pool_metrics in metrics.items():
+        stats = pool_metrics.snapshot()
+        logger.info(
+            "Database pool %s checked_out=%d/%d overflow=%d saturation=%.2f checkouts=%d timeouts=%d "
+            "wait_avg=%.4fs wait_max=%.4fs opened=%d closed=%d",
+            name,
+            stats.checked_out,
+            stats.size,
+            stats.overflow,
+            stats.saturation,
+            stats.checkouts,
+            stats.timeouts,
+            stats.wait_seconds_avg,
+            stats.wait_seconds_max,
+            stats.connections_opened,
+            stats.connections_closed,
+        )
@@ -0,0 +1,48 @@
+import threading
+import time
+from uuid import UUID
+
+from app.settings import get_settings
+
+settings = get_settings()
+
+
+class RecentWriters:
+    def __init__(self, window_seconds: float) -> None:
+        self._window_seconds = window_seconds
+        self._written_at: dict[UUID, float] = {}
+        self._lock = threading.Lock()
+
+    def record(self, user_id: UUID) -> None:
+        if self._window_seconds <= 0:
+            return
+
+        now = time.monotonic()
+        with self._lock:
+            self._written_at[user_id] = now
+            self._evict_expired(now)
+
+    def wrote_recently(self, user_id: UUID) -> bool:
+        with self._lock:
+            written_at = self._written_at.get(user_id)
+            if written_at is None:
+                return False
+
+            if time.monotonic() - written_at >= self._window_seconds:
+                del self._written_at[user_id]
+                return False
+            return True
+
+    def clear(self) -> None:
+        with self._lock:
+            self._written_at.clear()
+
+    def _evict_expired(self, now: float) -> None:
+        expired = [
+            user_id for user_id, written_at in self._written_at.items() if now - written_at >= self._window_seconds
+        ]
+        for user_id in expired:
+            del self._written_at[user_id]
+
+
+recent_writers = RecentWriters(window_seconds=settings.READ_YOUR_WRITES_WINDOW_SECONDS)
@@ -0,0 +1,90 @@
+import heapq
+import itertools
+import logging
+import threading
+import time
+from collections.abc import Callable
+
+from app.shared.domain.schedulers.expiry_scheduler import ExpiryScheduler
+from app.shared.domain.value_objects.date_time import DateTime
+from app.shared.domain.value_objects.id import Id
+
+logger = logging.getLogger(__name__)
+
+
+class HeapExpiryScheduler(ExpiryScheduler):
+    def __init__(self, on_expire: Callable[[list[Id]], object]) -> None:
+        self._on_expire = on_expire
+        self._heap: list[tuple[float, int, Id]] = []
+        self._sequence = itertools.count()
+        self._expires_at: dict[Id, float] = {}
+        self._condition = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._stopped = False
+
+    def schedule(self, id: Id, expires_at: DateTime) -> None:
+        timestamp = expires_at.value.timestamp()
+        with self._condition:
+            self._expires_at[id] = timestamp
+            heapq.heappush(self._heap, (timestamp, next(self._sequence), id))
+            if self._heap[0][2] == id:
+                self._condition.notify()
+
+    def discard(self, id: Id) -> None:
+        with self._condition:
+            self._expires_at.pop(id, None)
+
+    def pending(self) -> int:
+        with self._condition:
+            return len(self._expires_at)
+
+    def pop_expired(self, now: float) -> list[Id]:
+        with self._condition:
+            return self._pop_expired(now)
+
+    def start(self) -> None:
+        with self._condition:
+            if self._thread is not None:
+                return
+            self._stopped = False
+            self._thread = threading.Thread(target=self._run, name="expiry-scheduler", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        with self._condition:
+            thread, self._thread = self._thread, None
+            self._stopped = True
+            self._condition.notify()
+        if thread is not None:
+            thread.join()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                expired = self._pop_expired(time.time())
+                while not expired and not self._stopped:
+                    self._condition.wait(timeout=self._seconds_until_next_expiry())
+                    expired = self._pop_expired(time.time())
+                if self._stopped:
+                    return
+
+            try:
+                self._on_expire(expired)
+            except Exception:
+                logger.exception("Failed to expire %d entries", len(expired))
+
+    def _pop_expired(self, now: float) -> list[Id]:
+        expired = []
+        while self._heap and self._heap[0][0] <= now:
+            timestamp, _, id = heapq.heappop(self._heap)
+            if self._expires_at.get(id) == timestamp:
+                del self._expires_at[id]
+                expired.append(id)
+        return expired
+
+    def _seconds_until_next_expiry(self) -> float | None:
+        while self._heap and self._expires_at.get(self._heap[0][2]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+        if not self._heap:
+            return None
+        return max(self._heap[0][0] - time.time(), 0.0)
@@ -0,0 +1,71 @@
+import hashlib
+import logging
+import threading
+
+from sqlalchemy import Connection, Engine, text
+from sqlalchemy.exc import DBAPIError
+
+logger = logging.getLogger(__name__)
+
+
+def advisory_lock_key(name: str) -> int:
+    return int.from_bytes(hashlib.blake2b(name.encode(), digest_size=8).digest(), "big", signed=True)
+
+
+class LeaderElection:
+    def __init__(self, engine: Engine, name: str) -> None:
+        self._engine = engine
+        self._key = advisory_lock_key(name)
+        self._connection: Connection | None = None
+        self._lock = threading.Lock()
+
+    def is_leader(self) -> bool:
+        if self._engine.dialect.name != "postgresql":
+            return True
+
+        with self._lock:
+            if self._connection is not None and self._is_connected(self._connection):
+                return True
+
+            self._connection = self._try_acquire()
+            return self._connection is not None
+
+    def resign(self) -> None:
+        with self._lock:
+            if self._connection is None:
+                return
+
+            try:
+                self._connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": self._key})
+                self._connection.commit()
+            finally:
+                self._connection.close()
+                self._connection = None
+
+    def _try_acquire(self) -> Connection | None:
+        connection = self._engine.connect()
+        try:
+            acquired = connection.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": self._key}).scalar()
+            connection.commit()
+        except DBAPIError:
+            connection.close()
+            raise
+
+        if not acquired:
+            connection.close()
+            return None
+
+        logger.info("Acquired scheduler leadership")
+        return connection
+
+    @staticmethod
+    def _is_connected(connection: Connection) -> bool:
+        try:
+            connection.execute(text("SELECT 1"))
+            connection.commit()
+        except DBAPIError:
+            logger.warning("Lost scheduler leadership")
+            connection.invalidate()
+            connection.close()
+            return False
+        return True
@@ -0,0 +1,10 @@
+from datetime import datetime
+
+from sqlmodel import Field, SQLModel
+
+
+class JobRunModel(SQLModel, table=True):
+    name: str = Field(primary_key=True)
+    last_run_at: datetime
+    duration_seconds: float
+    rows_affected: int
@@ -0,0 +1,52 @@
+import logging
+import time
+from collections.abc import Callable
+
+from app.database import get_session
+from app.shared.domain.value_objects.date_time import DateTime
+from app.shared.infrastructure.scheduling.leader_election import LeaderElection
+from app.shared.infrastructure.scheduling.models import JobRunModel
+
+logger = logging.getLogger(__name__)
+
+
+class ScheduledJob:
+    def __init__(
+        self,
+        name: str,
+        job: Callable[[], int],
+        leader_election: LeaderElection,
+        flush_interval_seconds: float = 0.0,
+    ) -> None:
+        self.name = name
+        self._job = job
+        self._leader_election = leader_election
+        self._flush_interval_seconds = flush_interval_seconds
+        self._flushed_at: float | None = None
+        self._pending_rows_affected = 0
+
+    def __call__(self) -> None:
+        if not self._leader_election.is_leader():
+            return
+
+        last_run_at = DateTime.now()
+        started_at = time.perf_counter()
+        rows_affected = self._job()
+        duration_seconds = time.perf_counter() - started_at
+        self._pending_rows_affected += rows_affected
+
+        if self._flushed_at is not None and time.monotonic() - self._flushed_at < self._flush_interval_seconds:
+            return
+
+        rows_affected, self._pending_rows_affected = self._pending_rows_affected, 0
+        self._flushed_at = time.monotonic()
+        with get_session() as session:
+            session.merge(
+                JobRunModel(
+                    name=self.name,
+                    last_run_at=last_run_at.to_naive_utc(),
+                    duration_seconds=duration_seconds,
+                    rows_affected=rows_affected,
+                )
+            )
+        logger.info("Job %s affected %d rows in %.3fs", self.name, rows_affected, duration_seconds)
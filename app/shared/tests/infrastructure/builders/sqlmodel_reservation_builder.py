@@ -16,7 +16,7 @@ class SqlModelReservationBuilder:
         self.user_id: uuid.UUID = uuid.uuid4()
         self.showtime_id: uuid.UUID = uuid.uuid4()
         self.status: str = ReservationStatus.PENDING.value
-        self.provider_payment_id: str = "pi_3MtwBwLkdIwHu7ix28a3tqPa"
+        self.provider_payment_id: str | None = "pi_3MtwBwLkdIwHu7ix28a3tqPa"
         self.created_at: datetime = datetime.now()
 
     def with_id(self, id: uuid.UUID) -> Self:
@@ -51,6 +51,10 @@ class SqlModelReservationBuilder:
         self.provider_payment_id = provider_payment_id
         return self
 
+    def without_provider_payment_id(self) -> Self:
+        self.provider_payment_id = None
+        return self
+
     def with_created_at(self, created_at: datetime) -> Self:
         self.created_at = created_at
         return self
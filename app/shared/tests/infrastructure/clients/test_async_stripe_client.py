@@ -0,0 +1,148 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from stripe import APIConnectionError, InvalidRequestError
+
+from app.shared.domain.exceptions import PaymentCancellationError, PaymentIntentRejected, PaymentProviderUnavailable
+from app.shared.domain.payment_intent import PaymentIntent
+from app.shared.infrastructure.clients.async_stripe_client import AsyncStripeClient
+from app.shared.infrastructure.clients.circuit_breaker import CircuitBreaker, CircuitState
+
+
+class TestAsyncStripeClient:
+    @pytest.fixture
+    def mock_provider(self) -> Mock:
+        provider = Mock()
+        provider.payment_intents.create_async = AsyncMock(
+            return_value=Mock(client_secret="test_client_secret", id="test_payment_id")
+        )
+        return provider
+
+    @pytest.fixture
+    def circuit_breaker(self) -> CircuitBreaker:
+        return CircuitBreaker(failure_threshold=2, recovery_seconds=30.0)
+
+    @pytest.fixture
+    def client(self, mock_provider: Mock, circuit_breaker: CircuitBreaker) -> AsyncStripeClient:
+        return AsyncStripeClient(
+            provider=mock_provider, timeout_seconds=0.05, max_concurrency=1, circuit_breaker=circuit_breaker
+        )
+
+    @pytest.mark.anyio
+    async def test_creates_payment_intent(self, client: AsyncStripeClient, mock_provider: Mock) -> None:
+        payment_intent = await client.create_payment_intent(
+            amount=10.0, idempotency_key="5661455d-de5a-47ba-b99f-f6d50fdfc00b"
+        )
+
+        mock_provider.payment_intents.create_async.assert_awaited_once()
+        assert mock_provider.payment_intents.create_async.call_args.kwargs["params"]["amount"] == 1000
+        assert mock_provider.payment_intents.create_async.call_args.kwargs["options"] == {
+            "idempotency_key": "5661455d-de5a-47ba-b99f-f6d50fdfc00b"
+        }
+        assert payment_intent == PaymentIntent(
+            client_secret="test_client_secret", provider_payment_id="test_payment_id", amount=10.0
+        )
+
+    @pytest.mark.anyio
+    async def test_raises_unavailable_and_records_failure_on_timeout(
+        self, client: AsyncStripeClient, mock_provider: Mock, circuit_breaker: CircuitBreaker
+    ) -> None:
+        async def create_async(**_: object) -> None:
+            await asyncio.sleep(1)
+
+        mock_provider.payment_intents.create_async.side_effect = create_async
+
+        for _ in range(2):
+            with pytest.raises(PaymentProviderUnavailable):
+                await client.create_payment_intent(amount=10.0, idempotency_key="5661455d-de5a-47ba-b99f-f6d50fdfc00b")
+
+        assert circuit_breaker.state == CircuitState.OPEN
+
+    @pytest.mark.anyio
+    async def test_fails_fast_when_circuit_is_open(
+        self, client: AsyncStripeClient, mock_provider: Mock, circuit_breaker: CircuitBreaker
+    ) -> None:
+        circuit_breaker.record_failure()
+        circuit_breaker.record_failure()
+
+        with pytest.raises(PaymentProviderUnavailable):
+            await client.create_payment_intent(amount=10.0, idempotency_key="5661455d-de5a-47ba-b99f-f6d50fdfc00b")
+
+        mock_provider.payment_intents.create_async.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_records_connection_errors_as_failures(
+        self, client: AsyncStripeClient, mock_provider: Mock, circuit_breaker: CircuitBreaker
+    ) -> None:
+        mock_provider.payment_intents.create_async.side_effect = APIConnectionError("Connection reset")  # type: ignore
+
+        for _ in range(2):
+            with pytest.raises(PaymentProviderUnavailable):
+                await client.create_payment_intent(amount=10.0, idempotency_key="5661455d-de5a-47ba-b99f-f6d50fdfc00b")
+
+        assert circuit_breaker.state == CircuitState.OPEN
+
+    @pytest.mark.anyio
+    async def test_does_not_trip_circuit_on_client_errors(
+        self, client: AsyncStripeClient, mock_provider: Mock, circuit_breaker: CircuitBreaker
+    ) -> None:
+        mock_provider.payment_intents.create_async.side_effect = InvalidRequestError(  # type: ignore
+            "Invalid amount", param="amount", http_status=400
+        )
+
+        for _ in range(2):
+            with pytest.raises(PaymentIntentRejected):
+                await client.create_payment_intent(amount=10.0, idempotency_key="5661455d-de5a-47ba-b99f-f6d50fdfc00b")
+
+        assert circuit_breaker.state == CircuitState.CLOSED
+
+    @pytest.mark.anyio
+    async def test_raises_unavailable_without_tripping_circuit_when_no_slot_is_free(
+        self, mock_provider: Mock, circuit_breaker: CircuitBreaker
+    ) -> None:
+        client = AsyncStripeClient(
+            provider=mock_provider, timeout_seconds=0.01, max_concurrency=0, circuit_breaker=circuit_breaker
+        )
+
+        for _ in range(2):
+            with pytest.raises(PaymentProviderUnavailable):
+                await client.create_payment_intent(amount=10.0, idempotency_key="5661455d-de5a-47ba-b99f-f6d50fdfc00b")
+
+        mock_provider.payment_intents.create_async.assert_not_called()
+        assert circuit_breaker.state == CircuitState.CLOSED
+
+    @pytest.mark.anyio
+    async def test_releases_half_open_probe_when_no_slot_is_free(self, mock_provider: Mock) -> None:
+        circuit_breaker = CircuitBreaker(failure_threshold=1, recovery_seconds=0.0)
+        circuit_breaker.record_failure()
+        client = AsyncStripeClient(
+            provider=mock_provider, timeout_seconds=0.01, max_concurrency=0, circuit_breaker=circuit_breaker
+        )
+
+        with pytest.raises(PaymentProviderUnavailable):
+            await client.create_payment_intent(amount=10.0, idempotency_key="5661455d-de5a-47ba-b99f-f6d50fdfc00b")
+
+        assert circuit_breaker.state == CircuitState.HALF_OPEN
+        assert circuit_breaker.allow() is True
+
+    @pytest.mark.anyio
+    async def test_cancels_payment_intent(self, client: AsyncStripeClient, mock_provider: Mock) -> None:
+        mock_provider.payment_intents.cancel_async = AsyncMock()
+
+        await client.cancel_payment_intent(payment_id="pi_3MtwBwLkdIwHu7ix28a3tqPa")
+
+        mock_provider.payment_intents.cancel_async.assert_awaited_once_with("pi_3MtwBwLkdIwHu7ix28a3tqPa")
+
+    @pytest.mark.anyio
+    async def test_raises_cancellation_error_when_provider_rejects_cancel(
+        self, client: AsyncStripeClient, mock_provider: Mock, circuit_breaker: CircuitBreaker
+    ) -> None:
+        mock_provider.payment_intents.cancel_async = AsyncMock(
+            side_effect=InvalidRequestError("Already succeeded", param=None, http_status=400)  # type: ignore
+        )
+
+        with pytest.raises(PaymentCancellationError):
+            await client.cancel_payment_intent(payment_id="pi_3MtwBwLkdIwHu7ix28a3tqPa")
+
+        assert circuit_breaker.state == CircuitState.CLOSED
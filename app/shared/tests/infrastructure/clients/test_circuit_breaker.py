@@ -0,0 +1,86 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from freezegun import freeze_time
+
+from app.shared.infrastructure.clients.circuit_breaker import CircuitBreaker, CircuitState
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures(self) -> None:
+        circuit_breaker = CircuitBreaker(failure_threshold=2, recovery_seconds=30.0)
+
+        circuit_breaker.record_failure()
+        assert circuit_breaker.allow() is True
+
+        circuit_breaker.record_failure()
+        assert circuit_breaker.state == CircuitState.OPEN
+        assert circuit_breaker.allow() is False
+
+    def test_success_resets_failures(self) -> None:
+        circuit_breaker = CircuitBreaker(failure_threshold=2, recovery_seconds=30.0)
+
+        circuit_breaker.record_failure()
+        circuit_breaker.record_success()
+        circuit_breaker.record_failure()
+
+        assert circuit_breaker.state == CircuitState.CLOSED
+
+    def test_half_opens_after_recovery(self) -> None:
+        with freeze_time("2025-01-01T10:00:00Z") as frozen_time:
+            circuit_breaker = CircuitBreaker(failure_threshold=1, recovery_seconds=30.0)
+            circuit_breaker.record_failure()
+
+            frozen_time.tick(30)
+
+            assert circuit_breaker.state == CircuitState.HALF_OPEN
+            assert circuit_breaker.allow() is True
+
+    def test_admits_a_single_probe_when_half_open(self) -> None:
+        with freeze_time("2025-01-01T10:00:00Z") as frozen_time:
+            circuit_breaker = CircuitBreaker(failure_threshold=1, recovery_seconds=30.0)
+            circuit_breaker.record_failure()
+            frozen_time.tick(30)
+            barrier = threading.Barrier(2)
+
+            def allow() -> bool:
+                barrier.wait()
+                return circuit_breaker.allow()
+
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                admitted = list(executor.map(lambda _: allow(), range(2)))
+
+            assert sorted(admitted) == [False, True]
+            assert circuit_breaker.allow() is False
+
+    def test_admits_a_new_probe_after_release(self) -> None:
+        with freeze_time("2025-01-01T10:00:00Z") as frozen_time:
+            circuit_breaker = CircuitBreaker(failure_threshold=1, recovery_seconds=30.0)
+            circuit_breaker.record_failure()
+            frozen_time.tick(30)
+
+            assert circuit_breaker.allow() is True
+            circuit_breaker.release()
+
+            assert circuit_breaker.allow() is True
+
+    def test_closes_when_half_open_call_succeeds(self) -> None:
+        with freeze_time("2025-01-01T10:00:00Z") as frozen_time:
+            circuit_breaker = CircuitBreaker(failure_threshold=1, recovery_seconds=30.0)
+            circuit_breaker.record_failure()
+
+            frozen_time.tick(30)
+            circuit_breaker.record_success()
+
+            assert circuit_breaker.state == CircuitState.CLOSED
+
+    def test_reopens_when_half_open_call_fails(self) -> None:
+        with freeze_time("2025-01-01T10:00:00Z") as frozen_time:
+            circuit_breaker = CircuitBreaker(failure_threshold=3, recovery_seconds=30.0)
+            for _ in range(3):
+                circuit_breaker.record_failure()
+
+            frozen_time.tick(30)
+            circuit_breaker.record_failure()
+
+            assert circuit_breaker.state == CircuitState.OPEN
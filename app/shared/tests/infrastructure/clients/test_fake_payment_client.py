@@ -0,0 +1,35 @@
+import pytest
+
+from app.shared.infrastructure.clients.fake_payment_client import FakePaymentClient
+
+
+class TestFakePaymentClient:
+    @pytest.mark.anyio
+    async def test_creates_unique_payment_intents(self) -> None:
+        client = FakePaymentClient(latency_seconds=0)
+
+        first = await client.create_payment_intent(amount=10.0, idempotency_key="first")
+        second = await client.create_payment_intent(amount=20.0, idempotency_key="second")
+
+        assert first.provider_payment_id != second.provider_payment_id
+        assert first.provider_payment_id.startswith("pi_fake_")
+        assert second.amount == 20.0
+        assert client.payment_intents_created == 2
+
+    @pytest.mark.anyio
+    async def test_returns_same_payment_intent_for_same_idempotency_key(self) -> None:
+        client = FakePaymentClient(latency_seconds=0)
+
+        first = await client.create_payment_intent(amount=10.0, idempotency_key="reservation")
+        second = await client.create_payment_intent(amount=10.0, idempotency_key="reservation")
+
+        assert first == second
+        assert client.payment_intents_created == 1
+
+    @pytest.mark.anyio
+    async def test_cancels_payment_intent(self) -> None:
+        client = FakePaymentClient(latency_seconds=0)
+
+        await client.cancel_payment_intent(payment_id="pi_fake_1")
+
+        assert client.payment_intents_cancelled == 1
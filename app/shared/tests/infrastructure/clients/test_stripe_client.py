@@ -6,7 +6,7 @@ from stripe import SignatureVerificationError, StripeError
 
 from app.payments.domain.exceptions import InvalidSignature
 from app.settings import Settings
-from app.shared.domain.exceptions import RefundError
+from app.shared.domain.exceptions import PaymentCancellationError, RefundError
 from app.shared.domain.payment_event import PaymentEvent
 from app.shared.domain.payment_intent import PaymentIntent
 from app.shared.infrastructure.clients.stripe_client import StripeClient
@@ -14,9 +14,8 @@ from app.shared.infrastructure.clients.stripe_client import StripeClient
 
 class TestStripeClient:
     @pytest.fixture
-    def mock_stripe(self) -> Generator[Mock, None, None]:
-        with patch("app.shared.infrastructure.clients.stripe_client.stripe", autospec=True) as mock:
-            yield mock
+    def mock_provider(self) -> Mock:
+        return Mock()
 
     @pytest.fixture(autouse=True)
     def override_settings(self) -> Generator[None, None, None]:
@@ -30,35 +29,41 @@ class TestStripeClient:
         ):
             yield
 
-    def test_creates_payment_intent(self, mock_stripe: Mock) -> None:
-        mock_stripe.PaymentIntent.create.return_value = Mock(client_secret="test_client_secret", id="test_payment_id")
+    def test_creates_payment_intent(self, mock_provider: Mock) -> None:
+        mock_provider.payment_intents.create.return_value = Mock(
+            client_secret="test_client_secret", id="test_payment_id"
+        )
 
-        payment_intent = StripeClient().create_payment_intent(amount=10.0)
+        payment_intent = StripeClient(provider=mock_provider).create_payment_intent(amount=10.0)
 
-        mock_stripe.PaymentIntent.create.assert_called_once_with(
-            amount=1000, currency="eur", automatic_payment_methods={"enabled": True}
+        mock_provider.payment_intents.create.assert_called_once_with(
+            params={"amount": 1000, "currency": "eur", "automatic_payment_methods": {"enabled": True}}
         )
 
         assert payment_intent == PaymentIntent(
             client_secret="test_client_secret", provider_payment_id="test_payment_id", amount=10.0
         )
 
-    def test_verifies_payment(self, mock_stripe: Mock) -> None:
-        mock_stripe.Webhook.construct_event.return_value = Mock(
-            type="payment_intent.succeeded", data=Mock(object={"id": "test_payment_id"})
+    def test_verifies_payment(self, mock_provider: Mock) -> None:
+        mock_provider.construct_event.return_value = Mock(
+            id="evt_test", type="payment_intent.succeeded", data=Mock(object={"id": "test_payment_id"})
         )
 
         payload = b'{"type": "payment_intent.succeeded"}'
         signature = "test_signature"
 
-        payment_event = StripeClient().verify_payment(payload=payload, signature=signature)
+        payment_event = StripeClient(provider=mock_provider).verify_payment(payload=payload, signature=signature)
 
-        mock_stripe.Webhook.construct_event.assert_called_once_with(payload, signature, "test_webhook_secret")
+        mock_provider.construct_event.assert_called_once_with(
+            payload=payload, sig_header=signature, secret="test_webhook_secret"
+        )
 
-        assert payment_event == PaymentEvent(type="payment_intent.succeeded", payment_intent_id="test_payment_id")
+        assert payment_event == PaymentEvent(
+            id="evt_test", type="payment_intent.succeeded", payment_intent_id="test_payment_id"
+        )
 
-    def test_raises_invalid_signature_when_payment_verification_fails(self, mock_stripe: Mock) -> None:
-        mock_stripe.Webhook.construct_event.side_effect = SignatureVerificationError(  # type: ignore
+    def test_raises_invalid_signature_when_payment_verification_fails(self, mock_provider: Mock) -> None:
+        mock_provider.construct_event.side_effect = SignatureVerificationError(  # type: ignore
             "Invalid signature", "test_sig_header"
         )
 
@@ -66,17 +71,30 @@ class TestStripeClient:
         signature = "invalid_signature"
 
         with pytest.raises(InvalidSignature):
-            StripeClient().verify_payment(payload=payload, signature=signature)
+            StripeClient(provider=mock_provider).verify_payment(payload=payload, signature=signature)
 
-        mock_stripe.Webhook.construct_event.assert_called_once_with(payload, signature, "test_webhook_secret")
+        mock_provider.construct_event.assert_called_once_with(
+            payload=payload, sig_header=signature, secret="test_webhook_secret"
+        )
 
-    def test_refunds_payment(self, mock_stripe: Mock) -> None:
-        StripeClient().refund_payment(payment_id="test_payment_id")
+    def test_refunds_payment(self, mock_provider: Mock) -> None:
+        StripeClient(provider=mock_provider).refund_payment(payment_id="test_payment_id")
 
-        mock_stripe.Refund.create.assert_called_once_with(payment_intent="test_payment_id")
+        mock_provider.refunds.create.assert_called_once_with(params={"payment_intent": "test_payment_id"})
 
-    def test_raise_refund_error_when_refund_fails(self, mock_stripe: Mock) -> None:
-        mock_stripe.Refund.create.side_effect = StripeError
+    def test_raise_refund_error_when_refund_fails(self, mock_provider: Mock) -> None:
+        mock_provider.refunds.create.side_effect = StripeError
 
         with pytest.raises(RefundError):
-            StripeClient().refund_payment(payment_id="test_payment_id")
+            StripeClient(provider=mock_provider).refund_payment(payment_id="test_payment_id")
+
+    def test_cancels_payment_intent(self, mock_provider: Mock) -> None:
+        StripeClient(provider=mock_provider).cancel_payment_intent(payment_id="test_payment_id")
+
+        mock_provider.payment_intents.cancel.assert_called_once_with("test_payment_id")
+
+    def test_raises_cancellation_error_when_cancel_fails(self, mock_provider: Mock) -> None:
+        mock_provider.payment_intents.cancel.side_effect = StripeError
+
+        with pytest.raises(PaymentCancellationError):
+            StripeClient(provider=mock_provider).cancel_payment_intent(payment_id="test_payment_id")
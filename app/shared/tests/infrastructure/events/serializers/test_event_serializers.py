@@ -0,0 +1,74 @@
+import json
+
+import msgpack
+import pytest
+from pika.spec import BasicProperties
+
+from app.reservations.domain.events import ReservationCancelled
+from app.shared.infrastructure.events.serializers.event_serializers import (
+    EventSerializers,
+    UnsupportedContentType,
+    UnsupportedSchemaVersion,
+)
+from app.shared.infrastructure.events.serializers.json_event_serializer import JsonEventSerializer
+from app.shared.infrastructure.events.serializers.msgpack_event_serializer import MsgpackEventSerializer
+
+
+class TestEventSerializers:
+    @pytest.fixture
+    def serializers(self) -> EventSerializers:
+        return EventSerializers(
+            serializers=[JsonEventSerializer(), MsgpackEventSerializer()], default_content_type="application/msgpack"
+        )
+
+    @pytest.fixture
+    def event(self) -> ReservationCancelled:
+        return ReservationCancelled(
+            reservation_id="a41707bd-ae9c-43b8-bba5-8c4844e73e77", provider_payment_id="pi_3MtwBwLkdIwHu7ix28a3tqPa"
+        )
+
+    def test_default_serializer(self, serializers: EventSerializers) -> None:
+        assert isinstance(serializers.default, MsgpackEventSerializer)
+
+    def test_deserializes_msgpack_messages(self, serializers: EventSerializers, event: ReservationCancelled) -> None:
+        body = msgpack.packb(event.to_dict())
+
+        deserialized = serializers.deserialize(
+            ReservationCancelled,
+            BasicProperties(content_type="application/msgpack", headers={"x-schema-version": 1}),
+            body,
+        )
+
+        assert deserialized == event
+
+    def test_deserializes_json_messages(self, serializers: EventSerializers, event: ReservationCancelled) -> None:
+        body = json.dumps(event.to_dict()).encode()
+
+        deserialized = serializers.deserialize(
+            ReservationCancelled, BasicProperties(content_type="application/json"), body
+        )
+
+        assert deserialized == event
+
+    def test_deserializes_legacy_messages_without_properties_as_json(
+        self, serializers: EventSerializers, event: ReservationCancelled
+    ) -> None:
+        body = json.dumps(event.to_dict()).encode()
+
+        assert serializers.deserialize(ReservationCancelled, BasicProperties(), body) == event
+
+    def test_raises_for_unknown_content_type(self, serializers: EventSerializers) -> None:
+        with pytest.raises(UnsupportedContentType):
+            serializers.deserialize(ReservationCancelled, BasicProperties(content_type="application/xml"), b"<event/>")
+
+    def test_raises_for_newer_schema_version(self, serializers: EventSerializers, event: ReservationCancelled) -> None:
+        with pytest.raises(UnsupportedSchemaVersion):
+            serializers.deserialize(
+                ReservationCancelled,
+                BasicProperties(content_type="application/msgpack", headers={"x-schema-version": 2}),
+                msgpack.packb(event.to_dict()),
+            )
+
+    def test_raises_for_unknown_default_content_type(self) -> None:
+        with pytest.raises(UnsupportedContentType):
+            EventSerializers(serializers=[JsonEventSerializer()], default_content_type="application/msgpack")
@@ -0,0 +1,26 @@
+from app.reservations.domain.events import ReservationCancelled
+from app.shared.infrastructure.events.serializers.json_event_serializer import JsonEventSerializer
+from app.shared.infrastructure.events.serializers.msgpack_event_serializer import MsgpackEventSerializer
+
+
+class TestMsgpackEventSerializer:
+    def test_round_trips_event(self) -> None:
+        serializer = MsgpackEventSerializer()
+        event = ReservationCancelled(
+            reservation_id="a41707bd-ae9c-43b8-bba5-8c4844e73e77", provider_payment_id="pi_3MtwBwLkdIwHu7ix28a3tqPa"
+        )
+
+        assert serializer.deserialize(ReservationCancelled, serializer.serialize(event)) == event
+
+    def test_round_trips_optional_fields(self) -> None:
+        serializer = MsgpackEventSerializer()
+        event = ReservationCancelled(reservation_id="a41707bd-ae9c-43b8-bba5-8c4844e73e77", provider_payment_id=None)
+
+        assert serializer.deserialize(ReservationCancelled, serializer.serialize(event)) == event
+
+    def test_is_smaller_than_json(self) -> None:
+        event = ReservationCancelled(
+            reservation_id="a41707bd-ae9c-43b8-bba5-8c4844e73e77", provider_payment_id="pi_3MtwBwLkdIwHu7ix28a3tqPa"
+        )
+
+        assert len(MsgpackEventSerializer().serialize(event)) < len(JsonEventSerializer().serialize(event))
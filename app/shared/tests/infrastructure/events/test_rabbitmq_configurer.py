@@ -0,0 +1,290 @@
+import json
+import threading
+from collections.abc import Generator
+from typing import Any
+from unittest.mock import Mock, call, create_autospec, patch
+
+import msgpack
+import pytest
+from pika import BlockingConnection
+from pika.adapters.blocking_connection import BlockingChannel
+from pika.spec import Basic, BasicProperties
+
+from app.reservations.domain.events import ReservationCancelled
+from app.shared.domain.events.batch_event_subscriber import BatchEventSubscriber
+from app.shared.domain.events.event_subscriber import EventSubscriber
+from app.shared.infrastructure.events.rabbitmq_configurer import RabbitMQConfigurer
+
+handled_events: list[ReservationCancelled] = []
+handled_batches: list[list[ReservationCancelled]] = []
+barrier: threading.Barrier | None = None
+
+
+class RecordingSubscriber(EventSubscriber[ReservationCancelled]):
+    action: str = "record"
+
+    def on(self, event: ReservationCancelled) -> None:
+        if barrier is not None:
+            barrier.wait(timeout=5)
+        if event.provider_payment_id == "pi_failing":
+            raise Exception("Stripe unavailable")
+        handled_events.append(event)
+
+
+class RecordingBatchSubscriber(BatchEventSubscriber[ReservationCancelled]):
+    action: str = "record_batch"
+    batch_size: int = 2
+    batch_timeout_seconds: float = 0.5
+
+    def on_batch(self, events: list[ReservationCancelled]) -> list[ReservationCancelled]:
+        handled_batches.append(events)
+        return [event for event in events if event.provider_payment_id == "pi_failing"]
+
+
+class TestRabbitMQConfigurer:
+    @pytest.fixture(autouse=True)
+    def reset_subscriber(self) -> Generator[None, None, None]:
+        global barrier
+        yield
+        handled_events.clear()
+        handled_batches.clear()
+        barrier = None
+
+    @pytest.fixture
+    def mock_channel(self) -> Any:
+        mock_channel = create_autospec(BlockingChannel, instance=True)
+        mock_channel.is_closed = False
+        return mock_channel
+
+    @pytest.fixture
+    def mock_connection(self, mock_channel: Mock) -> Generator[Mock, None, None]:
+        with patch("app.shared.infrastructure.events.rabbitmq_configurer.BlockingConnection") as mock:
+            mock_connection = create_autospec(BlockingConnection, instance=True)
+            mock_connection.is_closed = False
+            mock_connection.is_open = True
+            mock_connection.channel.return_value = mock_channel
+            mock_connection.add_callback_threadsafe.side_effect = lambda callback: callback()
+            mock.return_value = mock_connection
+            yield mock_connection
+
+    def on_message(self, mock_channel: Mock) -> Any:
+        return mock_channel.basic_consume.call_args.kwargs["on_message_callback"]
+
+    def deliver(
+        self, mock_channel: Mock, delivery_tag: int, provider_payment_id: str, headers: dict[str, Any] | None = None
+    ) -> None:
+        body = json.dumps(
+            {"reservation_id": "5661455d-de5a-47ba-b99f-f6d50fdfc00b", "provider_payment_id": provider_payment_id}
+        )
+        self.on_message(mock_channel)(
+            mock_channel,
+            Basic.Deliver(delivery_tag=delivery_tag),
+            BasicProperties(timestamp=1700000000, headers=headers),
+            body.encode(),
+        )
+
+    def test_consumes_with_prefetch_and_manual_acks(self, mock_connection: Mock, mock_channel: Mock) -> None:
+        configurer = RabbitMQConfigurer(concurrency=2, prefetch_count=10)
+
+        configurer.add_subscriber(RecordingSubscriber)
+
+        mock_channel.basic_qos.assert_called_once_with(prefetch_count=10)
+        mock_channel.queue_bind.assert_called_once_with(
+            exchange="domain_events", queue="reservation.cancelled.record", routing_key="reservation.cancelled"
+        )
+        assert mock_channel.basic_consume.call_args.kwargs["queue"] == "reservation.cancelled.record"
+        assert mock_channel.basic_consume.call_args.kwargs["auto_ack"] is False
+
+    def test_declares_retry_and_dead_letter_queues(self, mock_connection: Mock, mock_channel: Mock) -> None:
+        configurer = RabbitMQConfigurer(max_attempts=3, retry_base_delay_seconds=10)
+
+        configurer.add_subscriber(RecordingSubscriber)
+
+        assert mock_channel.queue_declare.call_args_list == [
+            call(queue="reservation.cancelled.record", durable=True),
+            call(
+                queue="reservation.cancelled.record.retry.1",
+                durable=True,
+                arguments={
+                    "x-message-ttl": 10000,
+                    "x-dead-letter-exchange": "",
+                    "x-dead-letter-routing-key": "reservation.cancelled.record",
+                },
+            ),
+            call(
+                queue="reservation.cancelled.record.retry.2",
+                durable=True,
+                arguments={
+                    "x-message-ttl": 20000,
+                    "x-dead-letter-exchange": "",
+                    "x-dead-letter-routing-key": "reservation.cancelled.record",
+                },
+            ),
+            call(queue="reservation.cancelled.record.dead", durable=True),
+        ]
+
+    def test_acks_message_after_it_is_handled(self, mock_connection: Mock, mock_channel: Mock) -> None:
+        configurer = RabbitMQConfigurer(concurrency=2, prefetch_count=10)
+        configurer.add_subscriber(RecordingSubscriber)
+
+        self.deliver(mock_channel, delivery_tag=7, provider_payment_id="pi_1")
+        configurer.stop()
+
+        assert handled_events == [
+            ReservationCancelled(reservation_id="5661455d-de5a-47ba-b99f-f6d50fdfc00b", provider_payment_id="pi_1")
+        ]
+        mock_channel.basic_ack.assert_called_once_with(delivery_tag=7)
+        stats = configurer.metrics()["reservation.cancelled.record"]
+        assert stats.handled == 1
+        assert stats.failed == 0
+        assert stats.in_flight == 0
+
+    def test_decodes_msgpack_messages(self, mock_connection: Mock, mock_channel: Mock) -> None:
+        configurer = RabbitMQConfigurer(concurrency=2, prefetch_count=10)
+        configurer.add_subscriber(RecordingSubscriber)
+
+        self.on_message(mock_channel)(
+            mock_channel,
+            Basic.Deliver(delivery_tag=7),
+            BasicProperties(content_type="application/msgpack", timestamp=1700000000, headers={"x-schema-version": 1}),
+            msgpack.packb({"reservation_id": "5661455d-de5a-47ba-b99f-f6d50fdfc00b", "provider_payment_id": "pi_1"}),
+        )
+        configurer.stop()
+
+        assert handled_events == [
+            ReservationCancelled(reservation_id="5661455d-de5a-47ba-b99f-f6d50fdfc00b", provider_payment_id="pi_1")
+        ]
+        mock_channel.basic_ack.assert_called_once_with(delivery_tag=7)
+
+    def test_schedules_retry_when_handling_fails(self, mock_connection: Mock, mock_channel: Mock) -> None:
+        configurer = RabbitMQConfigurer(concurrency=2, prefetch_count=10, max_attempts=3)
+        configurer.add_subscriber(RecordingSubscriber)
+
+        self.deliver(mock_channel, delivery_tag=7, provider_payment_id="pi_failing", headers={"x-attempts": 1})
+        configurer.stop()
+
+        publish = mock_channel.basic_publish.call_args.kwargs
+        assert publish["exchange"] == ""
+        assert publish["routing_key"] == "reservation.cancelled.record.retry.2"
+        assert publish["properties"].timestamp == 1700000000
+        assert publish["properties"].headers == {"x-attempts": 2, "x-error": "Exception('Stripe unavailable')"}
+        mock_channel.basic_ack.assert_called_once_with(delivery_tag=7)
+        mock_channel.basic_nack.assert_not_called()
+        assert configurer.metrics()["reservation.cancelled.record"].failed == 1
+
+    def test_dead_letters_message_after_max_attempts(self, mock_connection: Mock, mock_channel: Mock) -> None:
+        configurer = RabbitMQConfigurer(concurrency=2, prefetch_count=10, max_attempts=3)
+        configurer.add_subscriber(RecordingSubscriber)
+
+        self.deliver(mock_channel, delivery_tag=7, provider_payment_id="pi_failing", headers={"x-attempts": 2})
+        configurer.stop()
+
+        publish = mock_channel.basic_publish.call_args.kwargs
+        assert publish["routing_key"] == "reservation.cancelled.record.dead"
+        assert publish["properties"].headers["x-attempts"] == 3
+        mock_channel.basic_ack.assert_called_once_with(delivery_tag=7)
+
+    def test_replays_dead_letters(self, mock_connection: Mock, mock_channel: Mock) -> None:
+        mock_channel.basic_get.side_effect = [
+            (
+                Basic.GetOk(delivery_tag=1),
+                BasicProperties(timestamp=1700000000, headers={"x-attempts": 5, "x-error": "RefundError()"}),
+                b"first",
+            ),
+            (
+                Basic.GetOk(delivery_tag=2),
+                BasicProperties(timestamp=1700000000, headers={"x-attempts": 5}),
+                b"second",
+            ),
+            (None, None, None),
+        ]
+        configurer = RabbitMQConfigurer()
+
+        replayed = configurer.replay_dead_letters(RecordingSubscriber)
+
+        assert replayed == 2
+        mock_channel.basic_get.assert_called_with(queue="reservation.cancelled.record.dead", auto_ack=False)
+        assert [publish.kwargs["routing_key"] for publish in mock_channel.basic_publish.call_args_list] == [
+            "reservation.cancelled.record",
+            "reservation.cancelled.record",
+        ]
+        assert mock_channel.basic_publish.call_args_list[0].kwargs["body"] == b"first"
+        assert mock_channel.basic_publish.call_args_list[0].kwargs["properties"].headers == {}
+        assert mock_channel.basic_ack.call_args_list == [call(delivery_tag=1), call(delivery_tag=2)]
+
+    def test_replays_dead_letters_up_to_limit(self, mock_connection: Mock, mock_channel: Mock) -> None:
+        mock_channel.basic_get.return_value = (Basic.GetOk(delivery_tag=1), BasicProperties(), b"body")
+        configurer = RabbitMQConfigurer()
+
+        replayed = configurer.replay_dead_letters(RecordingSubscriber, limit=3)
+
+        assert replayed == 3
+        assert mock_channel.basic_publish.call_count == 3
+
+    def test_handles_messages_concurrently(self, mock_connection: Mock, mock_channel: Mock) -> None:
+        global barrier
+        barrier = threading.Barrier(3)
+        configurer = RabbitMQConfigurer(concurrency=3, prefetch_count=10)
+        configurer.add_subscriber(RecordingSubscriber)
+
+        for delivery_tag in range(1, 4):
+            self.deliver(mock_channel, delivery_tag=delivery_tag, provider_payment_id=f"pi_{delivery_tag}")
+        configurer.stop()
+
+        assert len(handled_events) == 3
+        assert mock_channel.basic_ack.call_count == 3
+
+    def test_raises_prefetch_to_batch_size_for_batch_subscribers(
+        self, mock_connection: Mock, mock_channel: Mock
+    ) -> None:
+        configurer = RabbitMQConfigurer(prefetch_count=1)
+
+        configurer.add_subscriber(RecordingBatchSubscriber)
+
+        assert mock_channel.basic_qos.call_args_list == [
+            call(prefetch_count=1),
+            call(prefetch_count=2),
+            call(prefetch_count=1),
+        ]
+
+    def test_handles_full_batch_at_once(self, mock_connection: Mock, mock_channel: Mock) -> None:
+        configurer = RabbitMQConfigurer(concurrency=2, prefetch_count=10, max_attempts=3)
+        configurer.add_subscriber(RecordingBatchSubscriber)
+
+        self.deliver(mock_channel, delivery_tag=1, provider_payment_id="pi_1")
+        self.deliver(mock_channel, delivery_tag=2, provider_payment_id="pi_failing")
+        configurer.stop()
+
+        assert handled_batches == [
+            [
+                ReservationCancelled(reservation_id="5661455d-de5a-47ba-b99f-f6d50fdfc00b", provider_payment_id="pi_1"),
+                ReservationCancelled(
+                    reservation_id="5661455d-de5a-47ba-b99f-f6d50fdfc00b", provider_payment_id="pi_failing"
+                ),
+            ]
+        ]
+        assert mock_channel.basic_ack.call_args_list == [call(delivery_tag=1), call(delivery_tag=2)]
+        assert (
+            mock_channel.basic_publish.call_args.kwargs["routing_key"] == "reservation.cancelled.record_batch.retry.1"
+        )
+        mock_connection.remove_timeout.assert_called_once_with(mock_connection.call_later.return_value)
+        stats = configurer.metrics()["reservation.cancelled.record_batch"]
+        assert stats.handled == 1
+        assert stats.failed == 1
+        assert stats.in_flight == 0
+
+    def test_handles_partial_batch_when_timer_fires(self, mock_connection: Mock, mock_channel: Mock) -> None:
+        configurer = RabbitMQConfigurer(concurrency=2, prefetch_count=10)
+        configurer.add_subscriber(RecordingBatchSubscriber)
+
+        self.deliver(mock_channel, delivery_tag=1, provider_payment_id="pi_1")
+
+        assert handled_batches == []
+        delay, flush = mock_connection.call_later.call_args.args
+        assert delay == 0.5
+
+        flush()
+        configurer.stop()
+
+        assert len(handled_batches) == 1
+        mock_channel.basic_ack.assert_called_once_with(delivery_tag=1)
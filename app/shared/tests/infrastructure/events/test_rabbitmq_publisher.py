@@ -0,0 +1,121 @@
+from typing import Any
+from unittest.mock import ANY, create_autospec
+
+import pytest
+from freezegun import freeze_time
+from pika import BlockingConnection
+from pika.adapters.blocking_connection import BlockingChannel
+from pika.exceptions import NackError, StreamLostError
+from pika.exchange_type import ExchangeType
+
+from app.shared.infrastructure.events.rabbitmq_publisher import PublisherPoolExhausted, RabbitMQPublisher
+
+
+class TestRabbitMQPublisher:
+    @pytest.fixture
+    def connections(self) -> list[Any]:
+        return []
+
+    @pytest.fixture
+    def publisher(self, connections: list[Any]) -> RabbitMQPublisher:
+        def connect() -> Any:
+            mock_connection = create_autospec(BlockingConnection, instance=True)
+            mock_connection.is_open = True
+            mock_connection.channel.return_value = create_autospec(BlockingChannel, instance=True)
+            mock_connection.channel.return_value.is_open = True
+            connections.append(mock_connection)
+            return mock_connection
+
+        return RabbitMQPublisher(connect=connect, exchange_name="domain_events", pool_size=1, timeout=0.01)
+
+    @freeze_time("2025-01-10T00:00:00Z")
+    def test_publishes_with_confirms_over_a_declared_exchange(
+        self, publisher: RabbitMQPublisher, connections: list[Any]
+    ) -> None:
+        publisher.publish(routing_key="reservation.cancelled", body=b'{"reservation_id": "1"}')
+
+        mock_channel = connections[0].channel.return_value
+        mock_channel.confirm_delivery.assert_called_once_with()
+        mock_channel.exchange_declare.assert_called_once_with(
+            exchange="domain_events", exchange_type=ExchangeType.topic, durable=True
+        )
+        mock_channel.basic_publish.assert_called_once_with(
+            exchange="domain_events",
+            routing_key="reservation.cancelled",
+            body=b'{"reservation_id": "1"}',
+            properties=ANY,
+        )
+        properties = mock_channel.basic_publish.call_args.kwargs["properties"]
+        assert properties.content_type == "application/json"
+        assert properties.delivery_mode == 2
+        assert properties.timestamp == 1736467200
+
+    def test_publishes_with_content_type_and_headers(
+        self, publisher: RabbitMQPublisher, connections: list[Any]
+    ) -> None:
+        publisher.publish(
+            routing_key="reservation.cancelled",
+            body=b"\x82",
+            content_type="application/msgpack",
+            headers={"x-schema-version": 1},
+        )
+
+        properties = connections[0].channel.return_value.basic_publish.call_args.kwargs["properties"]
+        assert properties.content_type == "application/msgpack"
+        assert properties.headers == {"x-schema-version": 1}
+
+    def test_reuses_the_pooled_channel(self, publisher: RabbitMQPublisher, connections: list[Any]) -> None:
+        publisher.publish(routing_key="reservation.cancelled", body=b"{}")
+        publisher.publish(routing_key="reservation.cancelled", body=b"{}")
+
+        assert len(connections) == 1
+        assert publisher.connections_opened == 1
+        assert connections[0].channel.return_value.basic_publish.call_count == 2
+
+    def test_reconnects_when_connection_was_lost(self, publisher: RabbitMQPublisher, connections: list[Any]) -> None:
+        publisher.publish(routing_key="reservation.cancelled", body=b"{}")
+        connections[0].channel.return_value.basic_publish.side_effect = StreamLostError()
+
+        publisher.publish(routing_key="reservation.cancelled", body=b"{}")
+
+        assert len(connections) == 2
+        connections[0].close.assert_called_once_with()
+        connections[1].channel.return_value.basic_publish.assert_called_once()
+
+    def test_replaces_closed_idle_channels(self, publisher: RabbitMQPublisher, connections: list[Any]) -> None:
+        publisher.publish(routing_key="reservation.cancelled", body=b"{}")
+        connections[0].is_open = False
+
+        publisher.publish(routing_key="reservation.cancelled", body=b"{}")
+
+        assert len(connections) == 2
+        connections[0].channel.return_value.basic_publish.assert_called_once()
+
+    def test_raises_when_broker_nacks_and_keeps_channel(
+        self, publisher: RabbitMQPublisher, connections: list[Any]
+    ) -> None:
+        publisher.publish(routing_key="reservation.cancelled", body=b"{}")
+        connections[0].channel.return_value.basic_publish.side_effect = NackError(messages=[])
+
+        with pytest.raises(NackError):
+            publisher.publish(routing_key="reservation.cancelled", body=b"{}")
+
+        connections[0].channel.return_value.basic_publish.side_effect = None
+        publisher.publish(routing_key="reservation.cancelled", body=b"{}")
+        assert len(connections) == 1
+
+    def test_raises_when_pool_is_exhausted(self, publisher: RabbitMQPublisher, connections: list[Any]) -> None:
+        publisher.publish(routing_key="reservation.cancelled", body=b"{}")
+        connections[0].channel.return_value.basic_publish.side_effect = lambda **_: publisher.publish(
+            routing_key="reservation.cancelled", body=b"{}"
+        )
+
+        with pytest.raises(PublisherPoolExhausted):
+            publisher.publish(routing_key="reservation.cancelled", body=b"{}")
+
+    def test_close_closes_idle_connections(self, publisher: RabbitMQPublisher, connections: list[Any]) -> None:
+        publisher.publish(routing_key="reservation.cancelled", body=b"{}")
+
+        publisher.close()
+
+        connections[0].close.assert_called_once_with()
@@ -0,0 +1,38 @@
+from datetime import datetime, timezone
+
+from freezegun import freeze_time
+
+from app.shared.infrastructure.events.subscriber_metrics import SubscriberMetrics
+
+
+class TestSubscriberMetrics:
+    def test_records_lag_from_publish_timestamp(self) -> None:
+        with freeze_time("2025-01-10T00:00:30Z"):
+            metrics = SubscriberMetrics()
+            metrics.record_received(published_at=datetime(2025, 1, 10, 0, 0, 0, tzinfo=timezone.utc).timestamp())
+            metrics.record_received(published_at=datetime(2025, 1, 10, 0, 0, 20, tzinfo=timezone.utc).timestamp())
+
+            stats = metrics.snapshot()
+
+        assert stats.in_flight == 2
+        assert stats.lag_seconds_last == 10
+        assert stats.lag_seconds_max == 30
+
+    def test_records_handling_time_and_throughput(self) -> None:
+        with freeze_time("2025-01-10T00:00:00Z") as frozen_datetime:
+            metrics = SubscriberMetrics()
+            for seconds in (0.2, 0.4):
+                metrics.record_received(published_at=None)
+                metrics.record_handled(seconds=seconds)
+            metrics.record_received(published_at=None)
+            metrics.record_handled(seconds=1.0, failed=True)
+            frozen_datetime.tick(4)
+
+            stats = metrics.snapshot()
+
+        assert stats.handled == 2
+        assert stats.failed == 1
+        assert stats.in_flight == 0
+        assert round(stats.handle_seconds_avg, 3) == 0.3
+        assert stats.handle_seconds_max == 0.4
+        assert stats.throughput_per_second == 0.5
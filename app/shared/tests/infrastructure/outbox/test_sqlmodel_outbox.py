@@ -0,0 +1,112 @@
+from datetime import datetime
+from typing import Any
+from unittest.mock import Mock, call, create_autospec
+
+import pytest
+from freezegun import freeze_time
+from sqlmodel import Session, select
+
+from app.reservations.domain.events import ReservationCancelled, ReservationExpired
+from app.shared.domain.events.event import Event
+from app.shared.domain.events.event_bus import EventBus
+from app.shared.infrastructure.outbox.models import OutboxEventModel
+from app.shared.infrastructure.outbox.sqlmodel_outbox import SqlModelOutbox
+
+EVENT_CLASSES: dict[str, type[Event]] = {ReservationCancelled.topic(): ReservationCancelled}
+
+
+class TestSqlModelOutbox:
+    @pytest.fixture
+    def mock_event_bus(self) -> Any:
+        return create_autospec(spec=EventBus, instance=True, spec_set=True)
+
+    def add_events(self, session: Session, *events: Event) -> None:
+        for index, event in enumerate(events):
+            with freeze_time(datetime(2025, 1, 10, 0, 0, index)):
+                SqlModelOutbox(session).add(events=[event])
+        session.commit()
+
+    @freeze_time("2025-01-10T00:30:00Z")
+    def test_add_stores_events_without_committing(self, session: Session) -> None:
+        SqlModelOutbox(session).add(
+            events=[
+                ReservationCancelled(reservation_id="5661455d-de5a-47ba-b99f-f6d50fdfc00b", provider_payment_id=None)
+            ]
+        )
+        outbox_event_model = session.exec(select(OutboxEventModel)).one()
+
+        assert outbox_event_model.topic == "reservation.cancelled"
+        assert outbox_event_model.payload == (
+            '{"reservation_id": "5661455d-de5a-47ba-b99f-f6d50fdfc00b", "provider_payment_id": null}'
+        )
+        assert outbox_event_model.created_at == datetime(2025, 1, 10, 0, 30, 0)
+
+        session.rollback()
+        assert session.exec(select(OutboxEventModel)).all() == []
+
+    def test_relay_publishes_oldest_events_first_and_deletes_them(self, session: Session, mock_event_bus: Mock) -> None:
+        self.add_events(
+            session,
+            ReservationCancelled(reservation_id="first", provider_payment_id="pi_1"),
+            ReservationCancelled(reservation_id="second", provider_payment_id="pi_2"),
+            ReservationCancelled(reservation_id="third", provider_payment_id="pi_3"),
+        )
+
+        relayed = SqlModelOutbox(session).relay(event_bus=mock_event_bus, event_classes=EVENT_CLASSES, limit=2)
+
+        assert relayed == 2
+        assert mock_event_bus.publish.call_args_list == [
+            call(events=[ReservationCancelled(reservation_id="first", provider_payment_id="pi_1")]),
+            call(events=[ReservationCancelled(reservation_id="second", provider_payment_id="pi_2")]),
+        ]
+        assert session.exec(select(OutboxEventModel.topic)).all() == ["reservation.cancelled"]
+
+    def test_relay_keeps_events_that_could_not_be_published(self, session: Session, mock_event_bus: Mock) -> None:
+        self.add_events(
+            session,
+            ReservationCancelled(reservation_id="first", provider_payment_id="pi_1"),
+            ReservationCancelled(reservation_id="second", provider_payment_id="pi_2"),
+        )
+        mock_event_bus.publish.side_effect = [None, Exception("broker unavailable")]
+
+        with pytest.raises(Exception, match="broker unavailable"):
+            SqlModelOutbox(session).relay(event_bus=mock_event_bus, event_classes=EVENT_CLASSES, limit=10)
+
+        outbox_event_model = session.exec(select(OutboxEventModel)).one()
+        assert outbox_event_model.to_domain(EVENT_CLASSES) == ReservationCancelled(
+            reservation_id="second", provider_payment_id="pi_2"
+        )
+
+    @freeze_time("2025-01-10T00:30:00Z")
+    def test_relay_dead_letters_events_that_cannot_be_decoded(self, session: Session, mock_event_bus: Mock) -> None:
+        self.add_events(
+            session,
+            ReservationCancelled(reservation_id="first", provider_payment_id="pi_1"),
+            ReservationExpired(reservation_id="second", provider_payment_id="pi_2"),
+            ReservationCancelled(reservation_id="third", provider_payment_id="pi_3"),
+        )
+
+        relayed = SqlModelOutbox(session).relay(event_bus=mock_event_bus, event_classes=EVENT_CLASSES, limit=10)
+
+        assert relayed == 2
+        assert mock_event_bus.publish.call_args_list == [
+            call(events=[ReservationCancelled(reservation_id="first", provider_payment_id="pi_1")]),
+            call(events=[ReservationCancelled(reservation_id="third", provider_payment_id="pi_3")]),
+        ]
+        outbox_event_model = session.exec(select(OutboxEventModel)).one()
+        assert outbox_event_model.topic == "reservation.expired"
+        assert outbox_event_model.failed_at == datetime(2025, 1, 10, 0, 30, 0)
+        assert outbox_event_model.error == "KeyError('reservation.expired')"
+
+    def test_relay_skips_dead_lettered_events(self, session: Session, mock_event_bus: Mock) -> None:
+        self.add_events(session, ReservationExpired(reservation_id="first", provider_payment_id="pi_1"))
+        SqlModelOutbox(session).relay(event_bus=mock_event_bus, event_classes=EVENT_CLASSES, limit=10)
+
+        relayed = SqlModelOutbox(session).relay(
+            event_bus=mock_event_bus,
+            event_classes={**EVENT_CLASSES, ReservationExpired.topic(): ReservationExpired},
+            limit=10,
+        )
+
+        assert relayed == 0
+        mock_event_bus.publish.assert_not_called()
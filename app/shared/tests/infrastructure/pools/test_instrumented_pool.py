@@ -0,0 +1,68 @@
+from pathlib import Path
+
+import pytest
+from sqlalchemy import Engine, create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.shared.infrastructure.pools.instrumented_pool import InstrumentedQueuePool, instrument_pool
+from app.shared.infrastructure.pools.pool_metrics import PoolMetrics
+
+
+class TestInstrumentedQueuePool:
+    @pytest.fixture
+    def engine(self, tmp_path: Path) -> Engine:
+        return create_engine(
+            f"sqlite:///{tmp_path / 'pool.db'}",
+            poolclass=InstrumentedQueuePool,
+            pool_size=1,
+            max_overflow=1,
+            pool_timeout=0.01,
+        )
+
+    @pytest.fixture
+    def metrics(self, engine: Engine) -> PoolMetrics:
+        metrics = PoolMetrics()
+        instrument_pool(engine.pool, metrics)
+        return metrics
+
+    def test_records_checkouts_and_checked_out_connections(self, engine: Engine, metrics: PoolMetrics) -> None:
+        with engine.connect() as connection, engine.connect():
+            connection.execute(text("SELECT 1"))
+
+            stats = metrics.snapshot()
+            assert stats.size == 1
+            assert stats.checked_out == 2
+            assert stats.overflow == 1
+
+        stats = metrics.snapshot()
+        assert stats.checked_out == 0
+        assert stats.checkouts == 2
+        assert stats.connections_opened == 2
+        assert stats.wait_seconds_max >= 0
+
+    def test_records_timeouts_when_pool_is_exhausted(self, engine: Engine, metrics: PoolMetrics) -> None:
+        with engine.connect(), engine.connect():
+            with pytest.raises(PoolTimeoutError):
+                engine.connect()
+
+        stats = metrics.snapshot()
+        assert stats.checkouts == 2
+        assert stats.timeouts == 1
+        assert stats.wait_seconds_max >= 0.01
+
+    def test_records_connection_lifetime_and_keeps_metrics_after_dispose(
+        self, engine: Engine, metrics: PoolMetrics
+    ) -> None:
+        with engine.connect():
+            pass
+
+        engine.dispose()
+
+        with engine.connect():
+            pass
+
+        stats = metrics.snapshot()
+        assert stats.checkouts == 2
+        assert stats.connections_opened == 2
+        assert stats.connections_closed == 1
+        assert stats.connection_lifetime_seconds_max > 0
@@ -0,0 +1,27 @@
+import logging
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+
+from app.shared.infrastructure.pools.instrumented_pool import InstrumentedQueuePool, instrument_pool
+from app.shared.infrastructure.pools.pool_metrics import PoolMetrics, log_pool_metrics
+
+
+class TestLogPoolMetrics:
+    def test_logs_checkout_wait_and_saturation_per_pool(self, tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+        caplog.set_level(logging.INFO)
+        engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", poolclass=InstrumentedQueuePool, pool_size=2)
+        metrics = PoolMetrics()
+        instrument_pool(engine.pool, metrics)
+
+        with engine.connect():
+            log_pool_metrics({"primary": metrics, "replica_0": PoolMetrics()})
+
+        assert [record.getMessage() for record in caplog.records] == [
+            "Database pool primary checked_out=1/2 overflow=0 saturation=0.50 checkouts=1 timeouts=0 "
+            f"wait_avg={metrics.snapshot().wait_seconds_avg:.4f}s wait_max={metrics.snapshot().wait_seconds_max:.4f}s "
+            "opened=1 closed=0",
+            "Database pool replica_0 checked_out=0/0 overflow=0 saturation=0.00 checkouts=0 timeouts=0 "
+            "wait_avg=0.0000s wait_max=0.0000s opened=0 closed=0",
+        ]
@@ -0,0 +1,31 @@
+from uuid import UUID
+
+from freezegun import freeze_time
+
+from app.shared.infrastructure.replicas.recent_writers import RecentWriters
+
+
+class TestRecentWriters:
+    def test_user_wrote_recently_within_window(self) -> None:
+        recent_writers = RecentWriters(window_seconds=5)
+
+        recent_writers.record(UUID("913822a0-750b-4cb6-b7b9-e01869d7d62d"))
+
+        assert recent_writers.wrote_recently(UUID("913822a0-750b-4cb6-b7b9-e01869d7d62d")) is True
+        assert recent_writers.wrote_recently(UUID("ec725625-f502-4d39-9401-a415d8c1f964")) is False
+
+    def test_user_did_not_write_recently_after_window(self) -> None:
+        recent_writers = RecentWriters(window_seconds=5)
+
+        with freeze_time("2025-01-10T12:00:00Z") as frozen_datetime:
+            recent_writers.record(UUID("913822a0-750b-4cb6-b7b9-e01869d7d62d"))
+            frozen_datetime.tick(5)
+
+            assert recent_writers.wrote_recently(UUID("913822a0-750b-4cb6-b7b9-e01869d7d62d")) is False
+
+    def test_does_not_record_writes_when_window_is_disabled(self) -> None:
+        recent_writers = RecentWriters(window_seconds=0)
+
+        recent_writers.record(UUID("913822a0-750b-4cb6-b7b9-e01869d7d62d"))
+
+        assert recent_writers.wrote_recently(UUID("913822a0-750b-4cb6-b7b9-e01869d7d62d")) is False
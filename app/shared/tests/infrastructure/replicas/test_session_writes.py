@@ -0,0 +1,23 @@
+from sqlmodel import Session, select, update
+
+from app.shared.infrastructure.replicas.session_writes import has_writes
+from app.shared.tests.domain.mothers.user_mother import UserMother
+from app.users.infrastructure.models import UserModel
+
+
+class TestSessionWrites:
+    def test_session_without_writes(self, session: Session) -> None:
+        session.exec(select(UserModel)).all()
+
+        assert has_writes(session) is False
+
+    def test_session_with_flushed_writes(self, session: Session) -> None:
+        session.add(UserModel.from_domain(UserMother().create()))
+        session.flush()
+
+        assert has_writes(session) is True
+
+    def test_session_with_executed_writes(self, session: Session) -> None:
+        session.exec(update(UserModel).values(is_active=False))  # type: ignore
+
+        assert has_writes(session) is True
@@ -0,0 +1,103 @@
+import threading
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+from app.shared.domain.value_objects.date_time import DateTime
+from app.shared.domain.value_objects.id import Id
+from app.shared.infrastructure.schedulers.heap_expiry_scheduler import HeapExpiryScheduler
+
+
+class TestHeapExpiryScheduler:
+    def test_pops_only_expired_entries_in_expiry_order(self) -> None:
+        scheduler = HeapExpiryScheduler(on_expire=Mock())
+        scheduler.schedule(
+            Id("b6439a2d-c0c0-45c8-81b7-7d7b155830ba"), DateTime.from_datetime(datetime(2025, 1, 10, 0, 2))
+        )
+        scheduler.schedule(
+            Id("f48c4dae-b0e2-43f6-a659-599f5e254270"), DateTime.from_datetime(datetime(2025, 1, 10, 0, 1))
+        )
+        scheduler.schedule(
+            Id("ec725625-f502-4d39-9401-a415d8c1f964"), DateTime.from_datetime(datetime(2025, 1, 10, 0, 3))
+        )
+
+        expired = scheduler.pop_expired(now=datetime(2025, 1, 10, 0, 2, tzinfo=timezone.utc).timestamp())
+
+        assert expired == [Id("f48c4dae-b0e2-43f6-a659-599f5e254270"), Id("b6439a2d-c0c0-45c8-81b7-7d7b155830ba")]
+        assert scheduler.pending() == 1
+
+    def test_does_not_pop_discarded_entries(self) -> None:
+        scheduler = HeapExpiryScheduler(on_expire=Mock())
+        scheduler.schedule(
+            Id("b6439a2d-c0c0-45c8-81b7-7d7b155830ba"), DateTime.from_datetime(datetime(2025, 1, 10, 0, 1))
+        )
+
+        scheduler.discard(Id("b6439a2d-c0c0-45c8-81b7-7d7b155830ba"))
+
+        assert scheduler.pop_expired(now=datetime(2025, 1, 10, 0, 2, tzinfo=timezone.utc).timestamp()) == []
+        assert scheduler.pending() == 0
+
+    def test_rescheduling_replaces_previous_expiry(self) -> None:
+        scheduler = HeapExpiryScheduler(on_expire=Mock())
+        scheduler.schedule(
+            Id("b6439a2d-c0c0-45c8-81b7-7d7b155830ba"), DateTime.from_datetime(datetime(2025, 1, 10, 0, 1))
+        )
+        scheduler.schedule(
+            Id("b6439a2d-c0c0-45c8-81b7-7d7b155830ba"), DateTime.from_datetime(datetime(2025, 1, 10, 0, 5))
+        )
+
+        assert scheduler.pop_expired(now=datetime(2025, 1, 10, 0, 2, tzinfo=timezone.utc).timestamp()) == []
+        assert scheduler.pop_expired(now=datetime(2025, 1, 10, 0, 5, tzinfo=timezone.utc).timestamp()) == [
+            Id("b6439a2d-c0c0-45c8-81b7-7d7b155830ba")
+        ]
+
+    def test_wakes_up_when_next_entry_expires(self) -> None:
+        expired_ids: list[Id] = []
+        expired = threading.Event()
+
+        def on_expire(ids: list[Id]) -> None:
+            expired_ids.extend(ids)
+            expired.set()
+
+        scheduler = HeapExpiryScheduler(on_expire=on_expire)
+        scheduler.start()
+        try:
+            scheduler.schedule(
+                Id("ec725625-f502-4d39-9401-a415d8c1f964"),
+                DateTime.from_datetime(datetime.now(timezone.utc) + timedelta(hours=1)),
+            )
+            scheduler.schedule(
+                Id("b6439a2d-c0c0-45c8-81b7-7d7b155830ba"),
+                DateTime.from_datetime(datetime.now(timezone.utc) + timedelta(milliseconds=50)),
+            )
+
+            assert expired.wait(timeout=5)
+        finally:
+            scheduler.stop()
+
+        assert expired_ids == [Id("b6439a2d-c0c0-45c8-81b7-7d7b155830ba")]
+        assert scheduler.pending() == 1
+
+    def test_keeps_running_when_expiring_fails(self) -> None:
+        expired_ids: list[Id] = []
+        expired = threading.Event()
+
+        def on_expire(ids: list[Id]) -> None:
+            expired_ids.extend(ids)
+            if len(expired_ids) == 1:
+                raise Exception("database unavailable")
+            expired.set()
+
+        scheduler = HeapExpiryScheduler(on_expire=on_expire)
+        scheduler.start()
+        try:
+            scheduler.schedule(Id("b6439a2d-c0c0-45c8-81b7-7d7b155830ba"), DateTime.now())
+            scheduler.schedule(
+                Id("f48c4dae-b0e2-43f6-a659-599f5e254270"),
+                DateTime.from_datetime(datetime.now(timezone.utc) + timedelta(milliseconds=50)),
+            )
+
+            assert expired.wait(timeout=5)
+        finally:
+            scheduler.stop()
+
+        assert expired_ids == [Id("b6439a2d-c0c0-45c8-81b7-7d7b155830ba"), Id("f48c4dae-b0e2-43f6-a659-599f5e254270")]
@@ -0,0 +1,74 @@
+from typing import Any
+from unittest.mock import Mock, create_autospec
+
+import pytest
+from sqlalchemy import Connection, Engine
+from sqlalchemy.exc import DBAPIError
+
+from app.shared.infrastructure.scheduling.leader_election import LeaderElection, advisory_lock_key
+
+
+class TestLeaderElection:
+    @pytest.fixture
+    def mock_connection(self) -> Any:
+        return create_autospec(spec=Connection, instance=True)
+
+    @pytest.fixture
+    def mock_engine(self, mock_connection: Mock) -> Any:
+        mock_engine = create_autospec(spec=Engine, instance=True)
+        mock_engine.dialect = Mock()
+        mock_engine.dialect.name = "postgresql"
+        mock_engine.connect.return_value = mock_connection
+        return mock_engine
+
+    def test_advisory_lock_key_is_a_stable_signed_bigint(self) -> None:
+        key = advisory_lock_key("scheduler")
+
+        assert key == advisory_lock_key("scheduler")
+        assert key != advisory_lock_key("other")
+        assert -(2**63) <= key < 2**63
+
+    def test_is_always_leader_without_postgres(self, engine: Engine) -> None:
+        assert LeaderElection(engine=engine, name="scheduler").is_leader() is True
+
+    def test_becomes_leader_when_advisory_lock_is_acquired(self, mock_engine: Mock, mock_connection: Mock) -> None:
+        mock_connection.execute.return_value.scalar.return_value = True
+        leader_election = LeaderElection(engine=mock_engine, name="scheduler")
+
+        assert leader_election.is_leader() is True
+        assert leader_election.is_leader() is True
+
+        mock_engine.connect.assert_called_once()
+        mock_connection.close.assert_not_called()
+
+    def test_is_not_leader_when_advisory_lock_is_held_elsewhere(self, mock_engine: Mock, mock_connection: Mock) -> None:
+        mock_connection.execute.return_value.scalar.return_value = False
+
+        assert LeaderElection(engine=mock_engine, name="scheduler").is_leader() is False
+
+        mock_connection.close.assert_called_once()
+
+    def test_tries_to_acquire_again_after_losing_connection(self, mock_engine: Mock, mock_connection: Mock) -> None:
+        mock_connection.execute.return_value.scalar.return_value = True
+        leader_election = LeaderElection(engine=mock_engine, name="scheduler")
+        leader_election.is_leader()
+
+        mock_connection.execute.side_effect = [
+            DBAPIError("SELECT 1", {}, Exception()),
+            mock_connection.execute.return_value,
+        ]
+
+        assert leader_election.is_leader() is True
+
+        mock_connection.invalidate.assert_called_once()
+        assert mock_engine.connect.call_count == 2
+
+    def test_resign_releases_advisory_lock(self, mock_engine: Mock, mock_connection: Mock) -> None:
+        mock_connection.execute.return_value.scalar.return_value = True
+        leader_election = LeaderElection(engine=mock_engine, name="scheduler")
+        leader_election.is_leader()
+
+        leader_election.resign()
+
+        assert "pg_advisory_unlock" in str(mock_connection.execute.call_args.args[0])
+        mock_connection.close.assert_called_once()
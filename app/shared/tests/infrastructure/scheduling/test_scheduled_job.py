@@ -0,0 +1,87 @@
+from collections.abc import Generator
+from datetime import datetime
+from typing import Any
+from unittest.mock import Mock, create_autospec, patch
+
+import pytest
+from freezegun import freeze_time
+from sqlmodel import Session
+
+from app.shared.infrastructure.scheduling.leader_election import LeaderElection
+from app.shared.infrastructure.scheduling.models import JobRunModel
+from app.shared.infrastructure.scheduling.scheduled_job import ScheduledJob
+
+
+class TestScheduledJob:
+    @pytest.fixture
+    def mock_leader_election(self) -> Any:
+        return create_autospec(spec=LeaderElection, instance=True, spec_set=True)
+
+    @pytest.fixture
+    def mock_db_session(self, session: Session) -> Generator[Session, None, None]:
+        with patch("app.shared.infrastructure.scheduling.scheduled_job.get_session") as mock:
+            mock.return_value.__enter__.return_value = session
+            yield session
+
+    @freeze_time("2025-01-10T00:30:00Z")
+    def test_runs_job_and_records_run_when_leader(self, mock_leader_election: Mock, mock_db_session: Session) -> None:
+        mock_leader_election.is_leader.return_value = True
+        mock_job = Mock(return_value=3)
+
+        ScheduledJob(name="cancel_expired_reservations", job=mock_job, leader_election=mock_leader_election)()
+
+        mock_job.assert_called_once_with()
+        job_run_model = mock_db_session.get_one(JobRunModel, "cancel_expired_reservations")
+        assert job_run_model.last_run_at == datetime(2025, 1, 10, 0, 30, 0)
+        assert job_run_model.rows_affected == 3
+        assert job_run_model.duration_seconds >= 0
+
+    def test_overwrites_previous_run(self, mock_leader_election: Mock, mock_db_session: Session) -> None:
+        mock_leader_election.is_leader.return_value = True
+        scheduled_job = ScheduledJob(
+            name="cancel_expired_reservations", job=Mock(side_effect=[3, 0]), leader_election=mock_leader_election
+        )
+
+        scheduled_job()
+        scheduled_job()
+
+        job_run_model = mock_db_session.get_one(JobRunModel, "cancel_expired_reservations")
+        assert job_run_model.rows_affected == 0
+
+    def test_throttles_recorded_runs_and_accumulates_rows_affected(
+        self, mock_leader_election: Mock, mock_db_session: Session
+    ) -> None:
+        mock_leader_election.is_leader.return_value = True
+        with freeze_time("2025-01-10T00:30:00Z") as frozen_time:
+            scheduled_job = ScheduledJob(
+                name="relay_outbox",
+                job=Mock(side_effect=[3, 2, 4, 1]),
+                leader_election=mock_leader_election,
+                flush_interval_seconds=60.0,
+            )
+
+            scheduled_job()
+            frozen_time.tick(1)
+            scheduled_job()
+            frozen_time.tick(1)
+            scheduled_job()
+
+            job_run_model = mock_db_session.get_one(JobRunModel, "relay_outbox")
+            assert job_run_model.last_run_at == datetime(2025, 1, 10, 0, 30, 0)
+            assert job_run_model.rows_affected == 3
+
+            frozen_time.tick(58)
+            scheduled_job()
+
+            job_run_model = mock_db_session.get_one(JobRunModel, "relay_outbox")
+            assert job_run_model.last_run_at == datetime(2025, 1, 10, 0, 31, 0)
+            assert job_run_model.rows_affected == 7
+
+    def test_does_not_run_job_when_not_leader(self, mock_leader_election: Mock, mock_db_session: Session) -> None:
+        mock_leader_election.is_leader.return_value = False
+        mock_job = Mock(return_value=3)
+
+        ScheduledJob(name="cancel_expired_reservations", job=mock_job, leader_election=mock_leader_election)()
+
+        mock_job.assert_not_called()
+        assert mock_db_session.get(JobRunModel, "cancel_expired_reservations") is None
@@ -4,5 +4,5 @@ from app.shared.domain.value_objects.id import Id
 from app.showtimes.domain.seat import Seat
 
 
-class SeatFinder(Protocol):
-    def find_seats_by_showtime_id(self, showtime_id: Id) -> list[Seat]: ...
+class AsyncSeatFinder(Protocol):
+    async def find_seats_by_showtime_id(self, showtime_id: Id) -> list[Seat]: ...
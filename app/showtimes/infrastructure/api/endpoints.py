@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 
-from app.api.deps import SessionDep, get_current_active_superuser
+from app.api.deps import AsyncReadSessionDep, SessionDep, get_current_active_superuser
 from app.shared.domain.value_objects.id import Id
 from app.showtimes.application.commands.create_showtime import CreateShowtime, CreateShowtimeParams
 from app.showtimes.application.commands.delete_showtime import DeleteShowtime
@@ -8,7 +8,9 @@ from app.showtimes.application.queries.find_seats import FindSeats
 from app.showtimes.domain.exceptions import ShowtimeAlreadyExists
 from app.showtimes.infrastructure.api.payloads import CreateShowtimePayload
 from app.showtimes.infrastructure.api.responses import SeatResponse
-from app.showtimes.infrastructure.finders.sqlmodel_seat_finder import SqlModelSeatFinder
+from app.showtimes.infrastructure.caches.seat_map_cache import seat_map_cache
+from app.showtimes.infrastructure.finders.async_sqlmodel_seat_finder import AsyncSqlModelSeatFinder
+from app.showtimes.infrastructure.finders.cached_seat_finder import CachedSeatFinder
 from app.showtimes.infrastructure.repositories.sqlmodel_showtime_repository import SqlModelShowtimeRepository
 
 router = APIRouter()
@@ -37,6 +39,8 @@ def delete_showtime(session: SessionDep, showtime_id: str) -> None:
 
 
 @router.get("/{showtime_id}/seats/", response_model=list[SeatResponse], status_code=status.HTTP_200_OK)
-def list_seats(session: SessionDep, showtime_id: str) -> list[SeatResponse]:
-    seats = FindSeats(finder=SqlModelSeatFinder(session=session)).execute(showtime_id=Id(showtime_id))
+async def list_seats(session: AsyncReadSessionDep, showtime_id: str) -> list[SeatResponse]:
+    seats = await FindSeats(
+        finder=CachedSeatFinder(finder=AsyncSqlModelSeatFinder(session=session), cache=seat_map_cache),
+    ).execute(showtime_id=Id(showtime_id))
     return SeatResponse.from_domain_list(seats)
@@ -0,0 +1,103 @@
+import threading
+import time
+from dataclasses import dataclass, field
+
+from app.settings import get_settings
+from app.shared.domain.value_objects.id import Id
+from app.shared.domain.value_objects.seat_status import SeatStatus
+from app.showtimes.domain.seat import Seat
+
+settings = get_settings()
+
+SEAT_STATUSES: list[SeatStatus] = list(SeatStatus)
+
+
+@dataclass
+class SeatMap:
+    seat_ids: list[Id]
+    rows: list[int]
+    numbers: list[int]
+    statuses: bytearray
+    positions: dict[tuple[int, int], int]
+    loaded_at: float = field(default_factory=time.monotonic)
+
+    @classmethod
+    def from_seats(cls, seats: list[Seat]) -> "SeatMap":
+        return cls(
+            seat_ids=[seat.id for seat in seats],
+            rows=[seat.row for seat in seats],
+            numbers=[seat.number for seat in seats],
+            statuses=bytearray(SEAT_STATUSES.index(seat.status) for seat in seats),
+            positions={(seat.row, seat.number): position for position, seat in enumerate(seats)},
+        )
+
+    def is_expired(self, ttl_seconds: float) -> bool:
+        return time.monotonic() - self.loaded_at >= ttl_seconds
+
+    def update_status(self, row: int, number: int, status: SeatStatus) -> None:
+        position = self.positions.get((row, number))
+        if position is not None:
+            self.statuses[position] = SEAT_STATUSES.index(status)
+
+    def to_seats(self) -> list[Seat]:
+        return [
+            Seat(id=seat_id, row=row, number=number, status=SEAT_STATUSES[status])
+            for seat_id, row, number, status in zip(self.seat_ids, self.rows, self.numbers, self.statuses, strict=True)
+        ]
+
+
+class SeatMapCache:
+    def __init__(self, ttl_seconds: float) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._seat_maps: dict[Id, SeatMap] = {}
+        self._generations: dict[Id, int] = {}
+        self._version = 0
+        self._cleared_version = 0
+        self._lock = threading.Lock()
+
+    def generation(self, showtime_id: Id) -> int:
+        with self._lock:
+            return self._generations.get(showtime_id, self._cleared_version)
+
+    def get(self, showtime_id: Id) -> list[Seat] | None:
+        with self._lock:
+            seat_map = self._seat_maps.get(showtime_id)
+            if seat_map is None:
+                return None
+
+            if seat_map.is_expired(self._ttl_seconds):
+                del self._seat_maps[showtime_id]
+                return None
+            return seat_map.to_seats()
+
+    def put(self, showtime_id: Id, seats: list[Seat], generation: int) -> None:
+        seat_map = SeatMap.from_seats(seats)
+        with self._lock:
+            if generation == self._generations.get(showtime_id, self._cleared_version):
+                self._seat_maps[showtime_id] = seat_map
+
+    def update_seat_status(self, showtime_id: Id, row: int, number: int, status: SeatStatus) -> None:
+        with self._lock:
+            self._bump_generation(showtime_id)
+            seat_map = self._seat_maps.get(showtime_id)
+            if seat_map is not None:
+                seat_map.update_status(row=row, number=number, status=status)
+
+    def invalidate(self, showtime_id: Id) -> None:
+        with self._lock:
+            self._bump_generation(showtime_id)
+            self._seat_maps.pop(showtime_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._version += 1
+            self._cleared_version = self._version
+            self._generations.clear()
+            self._seat_maps.clear()
+
+    def _bump_generation(self, showtime_id: Id) -> None:
+        self._version += 1
+        self._generations[showtime_id] = self._version
+
+
+seat_map_cache = SeatMapCache(ttl_seconds=settings.SEAT_MAP_CACHE_TTL_SECONDS)
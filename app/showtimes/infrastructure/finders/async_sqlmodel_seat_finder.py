@@ -3,19 +3,19 @@ from sqlmodel import select
 from app.reservations.infrastructure.models import SeatModel
 from app.shared.domain.value_objects.id import Id
 from app.shared.domain.value_objects.seat_status import SeatStatus
-from app.shared.infrastructure.finders.sqlmodel_finder import SqlModelFinder
-from app.showtimes.domain.finders.seat_finder import SeatFinder
+from app.shared.infrastructure.finders.async_sqlmodel_finder import AsyncSqlModelFinder
+from app.showtimes.domain.finders.async_seat_finder import AsyncSeatFinder
 from app.showtimes.domain.seat import Seat
 
 
-class SqlModelSeatFinder(SeatFinder, SqlModelFinder):
-    def find_seats_by_showtime_id(self, showtime_id: Id) -> list[Seat]:
+class AsyncSqlModelSeatFinder(AsyncSeatFinder, AsyncSqlModelFinder):
+    async def find_seats_by_showtime_id(self, showtime_id: Id) -> list[Seat]:
         statement = (
             select(SeatModel)
             .where(SeatModel.showtime_id == showtime_id.to_uuid())
             .order_by(SeatModel.row, SeatModel.number)  # type: ignore
         )
-        seat_models = self._session.exec(statement).all()
+        seat_models = (await self._session.exec(statement)).all()
         return [self._build_seat(seat_model) for seat_model in seat_models]
 
     def _build_seat(self, seat_model: SeatModel) -> Seat:
@@ -0,0 +1,19 @@
+from app.shared.domain.value_objects.id import Id
+from app.showtimes.domain.finders.async_seat_finder import AsyncSeatFinder
+from app.showtimes.domain.seat import Seat
+from app.showtimes.infrastructure.caches.seat_map_cache import SeatMapCache
+
+
+class CachedSeatFinder(AsyncSeatFinder):
+    def __init__(self, finder: AsyncSeatFinder, cache: SeatMapCache) -> None:
+        self._finder = finder
+        self._cache = cache
+
+    async def find_seats_by_showtime_id(self, showtime_id: Id) -> list[Seat]:
+        seats = self._cache.get(showtime_id)
+
+        if seats is None:
+            generation = self._cache.generation(showtime_id)
+            seats = await self._finder.find_seats_by_showtime_id(showtime_id=showtime_id)
+            self._cache.put(showtime_id, seats, generation=generation)
+        return seats
@@ -2,6 +2,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship, SQLModel
 
 from app.shared.domain.value_objects.date_time import DateTime
@@ -15,8 +16,10 @@ if TYPE_CHECKING:
 
 
 class ShowtimeModel(SQLModel, table=True):
+    __table_args__ = (Index("ix_showtimemodel_movie_id_show_datetime", "movie_id", "show_datetime"),)
+
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
-    show_datetime: datetime
+    show_datetime: datetime = Field(index=True)
     movie_id: uuid.UUID = Field(foreign_key="moviemodel.id")
     room_id: uuid.UUID = Field(foreign_key="roommodel.id")
     movie: "MovieModel" = Relationship(back_populates="showtimes")
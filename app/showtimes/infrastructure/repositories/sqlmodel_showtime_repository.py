@@ -1,11 +1,13 @@
 from sqlmodel import select
 
+from app.movies.infrastructure.caches.movie_listing_cache import movie_listing_cache
 from app.reservations.infrastructure.models import SeatModel
 from app.shared.domain.value_objects.id import Id
 from app.shared.domain.value_objects.seat_status import SeatStatus
 from app.shared.infrastructure.repositories.sqlmodel_repository import SqlModelRepository
 from app.showtimes.domain.repositories.showtime_repository import ShowtimeRepository
 from app.showtimes.domain.showtime import Showtime
+from app.showtimes.infrastructure.caches.seat_map_cache import seat_map_cache
 from app.showtimes.infrastructure.models import ShowtimeModel
 
 
@@ -25,6 +27,8 @@ class SqlModelShowtimeRepository(ShowtimeRepository, SqlModelRepository):
         self._session.commit()
         self._session.refresh(showtime_model)
         self._create_seats(showtime_model)
+        seat_map_cache.invalidate(showtime.id)
+        movie_listing_cache.clear()
 
     def _create_seats(self, showtime_model: ShowtimeModel) -> None:
         seat_models: list[SeatModel] = []
@@ -46,3 +50,5 @@ class SqlModelShowtimeRepository(ShowtimeRepository, SqlModelRepository):
         if showtime_model:
             self._session.delete(showtime_model)
             self._session.commit()
+            seat_map_cache.invalidate(showtime_id)
+            movie_listing_cache.clear()
@@ -1,6 +1,6 @@
 from collections.abc import Generator
 from datetime import datetime, timezone
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from uuid import UUID
 
 import pytest
@@ -16,6 +16,7 @@ from app.shared.tests.infrastructure.mothers.sqlmodel_showtime_mother import Sql
 from app.showtimes.application.commands.create_showtime import CreateShowtimeParams
 from app.showtimes.domain.exceptions import ShowtimeAlreadyExists
 from app.showtimes.domain.seat import Seat
+from app.showtimes.infrastructure.caches.seat_map_cache import seat_map_cache
 from app.showtimes.infrastructure.models import ShowtimeModel
 from app.showtimes.tests.infrastructure.mothers.sqlmodel_seat_mother import SqlModelSeatMother
 
@@ -239,13 +240,19 @@ class TestListSeatsEndpoint:
     @pytest.fixture
     def mock_find_seats(self) -> Generator[Mock, None, None]:
         with patch("app.showtimes.infrastructure.api.endpoints.FindSeats") as mock:
+            mock.return_value.execute = AsyncMock()
             yield mock
 
     @pytest.fixture
     def mock_seat_finder(self) -> Generator[Mock, None, None]:
-        with patch("app.showtimes.infrastructure.api.endpoints.SqlModelSeatFinder") as mock:
+        with patch("app.showtimes.infrastructure.api.endpoints.AsyncSqlModelSeatFinder") as mock:
             yield mock.return_value
 
+    @pytest.fixture
+    def mock_cached_seat_finder(self) -> Generator[Mock, None, None]:
+        with patch("app.showtimes.infrastructure.api.endpoints.CachedSeatFinder") as mock:
+            yield mock
+
     @pytest.mark.integration
     @pytest.mark.parametrize("status", [SeatStatus.AVAILABLE, SeatStatus.RESERVED, SeatStatus.OCCUPIED])
     def test_integration(self, session: Session, client: TestClient, status: SeatStatus) -> None:
@@ -271,6 +278,8 @@ class TestListSeatsEndpoint:
         )
         SqlModelSeatMother(session).with_row(1).with_number(1).create()
 
+        session.commit()
+
         response = client.get(f"api/v1/showtimes/{showtime_id}/seats/")
 
         assert response.status_code == 200
@@ -280,7 +289,12 @@ class TestListSeatsEndpoint:
 
     @pytest.mark.parametrize("status", [SeatStatus.AVAILABLE, SeatStatus.RESERVED, SeatStatus.OCCUPIED])
     def test_returns_200_and_calls_find_seats(
-        self, client: TestClient, mock_find_seats: Mock, mock_seat_finder: Mock, status: SeatStatus
+        self,
+        client: TestClient,
+        mock_find_seats: Mock,
+        mock_seat_finder: Mock,
+        mock_cached_seat_finder: Mock,
+        status: SeatStatus,
     ) -> None:
         mock_find_seats.return_value.execute.return_value = [
             Seat(id=Id("cbdd7b54-c561-4cbb-a55f-15853c60e600"), row=1, number=2, status=status),
@@ -288,7 +302,8 @@ class TestListSeatsEndpoint:
 
         response = client.get("api/v1/showtimes/913822a0-750b-4cb6-b7b9-e01869d7d62d/seats/")
 
-        mock_find_seats.assert_called_once_with(finder=mock_seat_finder)
+        mock_cached_seat_finder.assert_called_once_with(finder=mock_seat_finder, cache=seat_map_cache)
+        mock_find_seats.assert_called_once_with(finder=mock_cached_seat_finder.return_value)
         mock_find_seats.return_value.execute.assert_called_once_with(
             showtime_id=Id("913822a0-750b-4cb6-b7b9-e01869d7d62d")
         )
@@ -0,0 +1,111 @@
+from freezegun import freeze_time
+
+from app.shared.domain.value_objects.id import Id
+from app.shared.domain.value_objects.seat_status import SeatStatus
+from app.showtimes.domain.seat import Seat
+from app.showtimes.infrastructure.caches.seat_map_cache import SeatMapCache
+
+
+class TestSeatMapCache:
+    def test_returns_none_when_showtime_is_not_cached(self) -> None:
+        cache = SeatMapCache(ttl_seconds=5)
+
+        assert cache.get(Id("cbdd7b54-c561-4cbb-a55f-15853c60e600")) is None
+
+    def test_returns_cached_seats(self) -> None:
+        cache = SeatMapCache(ttl_seconds=5)
+        cache.put(
+            Id("cbdd7b54-c561-4cbb-a55f-15853c60e600"),
+            [
+                Seat(id=Id("537cc255-2e01-4f32-9ee2-eb56aded66ef"), row=1, number=1, status=SeatStatus.AVAILABLE),
+                Seat(id=Id("b43ecf0f-24f7-429e-bbce-5b389de2f297"), row=1, number=2, status=SeatStatus.RESERVED),
+            ],
+            generation=0,
+        )
+
+        assert cache.get(Id("cbdd7b54-c561-4cbb-a55f-15853c60e600")) == [
+            Seat(id=Id("537cc255-2e01-4f32-9ee2-eb56aded66ef"), row=1, number=1, status=SeatStatus.AVAILABLE),
+            Seat(id=Id("b43ecf0f-24f7-429e-bbce-5b389de2f297"), row=1, number=2, status=SeatStatus.RESERVED),
+        ]
+
+    def test_updates_seat_status_by_row_and_number(self) -> None:
+        cache = SeatMapCache(ttl_seconds=5)
+        cache.put(
+            Id("cbdd7b54-c561-4cbb-a55f-15853c60e600"),
+            [
+                Seat(id=Id("537cc255-2e01-4f32-9ee2-eb56aded66ef"), row=1, number=1, status=SeatStatus.AVAILABLE),
+                Seat(id=Id("b43ecf0f-24f7-429e-bbce-5b389de2f297"), row=1, number=2, status=SeatStatus.AVAILABLE),
+            ],
+            generation=0,
+        )
+
+        cache.update_seat_status(
+            Id("cbdd7b54-c561-4cbb-a55f-15853c60e600"), row=1, number=2, status=SeatStatus.RESERVED
+        )
+
+        assert cache.get(Id("cbdd7b54-c561-4cbb-a55f-15853c60e600")) == [
+            Seat(id=Id("537cc255-2e01-4f32-9ee2-eb56aded66ef"), row=1, number=1, status=SeatStatus.AVAILABLE),
+            Seat(id=Id("b43ecf0f-24f7-429e-bbce-5b389de2f297"), row=1, number=2, status=SeatStatus.RESERVED),
+        ]
+
+    def test_ignores_updates_for_showtimes_not_cached(self) -> None:
+        cache = SeatMapCache(ttl_seconds=5)
+
+        cache.update_seat_status(
+            Id("cbdd7b54-c561-4cbb-a55f-15853c60e600"), row=1, number=1, status=SeatStatus.RESERVED
+        )
+
+        assert cache.get(Id("cbdd7b54-c561-4cbb-a55f-15853c60e600")) is None
+
+    def test_invalidates_showtime(self) -> None:
+        cache = SeatMapCache(ttl_seconds=5)
+        cache.put(
+            Id("cbdd7b54-c561-4cbb-a55f-15853c60e600"),
+            [Seat(id=Id("537cc255-2e01-4f32-9ee2-eb56aded66ef"), row=1, number=1, status=SeatStatus.AVAILABLE)],
+            generation=0,
+        )
+
+        cache.invalidate(Id("cbdd7b54-c561-4cbb-a55f-15853c60e600"))
+
+        assert cache.get(Id("cbdd7b54-c561-4cbb-a55f-15853c60e600")) is None
+
+    def test_drops_seats_loaded_before_a_seat_status_update(self) -> None:
+        cache = SeatMapCache(ttl_seconds=5)
+        generation = cache.generation(Id("cbdd7b54-c561-4cbb-a55f-15853c60e600"))
+
+        cache.update_seat_status(
+            Id("cbdd7b54-c561-4cbb-a55f-15853c60e600"), row=1, number=1, status=SeatStatus.RESERVED
+        )
+        cache.put(
+            Id("cbdd7b54-c561-4cbb-a55f-15853c60e600"),
+            [Seat(id=Id("537cc255-2e01-4f32-9ee2-eb56aded66ef"), row=1, number=1, status=SeatStatus.AVAILABLE)],
+            generation=generation,
+        )
+
+        assert cache.get(Id("cbdd7b54-c561-4cbb-a55f-15853c60e600")) is None
+
+    def test_drops_seats_loaded_before_clear(self) -> None:
+        cache = SeatMapCache(ttl_seconds=5)
+        generation = cache.generation(Id("cbdd7b54-c561-4cbb-a55f-15853c60e600"))
+
+        cache.clear()
+        cache.put(
+            Id("cbdd7b54-c561-4cbb-a55f-15853c60e600"),
+            [Seat(id=Id("537cc255-2e01-4f32-9ee2-eb56aded66ef"), row=1, number=1, status=SeatStatus.AVAILABLE)],
+            generation=generation,
+        )
+
+        assert cache.get(Id("cbdd7b54-c561-4cbb-a55f-15853c60e600")) is None
+
+    def test_expires_seats_after_ttl(self) -> None:
+        cache = SeatMapCache(ttl_seconds=5)
+
+        with freeze_time("2025-01-10T12:00:00Z") as frozen_datetime:
+            cache.put(
+                Id("cbdd7b54-c561-4cbb-a55f-15853c60e600"),
+                [Seat(id=Id("537cc255-2e01-4f32-9ee2-eb56aded66ef"), row=1, number=1, status=SeatStatus.AVAILABLE)],
+                generation=0,
+            )
+            frozen_datetime.tick(5)
+
+            assert cache.get(Id("cbdd7b54-c561-4cbb-a55f-15853c60e600")) is None
@@ -1,18 +1,23 @@
 from datetime import datetime, timezone
 from uuid import UUID
 
+import pytest
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.shared.domain.value_objects.id import Id
 from app.shared.domain.value_objects.seat_status import SeatStatus
 from app.shared.tests.infrastructure.builders.sqlmodel_movie_builder import SqlModelMovieBuilder
 from app.showtimes.domain.seat import Seat
-from app.showtimes.infrastructure.finders.sqlmodel_seat_finder import SqlModelSeatFinder
+from app.showtimes.infrastructure.finders.async_sqlmodel_seat_finder import AsyncSqlModelSeatFinder
 from app.showtimes.tests.infrastructure.mothers.sqlmodel_seat_mother import SqlModelSeatMother
 
 
-class TestSqlModelSeatFinder:
-    def test_find_seats_by_showtime_id_ordered_by_row_and_number(self, session: Session) -> None:
+class TestAsyncSqlModelSeatFinder:
+    @pytest.mark.anyio
+    async def test_find_seats_by_showtime_id_ordered_by_row_and_number(
+        self, session: Session, async_session: AsyncSession
+    ) -> None:
         showtime_id = UUID("cbdd7b54-c561-4cbb-a55f-15853c60e601")
         (
             SqlModelMovieBuilder(session)
@@ -52,7 +57,11 @@ class TestSqlModelSeatFinder:
             .create()
         )
 
-        seats = SqlModelSeatFinder(session).find_seats_by_showtime_id(showtime_id=Id.from_uuid(showtime_id))
+        session.commit()
+
+        seats = await AsyncSqlModelSeatFinder(async_session).find_seats_by_showtime_id(
+            showtime_id=Id.from_uuid(showtime_id)
+        )
 
         assert seats == [
             Seat(id=Id("537cc255-2e01-4f32-9ee2-eb56aded66ef"), row=1, number=1, status=SeatStatus.AVAILABLE),
@@ -0,0 +1,51 @@
+from typing import Any
+from unittest.mock import Mock, create_autospec
+
+import pytest
+
+from app.shared.domain.value_objects.id import Id
+from app.shared.domain.value_objects.seat_status import SeatStatus
+from app.showtimes.domain.finders.async_seat_finder import AsyncSeatFinder
+from app.showtimes.domain.seat import Seat
+from app.showtimes.infrastructure.caches.seat_map_cache import SeatMapCache
+from app.showtimes.infrastructure.finders.cached_seat_finder import CachedSeatFinder
+
+
+class TestCachedSeatFinder:
+    @pytest.fixture
+    def mock_seat_finder(self) -> Any:
+        return create_autospec(spec=AsyncSeatFinder, instance=True, spec_set=True)
+
+    @pytest.mark.anyio
+    async def test_loads_seats_from_finder_once(self, mock_seat_finder: Mock) -> None:
+        mock_seat_finder.find_seats_by_showtime_id.return_value = [
+            Seat(id=Id("537cc255-2e01-4f32-9ee2-eb56aded66ef"), row=1, number=1, status=SeatStatus.AVAILABLE),
+        ]
+        finder = CachedSeatFinder(finder=mock_seat_finder, cache=SeatMapCache(ttl_seconds=5))
+
+        await finder.find_seats_by_showtime_id(showtime_id=Id("cbdd7b54-c561-4cbb-a55f-15853c60e600"))
+        seats = await finder.find_seats_by_showtime_id(showtime_id=Id("cbdd7b54-c561-4cbb-a55f-15853c60e600"))
+
+        mock_seat_finder.find_seats_by_showtime_id.assert_called_once_with(
+            showtime_id=Id("cbdd7b54-c561-4cbb-a55f-15853c60e600")
+        )
+        assert seats == [
+            Seat(id=Id("537cc255-2e01-4f32-9ee2-eb56aded66ef"), row=1, number=1, status=SeatStatus.AVAILABLE),
+        ]
+
+    @pytest.mark.anyio
+    async def test_does_not_cache_seats_when_a_reservation_commits_during_the_read(
+        self, mock_seat_finder: Mock
+    ) -> None:
+        cache = SeatMapCache(ttl_seconds=5)
+
+        async def find_seats_by_showtime_id(showtime_id: Id) -> list[Seat]:
+            cache.update_seat_status(showtime_id, row=1, number=1, status=SeatStatus.RESERVED)
+            return [Seat(id=Id("537cc255-2e01-4f32-9ee2-eb56aded66ef"), row=1, number=1, status=SeatStatus.AVAILABLE)]
+
+        mock_seat_finder.find_seats_by_showtime_id.side_effect = find_seats_by_showtime_id
+        finder = CachedSeatFinder(finder=mock_seat_finder, cache=cache)
+
+        await finder.find_seats_by_showtime_id(showtime_id=Id("cbdd7b54-c561-4cbb-a55f-15853c60e600"))
+
+        assert cache.get(Id("cbdd7b54-c561-4cbb-a55f-15853c60e600")) is None
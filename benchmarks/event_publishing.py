@@ -0,0 +1,83 @@
+import json
+import sys
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+from pika import BlockingConnection
+from pika.exceptions import AMQPConnectionError
+
+from app.reservations.domain.events import ReservationCancelled
+from app.settings import get_settings
+from app.shared.infrastructure.events.rabbitmq_configurer import (
+    EXCHANGE_NAME,
+    RabbitMQConfigurer,
+    connection_parameters,
+)
+from app.shared.infrastructure.events.rabbitmq_event_bus import RabbitMQEventBus
+from app.shared.infrastructure.events.rabbitmq_publisher import RabbitMQPublisher
+
+CANCELLATIONS = 500
+THREADS = 8
+
+settings = get_settings()
+connections: list[BlockingConnection] = []
+
+
+def connect() -> BlockingConnection:
+    connection = BlockingConnection(connection_parameters())
+    connections.append(connection)
+    return connection
+
+
+def event() -> ReservationCancelled:
+    return ReservationCancelled(
+        reservation_id="a41707bd-ae9c-43b8-bba5-8c4844e73e77", provider_payment_id="pi_3MtwBwLkdIwHu7ix28a3tqPa"
+    )
+
+
+def per_request_cancellation() -> None:
+    configurer = RabbitMQConfigurer()
+    channel = configurer.get_channel()
+    if configurer._connection is not None:
+        connections.append(configurer._connection)
+    channel.basic_publish(exchange=EXCHANGE_NAME, routing_key=event().topic(), body=json.dumps(event().to_dict()))
+
+
+def pooled_cancellation(event_bus: RabbitMQEventBus) -> Callable[[], None]:
+    return lambda: event_bus.publish([event()])
+
+
+def measure(name: str, cancellation: Callable[[], None]) -> None:
+    connections.clear()
+    started_at = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        for future in [executor.submit(cancellation) for _ in range(CANCELLATIONS)]:
+            future.result()
+    elapsed = time.perf_counter() - started_at
+
+    open_connections = sum(connection.is_open for connection in connections)
+    print(f"{name:<12} {CANCELLATIONS / elapsed:>8.1f} cancellations/s open_connections={open_connections}")
+
+
+def main() -> None:
+    try:
+        BlockingConnection(connection_parameters()).close()
+    except AMQPConnectionError:
+        sys.exit(f"RabbitMQ is not reachable at {settings.RABBITMQ_HOST}:{settings.RABBITMQ_PORT}")
+
+    print(f"{CANCELLATIONS} cancellation events published from {THREADS} threads")
+    measure("per-request", per_request_cancellation)
+
+    publisher = RabbitMQPublisher(
+        connect=connect,
+        exchange_name=EXCHANGE_NAME,
+        pool_size=settings.RABBITMQ_PUBLISHER_POOL_SIZE,
+        timeout=settings.RABBITMQ_PUBLISHER_POOL_TIMEOUT,
+    )
+    measure("pooled", pooled_cancellation(RabbitMQEventBus(publisher=publisher)))
+    publisher.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+import json
+import time
+from collections.abc import Callable
+from dataclasses import asdict
+
+from app.reservations.domain.events import ReservationCancelled
+from app.shared.domain.events.event_serializer import EventSerializer
+from app.shared.infrastructure.events.serializers.json_event_serializer import JsonEventSerializer
+from app.shared.infrastructure.events.serializers.msgpack_event_serializer import MsgpackEventSerializer
+
+EVENTS = 200_000
+
+
+def legacy_serialize(event: ReservationCancelled) -> bytes:
+    return json.dumps(asdict(event)).encode()
+
+
+def legacy_deserialize(body: bytes) -> ReservationCancelled:
+    return ReservationCancelled.from_dict(data=json.loads(body.decode()))
+
+
+def measure(
+    name: str, serialize: Callable[[ReservationCancelled], bytes], deserialize: Callable[[bytes], ReservationCancelled]
+) -> None:
+    events = [
+        ReservationCancelled(
+            reservation_id=f"a41707bd-ae9c-43b8-bba5-{index:012d}",
+            provider_payment_id=f"pi_3MtwBwLkdIwHu7ix{index:08d}",
+        )
+        for index in range(EVENTS)
+    ]
+
+    started_at = time.perf_counter()
+    bodies = [serialize(event) for event in events]
+    encode_seconds = time.perf_counter() - started_at
+
+    started_at = time.perf_counter()
+    decoded = [deserialize(body) for body in bodies]
+    decode_seconds = time.perf_counter() - started_at
+
+    assert decoded == events
+    print(
+        f"{name:<8} encode={encode_seconds / EVENTS * 1_000_000:.2f}us "
+        f"decode={decode_seconds / EVENTS * 1_000_000:.2f}us "
+        f"size={sum(map(len, bodies)) / EVENTS:.0f}B"
+    )
+
+
+def with_serializer(
+    serializer: EventSerializer,
+) -> tuple[Callable[[ReservationCancelled], bytes], Callable[[bytes], ReservationCancelled]]:
+    return serializer.serialize, lambda body: serializer.deserialize(ReservationCancelled, body)
+
+
+def main() -> None:
+    print(f"{EVENTS} ReservationCancelled events")
+    measure("legacy", legacy_serialize, legacy_deserialize)
+    measure("json", *with_serializer(JsonEventSerializer()))
+    measure("msgpack", *with_serializer(MsgpackEventSerializer()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+import asyncio
+import random
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import AsyncAdaptedQueuePool, event
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.main import app  # noqa: F401
+from app.reservations.application.commands.create_reservation import CreateReservation, CreateReservationParams
+from app.reservations.domain.exceptions import SeatsNotAvailable
+from app.reservations.domain.locks.seat_lock_table import SeatLockTable
+from app.reservations.infrastructure.finders.async_sqlmodel_seat_finder import AsyncSqlModelSeatFinder
+from app.reservations.infrastructure.locks.in_memory_seat_lock_table import (
+    DisabledSeatLockTable,
+    InMemorySeatLockTable,
+)
+from app.reservations.infrastructure.models import SeatModel
+from app.reservations.infrastructure.repositories.async_sqlmodel_reservation_repository import (
+    AsyncSqlModelReservationRepository,
+)
+from app.settings import get_settings
+from app.shared.domain.value_objects.date_time import DateTime
+from app.shared.domain.value_objects.id import Id
+from app.shared.domain.value_objects.seat_status import SeatStatus
+from app.shared.infrastructure.clients.fake_payment_client import FakePaymentClient
+
+BUYERS = 1_000
+HOT_SEATS = 20
+SEATS_PER_BUYER = 2
+POOL_SIZE = 5
+
+settings = get_settings()
+
+
+class NoExpiryScheduler:
+    def schedule(self, id: Id, expires_at: DateTime) -> None:
+        pass
+
+    def discard(self, id: Id) -> None:
+        pass
+
+
+async def create_showtime(engine: AsyncEngine) -> tuple[Id, list[Id]]:
+    showtime_id = uuid.uuid4()
+    seat_models = [
+        SeatModel(showtime_id=showtime_id, row=1, number=number, status=SeatStatus.AVAILABLE.value)
+        for number in range(1, HOT_SEATS + 1)
+    ]
+    seat_ids = [Id.from_uuid(seat_model.id) for seat_model in seat_models]
+    async with AsyncSession(engine) as session:
+        session.add_all(seat_models)
+        await session.commit()
+    return Id.from_uuid(showtime_id), seat_ids
+
+
+async def buy(engine: AsyncEngine, seat_lock_table: SeatLockTable, params: CreateReservationParams) -> bool:
+    async with AsyncSession(engine) as session:
+        try:
+            await CreateReservation(
+                reservation_repository=AsyncSqlModelReservationRepository(session=session),
+                seat_finder=AsyncSqlModelSeatFinder(session=session),
+                payment_client=FakePaymentClient(latency_seconds=0),
+                expiry_scheduler=NoExpiryScheduler(),
+                seat_lock_table=seat_lock_table,
+            ).execute(params=params)
+        except SeatsNotAvailable:
+            return False
+    return True
+
+
+async def measure(name: str, seat_lock_table: SeatLockTable, directory: Path) -> int:
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{directory / f'{name}.db'}",
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=POOL_SIZE,
+        max_overflow=0,
+        pool_timeout=60,
+    )
+    async with engine.begin() as connection:
+        await connection.run_sync(SQLModel.metadata.create_all)
+    showtime_id, seat_ids = await create_showtime(engine)
+
+    queries = 0
+
+    def count_query(*_: Any) -> None:
+        nonlocal queries
+        queries += 1
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count_query)
+
+    buyers = random.Random(42)
+    params = [
+        CreateReservationParams(
+            showtime_id=showtime_id,
+            seat_ids=buyers.sample(seat_ids, SEATS_PER_BUYER),
+            user_id=Id.from_uuid(uuid.uuid4()),
+        )
+        for _ in range(BUYERS)
+    ]
+
+    started_at = time.perf_counter()
+    results = await asyncio.gather(*(buy(engine, seat_lock_table, buyer_params) for buyer_params in params))
+    elapsed = time.perf_counter() - started_at
+    await engine.dispose()
+
+    print(f"{name:<12} reservations={sum(results):<4} queries={queries:<6} elapsed={elapsed:.2f}s")
+    return queries
+
+
+async def main() -> None:
+    print(f"{BUYERS} concurrent buyers for {SEATS_PER_BUYER} of {HOT_SEATS} seats on one showtime")
+    with tempfile.TemporaryDirectory() as directory:
+        database_queries = await measure("database", DisabledSeatLockTable(), Path(directory))
+        lock_table_queries = await measure(
+            "lock table",
+            InMemorySeatLockTable(ttl_seconds=settings.SEAT_LOCK_TTL_SECONDS),
+            Path(directory),
+        )
+
+    saved = database_queries - lock_table_queries
+    print(f"queries saved={saved} ({saved / database_queries:.0%})")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
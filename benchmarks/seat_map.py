@@ -0,0 +1,70 @@
+import asyncio
+import statistics
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy import StaticPool
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.main import app  # noqa: F401
+from app.reservations.infrastructure.models import SeatModel
+from app.shared.domain.value_objects.id import Id
+from app.shared.domain.value_objects.seat_status import SeatStatus
+from app.showtimes.infrastructure.api.responses import SeatResponse
+from app.showtimes.infrastructure.caches.seat_map_cache import SeatMapCache
+from app.showtimes.infrastructure.finders.async_sqlmodel_seat_finder import AsyncSqlModelSeatFinder
+from app.showtimes.infrastructure.finders.cached_seat_finder import CachedSeatFinder
+
+ROWS = 20
+SEATS_PER_ROW = 25
+ITERATIONS = 2_000
+
+
+async def measure(name: str, request: Callable[[], Awaitable[object]]) -> None:
+    timings: list[float] = []
+    for _ in range(ITERATIONS):
+        started_at = time.perf_counter()
+        await request()
+        timings.append((time.perf_counter() - started_at) * 1_000)
+
+    percentiles = statistics.quantiles(timings, n=100)
+    print(f"{name:<12} p50={percentiles[49]:.3f}ms p99={percentiles[98]:.3f}ms")
+
+
+async def main() -> None:
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as connection:
+        await connection.run_sync(SQLModel.metadata.create_all)
+    showtime_id = uuid.uuid4()
+
+    async with AsyncSession(engine) as session:
+        session.add_all(
+            SeatModel(showtime_id=showtime_id, row=row, number=number, status=SeatStatus.AVAILABLE.value)
+            for row in range(1, ROWS + 1)
+            for number in range(1, SEATS_PER_ROW + 1)
+        )
+        await session.commit()
+
+        orm_finder = AsyncSqlModelSeatFinder(session=session)
+        cached_finder = CachedSeatFinder(finder=orm_finder, cache=SeatMapCache(ttl_seconds=3600))
+
+        async def find_with_orm() -> list[SeatResponse]:
+            return SeatResponse.from_domain_list(await orm_finder.find_seats_by_showtime_id(Id.from_uuid(showtime_id)))
+
+        async def find_with_seat_map() -> list[SeatResponse]:
+            return SeatResponse.from_domain_list(
+                await cached_finder.find_seats_by_showtime_id(Id.from_uuid(showtime_id))
+            )
+
+        print(f"Seat map for a {ROWS * SEATS_PER_ROW}-seat room, {ITERATIONS} requests")
+        await measure("orm", find_with_orm)
+        await measure("seat map", find_with_seat_map)
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,97 @@
+import random
+import statistics
+import time
+import uuid
+from collections.abc import Callable
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import ColumnElement, Engine, create_engine, func, text
+from sqlmodel import Session, SQLModel, select
+
+from app.main import app  # noqa: F401
+from app.movies.infrastructure.models import MovieModel
+from app.showtimes.infrastructure.models import ShowtimeModel
+
+MOVIES = 1_000
+SHOWTIMES = 100_000
+DAYS = 365
+ITERATIONS = 200
+FIRST_DAY = date(2024, 1, 1)
+
+
+def populate(engine: Engine) -> None:
+    SQLModel.metadata.create_all(engine)
+    randomizer = random.Random(42)
+    movie_ids = [uuid.uuid4() for _ in range(MOVIES)]
+    room_id = uuid.uuid4()
+
+    with Session(engine) as session:
+        session.add_all(MovieModel(id=movie_id, title=f"Movie {index}") for index, movie_id in enumerate(movie_ids))
+        session.add_all(
+            ShowtimeModel(
+                movie_id=randomizer.choice(movie_ids),
+                room_id=room_id,
+                show_datetime=datetime.combine(FIRST_DAY, datetime.min.time())
+                + timedelta(days=randomizer.randrange(DAYS), minutes=randomizer.randrange(16, 24 * 4) * 15),
+            )
+            for _ in range(SHOWTIMES)
+        )
+        session.commit()
+
+
+def date_function_predicate(showtime_date: date) -> list[ColumnElement[bool]]:
+    return [func.date(ShowtimeModel.show_datetime) == showtime_date]
+
+
+def date_range_predicate(showtime_date: date) -> list[ColumnElement[bool]]:
+    day_start = datetime.combine(showtime_date, datetime.min.time())
+    return [
+        ShowtimeModel.show_datetime >= day_start,  # type: ignore
+        ShowtimeModel.show_datetime < day_start + timedelta(days=1),  # type: ignore
+    ]
+
+
+def explain(session: Session, predicate: Callable[[date], list[ColumnElement[bool]]]) -> list[str]:
+    statement = (
+        select(MovieModel, ShowtimeModel)
+        .join(ShowtimeModel)
+        .where(*predicate(FIRST_DAY + timedelta(days=100)))
+        .order_by(MovieModel.title, ShowtimeModel.show_datetime)  # type: ignore
+    )
+    compiled = statement.compile(session.get_bind(), compile_kwargs={"literal_binds": True})
+    rows = session.connection().execute(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+    return [row[-1] for row in rows]
+
+
+def measure(name: str, session: Session, predicate: Callable[[date], list[ColumnElement[bool]]]) -> None:
+    randomizer = random.Random(7)
+    timings: list[float] = []
+    for _ in range(ITERATIONS):
+        showtime_date = FIRST_DAY + timedelta(days=randomizer.randrange(DAYS))
+        started_at = time.perf_counter()
+        session.exec(
+            select(MovieModel, ShowtimeModel)
+            .join(ShowtimeModel)
+            .where(*predicate(showtime_date))
+            .order_by(MovieModel.title, ShowtimeModel.show_datetime)  # type: ignore
+        ).all()
+        timings.append((time.perf_counter() - started_at) * 1_000)
+
+    percentiles = statistics.quantiles(timings, n=100)
+    print(f"{name:<12} p50={percentiles[49]:.3f}ms p99={percentiles[98]:.3f}ms")
+    for step in explain(session, predicate):
+        print(f"{'':<12} {step}")
+
+
+def main() -> None:
+    engine = create_engine("sqlite://")
+    populate(engine)
+
+    with Session(engine) as session:
+        print(f"Movies by showtime date over {SHOWTIMES} showtimes, {ITERATIONS} lookups")
+        measure("date()", session, date_function_predicate)
+        measure("range", session, date_range_predicate)
+
+
+if __name__ == "__main__":
+    main()